@@ -0,0 +1,364 @@
+import gc
+import numpy as np
+import psutil
+from tipe_data import TIPE_DATA, TIPE_DATA_BAWAAN, buat_matriks_acak, tipe_hasil, jalur_perkalian, kalikan
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+# Registry backend: nama -> kelas backend
+DAFTAR_BACKEND = {}
+
+
+# Dekorator untuk mendaftarkan kelas backend ke registry
+def daftarkan_backend(kelas):
+    DAFTAR_BACKEND[kelas.nama] = kelas
+    return kelas
+
+
+# Antarmuka backend: alokasi, isi acak, perkalian, sinkronisasi, pembebasan memori
+# dan pemeriksaan kapasitas memori. Backend baru cukup menurunkan kelas ini.
+class Backend:
+    nama = "dasar"
+    xp = np
+    # Backend yang datanya di RAM bisa memakai mode blok out-of-core (perkalian_blok.py)
+    mendukung_luar_memori = False
+    # Backend yang kalikan() menerima tumpukan (batch, dim, dim) bisa memakai mode batch (perkalian_batch.py)
+    mendukung_batch = True
+    # Backend yang operandnya array padat yang bisa diisi di tempat bisa memakai mode pipeline (pipeline_sapuan.py)
+    mendukung_pipeline = True
+
+    @classmethod
+    def tersedia(cls):
+        return True
+
+    def info(self):
+        return f"{self.nama} (NumPy {np.__version__})"
+
+    # Memori (byte) yang masih bisa dipakai backend ini
+    def memori_tersedia(self):
+        return psutil.virtual_memory().available
+
+    def memori_total(self):
+        return psutil.virtual_memory().total
+
+    # Memori perangkat (byte) yang sedang dipakai backend; None untuk backend yang datanya di RAM host
+    def memori_terpakai(self):
+        return None
+
+    def alokasi(self, bentuk, tipe_data=TIPE_DATA_BAWAAN):
+        return self.xp.empty(bentuk, dtype=TIPE_DATA[tipe_data])
+
+    def isi_acak(self, matriks, tipe_data=TIPE_DATA_BAWAAN):
+        matriks[...] = buat_matriks_acak(self.xp, matriks.shape, tipe_data)
+        return matriks
+
+    # Alokasi sekaligus isi acak (satu langkah, tanpa salinan tambahan)
+    def buat_acak(self, bentuk, tipe_data=TIPE_DATA_BAWAAN):
+        return buat_matriks_acak(self.xp, bentuk, tipe_data)
+
+    # jalur boleh dihitung sekali oleh pemanggil (tipe_data.jalur_perkalian) di luar waktu terukur,
+    # agar pemindaian nilai maks/min operand bulat tidak ikut terukur di setiap ulangan
+    def kalikan(self, matriks_a, matriks_b, jalur=None):
+        return kalikan(self.xp, matriks_a, matriks_b, jalur)
+
+    # Nama jalur perkalian yang dipakai kalikan() untuk operand ini (lihat tipe_data.jalur_perkalian)
+    def jalur(self, matriks_a, matriks_b):
+        return jalur_perkalian(matriks_a, matriks_b)
+
+    def sinkronisasi(self):
+        pass
+
+    def bebaskan(self):
+        gc.collect()
+
+    def ke_numpy(self, matriks):
+        return np.asarray(matriks)
+
+    # Array NumPy host (misalnya memmap dari cache_operand.py) sebagai operand backend; tanpa salinan bila bisa
+    def dari_numpy(self, matriks):
+        return self.xp.asarray(matriks)
+
+    # Lepaskan sumber daya yang dipegang backend (pool proses, dsb.) setelah benchmark selesai
+    def tutup(self):
+        pass
+
+
+@daftarkan_backend
+class BackendNumPy(Backend):
+    nama = "numpy"
+    mendukung_luar_memori = True
+
+
+# NumPy dengan pembangkit np.random.Generator yang mengisi buffer dari beberapa thread (pembangkit_acak.py)
+# Setiap pemanggilan memakai substream baru dari seed, jadi urutan matriks sama untuk seed yang sama
+# berapa pun jumlah threadnya
+@daftarkan_backend
+class BackendNumPyGenerator(BackendNumPy):
+    nama = "numpy-generator"
+
+    def __init__(self, seed=None, jumlah_thread=None, bit_generator=None):
+        from pembangkit_acak import JUMLAH_THREAD_DEFAULT, BIT_GENERATOR_BAWAAN
+        self.urutan_seed = np.random.SeedSequence(seed)
+        self.jumlah_thread = jumlah_thread or JUMLAH_THREAD_DEFAULT
+        self.bit_generator = bit_generator or BIT_GENERATOR_BAWAAN
+
+    def info(self):
+        return f"{self.nama} (NumPy {np.__version__}, {self.bit_generator}, {self.jumlah_thread} thread)"
+
+    def isi_acak(self, matriks, tipe_data=TIPE_DATA_BAWAAN):
+        from pembangkit_acak import isi_acak_paralel
+        return isi_acak_paralel(matriks, self.urutan_seed.spawn(1)[0], self.jumlah_thread, self.bit_generator)
+
+    def buat_acak(self, bentuk, tipe_data=TIPE_DATA_BAWAAN):
+        return self.isi_acak(self.alokasi(bentuk, tipe_data), tipe_data)
+
+
+# NumPy dengan jumlah thread BLAS yang diatur saat runtime lewat threadpoolctl
+# Batas diterapkan sekali saat backend dibuat dan dipulihkan di tutup(), bukan di setiap kalikan(): memasang
+# threadpool_limits memakan waktu jauh lebih lama dari perkalian kecil dan akan ikut terukur
+@daftarkan_backend
+class BackendNumPyThread(Backend):
+    nama = "numpy-thread"
+
+    def __init__(self, jumlah_thread=None):
+        self.jumlah_thread = jumlah_thread or psutil.cpu_count(logical=False) or psutil.cpu_count()
+        self._batas = None
+        self._terapkan_batas()
+
+    # Backend yang dipakai lagi setelah tutup() (mode batch/bentuk/rantai setelah sapuan) memasang batasnya kembali
+    def _terapkan_batas(self):
+        if self._batas is None:
+            self._batas = threadpool_limits(limits=self.jumlah_thread, user_api="blas")
+
+    @classmethod
+    def tersedia(cls):
+        return threadpool_limits is not None
+
+    def info(self):
+        return f"{self.nama} (NumPy {np.__version__}, {self.jumlah_thread} thread BLAS)"
+
+    def kalikan(self, matriks_a, matriks_b, jalur=None):
+        self._terapkan_batas()
+        return kalikan(self.xp, matriks_a, matriks_b, jalur)
+
+    def tutup(self):
+        if self._batas is not None:
+            self._batas.restore_original_limits()
+            self._batas = None
+
+
+# NumPy dengan ProcessPoolExecutor dan operand di shared memory (perkalian_paralel.py)
+@daftarkan_backend
+class BackendNumPyParalel(Backend):
+    nama = "numpy-paralel"
+    mendukung_batch = False
+
+    def __init__(self, jumlah_worker=None):
+        from perkalian_paralel import JUMLAH_WORKER_DEFAULT
+        self.jumlah_worker = jumlah_worker or JUMLAH_WORKER_DEFAULT
+
+    def info(self):
+        return f"{self.nama} (NumPy {np.__version__}, {self.jumlah_worker} worker)"
+
+    def kalikan(self, matriks_a, matriks_b, jalur=None):
+        from perkalian_paralel import kalikan_paralel
+        return kalikan_paralel(matriks_a, matriks_b, self.jumlah_worker, jalur=jalur)
+
+    def tutup(self):
+        from perkalian_paralel import tutup_pool
+        tutup_pool()
+
+
+# NumPy terdistribusi blok 2D: blok C di grid proses, panel A/B dikirim koordinator lewat socket ke worker lokal
+# yang mewakili node (perkalian_terdistribusi.py)
+@daftarkan_backend
+class BackendNumPyTerdistribusi(Backend):
+    nama = "numpy-terdistribusi"
+    mendukung_batch = False
+
+    def __init__(self, jumlah_worker=None, ukuran_panel=None):
+        from perkalian_terdistribusi import JUMLAH_WORKER_BAWAAN, UKURAN_PANEL_BAWAAN
+        self.jumlah_worker = jumlah_worker or JUMLAH_WORKER_BAWAAN
+        self.ukuran_panel = ukuran_panel or UKURAN_PANEL_BAWAAN
+
+    def info(self):
+        from perkalian_terdistribusi import grid_proses
+        pr, pc = grid_proses(self.jumlah_worker)
+        return f"{self.nama} (NumPy {np.__version__}, {self.jumlah_worker} worker, grid {pr}x{pc}, panel {self.ukuran_panel})"
+
+    def kalikan(self, matriks_a, matriks_b, jalur=None):
+        from perkalian_terdistribusi import kalikan_terdistribusi
+        return kalikan_terdistribusi(matriks_a, matriks_b, self.jumlah_worker, self.ukuran_panel, jalur)
+
+    def jalur(self, matriks_a, matriks_b):
+        return "blok-2d-hub"
+
+    def tutup(self):
+        from perkalian_terdistribusi import tutup_klaster
+        tutup_klaster()
+
+
+# NumPy dengan Strassen-Winograd rekursif di atas ukuran_cutoff (perkalian_strassen.py)
+@daftarkan_backend
+class BackendNumPyStrassen(Backend):
+    nama = "numpy-strassen"
+    mendukung_batch = False
+
+    def __init__(self, ukuran_cutoff=None):
+        from perkalian_strassen import UKURAN_CUTOFF_BAWAAN
+        self.ukuran_cutoff = ukuran_cutoff or UKURAN_CUTOFF_BAWAAN
+
+    def info(self):
+        return f"{self.nama} (NumPy {np.__version__}, cutoff {self.ukuran_cutoff})"
+
+    def kalikan(self, matriks_a, matriks_b, jalur=None):
+        from perkalian_strassen import kalikan_strassen
+        return kalikan_strassen(matriks_a, matriks_b, self.ukuran_cutoff, jalur)
+
+    def jalur(self, matriks_a, matriks_b):
+        if max(matriks_a.shape + matriks_b.shape) <= self.ukuran_cutoff:
+            return jalur_perkalian(matriks_a, matriks_b)
+        return "strassen"
+
+    def bebaskan(self):
+        from perkalian_strassen import bebaskan_ruang_kerja
+        bebaskan_ruang_kerja()
+        gc.collect()
+
+
+# Matriks sparse scipy.sparse (CSR/CSC) dengan kepadatan tetap, dikalikan lewat SpGEMM (perkalian_sparse.py)
+# Pemeriksaan memori sapuan biasa tetap memakai perkiraan padat, jadi selalu konservatif
+@daftarkan_backend
+class BackendSparse(Backend):
+    nama = "scipy-sparse"
+    mendukung_batch = False
+    mendukung_pipeline = False
+
+    def __init__(self, kepadatan=None, format=None, seed=None):
+        from perkalian_sparse import KEPADATAN_BAWAAN, FORMAT_BAWAAN, FORMAT_SPARSE
+        self.kepadatan = kepadatan or KEPADATAN_BAWAAN
+        self.format = format or FORMAT_BAWAAN
+        if self.format not in FORMAT_SPARSE:
+            raise ValueError(f"Format sparse tidak dikenal: {self.format} (pilihan: {', '.join(FORMAT_SPARSE)})")
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def tersedia(cls):
+        from importlib.util import find_spec
+        return find_spec("scipy") is not None
+
+    def info(self):
+        import scipy
+        return f"{self.nama} (SciPy {scipy.__version__}, {self.format.upper()}, kepadatan {self.kepadatan:g})"
+
+    def buat_acak(self, bentuk, tipe_data=TIPE_DATA_BAWAAN):
+        from perkalian_sparse import buat_matriks_sparse
+        return buat_matriks_sparse(bentuk, tipe_data, self.kepadatan, self.format, self.rng)
+
+    def kalikan(self, matriks_a, matriks_b, jalur=None):
+        from perkalian_sparse import kalikan_sparse
+        return kalikan_sparse(matriks_a, matriks_b, self.format)
+
+    def jalur(self, matriks_a, matriks_b):
+        return f"sparse-{self.format}"
+
+    def ke_numpy(self, matriks):
+        return matriks.toarray() if hasattr(matriks, "toarray") else np.asarray(matriks)
+
+    def dari_numpy(self, matriks):
+        from perkalian_sparse import buat_dari_padat
+        return buat_dari_padat(matriks, self.format)
+
+
+@daftarkan_backend
+class BackendCuPy(Backend):
+    nama = "cupy"
+
+    def __init__(self):
+        import cupy
+        self.xp = cupy
+
+    @classmethod
+    def tersedia(cls):
+        try:
+            import cupy
+            return cupy.cuda.runtime.getDeviceCount() > 0
+        except Exception:
+            return False
+
+    def info(self):
+        properti = self.xp.cuda.runtime.getDeviceProperties(self.xp.cuda.Device().id)
+        nama_gpu = properti["name"].decode() if isinstance(properti["name"], bytes) else properti["name"]
+        return f"{self.nama} (CuPy {self.xp.__version__}, {nama_gpu})"
+
+    def memori_tersedia(self):
+        return self.xp.cuda.runtime.memGetInfo()[0]
+
+    def memori_total(self):
+        return self.xp.cuda.runtime.memGetInfo()[1]
+
+    def memori_terpakai(self):
+        return self.xp.get_default_memory_pool().used_bytes()
+
+    def sinkronisasi(self):
+        self.xp.cuda.Stream.null.synchronize()
+
+    def bebaskan(self):
+        gc.collect()
+        self.xp.get_default_memory_pool().free_all_blocks()
+
+    def ke_numpy(self, matriks):
+        return self.xp.asnumpy(matriks)
+
+
+# Backend acuan murni CPU sebagai pengganti perangkat akselerator di mesin tanpa GPU (misalnya CI).
+# Perilakunya meniru backend perangkat (kapasitas memori terbatas, sinkronisasi, salinan ke host)
+# dan perkaliannya selalu lewat loop NumPy asli di tipe hasil, tanpa jalan pintas BLAS float,
+# sehingga hasilnya bisa dipakai sebagai acuan kebenaran.
+@daftarkan_backend
+class BackendReferensi(Backend):
+    nama = "referensi"
+
+    def __init__(self, kapasitas_memori=None):
+        self.kapasitas_memori = kapasitas_memori
+
+    def memori_tersedia(self):
+        tersedia = psutil.virtual_memory().available
+        if self.kapasitas_memori is not None:
+            tersedia = min(tersedia, self.kapasitas_memori)
+        return tersedia
+
+    def memori_total(self):
+        if self.kapasitas_memori is not None:
+            return self.kapasitas_memori
+        return psutil.virtual_memory().total
+
+    def kalikan(self, matriks_a, matriks_b, jalur=None):
+        dtype = tipe_hasil(np.result_type(matriks_a.dtype, matriks_b.dtype))
+        return np.matmul(matriks_a.astype(dtype, copy=False), matriks_b.astype(dtype, copy=False))
+
+    def jalur(self, matriks_a, matriks_b):
+        return "referensi"
+
+    def ke_numpy(self, matriks):
+        return np.array(matriks, copy=True)
+
+
+# Fungsi untuk membuat instance backend berdasarkan nama; None bila tidak tersedia di mesin ini
+def dapatkan_backend(nama, **opsi):
+    if nama not in DAFTAR_BACKEND:
+        print(f"Backend '{nama}' tidak dikenal. Pilihan: {', '.join(DAFTAR_BACKEND)}")
+        return None
+    kelas = DAFTAR_BACKEND[nama]
+    if not kelas.tersedia():
+        print(f"Backend '{nama}' tidak tersedia di mesin ini. Melewati.")
+        return None
+    return kelas(**opsi)
+
+
+# Fungsi untuk mendaftar nama backend yang bisa dipakai di mesin ini
+def backend_tersedia():
+    return [nama for nama, kelas in DAFTAR_BACKEND.items() if kelas.tersedia()]
@@ -0,0 +1,888 @@
+import os
+import sys
+import socket
+import time
+import numpy as np
+import psutil
+from backend import DAFTAR_BACKEND, dapatkan_backend
+from tipe_data import TIPE_DATA, TIPE_DATA_BAWAAN, byte_per_elemen_perkalian, jalur_perkalian
+from pengukuran_waktu import ukur, format_statistik, jumlahkan_statistik
+from penyimpanan_hasil import (PATH_PENYIMPANAN, UKURAN_CONTOH, tambah_catatan, muat_hasil, pilih, id_run_sekarang,
+                               id_run_terbaru, atur_id_run, catatan_tersimpan)
+from verifikasi import JUMLAH_PUTARAN_BAWAAN, verifikasi_freivalds
+from profil_memori import ProfilMemori, format_profil
+from roofline import metrik_perkalian, dapatkan_kalibrasi, path_kalibrasi, posisi_roofline, batas_roofline, tipe_puncak
+from checkpoint_run import (DIM_MINIMUM_CHECKPOINT, BATAS_PERCOBAAN_SEL, folder_sel, mulai_sel, selesaikan_sel,
+                            tandai_operand, simpan_operand, muat_operand)
+
+# Folder bawaan untuk plot dan file memmap (hasil pengukuran masuk ke PATH_HASIL)
+FOLDER_HASIL = "matrix_results"
+
+# File penyimpanan hasil yang dipakai sapuan (simpan, lanjutkan run, sel selesai, riwayat memori); run --path
+# mengalihkannya. Kalibrasi roofline ikut disimpan di folder file ini (roofline.path_kalibrasi)
+PATH_HASIL = PATH_PENYIMPANAN
+
+# Dimensi dan tipe data bawaan yang diuji
+DIMENSI_BAWAAN = [8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+TIPE_DATA_DIUJI_BAWAAN = ["int64", "float64", "float32", "int32", "int16", "int8"]
+
+# Bentuk persegi panjang bawaan (m, k, n) untuk A (m x k) @ B (k x n): tall-skinny, short-wide,
+# perkalian luar dan dalam yang dominan memori, sebagai pelengkap sapuan persegi
+BENTUK_BAWAAN = [
+    (4096, 64, 4096),
+    (64, 4096, 64),
+    (8192, 512, 64),
+    (64, 512, 8192),
+    (4096, 4096, 1),
+    (1, 4096, 4096),
+    (2048, 1024, 512),
+]
+
+# Lacak alokasi lewat tracemalloc di setiap fase (mahal; mati secara bawaan). Profil memori perkalian selalu
+# diambil dari pemanggilan terpisah di luar ukur(), jadi tracemalloc dan thread sampler tidak ikut terukur
+LACAK_ALOKASI = False
+
+# Checkpoint operand besar (>= checkpoint_run.DIM_MINIMUM_CHECKPOINT) ke disk sebelum perkalian, agar run
+# yang dilanjutkan setelah terputus tidak perlu membuat ulang operand
+CHECKPOINT_OPERAND = False
+
+# Cache operand berdasarkan isi (cache_operand.CacheOperand) atau None; bila diisi, operand A dan B diambil
+# dari cache sehingga run berulang dan backend yang berbeda memakai operand yang persis sama
+CACHE_OPERAND = None
+
+# Jalankan sapuan tetap (jalankan_benchmark) dalam mode pipeline (pipeline_sapuan.py): pembuatan operand sel
+# berikutnya dan penyimpanan hasil sel sebelumnya berjalan di thread lain selama perkalian
+MODE_PIPELINE = False
+
+# Byte per elemen terukur baru dipercaya mulai dimensi ini (di bawahnya overhead tetap mendominasi)
+DIM_MINIMUM_TERUKUR = 256
+
+# (host, backend, tipe data) -> byte per elemen terbesar yang pernah terukur, diisi dari riwayat dan run ini
+_byte_per_elemen_terukur = None
+
+
+# Fungsi untuk mengambil byte per elemen puncak yang terukur untuk backend dan tipe data ini (None bila belum ada)
+# Riwayat dibaca sekali dari penyimpanan hasil: jejak puncak = RSS puncak fase perkalian - RSS sebelum pembuatan
+def byte_per_elemen_terukur(backend, tipe_data):
+    global _byte_per_elemen_terukur
+    if _byte_per_elemen_terukur is None:
+        _byte_per_elemen_terukur = {}
+        baris, _ = muat_hasil(PATH_HASIL)
+        baris = pilih(baris, hostname=socket.gethostname(), fase="perkalian", ukuran_batch=0)
+        baris = baris[(baris["dim"] >= DIM_MINIMUM_TERUKUR) & (baris["rss_puncak"] > 0) & (baris["jalur"] != "blok")]
+        for b in baris:
+            catat_byte_per_elemen(b["backend"], b["dtype"], b["dim"], b["rss_puncak"] - b["rss_dasar"])
+    return _byte_per_elemen_terukur.get((backend.nama, tipe_data))
+
+
+# Fungsi untuk mencatat jejak memori terukur satu perkalian dim x dim
+def catat_byte_per_elemen(nama_backend, tipe_data, dim, jejak_byte):
+    if dim < DIM_MINIMUM_TERUKUR or _byte_per_elemen_terukur is None:
+        return
+    kunci = (str(nama_backend), str(tipe_data))
+    _byte_per_elemen_terukur[kunci] = max(_byte_per_elemen_terukur.get(kunci, 0), float(jejak_byte) / (dim * dim))
+
+
+# Fungsi untuk memeriksa apakah memori backend cukup untuk A, B dan C
+def periksa_memori_tersedia(backend, dim, tipe_data=TIPE_DATA_BAWAAN):
+    # Kita membutuhkan memori untuk dua matriks input dan satu matriks output
+    # (ditambah salinan float sementara bila operand bilangan bulat). Bila jejak puncak sebenarnya
+    # sudah pernah terukur di mesin ini, angka terukur itu yang dipakai, bukan perkiraan.
+    byte_per_elemen = byte_per_elemen_perkalian(TIPE_DATA[tipe_data])
+    terukur = byte_per_elemen_terukur(backend, tipe_data) if backend.memori_terpakai() is None else None
+    if terukur is not None:
+        print(f"Memakai jejak memori terukur {terukur:.1f} byte/elemen (perkiraan {byte_per_elemen} byte/elemen)")
+        byte_per_elemen = terukur
+    memori_dibutuhkan = dim * dim * byte_per_elemen
+
+    memori_tersedia = backend.memori_tersedia()
+
+    memori_aman = memori_tersedia * 0.95
+
+    memori_cukup = memori_dibutuhkan <= memori_aman
+
+    print(f"Matriks Ukuran: {dim}x{dim} ({tipe_data}) Membutuhkan {memori_dibutuhkan / (1024**3):.2f} GB untuk perkalian")
+    print(f"Memori Tersedia ({backend.nama}): {memori_tersedia / (1024**3):.2f} GB (menggunakan 95%: {memori_aman / (1024**3):.2f} GB)")
+    print(f"Memori Cukup: {memori_cukup}")
+
+    return memori_cukup
+
+
+# Fungsi untuk membuat matriks acak di backend dan mengukur waktu
+# Dengan CACHE_OPERAND, operand ke-indeks dibangkitkan ke cache bila belum ada (di luar pengukuran), lalu
+# yang diukur adalah pemuatannya dari cache ke backend (tanpa salinan untuk NumPy)
+# dim boleh berupa bentuk (baris, kolom) untuk matriks persegi panjang. Waktu muat dari cache ditandai
+# statistik["fase"] = "muat_cache" agar tersimpan terpisah dari fase "pembuatan"
+def buat_matriks(backend, dim, tipe_data=TIPE_DATA_BAWAAN, indeks=None):
+    bentuk = (dim, dim) if np.ndim(dim) == 0 else tuple(dim)
+    label = "x".join(map(str, bentuk))
+    buat = lambda: backend.buat_acak(bentuk, tipe_data)
+    path_cache = None
+    if CACHE_OPERAND is not None and indeks is not None:
+        path_cache = CACHE_OPERAND.path_operand(bentuk, tipe_data, indeks)
+    if path_cache is not None:
+        buat = lambda: backend.dari_numpy(np.load(path_cache, mmap_mode="r"))
+    try:
+        matriks, statistik = ukur(buat, sinkronisasi=backend.sinkronisasi)
+        print(f"{backend.nama} {label} ({tipe_data}) dibuat dalam {format_statistik(statistik)}")
+        if path_cache is not None:
+            statistik["fase"] = "muat_cache"
+        return matriks, statistik
+    except MemoryError as e:
+        print(f"Kesalahan memori saat membuat matriks {label}: {str(e)}")
+        return None, None
+    except Exception as e:
+        print(f"Kesalahan tak terduga saat membuat matriks {label}: {str(e)}")
+        return None, None
+
+
+# Fungsi untuk melakukan perkalian matriks di backend dan mengukur waktu
+# Jalur perkalian dipilih sekali per pasangan operand di luar waktu terukur. Setelah pengukuran, hasil diperiksa
+# dengan Freivalds (juga di luar waktu terukur); putaran_verifikasi=0 mematikannya
+def perkalian_matriks(backend, matriks_a, matriks_b, putaran_verifikasi=JUMLAH_PUTARAN_BAWAAN):
+    try:
+        jalur = jalur_perkalian(matriks_a, matriks_b)
+        hasil, statistik = ukur(lambda: backend.kalikan(matriks_a, matriks_b, jalur), sinkronisasi=backend.sinkronisasi)
+    except Exception as e:
+        print(f"Kesalahan selama perkalian matriks {backend.nama}: {str(e)}")
+        return None, None
+
+    statistik["terverifikasi"] = None
+    if putaran_verifikasi > 0:
+        statistik["terverifikasi"] = verifikasi_freivalds(matriks_a, matriks_b, hasil, putaran_verifikasi)
+        if not statistik["terverifikasi"]:
+            print(f"Peringatan: hasil perkalian {backend.nama} {matriks_a.shape[0]}x{matriks_b.shape[1]} GAGAL verifikasi Freivalds!")
+    return hasil, statistik
+
+
+# Fungsi untuk mengambil profil memori satu pemanggilan perkalian di luar waktu terukur
+# Hasilnya langsung dilepas; dipanggil setelah hasil terukur dilepas agar jejaknya sama dengan perkalian terukur
+def profil_perkalian(backend, fungsi, *argumen):
+    with ProfilMemori(backend, LACAK_ALOKASI) as profil:
+        hasil = fungsi(*argumen)
+        backend.sinkronisasi()
+    del hasil
+    backend.bebaskan()
+    return profil.hasil
+
+
+# Fungsi untuk menulis status verifikasi dalam tabel ringkasan
+def format_verifikasi(terverifikasi):
+    if terverifikasi is None:
+        return "-"
+    return "OK" if terverifikasi else "GAGAL"
+
+
+# Fungsi untuk mengambil contoh 5x5 pertama dan checksum (jumlah seluruh elemen) dari hasil perkalian
+# Contoh selalu berbentuk 5x5 float64; sel di luar matriks kecil diisi NaN
+def ambil_contoh_hasil(backend, hasil, dengan_checksum=True):
+    contoh = np.full((UKURAN_CONTOH, UKURAN_CONTOH), np.nan)
+    bagian = backend.ke_numpy(hasil[:UKURAN_CONTOH, :UKURAN_CONTOH])  # Konversi bagian kecil ke NumPy
+    contoh[:bagian.shape[0], :bagian.shape[1]] = bagian
+    checksum = float(hasil.sum(dtype=np.float64)) if dengan_checksum else float("nan")
+    return contoh, checksum
+
+
+# Fungsi untuk mengambil operand A dan B mode blok dari cache, diukur sekali seperti pembuatan memmap
+# Mengembalikan (matriks_a, matriks_b, statistik_a, statistik_b), atau None bila operand melebihi batas cache
+def _ambil_operand_cache(dim, tipe_data):
+    hasil = []
+    for indeks in (0, 1):
+        matriks, statistik = ukur(lambda: CACHE_OPERAND.ambil((dim, dim), tipe_data, indeks), pemanasan=0, ulangan=1)
+        if matriks is None:
+            return None
+        print(f"Operand cache {dim}x{dim} ({tipe_data}) diambil dalam {format_statistik(statistik)}")
+        statistik["fase"] = "muat_cache"
+        hasil.append((matriks, statistik))
+    return hasil[0][0], hasil[1][0], hasil[0][1], hasil[1][1]
+
+
+# Fungsi untuk menjalankan pembuatan dan perkalian out-of-core bila matriks tidak muat di RAM
+# Mengembalikan catatan hasil, atau None bila disk juga tidak cukup
+# Bila checkpoint diberikan, file memmap A dan B ditulis di folder checkpoint sel dan dipakai ulang saat run dilanjutkan
+def jalankan_perkalian_blok(backend, dim, tipe_data=TIPE_DATA_BAWAAN, folder=FOLDER_HASIL, checkpoint=None):
+    from perkalian_blok import (anggaran_memori_default, periksa_disk_tersedia, buat_matriks_memmap,
+                                perkalian_matriks_numpy_blok, profil_panel_blok, hapus_matriks_memmap)
+
+    folder_memmap = os.path.join(folder, "memmap")
+    if not periksa_disk_tersedia(dim, tipe_data, folder_memmap):
+        print(f"Disk tidak cukup untuk matriks {dim}x{dim}. Melewati.")
+        return None
+
+    anggaran_memori = anggaran_memori_default()
+    print(f"Menggunakan mode blok out-of-core dengan anggaran memori {anggaran_memori / (1024**3):.2f} GB")
+
+    rss_dasar = psutil.Process().memory_info().rss
+    operand = muat_operand(checkpoint) if checkpoint is not None else None
+    dari_cache = False
+    with ProfilMemori(backend, LACAK_ALOKASI) as profil_buat:
+        if operand is None and CACHE_OPERAND is not None:
+            # Operand cache sudah berupa file memmap, bisa dibaca per panel seperti file blok biasa
+            operand = _ambil_operand_cache(dim, tipe_data)
+            dari_cache = operand is not None
+        if operand is not None:
+            matriks_a, matriks_b, statistik_buat_a, statistik_buat_b = operand
+        else:
+            path_a, path_b = (os.path.join(folder_memmap, f"{nama}_{dim}x{dim}.dat") if checkpoint is None
+                              else os.path.join(checkpoint, f"{nama}.dat") for nama in ("a", "b"))
+            matriks_a, statistik_buat_a = buat_matriks_memmap(dim, path_a, tipe_data, anggaran_memori)
+            matriks_b, statistik_buat_b = buat_matriks_memmap(dim, path_b, tipe_data, anggaran_memori)
+    if matriks_a is None or matriks_b is None:
+        hapus_matriks_memmap(matriks_a, matriks_b)
+        return None
+    if operand is None and checkpoint is not None:
+        matriks_a.flush()
+        matriks_b.flush()
+        tandai_operand(checkpoint, "dat", dim, TIPE_DATA[tipe_data], statistik_buat_a, statistik_buat_b)
+    print(f"Memori pembuatan: {format_profil(profil_buat.hasil)}")
+
+    print(f"Mengalikan matriks {dim}x{dim} secara blok...")
+    hasil, statistik_perkalian = perkalian_matriks_numpy_blok(matriks_a, matriks_b, os.path.join(folder_memmap, f"c_{dim}x{dim}.dat"), anggaran_memori)
+
+    catatan = None
+    if hasil is not None:
+        print(f"Perkalian matriks blok {dim}x{dim} selesai dalam {format_statistik(statistik_perkalian)}")
+        print(f"Verifikasi checksum aliran: {format_verifikasi(statistik_perkalian['terverifikasi'])}")
+        profil_kali = profil_perkalian(backend, profil_panel_blok, matriks_a, matriks_b, anggaran_memori)
+        print(f"Memori perkalian (satu baris panel): {format_profil(profil_kali)}")
+        # Checksum sudah diakumulasi per panel saat perkalian, tidak perlu membaca ulang file hasil
+        with ProfilMemori(backend, LACAK_ALOKASI) as profil_simpan:
+            contoh, _ = ambil_contoh_hasil(backend, hasil, dengan_checksum=False)
+        checksum = statistik_perkalian["checksum"]
+        catatan = buat_catatan(backend, dim, tipe_data, "blok", statistik_buat_a, statistik_buat_b, statistik_perkalian,
+                               contoh, checksum)
+        catatan["rss_dasar"] = rss_dasar
+        catatan["memori"] = {"pembuatan": profil_buat.hasil, "perkalian": profil_kali, "simpan": profil_simpan.hasil}
+
+    # File memmap sangat besar, hapus setelah setiap ukuran (kecuali operand milik cache)
+    hapus_matriks_memmap(*([hasil] if dari_cache else [matriks_a, matriks_b, hasil]))
+    return catatan
+
+
+# Fungsi untuk menyusun satu catatan hasil benchmark
+def buat_catatan(backend, dim, tipe_data, jalur, statistik_buat_a, statistik_buat_b, statistik_perkalian,
+                 contoh=None, checksum=float("nan")):
+    # Fase pembuatan menyimpan waktu A + B per ulangan, bukan hanya statistik A
+    statistik_pembuatan = jumlahkan_statistik(statistik_buat_a, statistik_buat_b)
+    catatan = {
+        "backend": backend.nama,
+        "dtype": tipe_data,
+        "dim": dim,
+        "jalur": jalur,
+        "waktu_pembuatan": statistik_pembuatan["median"],
+        "waktu_perkalian": statistik_perkalian["median"],
+        "statistik_pembuatan": statistik_pembuatan,
+        "fase_pembuatan": statistik_buat_a.get("fase", "pembuatan"),
+        "statistik_perkalian": statistik_perkalian,
+        "contoh": contoh,
+        "checksum": checksum,
+        "terverifikasi": statistik_perkalian.get("terverifikasi"),
+        "kepadatan": getattr(backend, "kepadatan", 1.0),
+    }
+    # GFLOP/s, byte efektif dan intensitas aritmetika dari waktu median
+    catatan.update(metrik_perkalian(dim, TIPE_DATA[tipe_data], jalur, statistik_perkalian["median"]))
+    return catatan
+
+
+# Fungsi untuk membuat dan mengalikan sepasang matriks satu dimensi dan satu tipe data
+# Mengembalikan (lanjut, catatan); lanjut bernilai False bila memori (dan disk) tidak cukup
+# Bila checkpoint (folder sel) diberikan, operand dimuat dari sana bila ada, atau disimpan ke sana setelah dibuat
+def uji_dimensi(backend, dim, tipe_data, folder=FOLDER_HASIL, checkpoint=None):
+    print(f"\nMembuat dan mengalikan matriks {backend.nama} {dim}x{dim} ({tipe_data})...")
+
+    if not periksa_memori_tersedia(backend, dim, tipe_data):
+        print(f"Memori tidak cukup untuk matriks {dim}x{dim}.")
+        if backend.mendukung_luar_memori:
+            # Matriks tidak muat di RAM, coba mode blok out-of-core di disk
+            catatan = jalankan_perkalian_blok(backend, dim, tipe_data, folder, checkpoint)
+            return catatan is not None, catatan
+        return False, None
+
+    # RSS sebelum pembuatan menjadi dasar jejak memori seluruh perkalian (A, B, C dan temporer)
+    rss_dasar = psutil.Process().memory_info().rss
+
+    # Buat matriks pertama dan kedua, atau salin dari checkpoint operand run sebelumnya
+    operand = muat_operand(checkpoint) if checkpoint is not None else None
+    with ProfilMemori(backend, LACAK_ALOKASI) as profil_buat:
+        if operand is not None:
+            matriks_a, matriks_b = backend.xp.array(operand[0]), backend.xp.array(operand[1])
+            statistik_buat_a, statistik_buat_b = operand[2], operand[3]
+        else:
+            matriks_a, statistik_buat_a = buat_matriks(backend, dim, tipe_data, 0)
+            matriks_b, statistik_buat_b = (None, None) if matriks_a is None else buat_matriks(backend, dim, tipe_data, 1)
+    del operand
+    if matriks_a is None:
+        return False, None
+    if matriks_b is None:
+        del matriks_a
+        backend.bebaskan()
+        return False, None
+    print(f"Memori pembuatan: {format_profil(profil_buat.hasil)}")
+    if checkpoint is not None and not os.path.exists(os.path.join(checkpoint, "operand.json")):
+        simpan_operand(checkpoint, matriks_a, matriks_b, statistik_buat_a, statistik_buat_b, backend.ke_numpy)
+
+    # Lakukan perkalian matriks
+    print(f"Mengalikan matriks {dim}x{dim}...")
+    hasil, statistik_perkalian = perkalian_matriks(backend, matriks_a, matriks_b)
+
+    catatan = None
+    if hasil is not None:
+        jalur = backend.jalur(matriks_a, matriks_b)
+        print(f"Perkalian matriks {dim}x{dim} (jalur {jalur}) selesai dalam {format_statistik(statistik_perkalian)}, "
+              f"verifikasi {format_verifikasi(statistik_perkalian['terverifikasi'])}")
+
+        # Ambil contoh dan checksum hasil matriks untuk penyimpanan hasil
+        with ProfilMemori(backend, LACAK_ALOKASI) as profil_simpan:
+            contoh, checksum = ambil_contoh_hasil(backend, hasil)
+        del hasil
+        backend.bebaskan()
+
+        # Profil memori dari satu perkalian tambahan yang tidak diukur waktunya
+        profil_kali = profil_perkalian(backend, backend.kalikan, matriks_a, matriks_b)
+        print(f"Memori perkalian: {format_profil(profil_kali)}")
+
+        catatan = buat_catatan(backend, dim, tipe_data, jalur, statistik_buat_a, statistik_buat_b, statistik_perkalian,
+                               contoh, checksum)
+        catatan["rss_dasar"] = rss_dasar
+        catatan["memori"] = {"pembuatan": profil_buat.hasil, "perkalian": profil_kali, "simpan": profil_simpan.hasil}
+        catat_byte_per_elemen(backend.nama, tipe_data, dim, profil_kali["rss_puncak"] - rss_dasar)
+
+    # Bebaskan memori secara eksplisit
+    del matriks_a, matriks_b
+    backend.bebaskan()
+
+    # Laporkan memori setelah setiap matriks besar
+    if dim >= 1024:
+        print(f"Memori {backend.nama} tersedia setelah dibersihkan: {backend.memori_tersedia() / (1024**3):.2f} GB")
+    return True, catatan
+
+
+# Fungsi untuk menjalankan satu sel (backend, dimensi, tipe data) dan langsung menyimpan hasilnya.
+# Penanda sel ditulis sebelum mulai dan dihapus setelah hasilnya tersimpan, sehingga sel yang terputus
+# (misalnya dibunuh OOM killer) dikenali saat run dilanjutkan dan tidak diulang tanpa batas.
+def uji_sel(backend, dim, tipe_data, folder=FOLDER_HASIL):
+    folder_checkpoint = folder_sel(os.path.join(folder, "checkpoint"), id_run_sekarang(), backend.nama, tipe_data, dim)
+    percobaan = mulai_sel(folder_checkpoint)
+    if percobaan > BATAS_PERCOBAAN_SEL:
+        print(f"Sel {backend.nama} {dim}x{dim} ({tipe_data}) sudah terputus {percobaan - 1} kali, dilewati.")
+        return False, None
+    if percobaan > 1:
+        print(f"Sel {backend.nama} {dim}x{dim} ({tipe_data}) terputus di run sebelumnya, percobaan ke-{percobaan}.")
+
+    # Operand dari cache sudah tersimpan di disk, checkpoint terpisah tidak diperlukan
+    checkpoint = (folder_checkpoint if CHECKPOINT_OPERAND and CACHE_OPERAND is None and dim >= DIM_MINIMUM_CHECKPOINT
+                  else None)
+    lanjut, catatan = uji_dimensi(backend, dim, tipe_data, folder, checkpoint)
+    if catatan is not None:
+        simpan_hasil(backend, [catatan])
+    selesaikan_sel(folder_checkpoint)
+    return lanjut, catatan
+
+
+# Fungsi untuk melanjutkan run yang terputus: hasil berikutnya ditulis dengan ID run yang sama dan sel
+# yang sudah tersimpan dilewati. Tanpa id_run, run terbaru di penyimpanan hasil yang dilanjutkan.
+def lanjutkan_run(id_run=None, path=None):
+    if id_run is None:
+        baris, _ = muat_hasil(path or PATH_HASIL)
+        id_run = id_run_terbaru(baris)
+    if id_run is None:
+        print("Tidak ada run yang bisa dilanjutkan, memulai run baru.")
+        return id_run_sekarang()
+    atur_id_run(str(id_run))
+    print(f"Melanjutkan run {id_run}")
+    return id_run
+
+
+# Fungsi untuk mengambil catatan run sekarang yang sudah tersimpan untuk backend, per (tipe data, dimensi)
+def sel_selesai(backend):
+    selesai = {(c["dtype"], c["dim"]): c for c in catatan_tersimpan(id_run_sekarang(), backend.nama, PATH_HASIL)}
+    if selesai:
+        print(f"Melewati {len(selesai)} sel {backend.nama} yang sudah selesai di run {id_run_sekarang()}")
+    return selesai
+
+
+# Fungsi untuk menjalankan seluruh sapuan dimensi x tipe data pada satu backend
+# Setiap sel disimpan begitu selesai; sel yang sudah tersimpan di run ini (run dilanjutkan) dilewati
+def jalankan_benchmark(backend, dimensi=DIMENSI_BAWAAN, tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN, folder=FOLDER_HASIL):
+    if MODE_PIPELINE and backend.mendukung_pipeline:
+        from pipeline_sapuan import jalankan_benchmark_pipeline
+        return jalankan_benchmark_pipeline(backend, dimensi, tipe_data_diuji, folder)
+    os.makedirs(folder, exist_ok=True)
+    print(f"\n--- Memulai benchmark {backend.info()} ---")
+
+    # Lacak tipe data yang gagal karena memori untuk menghentikan percobaan ukuran yang lebih besar
+    tipe_gagal_memori = set()
+    daftar_catatan = []
+    selesai = sel_selesai(backend)
+
+    for dim in dimensi:
+        for tipe_data in tipe_data_diuji:
+            if tipe_data in tipe_gagal_memori:
+                continue
+            if (tipe_data, dim) in selesai:
+                daftar_catatan.append(selesai[(tipe_data, dim)])
+                continue
+            lanjut, catatan = uji_sel(backend, dim, tipe_data, folder)
+            if catatan is not None:
+                daftar_catatan.append(catatan)
+            if not lanjut:
+                tipe_gagal_memori.add(tipe_data)
+        if len(tipe_gagal_memori) == len(tipe_data_diuji):
+            break
+
+    backend.tutup()
+    return daftar_catatan
+
+
+# Jejak memori puncak perkalian satu catatan: memori perangkat bila dilaporkan, selain itu kenaikan RSS
+def _jejak_memori(catatan):
+    profil = catatan["memori"]["perkalian"]
+    if profil["memori_perangkat_puncak"] is not None:
+        return profil["memori_perangkat_puncak"]
+    return profil["rss_puncak"] - catatan["rss_dasar"]
+
+
+# Fungsi untuk menjalankan sapuan adaptif (penjadwal_sapuan.py) dengan anggaran waktu dinding (detik)
+# dan anggaran memori (byte, bawaan 95% memori tersedia). Anggaran waktu dibagi rata ke tipe data yang
+# belum disapu; sisa anggaran satu tipe data diwariskan ke tipe data berikutnya.
+# waktu_acuan berisi {tipe data: {dim: waktu perkalian}} backend lain untuk merapatkan titik potong.
+# Sel yang sudah tersimpan di run ini menjadi titik awal model penjadwal tanpa memakan anggaran.
+def jalankan_benchmark_adaptif(backend, anggaran_waktu, anggaran_memori=None, tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN,
+                               waktu_acuan=None, folder=FOLDER_HASIL):
+    from penjadwal_sapuan import PenjadwalSapuan
+
+    os.makedirs(folder, exist_ok=True)
+    print(f"\n--- Memulai sapuan adaptif {backend.info()} (anggaran {anggaran_waktu:.0f} detik) ---")
+    if anggaran_memori is None:
+        anggaran_memori = backend.memori_tersedia() * 0.95
+
+    daftar_catatan = []
+    sisa_waktu = anggaran_waktu
+    selesai = sel_selesai(backend)
+    for i, tipe_data in enumerate(tipe_data_diuji):
+        byte_per_elemen = byte_per_elemen_terukur(backend, tipe_data) if backend.memori_terpakai() is None else None
+        penjadwal = PenjadwalSapuan(sisa_waktu / (len(tipe_data_diuji) - i), anggaran_memori,
+                                    byte_per_elemen or byte_per_elemen_perkalian(TIPE_DATA[tipe_data]),
+                                    waktu_acuan=(waktu_acuan or {}).get(tipe_data))
+        for (tipe, dim), catatan in sorted(selesai.items(), key=lambda item: item[0][1]):
+            if tipe == tipe_data:
+                daftar_catatan.append(catatan)
+                penjadwal.catat(dim, catatan["waktu_perkalian"], catatan["waktu_pembuatan"], 0.0, _jejak_memori(catatan))
+        while (dim := penjadwal.usul_berikutnya()) is not None:
+            print(f"\nSapuan adaptif {tipe_data}: {dim}x{dim} (perkiraan {penjadwal.prediksi_waktu(dim):.2f} detik, "
+                  f"sisa {penjadwal.sisa_waktu:.1f} detik)")
+            mulai = time.perf_counter()
+            lanjut, catatan = uji_sel(backend, dim, tipe_data, folder)
+            waktu_dinding = time.perf_counter() - mulai
+            sisa_waktu -= waktu_dinding
+            if catatan is None or not lanjut:
+                penjadwal.catat_gagal(dim, waktu_dinding)
+                continue
+            daftar_catatan.append(catatan)
+            penjadwal.catat(dim, catatan["waktu_perkalian"], catatan["waktu_pembuatan"], waktu_dinding,
+                            _jejak_memori(catatan))
+        print(f"Sapuan adaptif {tipe_data} selesai: {len(penjadwal.titik)} dimensi {sorted(penjadwal.titik)}")
+
+    backend.tutup()
+    daftar_catatan.sort(key=lambda c: (c["dim"], tipe_data_diuji.index(c["dtype"])))
+    return daftar_catatan
+
+
+# Fungsi untuk menjalankan sapuan mode batch (dimensi kecil x ukuran batch x tipe data) pada satu backend
+def jalankan_benchmark_batch(backend, dimensi=None, ukuran_batch_diuji=None, jumlah_matriks=None,
+                             tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN, folder=FOLDER_HASIL):
+    from perkalian_batch import (DIMENSI_BATCH_BAWAAN, UKURAN_BATCH_BAWAAN, JUMLAH_MATRIKS_BAWAAN,
+                                 jalankan_aliran_batch)
+
+    dimensi = dimensi or DIMENSI_BATCH_BAWAAN
+    ukuran_batch_diuji = ukuran_batch_diuji or UKURAN_BATCH_BAWAAN
+    jumlah_matriks = jumlah_matriks or JUMLAH_MATRIKS_BAWAAN
+
+    os.makedirs(folder, exist_ok=True)
+    print(f"\n--- Memulai benchmark batch {backend.info()} ---")
+    if not backend.mendukung_batch:
+        print(f"Backend {backend.nama} tidak mendukung mode batch. Melewati.")
+        return []
+
+    daftar_catatan = []
+    for dim in dimensi:
+        for tipe_data in tipe_data_diuji:
+            for ukuran_batch in ukuran_batch_diuji:
+                try:
+                    catatan, hasil = jalankan_aliran_batch(backend, dim, ukuran_batch, jumlah_matriks, tipe_data)
+                except MemoryError as e:
+                    print(f"Kesalahan memori saat batch {ukuran_batch}x{dim}x{dim}: {str(e)}")
+                    continue
+                except Exception as e:
+                    print(f"Kesalahan selama perkalian batch {backend.nama}: {str(e)}")
+                    continue
+                print(f"{backend.nama} {jumlah_matriks}x {dim}x{dim} ({tipe_data}, batch {catatan['ukuran_batch']}, "
+                      f"jalur {catatan['jalur']}): {catatan['matriks_per_detik']:.0f} matriks/detik, "
+                      f"{catatan['gflops']:.2f} GFLOP/s")
+                catatan["contoh"], _ = ambil_contoh_hasil(backend, hasil[-1], dengan_checksum=False)
+                daftar_catatan.append(catatan)
+                del hasil
+        # Bebaskan memori sekali per dimensi, bukan per pasangan matriks
+        backend.bebaskan()
+
+    backend.tutup()
+    return daftar_catatan
+
+
+# Fungsi untuk mengalikan satu bentuk persegi panjang (m, k) @ (k, n) pada satu tipe data.
+# Operand dibangkitkan langsung (tanpa cache/checkpoint) dan hanya fase perkalian yang dicatat.
+# Mengembalikan catatan, atau None bila memori tidak cukup atau perkalian gagal
+def uji_bentuk(backend, bentuk, tipe_data):
+    m, k, n = bentuk
+    label = f"{m}x{k} @ {k}x{n}"
+    # byte_per_elemen_perkalian dihitung untuk tiga matriks dim x dim (A, B, C dan temporernya)
+    memori_dibutuhkan = (m * k + k * n + m * n) / 3 * byte_per_elemen_perkalian(TIPE_DATA[tipe_data])
+    if memori_dibutuhkan > backend.memori_tersedia() * 0.95:
+        print(f"Memori tidak cukup untuk {label} ({tipe_data}). Melewati.")
+        return None
+
+    print(f"\nMengalikan matriks {backend.nama} {label} ({tipe_data})...")
+    matriks_a = matriks_b = hasil = None
+    try:
+        matriks_a = backend.buat_acak((m, k), tipe_data)
+        matriks_b = backend.buat_acak((k, n), tipe_data)
+    except MemoryError as e:
+        print(f"Kesalahan memori saat membuat matriks {label}: {str(e)}")
+    catatan = None
+    if matriks_b is not None:
+        hasil, statistik_perkalian = perkalian_matriks(backend, matriks_a, matriks_b)
+    if hasil is not None:
+        jalur = backend.jalur(matriks_a, matriks_b)
+        print(f"Perkalian matriks {label} (jalur {jalur}) selesai dalam {format_statistik(statistik_perkalian)}, "
+              f"verifikasi {format_verifikasi(statistik_perkalian['terverifikasi'])}")
+        contoh, checksum = ambil_contoh_hasil(backend, hasil)
+        catatan = {
+            "backend": backend.nama,
+            "dtype": tipe_data,
+            "dim": m,
+            "bentuk": bentuk,
+            "jalur": jalur,
+            "waktu_perkalian": statistik_perkalian["median"],
+            "statistik_perkalian": statistik_perkalian,
+            "contoh": contoh,
+            "checksum": checksum,
+            "terverifikasi": statistik_perkalian["terverifikasi"],
+        }
+        catatan.update(metrik_perkalian(bentuk, TIPE_DATA[tipe_data], jalur, statistik_perkalian["median"]))
+    del matriks_a, matriks_b, hasil
+    backend.bebaskan()
+    return catatan
+
+
+# Fungsi untuk menjalankan sapuan bentuk persegi panjang (bentuk x tipe data) pada satu backend
+def jalankan_benchmark_bentuk(backend, daftar_bentuk=BENTUK_BAWAAN, tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN):
+    print(f"\n--- Memulai benchmark bentuk persegi panjang {backend.info()} ---")
+    daftar_catatan = []
+    for bentuk in daftar_bentuk:
+        for tipe_data in tipe_data_diuji:
+            catatan = uji_bentuk(backend, tuple(int(x) for x in bentuk), tipe_data)
+            if catatan is not None:
+                daftar_catatan.append(catatan)
+    backend.tutup()
+    return daftar_catatan
+
+
+# Fungsi untuk mencetak ringkasan sapuan bentuk persegi panjang
+def cetak_ringkasan_bentuk(nama_backend, daftar_catatan):
+    print(f"\nRingkasan Bentuk {nama_backend}:")
+    print("=" * 100)
+    print(f"{'Bentuk (m x k x n)':<24} {'Tipe':<10} {'Jalur':<10} {'Median (detik)':<15} {'GFLOP/s':<10} "
+          f"{'Intensitas':<12} {'Verifikasi':<10}")
+    print("-" * 100)
+    for c in daftar_catatan:
+        print(f"{'x'.join(map(str, c['bentuk'])):<24} {c['dtype']:<10} {c['jalur']:<10} "
+              f"{c['waktu_perkalian']:<15.6f} {c['gflops']:<10.2f} {c['intensitas_aritmetika']:<12.2f} "
+              f"{format_verifikasi(c['terverifikasi']):<10}")
+
+
+# Fungsi untuk mencetak throughput mode batch
+def cetak_ringkasan_batch(nama_backend, daftar_catatan):
+    print(f"\nRingkasan Batch {nama_backend}:")
+    print("=" * 90)
+    print(f"{'Dimensi':<10} {'Tipe':<10} {'Batch':<8} {'Jalur':<10} {'Matriks/detik':<16} {'GFLOP/s':<10} {'Pembuatan (detik)':<18} {'Verifikasi':<10}")
+    print("-" * 90)
+    for c in daftar_catatan:
+        print(f"{c['dim']:<10} {c['dtype']:<10} {c['ukuran_batch']:<8} {c['jalur']:<10} "
+              f"{c['matriks_per_detik']:<16.0f} {c['gflops']:<10.2f} {c['waktu_pembuatan']:<18.6f} "
+              f"{format_verifikasi(c['terverifikasi']):<10}")
+
+
+# Fungsi untuk membandingkan waktu pembuatan matriks beberapa backend dalam satu run
+# (misalnya np.random lama vs np.random.Generator paralel). Backend pertama menjadi acuan percepatan.
+def bandingkan_pembuatan(daftar_backend, dimensi=DIMENSI_BAWAAN, tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN):
+    print(f"\nPerbandingan Pembuatan Matriks ({', '.join(b.info() for b in daftar_backend)}):")
+    print("=" * 70)
+    print(f"{'Dimensi':<10} {'Tipe':<10} {'Backend':<20} {'Median (detik)':<15} {'Percepatan':<10}")
+    print("-" * 70)
+    daftar_catatan = []
+    for dim in dimensi:
+        for tipe_data in tipe_data_diuji:
+            waktu_acuan = None
+            for backend in daftar_backend:
+                # Hanya satu matriks yang hidup sekaligus, ditambah satu salinan sementara pembangkit
+                if dim * dim * TIPE_DATA[tipe_data]().itemsize * 2 > backend.memori_tersedia() * 0.95:
+                    continue
+                try:
+                    matriks, statistik = ukur(lambda: backend.buat_acak((dim, dim), tipe_data),
+                                              sinkronisasi=backend.sinkronisasi)
+                except MemoryError as e:
+                    print(f"Kesalahan memori saat membuat matriks {dim}x{dim}: {str(e)}")
+                    continue
+                del matriks
+                backend.bebaskan()
+                if waktu_acuan is None:
+                    waktu_acuan = statistik["median"]
+                print(f"{dim:<10} {tipe_data:<10} {backend.nama:<20} {statistik['median']:<15.6f} "
+                      f"{waktu_acuan / statistik['median']:<10.2f}x")
+                daftar_catatan.append({"backend": backend.nama, "dtype": tipe_data, "dim": dim,
+                                       "waktu_pembuatan": statistik["median"], "statistik_pembuatan": statistik})
+    return daftar_catatan
+
+
+# Fungsi untuk mengambil {dim: waktu} dari daftar catatan untuk satu tipe data
+def waktu_per_dimensi(daftar_catatan, kunci, tipe_data=TIPE_DATA_BAWAAN):
+    return {c["dim"]: c[kunci] for c in daftar_catatan if c["dtype"] == tipe_data}
+
+
+# Fungsi untuk menambahkan catatan satu backend ke penyimpanan hasil biner (penyimpanan_hasil.py)
+def simpan_hasil(backend, daftar_catatan, path=None, fase_perkalian="perkalian"):
+    tambah_catatan(daftar_catatan, path or PATH_HASIL, backend.info(), fase_perkalian)
+
+
+# Fungsi untuk mencetak ringkasan pembuatan dan perkalian
+def cetak_ringkasan(nama_backend, daftar_catatan):
+    print(f"\nRingkasan Pembuatan {nama_backend}:")
+    print("=" * 50)
+    print(f"{'Dimensi':<10} {'Tipe':<10} {'Waktu (detik)':<15}")
+    print("-" * 50)
+    for c in daftar_catatan:
+        print(f"{c['dim']:<10} {c['dtype']:<10} {c['waktu_pembuatan']:<15.6f}")
+
+    print(f"\nRingkasan Perkalian {nama_backend}:")
+    print("=" * 110)
+    print(f"{'Dimensi':<10} {'Tipe':<10} {'Jalur':<10} {'Median (detik)':<15} {'Min (detik)':<15} {'IQR (detik)':<15} {'GFLOP/s':<10} {'Verifikasi':<10}")
+    print("-" * 110)
+    for c in daftar_catatan:
+        statistik = c["statistik_perkalian"]
+        print(f"{c['dim']:<10} {c['dtype']:<10} {c['jalur']:<10} {statistik['median']:<15.6f} {statistik['min']:<15.6f} "
+              f"{statistik['iqr']:<15.6f} {c['gflops']:<10.2f} {format_verifikasi(c['terverifikasi']):<10}")
+
+
+# Fungsi untuk mencetak percepatan perkalian backend pembanding terhadap backend dasar
+def cetak_percepatan(catatan_dasar, catatan_pembanding, nama_dasar, nama_pembanding):
+    waktu_dasar = {(c["dtype"], c["dim"]): c["waktu_perkalian"] for c in catatan_dasar}
+    print(f"\nPercepatan Perkalian {nama_pembanding} terhadap {nama_dasar}:")
+    print("=" * 60)
+    print(f"{'Dimensi':<10} {'Tipe':<10} {'Waktu (detik)':<15} {'Percepatan':<10}")
+    print("-" * 60)
+    for c in catatan_pembanding:
+        waktu_serial = waktu_dasar.get((c["dtype"], c["dim"]), 0)
+        if c["waktu_perkalian"] > 0 and waktu_serial > 0:
+            print(f"{c['dim']:<10} {c['dtype']:<10} {c['waktu_perkalian']:<15.6f} {waktu_serial / c['waktu_perkalian']:<10.2f}x")
+        else:
+            print(f"{c['dim']:<10} {c['dtype']:<10} {c['waktu_perkalian']:<15.6f} {'N/A':<10}")
+
+
+# Fungsi untuk mencari titik potong per tipe data: dimensi terkecil di mana backend pembanding
+# lebih cepat dari backend dasar dan tetap lebih cepat untuk semua dimensi yang lebih besar
+def cari_titik_potong(catatan_dasar, catatan_pembanding):
+    waktu_dasar = {(c["dtype"], c["dim"]): c["waktu_perkalian"] for c in catatan_dasar}
+    titik_potong = {}
+    for tipe_data in dict.fromkeys(c["dtype"] for c in catatan_pembanding):
+        dimensi_menang = None
+        for c in sorted((c for c in catatan_pembanding if c["dtype"] == tipe_data), key=lambda c: c["dim"]):
+            waktu_serial = waktu_dasar.get((tipe_data, c["dim"]))
+            if waktu_serial is None:
+                continue
+            if c["waktu_perkalian"] < waktu_serial:
+                if dimensi_menang is None:
+                    dimensi_menang = c["dim"]
+            else:
+                dimensi_menang = None
+        titik_potong[tipe_data] = dimensi_menang
+    return titik_potong
+
+
+# Fungsi untuk mencetak titik potong backend pembanding terhadap backend dasar
+def cetak_titik_potong(catatan_dasar, catatan_pembanding, nama_dasar, nama_pembanding):
+    print(f"\nTitik Potong {nama_pembanding} terhadap {nama_dasar}:")
+    print("=" * 40)
+    print(f"{'Tipe':<10} {'Mulai menang pada dimensi':<30}")
+    print("-" * 40)
+    for tipe_data, dim in cari_titik_potong(catatan_dasar, catatan_pembanding).items():
+        print(f"{tipe_data:<10} {dim if dim is not None else 'tidak pernah':<30}")
+
+
+# Fungsi untuk mencetak posisi setiap (dimensi, tipe data) di roofline backend
+def cetak_roofline(nama_backend, daftar_catatan, hasil_kalibrasi):
+    print(f"\nRoofline {nama_backend}: puncak float32 {hasil_kalibrasi['puncak_gflops']['float32']:.1f} GFLOP/s, "
+          f"float64 {hasil_kalibrasi['puncak_gflops']['float64']:.1f} GFLOP/s, bandwidth {hasil_kalibrasi['bandwidth_gbs']:.1f} GB/s")
+    print("=" * 100)
+    print(f"{'Dimensi':<10} {'Tipe':<10} {'Jalur':<10} {'GFLOP/s':<10} {'Byte (MB)':<12} {'FLOP/byte':<10} {'Atap':<10} {'% Atap':<8} {'Terikat':<10}")
+    print("-" * 100)
+    for c in daftar_catatan:
+        posisi = posisi_roofline(c, hasil_kalibrasi)
+        print(f"{c['dim']:<10} {c['dtype']:<10} {c['jalur']:<10} {c['gflops']:<10.2f} {c['byte_dipindahkan'] / 1e6:<12.2f} "
+              f"{c['intensitas_aritmetika']:<10.2f} {posisi['atap_gflops']:<10.1f} {posisi['persen_atap']:<8.1f} {posisi['terikat']:<10}")
+
+
+# Fungsi untuk menggambar roofline (atap per tipe float) dengan titik setiap catatan
+def buat_plot_roofline(nama_backend, daftar_catatan, hasil_kalibrasi, path):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 8))
+    bandwidth = hasil_kalibrasi["bandwidth_gbs"]
+    intensitas = [c["intensitas_aritmetika"] for c in daftar_catatan] or [1.0]
+    sumbu_x = np.logspace(np.log10(min(intensitas) / 4), np.log10(max(intensitas) * 4), 200)
+    for tipe, puncak in hasil_kalibrasi["puncak_gflops"].items():
+        plt.plot(sumbu_x, [batas_roofline(i, puncak, bandwidth) for i in sumbu_x], '--', linewidth=2,
+                 label=f'Atap {tipe} ({puncak:.0f} GFLOP/s, {bandwidth:.0f} GB/s)')
+
+    for tipe_data in dict.fromkeys(c["dtype"] for c in daftar_catatan):
+        terpilih = [c for c in daftar_catatan if c["dtype"] == tipe_data]
+        plt.plot([c["intensitas_aritmetika"] for c in terpilih], [c["gflops"] for c in terpilih], 'o',
+                 label=f'{tipe_data} (atap {tipe_puncak(tipe_data, terpilih[0]["jalur"])})', markersize=8)
+        for c in terpilih:
+            plt.annotate(str(c["dim"]), (c["intensitas_aritmetika"], c["gflops"]), fontsize=7)
+
+    plt.title(f'Roofline Perkalian Matriks {nama_backend}', fontsize=14)
+    plt.xlabel('Intensitas Aritmetika (FLOP/byte)', fontsize=12)
+    plt.ylabel('GFLOP/s', fontsize=12)
+    plt.legend()
+    plt.grid(True)
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+    print(f"Plot roofline disimpan di '{path}'")
+
+
+# Fungsi untuk menampilkan roofline satu backend (kalibrasi dijalankan sekali lalu di-cache)
+# Plot hanya dibuat bila path_plot diberikan
+def laporkan_roofline(backend, daftar_catatan, path_plot=None):
+    if not daftar_catatan:
+        return
+    hasil_kalibrasi = dapatkan_kalibrasi(backend, path_kalibrasi(PATH_HASIL))
+    cetak_roofline(backend.nama, daftar_catatan, hasil_kalibrasi)
+    if path_plot is not None:
+        buat_plot_roofline(backend.nama, daftar_catatan, hasil_kalibrasi, path_plot)
+
+
+# Fungsi untuk membuat visualisasi waktu perkalian dan pembuatan per tipe data
+def buat_plot(nama_backend, daftar_catatan, path, tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 8))
+
+    # Plot waktu perkalian matriks
+    plt.subplot(2, 1, 1)
+    for tipe_data in tipe_data_diuji:
+        waktu_dict = waktu_per_dimensi(daftar_catatan, "waktu_perkalian", tipe_data)
+        dimensi_sorted = sorted(waktu_dict.keys())
+        plt.plot(dimensi_sorted, [waktu_dict[dim] for dim in dimensi_sorted], 'o-', label=tipe_data, linewidth=2, markersize=8)
+    plt.title(f'Performa Perkalian Matriks {nama_backend}', fontsize=14)
+    plt.xlabel('Dimensi Matriks', fontsize=12)
+    plt.ylabel('Waktu (detik)', fontsize=12)
+    plt.legend()
+    plt.grid(True)
+    plt.xscale('log', base=2)
+    plt.yscale('log')
+
+    # Plot waktu pembuatan matriks
+    plt.subplot(2, 1, 2)
+    for tipe_data in tipe_data_diuji:
+        waktu_dict = waktu_per_dimensi(daftar_catatan, "waktu_pembuatan", tipe_data)
+        dimensi_sorted = sorted(waktu_dict.keys())
+        plt.plot(dimensi_sorted, [waktu_dict[dim] for dim in dimensi_sorted], 'o-', label=tipe_data, linewidth=2, markersize=8)
+    plt.title(f'Performa Pembuatan Matriks {nama_backend}', fontsize=14)
+    plt.xlabel('Dimensi Matriks', fontsize=12)
+    plt.ylabel('Waktu (detik)', fontsize=12)
+    plt.legend()
+    plt.grid(True)
+    plt.xscale('log', base=2)
+    plt.yscale('log')
+
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+    print(f"Visualisasi performa disimpan di '{path}'")
+
+
+# Fungsi untuk mencetak ringkasan, roofline dan (bila plot=True) plot satu sapuan; matplotlib hanya diimpor saat plot
+def laporkan_sapuan(backend, daftar_catatan, tipe_data_diuji, folder, plot=True):
+    cetak_ringkasan(backend.nama, daftar_catatan)
+    if plot:
+        buat_plot(backend.nama, daftar_catatan, os.path.join(folder, f"performa_matriks_{backend.nama}.png"), tipe_data_diuji)
+    laporkan_roofline(backend, daftar_catatan, os.path.join(folder, f"roofline_{backend.nama}.png") if plot else None)
+
+
+# Fungsi untuk menjalankan benchmark lengkap (sapuan, penyimpanan hasil, ringkasan, plot) untuk satu backend
+def jalankan_dan_simpan(backend, dimensi=DIMENSI_BAWAAN, tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN, folder=FOLDER_HASIL,
+                        plot=True):
+    daftar_catatan = jalankan_benchmark(backend, dimensi, tipe_data_diuji, folder)
+    laporkan_sapuan(backend, daftar_catatan, tipe_data_diuji, folder, plot)
+    return daftar_catatan
+
+
+# Fungsi untuk menjalankan sapuan adaptif lengkap (penyimpanan hasil, ringkasan, plot) untuk satu backend
+def jalankan_dan_simpan_adaptif(backend, anggaran_waktu, anggaran_memori=None, tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN,
+                                waktu_acuan=None, folder=FOLDER_HASIL, plot=True):
+    daftar_catatan = jalankan_benchmark_adaptif(backend, anggaran_waktu, anggaran_memori, tipe_data_diuji,
+                                                waktu_acuan, folder)
+    laporkan_sapuan(backend, daftar_catatan, tipe_data_diuji, folder, plot)
+    return daftar_catatan
+
+
+# Fungsi untuk menjalankan mode batch lengkap (sapuan, ringkasan, penyimpanan hasil) untuk satu backend
+def jalankan_dan_simpan_batch(backend, dimensi=None, ukuran_batch_diuji=None, jumlah_matriks=None,
+                              tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN, folder=FOLDER_HASIL, plot=True):
+    daftar_catatan = jalankan_benchmark_batch(backend, dimensi, ukuran_batch_diuji, jumlah_matriks, tipe_data_diuji, folder)
+    if daftar_catatan:
+        cetak_ringkasan_batch(backend.nama, daftar_catatan)
+        simpan_hasil(backend, daftar_catatan, fase_perkalian="perkalian_batch")
+        laporkan_roofline(backend, daftar_catatan,
+                          os.path.join(folder, f"roofline_batch_{backend.nama}.png") if plot else None)
+    return daftar_catatan
+
+
+# Fungsi untuk menjalankan sapuan bentuk persegi panjang lengkap (ringkasan, penyimpanan hasil) untuk satu backend
+def jalankan_dan_simpan_bentuk(backend, daftar_bentuk=BENTUK_BAWAAN, tipe_data_diuji=TIPE_DATA_DIUJI_BAWAAN):
+    daftar_catatan = jalankan_benchmark_bentuk(backend, daftar_bentuk, tipe_data_diuji)
+    if daftar_catatan:
+        cetak_ringkasan_bentuk(backend.nama, daftar_catatan)
+        simpan_hasil(backend, daftar_catatan, fase_perkalian="perkalian_bentuk")
+    return daftar_catatan
+
+
+# Fungsi untuk memproses opsi --resume [id_run] dari argumen baris perintah (melanjutkan run bila diminta)
+# Mengembalikan argumen sisanya
+def proses_argumen_lanjutkan(argumen):
+    if "--resume" not in argumen:
+        return argumen
+    i = argumen.index("--resume")
+    berikutnya = argumen[i + 1] if i + 1 < len(argumen) else None
+    id_run = berikutnya if berikutnya and not berikutnya.startswith("-") and berikutnya not in DAFTAR_BACKEND else None
+    lanjutkan_run(id_run)
+    return argumen[:i] + argumen[i + 1 + (id_run is not None):]
+
+
+if __name__ == "__main__":
+    # Backend dipilih lewat argumen, misalnya: python benchmark.py numpy cupy referensi
+    # --resume [id_run] melanjutkan run yang terputus (tanpa id_run: run terbaru)
+    nama_backend_diuji = proses_argumen_lanjutkan(sys.argv[1:]) or list(DAFTAR_BACKEND)
+
+    for nama_backend in nama_backend_diuji:
+        backend = dapatkan_backend(nama_backend)
+        if backend is None:
+            continue
+        print("\n--- Informasi Backend ---")
+        print(backend.info())
+        print(f"Total Memori: {backend.memori_total() / (1024**3):.2f} GB")
+        print(f"Memori Tersedia: {backend.memori_tersedia() / (1024**3):.2f} GB")
+        jalankan_dan_simpan(backend)
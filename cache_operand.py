@@ -0,0 +1,119 @@
+import os
+import json
+import hashlib
+import numpy as np
+from tipe_data import TIPE_DATA, NILAI_MIN, NILAI_MAKS
+from pembangkit_acak import BIT_GENERATOR_BAWAAN, UKURAN_POTONGAN, isi_acak_paralel
+
+# Folder cache operand bersama untuk semua run dan semua backend
+FOLDER_CACHE = os.path.join("matrix_results", "cache_operand")
+
+# Batas ukuran cache; entri yang paling lama tidak dipakai dihapus lebih dulu (LRU)
+BATAS_BYTE_BAWAAN = 8 * 1024**3
+
+# Distribusi operand yang dikenal: bilangan bulat seragam NILAI_MIN..NILAI_MAKS-1 (sama dengan tipe_data.buat_matriks_acak)
+DISTRIBUSI = {"seragam": (NILAI_MIN, NILAI_MAKS)}
+DISTRIBUSI_BAWAAN = "seragam"
+
+
+# Kunci isi operand: hash dari semua yang menentukan nilainya, termasuk cara pembangkitannya
+# (bit generator dan ukuran potongan substream), sehingga perubahan pembangkit tidak memakai entri lama
+def kunci_operand(seed, bentuk, tipe_data, indeks, distribusi=DISTRIBUSI_BAWAAN):
+    parameter = {
+        "seed": seed,
+        "bentuk": list(bentuk),
+        "dtype": np.dtype(TIPE_DATA[tipe_data]).name,
+        "indeks": indeks,
+        "distribusi": distribusi,
+        "rentang": DISTRIBUSI[distribusi],
+        "bit_generator": BIT_GENERATOR_BAWAAN,
+        "ukuran_potongan": UKURAN_POTONGAN,
+    }
+    return hashlib.sha256(json.dumps(parameter, sort_keys=True).encode()).hexdigest()[:32], parameter
+
+
+# Cache operand di disk berdasarkan isi: (seed, bentuk, tipe data, indeks operand, distribusi) -> file .npy.
+# Operand dibangkitkan sekali dengan pembangkit_acak langsung ke file memmap, lalu setiap pemakaian
+# (run berikutnya, backend lain) memuatnya tanpa salinan lewat np.load(mmap_mode="r").
+# Waktu modifikasi file diperbarui setiap kali dipakai dan menjadi urutan LRU saat cache melebihi batas_byte.
+class CacheOperand:
+    def __init__(self, seed=0, batas_byte=BATAS_BYTE_BAWAAN, folder=FOLDER_CACHE, distribusi=DISTRIBUSI_BAWAAN):
+        if distribusi not in DISTRIBUSI:
+            raise ValueError(f"Distribusi '{distribusi}' tidak dikenal. Pilihan: {', '.join(DISTRIBUSI)}")
+        self.seed = seed
+        self.batas_byte = batas_byte
+        self.folder = folder
+        self.distribusi = distribusi
+        self.jumlah_hit = 0
+        self.jumlah_miss = 0
+
+    def _path(self, kunci):
+        return os.path.join(self.folder, f"{kunci}.npy")
+
+    # Daftar (waktu pakai terakhir, ukuran, path) semua entri, yang paling lama dipakai lebih dulu
+    def entri(self):
+        if not os.path.isdir(self.folder):
+            return []
+        daftar = []
+        for nama in os.listdir(self.folder):
+            if nama.endswith(".npy"):
+                status = os.stat(os.path.join(self.folder, nama))
+                daftar.append((status.st_mtime, status.st_size, os.path.join(self.folder, nama)))
+        return sorted(daftar)
+
+    def ukuran(self):
+        return sum(ukuran for _, ukuran, _ in self.entri())
+
+    # Fungsi untuk menghapus entri paling lama tidak dipakai sampai byte_baru masih muat di batas
+    def _usir(self, byte_baru):
+        daftar = self.entri()
+        total = sum(ukuran for _, ukuran, _ in daftar)
+        for _, ukuran, path in daftar:
+            if total + byte_baru <= self.batas_byte:
+                break
+            os.remove(path)
+            path_meta = path[:-len(".npy")] + ".json"
+            if os.path.exists(path_meta):
+                os.remove(path_meta)
+            total -= ukuran
+            print(f"Cache operand: {os.path.basename(path)} ({ukuran / (1024**2):.1f} MB) diusir (LRU)")
+
+    def _bangkitkan(self, path, parameter, bentuk, dtype):
+        path_sementara = f"{path}.{os.getpid()}.tmp"
+        matriks = np.lib.format.open_memmap(path_sementara, mode="w+", dtype=dtype, shape=tuple(bentuk))
+        isi_acak_paralel(matriks, np.random.SeedSequence([self.seed, parameter["indeks"]]))
+        matriks.flush()
+        del matriks
+        with open(path[:-len(".npy")] + ".json", "w") as f:
+            json.dump(parameter, f)
+        # Penulis lain yang membangkitkan entri yang sama menghasilkan isi yang identik, jadi aman saling menimpa
+        os.replace(path_sementara, path)
+
+    # Fungsi untuk memastikan operand ke-indeks (0 untuk A, 1 untuk B, ...) ada di cache dan mengembalikan path-nya
+    # Mengembalikan None bila operand lebih besar dari batas cache (pemanggil membangkitkannya sendiri)
+    def path_operand(self, bentuk, tipe_data, indeks):
+        kunci, parameter = kunci_operand(self.seed, bentuk, tipe_data, indeks, self.distribusi)
+        path = self._path(kunci)
+        if os.path.exists(path):
+            self.jumlah_hit += 1
+            os.utime(path)
+            return path
+
+        dtype = np.dtype(TIPE_DATA[tipe_data])
+        byte_operand = int(np.prod(bentuk)) * dtype.itemsize
+        if byte_operand > self.batas_byte:
+            return None
+        self.jumlah_miss += 1
+        os.makedirs(self.folder, exist_ok=True)
+        self._usir(byte_operand)
+        self._bangkitkan(path, parameter, bentuk, dtype)
+        return path
+
+    # Fungsi untuk mengambil operand sebagai memmap hanya-baca (tanpa salinan), None bila melebihi batas cache
+    def ambil(self, bentuk, tipe_data, indeks):
+        path = self.path_operand(bentuk, tipe_data, indeks)
+        return None if path is None else np.load(path, mmap_mode="r")
+
+    def info(self):
+        return (f"cache operand {self.folder}: {len(self.entri())} entri, {self.ukuran() / (1024**3):.2f} / "
+                f"{self.batas_byte / (1024**3):.2f} GB, {self.jumlah_hit} hit, {self.jumlah_miss} miss")
@@ -0,0 +1,104 @@
+import os
+import json
+import shutil
+import numpy as np
+
+# Operand baru di-checkpoint mulai dimensi ini; di bawahnya membuat ulang lebih murah daripada menulis ke disk
+DIM_MINIMUM_CHECKPOINT = 4096
+
+# Sel yang sudah terputus sebanyak ini (misalnya dibunuh OOM killer) tidak dicoba lagi saat run dilanjutkan
+BATAS_PERCOBAAN_SEL = 2
+
+# Jumlah baris per potongan saat menyalin operand ke file, agar salinan NumPy dari GPU tidak sebesar matriks penuh
+BARIS_PER_POTONGAN = 1024
+
+PENANDA_PERCOBAAN = "percobaan"
+PENANDA_OPERAND = "operand.json"
+
+
+# Folder checkpoint satu sel (run, backend, tipe data, dimensi)
+def folder_sel(folder_checkpoint, id_run, nama_backend, tipe_data, dim):
+    return os.path.join(folder_checkpoint, id_run, f"{nama_backend}_{tipe_data}_{dim}x{dim}")
+
+
+# Fungsi untuk menandai sel mulai dikerjakan; mengembalikan nomor percobaan (1 untuk sel baru)
+# Penanda tetap ada bila proses mati di tengah sel, sehingga run yang dilanjutkan tahu sel ini pernah terputus
+def mulai_sel(folder):
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, PENANDA_PERCOBAAN)
+    percobaan = 1
+    if os.path.exists(path):
+        with open(path) as f:
+            percobaan = int(f.read() or 0) + 1
+    with open(path, "w") as f:
+        f.write(str(percobaan))
+        f.flush()
+        os.fsync(f.fileno())
+    return percobaan
+
+
+# Fungsi untuk menghapus penanda dan operand checkpoint setelah hasil sel tersimpan
+def selesaikan_sel(folder):
+    shutil.rmtree(folder, ignore_errors=True)
+    try:
+        os.rmdir(os.path.dirname(folder))  # Folder run dihapus bila sudah kosong
+    except OSError:
+        pass
+
+
+def _tulis_json_atomik(path, data):
+    with open(path + ".tmp", "w") as f:
+        json.dump(data, f, default=float)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+
+# Fungsi untuk mencatat bahwa operand sel sudah lengkap di disk beserta statistik pembuatannya.
+# format "npy" untuk salinan dari simpan_operand, "dat" untuk file memmap mentah mode blok (a.dat, b.dat)
+def tandai_operand(folder, format_file, dim, dtype, statistik_a, statistik_b):
+    _tulis_json_atomik(os.path.join(folder, PENANDA_OPERAND), {
+        "format": format_file,
+        "dim": dim,
+        "dtype": np.dtype(dtype).name,
+        "statistik_a": statistik_a,
+        "statistik_b": statistik_b,
+    })
+
+
+# Fungsi untuk menyalin operand A dan B ke file .npy per potongan baris, lalu menandainya lengkap
+# ke_numpy dipakai untuk memindahkan potongan dari perangkat (misalnya GPU) ke host
+def simpan_operand(folder, matriks_a, matriks_b, statistik_a, statistik_b, ke_numpy=np.asarray):
+    os.makedirs(folder, exist_ok=True)
+    for nama, matriks in (("a", matriks_a), ("b", matriks_b)):
+        path = os.path.join(folder, f"{nama}.npy")
+        salinan = np.lib.format.open_memmap(path + ".tmp", mode="w+", dtype=matriks.dtype, shape=matriks.shape)
+        for i in range(0, matriks.shape[0], BARIS_PER_POTONGAN):
+            salinan[i:i + BARIS_PER_POTONGAN] = ke_numpy(matriks[i:i + BARIS_PER_POTONGAN])
+        salinan.flush()
+        del salinan
+        os.replace(path + ".tmp", path)
+    tandai_operand(folder, "npy", matriks_a.shape[0], matriks_a.dtype, statistik_a, statistik_b)
+    print(f"Operand {matriks_a.shape[0]}x{matriks_a.shape[1]} di-checkpoint ke {folder}")
+
+
+# Fungsi untuk memuat operand checkpoint sebagai memmap (tanpa membaca seluruh file)
+# Mengembalikan (matriks_a, matriks_b, statistik_a, statistik_b), atau None bila belum ada checkpoint lengkap
+def muat_operand(folder):
+    path_penanda = os.path.join(folder, PENANDA_OPERAND)
+    if not os.path.exists(path_penanda):
+        return None
+    with open(path_penanda) as f:
+        penanda = json.load(f)
+    try:
+        if penanda["format"] == "npy":
+            daftar = [np.load(os.path.join(folder, f"{nama}.npy"), mmap_mode="r") for nama in ("a", "b")]
+        else:
+            bentuk = (penanda["dim"], penanda["dim"])
+            daftar = [np.memmap(os.path.join(folder, f"{nama}.dat"), dtype=penanda["dtype"], mode="r", shape=bentuk)
+                      for nama in ("a", "b")]
+    except (OSError, ValueError) as e:
+        print(f"Checkpoint operand di {folder} rusak, operand dibuat ulang: {str(e)}")
+        return None
+    print(f"Memakai operand checkpoint dari {folder}")
+    return daftar[0], daftar[1], penanda["statistik_a"], penanda["statistik_b"]
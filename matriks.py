@@ -0,0 +1,421 @@
+import sys
+import argparse
+
+# Entry point baris perintah suite benchmark:
+#
+#     python -m matriks run numpy cupy --dimensi 512 1024 --tipe float32 int8
+#     python -m matriks run numpy --adaptif 600 --resume
+#     python -m matriks run numpy --dimensi 256 --bentuk 4096x64x4096 64x4096x64 --rantai 2048x32x2048x32x2048
+#     python -m matriks compare --dasar numpy --pembanding cupy --plot
+#     python -m matriks compare --pasangan numpy:cupy numpy:numpy-strassen --riwayat numpy --plot
+#     python -m matriks report --plot
+#     python -m matriks skala --thread 1 2 4 8 --afinitas kompak tersebar --plot
+#     python -m matriks sparse --dimensi 1024 4096 --kepadatan 0.001 0.01 0.1 --plot
+#     python -m matriks terdistribusi --worker 1 2 4 8 --dimensi 2048 4096
+#     python -m matriks baseline && python -m matriks check numpy --dimensi 512 1024 2048
+#
+# Modul berat (NumPy, psutil, backend, matplotlib) baru diimpor di dalam subperintah yang membutuhkannya,
+# backend hanya dibuat untuk nama yang diminta, dan matplotlib tidak pernah diimpor tanpa --plot.
+
+# Lokasi bawaan, ditulis langsung agar --help tidak perlu mengimpor modul benchmark (harus sama dengan
+# benchmark.FOLDER_HASIL, penyimpanan_hasil.PATH_PENYIMPANAN dan regresi.PATH_BASELINE)
+FOLDER_BAWAAN = "matrix_results"
+PATH_HASIL_BAWAAN = f"{FOLDER_BAWAAN}/hasil_benchmark.npz"
+PATH_BASELINE_BAWAAN = f"{FOLDER_BAWAAN}/baseline.npz"
+
+
+# Fungsi untuk mengurai --opsi menjadi daftar (backend atau None, kunci, nilai); nilai angka diubah ke int/float.
+# "backend:kunci=nilai" hanya untuk backend itu, "kunci=nilai" untuk setiap backend yang menerima kunci tersebut
+def _urai_opsi(daftar_opsi):
+    hasil = []
+    for teks in daftar_opsi or []:
+        kiri, sama_dengan, nilai = teks.partition("=")
+        nama_backend, _, kunci = kiri.rpartition(":")
+        if not sama_dengan or not kunci:
+            raise ValueError(f"opsi tidak valid: {teks} (format: KUNCI=NILAI atau BACKEND:KUNCI=NILAI)")
+        for konversi in (int, float):
+            try:
+                nilai = konversi(nilai)
+                break
+            except ValueError:
+                pass
+        hasil.append((nama_backend or None, kunci, nilai))
+    return hasil
+
+
+# Nama argumen __init__ kelas backend (tanpa self); kosong untuk backend tanpa opsi
+def _kunci_diterima(kelas):
+    import inspect
+    if kelas.__init__ is object.__init__:
+        return set()
+    return set(inspect.signature(kelas.__init__).parameters) - {"self"}
+
+
+# Fungsi untuk memeriksa --opsi terhadap backend yang diminta; mengembalikan pesan kesalahan atau None
+def _periksa_opsi(daftar_opsi, daftar_backend):
+    from backend import DAFTAR_BACKEND
+
+    try:
+        daftar = _urai_opsi(daftar_opsi)
+    except ValueError as e:
+        return str(e)
+    diminta = [nama for nama in daftar_backend if nama in DAFTAR_BACKEND]
+    for nama_backend, kunci, _ in daftar:
+        if nama_backend is not None:
+            if nama_backend not in DAFTAR_BACKEND:
+                return f"opsi {nama_backend}:{kunci}: backend '{nama_backend}' tidak dikenal"
+            if kunci not in _kunci_diterima(DAFTAR_BACKEND[nama_backend]):
+                diterima = ", ".join(sorted(_kunci_diterima(DAFTAR_BACKEND[nama_backend]))) or "tidak ada"
+                return f"opsi {nama_backend}:{kunci}: backend '{nama_backend}' tidak menerima '{kunci}' (diterima: {diterima})"
+        elif diminta and not any(kunci in _kunci_diterima(DAFTAR_BACKEND[nama]) for nama in diminta):
+            return f"opsi {kunci}: tidak diterima oleh backend {', '.join(diminta)}"
+    return None
+
+
+# Fungsi untuk mengambil opsi satu backend dari --opsi: hanya kunci yang diterima __init__ backend itu
+def _opsi_backend(daftar_opsi, nama_backend):
+    from backend import DAFTAR_BACKEND
+
+    kelas = DAFTAR_BACKEND.get(nama_backend)
+    if kelas is None:
+        return {}
+    diterima = _kunci_diterima(kelas)
+    return {kunci: nilai for nama, kunci, nilai in _urai_opsi(daftar_opsi)
+            if (nama is None or nama == nama_backend) and kunci in diterima}
+
+
+# Fungsi untuk memeriksa nama tipe data (--tipe) sebelum benchmark berjalan; mengembalikan pesan kesalahan atau None
+def _periksa_tipe(daftar_tipe):
+    from tipe_data import TIPE_DATA
+
+    for tipe_data in daftar_tipe:
+        if tipe_data not in TIPE_DATA:
+            return f"tipe data tidak dikenal: {tipe_data} (pilihan: {', '.join(TIPE_DATA)})"
+    return None
+
+
+# Fungsi untuk mengubah "MxKxN" (atau "P0xP1x...") menjadi tuple int, untuk argparse
+def _bentuk(teks):
+    try:
+        return tuple(int(x) for x in teks.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bentuk tidak valid: {teks} (contoh: 4096x64x4096)")
+
+
+def perintah_run(argumen):
+    import benchmark
+    from backend import dapatkan_backend
+
+    benchmark.PATH_HASIL = argumen.path
+    if argumen.resume is not None:
+        benchmark.lanjutkan_run(argumen.resume or None)
+    benchmark.CHECKPOINT_OPERAND = argumen.checkpoint
+    benchmark.MODE_PIPELINE = argumen.pipeline
+    benchmark.LACAK_ALOKASI = argumen.lacak_alokasi
+    if argumen.cache_operand is not None:
+        from cache_operand import CacheOperand
+        benchmark.CACHE_OPERAND = CacheOperand(argumen.cache_operand, argumen.batas_cache * (1024**3))
+
+    tipe_data_diuji = argumen.tipe or benchmark.TIPE_DATA_DIUJI_BAWAAN
+    anggaran_memori = None if argumen.anggaran_memori is None else argumen.anggaran_memori * (1024**3)
+    for nama_backend in argumen.backend:
+        backend = dapatkan_backend(nama_backend, **_opsi_backend(argumen.opsi, nama_backend))
+        if backend is None:
+            continue
+        print(f"\n--- Informasi Backend ---\n{backend.info()}")
+        if argumen.adaptif is not None:
+            benchmark.jalankan_dan_simpan_adaptif(backend, argumen.adaptif, anggaran_memori, tipe_data_diuji,
+                                                  folder=argumen.folder, plot=argumen.plot)
+        else:
+            benchmark.jalankan_dan_simpan(backend, argumen.dimensi or benchmark.DIMENSI_BAWAAN, tipe_data_diuji,
+                                          argumen.folder, argumen.plot)
+        if argumen.batch and backend.mendukung_batch:
+            benchmark.jalankan_dan_simpan_batch(backend, tipe_data_diuji=tipe_data_diuji, folder=argumen.folder,
+                                                plot=argumen.plot)
+        if argumen.bentuk is not None:
+            benchmark.jalankan_dan_simpan_bentuk(backend, argumen.bentuk or benchmark.BENTUK_BAWAAN, tipe_data_diuji)
+        if argumen.rantai is not None:
+            import perkalian_rantai
+            catatan_rantai = perkalian_rantai.jalankan_benchmark_rantai(
+                backend, argumen.rantai or perkalian_rantai.RANTAI_BAWAAN, argumen.tipe or ["float64"])
+            perkalian_rantai.cetak_ringkasan_rantai(backend.nama, catatan_rantai)
+    if benchmark.CACHE_OPERAND is not None:
+        print(benchmark.CACHE_OPERAND.info())
+    return 0
+
+
+# Tanpa --pasangan/--riwayat: perbandingan run terbaru --dasar dan --pembanding seperti perbandingan.py.
+# Dengan --pasangan/--riwayat: tabel percepatan banyak pasangan dan riwayat antar-run dari seluruh penyimpanan
+def perintah_compare(argumen):
+    from perbandingan import bandingkan, laporan_perbandingan
+
+    if argumen.pasangan or argumen.riwayat:
+        pasangan = []
+        for teks in argumen.pasangan or []:
+            dasar, _, pembanding = teks.partition(":")
+            if not pembanding:
+                print(f"Pasangan '{teks}' tidak valid, gunakan format DASAR:PEMBANDING")
+                return 2
+            pasangan.append((dasar, pembanding))
+        ada = laporan_perbandingan(pasangan, argumen.riwayat or [], argumen.tipe, argumen.fase, argumen.path,
+                                   argumen.plot, argumen.folder, argumen.mode)
+        return 0 if ada else 1
+
+    lengkap = bandingkan(argumen.dasar, argumen.pembanding, argumen.tipe, argumen.path, argumen.plot, argumen.folder,
+                         argumen.mode)
+    return 0 if any(lengkap.values()) else 1
+
+
+# Jalankan run baru (atau ambil run tersimpan dengan --run) dan periksa terhadap baseline host ini.
+# Kode keluar: 0 tanpa regresi, 1 ada regresi signifikan, 2 tidak ada titik yang bisa diperiksa
+def perintah_check(argumen):
+    from regresi import periksa_regresi, cetak_hasil_regresi, ada_regresi, tetapkan_baseline
+
+    id_run = argumen.run
+    if id_run is None:
+        import benchmark
+        from backend import dapatkan_backend
+        from penyimpanan_hasil import id_run_sekarang
+
+        benchmark.PATH_HASIL = argumen.path
+        for nama_backend in argumen.backend or ["numpy"]:
+            backend = dapatkan_backend(nama_backend, **_opsi_backend(argumen.opsi, nama_backend))
+            if backend is not None:
+                benchmark.jalankan_dan_simpan(backend, argumen.dimensi or benchmark.DIMENSI_BAWAAN,
+                                              argumen.tipe or benchmark.TIPE_DATA_DIUJI_BAWAAN, argumen.folder, False)
+        id_run = id_run_sekarang()
+
+    hasil = periksa_regresi(id_run, argumen.backend, argumen.path, argumen.baseline, ambang=argumen.ambang,
+                            alfa=argumen.alfa, fase=argumen.fase)
+    if not hasil:
+        print(f"Tidak ada titik yang bisa diperiksa di run {id_run}.")
+        return 2
+    cetak_hasil_regresi(hasil, argumen.ambang, argumen.alfa)
+    if ada_regresi(hasil):
+        return 1
+    if argumen.perbarui_baseline:
+        tetapkan_baseline(id_run, argumen.backend, argumen.path, argumen.baseline, fase=argumen.fase)
+    return 0
+
+
+def perintah_skala(argumen):
+    import os
+    import studi_skala
+
+    daftar_catatan = studi_skala.jalankan_studi_skala(argumen.dimensi or studi_skala.DIMENSI_STUDI_BAWAAN,
+                                                      argumen.tipe, argumen.thread, argumen.afinitas)
+    if not daftar_catatan:
+        return 1
+    studi_skala.cetak_studi_skala(daftar_catatan, argumen.ambang)
+    studi_skala.simpan_studi_skala(daftar_catatan)
+    if argumen.plot:
+        os.makedirs(argumen.folder, exist_ok=True)
+        for tipe_data in argumen.tipe:
+            studi_skala.buat_plot_studi_skala(daftar_catatan, tipe_data,
+                                              os.path.join(argumen.folder, f"studi_skala_{tipe_data}.png"))
+    return 0
+
+
+def perintah_sparse(argumen):
+    import os
+    import perkalian_sparse
+
+    daftar_catatan = perkalian_sparse.jalankan_sapuan_kepadatan(
+        argumen.dimensi or perkalian_sparse.DIMENSI_SAPUAN_BAWAAN,
+        argumen.kepadatan or perkalian_sparse.KEPADATAN_SAPUAN_BAWAAN, argumen.tipe, argumen.format, argumen.seed)
+    if not daftar_catatan:
+        return 1
+    perkalian_sparse.cetak_sapuan_kepadatan(daftar_catatan)
+    if argumen.plot:
+        os.makedirs(argumen.folder, exist_ok=True)
+        for tipe_data in argumen.tipe:
+            perkalian_sparse.buat_plot_kepadatan(daftar_catatan, tipe_data,
+                                                 os.path.join(argumen.folder, f"sapuan_kepadatan_{tipe_data}.png"))
+    return 0
+
+
+def perintah_terdistribusi(argumen):
+    import perkalian_terdistribusi
+
+    daftar_catatan = perkalian_terdistribusi.jalankan_studi_terdistribusi(argumen.dimensi, argumen.worker, argumen.tipe,
+                                                                         argumen.panel)
+    if not daftar_catatan:
+        return 1
+    perkalian_terdistribusi.cetak_studi_terdistribusi(daftar_catatan)
+    return 0
+
+
+def perintah_baseline(argumen):
+    from regresi import tetapkan_baseline
+
+    jumlah = tetapkan_baseline(argumen.run, argumen.backend, argumen.path, argumen.baseline, argumen.fase)
+    return 0 if jumlah else 1
+
+
+# Laporan dari penyimpanan hasil tanpa menjalankan benchmark: ringkasan dan roofline (bila kalibrasinya
+# sudah tersimpan) per backend dari satu run, plus plot bila diminta
+def perintah_report(argumen):
+    import os
+    from penyimpanan_hasil import muat_hasil, pilih, id_run_terbaru, catatan_tersimpan, cetak_ringkasan_penyimpanan
+    from roofline import kalibrasi_tersimpan, path_kalibrasi
+    import benchmark
+
+    cetak_ringkasan_penyimpanan(argumen.path)
+    baris, _ = muat_hasil(argumen.path)
+    id_run = argumen.run or id_run_terbaru(baris)
+    if id_run is None:
+        print("Penyimpanan hasil masih kosong.")
+        return 1
+    baris = pilih(baris, id_run=id_run)
+    print(f"\nLaporan run {id_run}")
+    for nama_backend in argumen.backend or list(dict.fromkeys(baris["backend"])):
+        daftar_catatan = catatan_tersimpan(id_run, nama_backend, argumen.path)
+        if not daftar_catatan:
+            print(f"Tidak ada hasil {nama_backend} di run {id_run}.")
+            continue
+        benchmark.cetak_ringkasan(nama_backend, daftar_catatan)
+        baris_backend = pilih(baris, backend=nama_backend)
+        hasil_kalibrasi = kalibrasi_tersimpan(baris_backend["info_backend"][0], baris_backend["hostname"][0],
+                                              path_kalibrasi(argumen.path))
+        if hasil_kalibrasi is not None:
+            benchmark.cetak_roofline(nama_backend, daftar_catatan, hasil_kalibrasi)
+        if argumen.plot:
+            os.makedirs(argumen.folder, exist_ok=True)
+            tipe_data_diuji = list(dict.fromkeys(c["dtype"] for c in daftar_catatan))
+            benchmark.buat_plot(nama_backend, daftar_catatan,
+                                os.path.join(argumen.folder, f"performa_matriks_{nama_backend}.png"), tipe_data_diuji)
+            if hasil_kalibrasi is not None:
+                benchmark.buat_plot_roofline(nama_backend, daftar_catatan, hasil_kalibrasi,
+                                             os.path.join(argumen.folder, f"roofline_{nama_backend}.png"))
+    return 0
+
+
+def buat_parser():
+    parser = argparse.ArgumentParser(prog="python -m matriks", description="Benchmark perkalian matriks NumPy/CuPy")
+    subparser = parser.add_subparsers(dest="perintah", required=True)
+
+    run = subparser.add_parser("run", help="jalankan benchmark dan simpan hasilnya")
+    run.add_argument("backend", nargs="*", default=["numpy"], help="nama backend (bawaan: numpy)")
+    run.add_argument("--dimensi", type=int, nargs="+", help="dimensi yang diuji (bawaan: 8..4096)")
+    run.add_argument("--tipe", nargs="+", help="tipe data yang diuji (bawaan: semua)")
+    run.add_argument("--opsi", action="append", metavar="[BACKEND:]KUNCI=NILAI",
+                     help="opsi backend, misalnya jumlah_worker=4 atau numpy-strassen:ukuran_cutoff=256; "
+                          "tanpa BACKEND: hanya diberikan ke backend yang menerima kunci itu")
+    run.add_argument("--adaptif", type=float, metavar="DETIK", help="sapuan adaptif dengan anggaran waktu ini")
+    run.add_argument("--anggaran-memori", type=float, metavar="GB", help="anggaran memori sapuan adaptif")
+    run.add_argument("--batch", action="store_true", help="jalankan juga mode batch")
+    run.add_argument("--bentuk", type=_bentuk, nargs="*", metavar="MxKxN",
+                     help="jalankan juga sapuan bentuk persegi panjang A (m x k) @ B (k x n) (tanpa nilai: bawaan)")
+    run.add_argument("--rantai", type=_bentuk, nargs="*", metavar="P0xP1x...",
+                     help="jalankan juga perkalian rantai urutan optimal vs kiri-ke-kanan (tanpa nilai: bawaan)")
+    run.add_argument("--resume", nargs="?", const="", metavar="ID_RUN",
+                     help="lanjutkan run yang terputus (tanpa ID: run terbaru)")
+    run.add_argument("--pipeline", action="store_true",
+                     help="buat operand dan simpan hasil di thread lain selama perkalian (sapuan tetap)")
+    run.add_argument("--checkpoint", action="store_true", help="checkpoint operand besar ke disk")
+    run.add_argument("--lacak-alokasi", action="store_true", help="lacak alokasi lewat tracemalloc di profil memori")
+    run.add_argument("--cache-operand", type=int, metavar="SEED", help="pakai cache operand dengan seed ini")
+    run.add_argument("--batas-cache", type=float, default=8, metavar="GB", help="batas ukuran cache operand")
+    run.add_argument("--plot", action="store_true", help="buat plot (mengimpor matplotlib)")
+    run.add_argument("--folder", default=FOLDER_BAWAAN, help="folder plot dan file memmap")
+    run.add_argument("--path", default=PATH_HASIL_BAWAAN,
+                     help="file penyimpanan hasil (kalibrasi roofline disimpan di folder yang sama)")
+    run.set_defaults(fungsi=perintah_run)
+
+    compare = subparser.add_parser("compare", help="bandingkan backend dan riwayat run")
+    compare.add_argument("--dasar", default="numpy")
+    compare.add_argument("--pembanding", default="cupy")
+    compare.add_argument("--tipe", default="int64")
+    compare.add_argument("--pasangan", nargs="+", metavar="DASAR:PEMBANDING",
+                         help="tabel percepatan untuk banyak pasangan backend sekaligus")
+    compare.add_argument("--riwayat", nargs="+", metavar="BACKEND", help="riwayat waktu backend ini atas semua run")
+    compare.add_argument("--fase", default="perkalian", choices=["pembuatan", "muat_cache", "perkalian"],
+                         help="fase untuk --pasangan/--riwayat")
+    compare.add_argument("--mode", default="berurutan", choices=["berurutan", "pipeline"],
+                         help="mode sapuan yang dibandingkan (run --pipeline menyimpan mode pipeline)")
+    compare.add_argument("--path", default=PATH_HASIL_BAWAAN, help="file penyimpanan hasil")
+    compare.add_argument("--plot", action="store_true", help="buat plot (mengimpor matplotlib)")
+    compare.add_argument("--folder", default=FOLDER_BAWAAN, help="folder plot")
+    compare.set_defaults(fungsi=perintah_compare)
+
+    check = subparser.add_parser("check", help="jalankan run baru dan periksa regresi terhadap baseline")
+    check.add_argument("backend", nargs="*", help="nama backend (bawaan: numpy)")
+    check.add_argument("--dimensi", type=int, nargs="+", help="dimensi yang diuji (bawaan: 8..4096)")
+    check.add_argument("--tipe", nargs="+", help="tipe data yang diuji (bawaan: semua)")
+    check.add_argument("--opsi", action="append", metavar="[BACKEND:]KUNCI=NILAI", help="opsi backend (lihat run)")
+    check.add_argument("--run", help="periksa run tersimpan ini tanpa menjalankan benchmark")
+    check.add_argument("--ambang", type=float, default=0.05, help="perlambatan relatif minimum (bawaan: 0.05)")
+    check.add_argument("--alfa", type=float, default=0.01, help="tingkat signifikansi uji (bawaan: 0.01)")
+    check.add_argument("--fase", nargs="+", default=["perkalian"], help="fase yang diperiksa")
+    check.add_argument("--perbarui-baseline", action="store_true",
+                       help="tambahkan run ini ke baseline bila tidak ada regresi")
+    check.add_argument("--path", default=PATH_HASIL_BAWAAN, help="file penyimpanan hasil")
+    check.add_argument("--baseline", default=PATH_BASELINE_BAWAAN, help="file baseline")
+    check.add_argument("--folder", default=FOLDER_BAWAAN, help="folder file memmap")
+    check.set_defaults(fungsi=perintah_check)
+
+    skala = subparser.add_parser("skala", help="studi skala jumlah thread BLAS dan afinitas CPU")
+    skala.add_argument("--dimensi", type=int, nargs="+", help="dimensi yang diuji (bawaan: 256..4096)")
+    skala.add_argument("--tipe", nargs="+", default=["float64"], help="tipe data yang diuji (bawaan: float64)")
+    skala.add_argument("--thread", type=int, nargs="+", help="jumlah thread BLAS (bawaan: 1, 2, 4, ..., jumlah CPU)")
+    skala.add_argument("--afinitas", nargs="+", default=["semua", "kompak", "tersebar"],
+                       choices=["semua", "kompak", "tersebar"], help="strategi afinitas CPU")
+    skala.add_argument("--ambang", type=float, default=0.7, help="efisiensi minimum untuk rekomendasi (bawaan: 0.7)")
+    skala.add_argument("--plot", action="store_true", help="buat plot (mengimpor matplotlib)")
+    skala.add_argument("--folder", default=FOLDER_BAWAAN, help="folder plot")
+    skala.set_defaults(fungsi=perintah_skala)
+
+    sparse = subparser.add_parser("sparse", help="sapuan kepadatan x dimensi SpGEMM sparse vs perkalian padat")
+    sparse.add_argument("--dimensi", type=int, nargs="+", help="dimensi yang diuji (bawaan: 256..4096)")
+    sparse.add_argument("--kepadatan", type=float, nargs="+", help="kepadatan yang diuji (bawaan: 0.001..0.5)")
+    sparse.add_argument("--tipe", nargs="+", default=["float64"], help="tipe data yang diuji (bawaan: float64)")
+    sparse.add_argument("--format", default="csr", choices=["csr", "csc"], help="format sparse (bawaan: csr)")
+    sparse.add_argument("--seed", type=int, help="seed pembangkit operand sparse")
+    sparse.add_argument("--plot", action="store_true", help="buat plot (mengimpor matplotlib)")
+    sparse.add_argument("--folder", default=FOLDER_BAWAAN, help="folder plot")
+    sparse.set_defaults(fungsi=perintah_sparse)
+
+    terdistribusi = subparser.add_parser("terdistribusi", help="perkalian terdistribusi blok 2D (panel dikirim "
+                                         "koordinator) di worker lokal vs NumPy satu proses")
+    terdistribusi.add_argument("--dimensi", type=int, nargs="+", default=[1024, 2048, 4096], help="dimensi yang diuji")
+    terdistribusi.add_argument("--worker", type=int, nargs="+", default=[1, 2, 4], help="jumlah worker (bawaan: 1 2 4)")
+    terdistribusi.add_argument("--tipe", nargs="+", default=["float64"], help="tipe data yang diuji (bawaan: float64)")
+    terdistribusi.add_argument("--panel", type=int, help="lebar panel k (bawaan: 256)")
+    terdistribusi.set_defaults(fungsi=perintah_terdistribusi)
+
+    baseline = subparser.add_parser("baseline", help="tambahkan run tersimpan ke baseline regresi (beberapa run terakhir per titik)")
+    baseline.add_argument("--run", help="ID run (bawaan: run terbaru)")
+    baseline.add_argument("--backend", nargs="+", help="backend yang ditetapkan (bawaan: semua di run)")
+    baseline.add_argument("--fase", nargs="+", default=["perkalian"], help="fase yang ditetapkan")
+    baseline.add_argument("--path", default=PATH_HASIL_BAWAAN, help="file penyimpanan hasil")
+    baseline.add_argument("--baseline", default=PATH_BASELINE_BAWAAN, help="file baseline")
+    baseline.set_defaults(fungsi=perintah_baseline)
+
+    report = subparser.add_parser("report", help="laporkan hasil tersimpan tanpa menjalankan benchmark")
+    report.add_argument("--run", help="ID run (bawaan: run terbaru)")
+    report.add_argument("--backend", nargs="+", help="backend yang dilaporkan (bawaan: semua di run)")
+    report.add_argument("--path", default=PATH_HASIL_BAWAAN, help="file penyimpanan hasil")
+    report.add_argument("--plot", action="store_true", help="buat plot (mengimpor matplotlib)")
+    report.add_argument("--folder", default=FOLDER_BAWAAN, help="folder plot")
+    report.set_defaults(fungsi=perintah_report)
+    return parser
+
+
+def main(argv=None):
+    parser = buat_parser()
+    argumen = parser.parse_args(argv)
+    # Tipe data dan opsi backend diperiksa di sini (bukan lewat choices=) agar --help tidak mengimpor NumPy
+    tipe = getattr(argumen, "tipe", None)
+    if tipe:
+        pesan = _periksa_tipe([tipe] if isinstance(tipe, str) else tipe)
+        if pesan:
+            parser.error(pesan)
+    if getattr(argumen, "opsi", None):
+        pesan = _periksa_opsi(argumen.opsi, argumen.backend or ["numpy"])
+        if pesan:
+            parser.error(pesan)
+    return argumen.fungsi(argumen)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
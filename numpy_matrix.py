@@ -1,182 +1,218 @@
-import numpy as np
-import time
 import os
-import json
+import sys
 import psutil
-import matplotlib.pyplot as plt
+from backend import dapatkan_backend
+from tipe_data import TIPE_DATA_BAWAAN
+import benchmark
 
 # definisikan dimensi matriks yang akan diuji
 dimensi = [8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
-# dimensi_sangat_besar = [8192, 16384, 32768, 65536, 131072, 262144]
-
-# buat folder untuk menyimpan hasil
-os.makedirs("hasil_matriks", exist_ok=True)
-
-# buat dictionary untuk menyimpan waktu eksekusi
-waktu_numpy_dict = {}
-waktu_perkalian_numpy_dict = {}
-
-# Ambil informasi memori dari sistem
-print("\n--- Informasi Sistem ---")
-info_memori = psutil.virtual_memory()
-print(f"Total RAM: {info_memori.total / (1024**3):.2f} GB")
-print(f"RAM Tersedia: {info_memori.available / (1024**3):.2f} GB")
-print(f"Persentase Terpakai: {info_memori.percent}%")
-
-print("\n--- Memulai Pembuatan Matriks ---")
+# dimensi yang tidak muat di RAM dijalankan dengan mode blok out-of-core
+dimensi_sangat_besar = [8192, 16384, 32768, 65536, 131072, 262144]
+
+# tipe data yang diuji untuk setiap dimensi
+tipe_data_diuji = ["int64", "float64", "float32", "int32", "int16", "int8"]
+
+# jalankan juga perkalian paralel (ProcessPoolExecutor) dengan jumlah worker berikut
+jalankan_paralel = True
+jumlah_worker = None  # None: semua core
+
+# jalankan juga perkalian Strassen-Winograd; di bawah ukuran cutoff dipakai BLAS biasa
+jalankan_strassen = True
+ukuran_cutoff_strassen = None  # None: UKURAN_CUTOFF_BAWAAN di perkalian_strassen.py
+
+# jalankan juga mode batch: banyak matriks kecil (batch, dim, dim) dalam satu matmul
+jalankan_batch = True
+dimensi_batch = [8, 16, 32, 64, 128]
+ukuran_batch_diuji = [1, 16, 256, 4096]
+jumlah_matriks_batch = 16384
+
+# jalankan juga sapuan bentuk persegi panjang A (m x k) @ B (k x n), misalnya tall-skinny dan short-wide
+jalankan_bentuk = True
+bentuk_diuji = [(4096, 64, 4096), (64, 4096, 64), (8192, 512, 64), (64, 512, 8192), (4096, 4096, 1), (2048, 1024, 512)]
+
+# jalankan juga perkalian rantai A1 @ A2 @ ... @ An dengan urutan optimal (perkalian_rantai.py);
+# setiap rantai ditulis sebagai p0..pn, matriks ke-i berbentuk (p[i], p[i+1])
+jalankan_rantai = True
+rantai_diuji = [(1024, 1024, 1024, 1024), (2048, 32, 2048, 32, 2048), (1024, 2048, 2048, 2048, 1)]
+tipe_data_rantai = ["float64", "float32"]
+
+# bandingkan pembuatan np.random lama dengan np.random.Generator multi-thread (pembangkit_acak.py)
+bandingkan_pembangkit = True
+seed_pembangkit = None  # None: acak; isi int untuk hasil yang bisa diulang
+jumlah_thread_pembangkit = None  # None: semua core
+
+# sapuan adaptif (penjadwal_sapuan.py): dimensi dipilih sendiri dalam anggaran waktu dan memori,
+# menggantikan daftar dimensi tetap di atas untuk backend numpy dan paralel
+sapuan_adaptif = False
+anggaran_waktu_sapuan = 600  # detik per backend
+anggaran_memori_sapuan_gb = None  # None: 95% RAM tersedia
+
+# checkpoint operand besar ke disk agar run yang dilanjutkan (--resume) tidak perlu membuatnya ulang
+checkpoint_operand = False
+
+# mode pipeline (pipeline_sapuan.py): operand dimensi berikutnya dibuat dan hasil sebelumnya disimpan di thread
+# lain selama perkalian, dengan buffer operand ping-pong yang dipakai ulang untuk semua ukuran
+mode_pipeline = False
+
+# cache operand di disk (cache_operand.py): operand yang sama dipakai ulang antar run dan antar backend
+cache_operand = False
+seed_cache_operand = 0
+batas_cache_operand_gb = 8
+
+# studi skala (studi_skala.py): perkalian di atas grid jumlah thread BLAS dan strategi afinitas CPU,
+# dengan efisiensi paralel per dimensi dan rekomendasi jumlah core
+studi_skala_thread = False
+dimensi_studi_skala = [256, 512, 1024, 2048, 4096]
+jumlah_thread_studi = None  # None: 1, 2, 4, ... sampai jumlah CPU
+strategi_afinitas_studi = ["semua", "kompak", "tersebar"]
+
+# sapuan kepadatan x dimensi (perkalian_sparse.py): SpGEMM scipy.sparse dibandingkan dengan perkalian padat,
+# dengan titik potong kepadatan dan memori yang dihemat terhadap perkiraan padat
+sapuan_sparse = False
+dimensi_sparse = [256, 512, 1024, 2048, 4096]
+kepadatan_sparse = [0.001, 0.005, 0.01, 0.05, 0.1, 0.2, 0.5]
+format_sparse = "csr"  # "csr" atau "csc"
+
+# perkalian terdistribusi blok 2D lewat hub (perkalian_terdistribusi.py): worker lokal mewakili node, dengan waktu
+# komunikasi dan komputasi dilaporkan terpisah
+jalankan_terdistribusi = False
+dimensi_terdistribusi = [1024, 2048, 4096]
+jumlah_worker_terdistribusi = [1, 2, 4]
+ukuran_panel_terdistribusi = None  # None: UKURAN_PANEL_BAWAAN di perkalian_terdistribusi.py
+
+# periksa hasil run ini terhadap baseline regresi host ini (regresi.py); keluar dengan kode 1 bila ada
+# perlambatan signifikan. Baseline ditetapkan dengan: python -m matriks baseline
+cek_regresi = False
+
+# folder untuk menyimpan hasil
+folder_hasil = benchmark.FOLDER_HASIL
+
+# backend NumPy yang dipakai oleh fungsi-fungsi di bawah
+backend_numpy = dapatkan_backend("numpy")
 
 # fungsi untuk memeriksa apakah memori cukup tersedia
-def periksa_memori_tersedia(dim):
-    # Kita membutuhkan memori untuk dua matriks input dan satu matriks output
-    memori_dibutuhkan = 3 * dim * dim * 8
-    
-    memori_tersedia = psutil.virtual_memory().available
-    
-    memori_aman = memori_tersedia * 0.95
-    
-    memori_cukup = memori_dibutuhkan <= memori_aman
-    
-    print(f"Matriks Ukuran: {dim}x{dim} Membutuhkan {memori_dibutuhkan / (1024**3):.2f} GB untuk perkalian")
-    print(f"Memori Tersedia: {memori_tersedia / (1024**3):.2f} GB (menggunakan 95%: {memori_aman / (1024**3):.2f} GB)")
-    print(f"Memori Cukup: {memori_cukup}")
-    
-    return memori_cukup
+def periksa_memori_tersedia(dim, tipe_data=TIPE_DATA_BAWAAN):
+    return benchmark.periksa_memori_tersedia(backend_numpy, dim, tipe_data)
 
 # Fungsi untuk membuat matriks numpy dan mengukur waktu
-def buat_matriks_numpy(dim):
+def buat_matriks_numpy(dim, tipe_data=TIPE_DATA_BAWAAN):
     # Periksa apakah memori cukup tersedia terlebih dahulu
-    if not periksa_memori_tersedia(dim):
+    if not periksa_memori_tersedia(dim, tipe_data):
         print(f"Memori tidak cukup untuk matriks {dim}x{dim}. Melewati.")
-        return None, 0
-    
-    try:
-        waktu_mulai = time.time()
-        matriks = np.random.randint(1, 101, size=(dim, dim))
-        waktu_selesai = time.time()
-        waktu_eksekusi = waktu_selesai - waktu_mulai
-        print(f"NumPy {dim}x{dim} dibuat dalam {waktu_eksekusi:.6f} detik")
-        return matriks, waktu_eksekusi
-    except (MemoryError, np.core._exceptions._ArrayMemoryError) as e:
-        print(f"Kesalahan memori saat membuat matriks {dim}x{dim}: {str(e)}")
-        return None, 0
-    except Exception as e:
-        print(f"Kesalahan tak terduga saat membuat matriks {dim}x{dim}: {str(e)}")
-        return None, 0
+        return None, None
+    return benchmark.buat_matriks(backend_numpy, dim, tipe_data)
 
 # Fungsi untuk melakukan perkalian matriks dan mengukur waktu
+# Operand bilangan bulat dialihkan ke BLAS float bila hasilnya dijamin eksak (lihat tipe_data.py)
 def perkalian_matriks_numpy(matriks_a, matriks_b):
-    try:
-        waktu_mulai = time.time()
-        hasil = np.matmul(matriks_a, matriks_b)
-        waktu_selesai = time.time()
-        waktu_eksekusi = waktu_selesai - waktu_mulai
-        return hasil, waktu_eksekusi
-    except Exception as e:
-        print(f"Kesalahan selama perkalian matriks: {str(e)}")
-        return None, 0
-
-# Lacak apakah ada kegagalan memori untuk menghentikan percobaan ukuran yang lebih besar
-gagal_memori = False
-
-# buat matriks untuk ukuran yang lebih kecil
-for dim in dimensi:
-    print(f"\nMembuat dan mengalikan matriks NumPy {dim}x{dim}...")
-    
-    # Buat matriks NumPy pertama
-    matriks_numpy_a, waktu_buat_a = buat_matriks_numpy(dim)
-    
-    if matriks_numpy_a is not None:
-        # Buat matriks NumPy kedua
-        matriks_numpy_b, waktu_buat_b = buat_matriks_numpy(dim)
-        
-        if matriks_numpy_b is not None:
-            waktu_numpy_dict[dim] = waktu_buat_a + waktu_buat_b
-            
-            # Lakukan perkalian matriks
-            print(f"Mengalikan matriks {dim}x{dim}...")
-            hasil, waktu_perkalian = perkalian_matriks_numpy(matriks_numpy_a, matriks_numpy_b)
-            
-            if hasil is not None:
-                waktu_perkalian_numpy_dict[dim] = waktu_perkalian
-                print(f"Perkalian matriks {dim}x{dim} selesai dalam {waktu_perkalian:.6f} detik")
-                
-                # Simpan contoh hasil matriks
-                with open(f"hasil_matriks/hasil_perkalian_numpy_{dim}x{dim}_contoh.txt", "w") as f:
-                    f.write(f"Hasil Perkalian NumPy {dim}x{dim} (menampilkan elemen 5x5 pertama):\n")
-                    ukuran_contoh = min(5, dim)
-                    for i in range(ukuran_contoh):
-                        f.write(" ".join(map(str, hasil[i, :ukuran_contoh])) + "\n")
-            
-            # Bebaskan memori secara eksplisit
-            del matriks_numpy_a, matriks_numpy_b
-            if hasil is not None:
-                del hasil
-            import gc
-            gc.collect()
-            
-            # Laporkan memori setelah setiap matriks besar
-            if dim >= 1024:
-                info_memori = psutil.virtual_memory()
-                print(f"RAM Tersedia setelah dibersihkan: {info_memori.available / (1024**3):.2f} GB")
-        else:
-            gagal_memori = True
-            break
+    return benchmark.perkalian_matriks(backend_numpy, matriks_a, matriks_b)
+
+# Fungsi untuk melakukan perkalian matriks dengan Strassen-Winograd dan mengukur waktu
+# Signature dan nilai kembali sama dengan perkalian_matriks_numpy
+def perkalian_matriks_numpy_strassen(matriks_a, matriks_b):
+    backend_strassen = dapatkan_backend("numpy-strassen", ukuran_cutoff=ukuran_cutoff_strassen)
+    return benchmark.perkalian_matriks(backend_strassen, matriks_a, matriks_b)
+
+# Fungsi untuk mengalikan rantai matriks dengan urutan optimal dan mengukur waktu
+# Nilai kembali sama dengan perkalian_matriks_numpy; hasil diverifikasi dengan Freivalds rantai
+def perkalian_rantai_numpy(daftar_matriks):
+    from perkalian_rantai import perkalian_rantai
+    return perkalian_rantai(backend_numpy, daftar_matriks)
+
+# Fungsi untuk melakukan perkalian matriks terdistribusi di worker lokal dan mengukur waktu
+# Signature dan nilai kembali sama dengan perkalian_matriks_numpy
+def perkalian_matriks_numpy_terdistribusi(matriks_a, matriks_b, jumlah_worker=None):
+    backend_terdistribusi = dapatkan_backend("numpy-terdistribusi", jumlah_worker=jumlah_worker,
+                                             ukuran_panel=ukuran_panel_terdistribusi)
+    return benchmark.perkalian_matriks(backend_terdistribusi, matriks_a, matriks_b)
+
+if __name__ == "__main__":
+    # python numpy_matrix.py --resume [id_run] melanjutkan run yang terputus; sel yang sudah tersimpan dilewati
+    benchmark.proses_argumen_lanjutkan(sys.argv[1:])
+    benchmark.CHECKPOINT_OPERAND = checkpoint_operand
+    benchmark.MODE_PIPELINE = mode_pipeline
+    if cache_operand:
+        from cache_operand import CacheOperand
+        benchmark.CACHE_OPERAND = CacheOperand(seed_cache_operand, batas_cache_operand_gb * (1024**3))
+
+    # Ambil informasi memori dari sistem
+    print("\n--- Informasi Sistem ---")
+    info_memori = psutil.virtual_memory()
+    print(f"Total RAM: {info_memori.total / (1024**3):.2f} GB")
+    print(f"RAM Tersedia: {info_memori.available / (1024**3):.2f} GB")
+    print(f"Persentase Terpakai: {info_memori.percent}%")
+
+    anggaran_memori_sapuan = None if anggaran_memori_sapuan_gb is None else anggaran_memori_sapuan_gb * (1024**3)
+    if sapuan_adaptif:
+        catatan_numpy = benchmark.jalankan_dan_simpan_adaptif(backend_numpy, anggaran_waktu_sapuan, anggaran_memori_sapuan,
+                                                              tipe_data_diuji, folder=folder_hasil)
     else:
-        gagal_memori = True
-        break
-
-# Simpan hasil waktu ke file JSON
-with open("hasil_matriks/waktu_pembuatan_numpy.json", "w") as f:
-    json.dump(waktu_numpy_dict, f)
-
-with open("hasil_matriks/waktu_perkalian_numpy.json", "w") as f:
-    json.dump(waktu_perkalian_numpy_dict, f)
-
-print("\nPembuatan dan perkalian matriks NumPy selesai.")
-print(f"Hasil disimpan di hasil_matriks/waktu_pembuatan_numpy.json dan hasil_matriks/waktu_perkalian_numpy.json")
-
-# Cetak ringkasan
-print("\nRingkasan Pembuatan NumPy:")
-print("=" * 50)
-print(f"{'Dimensi':<10} {'Waktu (detik)':<15}")
-print("-" * 50)
-for dim in sorted(waktu_numpy_dict.keys()):
-    print(f"{dim:<10} {waktu_numpy_dict[dim]:<15.6f}")
-
-print("\nRingkasan Perkalian NumPy:")
-print("=" * 50)
-print(f"{'Dimensi':<10} {'Waktu (detik)':<15}")
-print("-" * 50)
-for dim in sorted(waktu_perkalian_numpy_dict.keys()):
-    print(f"{dim:<10} {waktu_perkalian_numpy_dict[dim]:<15.6f}")
-
-# Buat visualisasi menggunakan matplotlib
-plt.figure(figsize=(12, 8))
-
-# Plot waktu perkalian matriks
-plt.subplot(2, 1, 1)
-dimensi_sorted = sorted(waktu_perkalian_numpy_dict.keys())
-waktu = [waktu_perkalian_numpy_dict[dim] for dim in dimensi_sorted]
-plt.plot(dimensi_sorted, waktu, 'o-', color='blue', linewidth=2, markersize=8)
-plt.title('Performa Perkalian Matriks NumPy', fontsize=14)
-plt.xlabel('Dimensi Matriks', fontsize=12)
-plt.ylabel('Waktu (detik)', fontsize=12)
-plt.grid(True)
-plt.xscale('log', base=2)
-plt.yscale('log')
-
-# Plot waktu pembuatan matriks
-plt.subplot(2, 1, 2)
-dimensi_sorted = sorted(waktu_numpy_dict.keys())
-waktu = [waktu_numpy_dict[dim] for dim in dimensi_sorted]
-plt.plot(dimensi_sorted, waktu, 'o-', color='green', linewidth=2, markersize=8)
-plt.title('Performa Pembuatan Matriks NumPy', fontsize=14)
-plt.xlabel('Dimensi Matriks', fontsize=12)
-plt.ylabel('Waktu (detik)', fontsize=12)
-plt.grid(True)
-plt.xscale('log', base=2)
-plt.yscale('log')
-
-plt.tight_layout()
-plt.savefig('hasil_matriks/performa_matriks_numpy.png')
-print("Visualisasi performa disimpan di 'hasil_matriks/performa_matriks_numpy.png'")
\ No newline at end of file
+        catatan_numpy = benchmark.jalankan_dan_simpan(backend_numpy, dimensi + dimensi_sangat_besar, tipe_data_diuji, folder_hasil)
+
+    if jalankan_paralel:
+        backend_paralel = dapatkan_backend("numpy-paralel", jumlah_worker=jumlah_worker)
+        if sapuan_adaptif:
+            # Waktu numpy menjadi acuan agar titik potong paralel vs serial disampel lebih rapat
+            waktu_acuan = {t: benchmark.waktu_per_dimensi(catatan_numpy, "waktu_perkalian", t) for t in tipe_data_diuji}
+            catatan_paralel = benchmark.jalankan_dan_simpan_adaptif(backend_paralel, anggaran_waktu_sapuan,
+                                                                    anggaran_memori_sapuan, tipe_data_diuji,
+                                                                    waktu_acuan, folder_hasil)
+        else:
+            catatan_paralel = benchmark.jalankan_dan_simpan(backend_paralel, dimensi, tipe_data_diuji, folder_hasil)
+        benchmark.cetak_percepatan(catatan_numpy, catatan_paralel, backend_numpy.nama, backend_paralel.info())
+
+    if jalankan_strassen:
+        backend_strassen = dapatkan_backend("numpy-strassen", ukuran_cutoff=ukuran_cutoff_strassen)
+        catatan_strassen = benchmark.jalankan_dan_simpan(backend_strassen, dimensi, tipe_data_diuji, folder_hasil)
+        benchmark.cetak_percepatan(catatan_numpy, catatan_strassen, backend_numpy.nama, backend_strassen.info())
+        benchmark.cetak_titik_potong(catatan_numpy, catatan_strassen, backend_numpy.nama, backend_strassen.info())
+
+    if bandingkan_pembangkit:
+        backend_generator = dapatkan_backend("numpy-generator", seed=seed_pembangkit, jumlah_thread=jumlah_thread_pembangkit)
+        benchmark.bandingkan_pembuatan([backend_numpy, backend_generator], dimensi, tipe_data_diuji)
+
+    if jalankan_batch:
+        benchmark.jalankan_dan_simpan_batch(backend_numpy, dimensi_batch, ukuran_batch_diuji, jumlah_matriks_batch,
+                                            tipe_data_diuji, folder_hasil)
+
+    if jalankan_bentuk:
+        benchmark.jalankan_dan_simpan_bentuk(backend_numpy, bentuk_diuji, tipe_data_diuji)
+
+    if jalankan_rantai:
+        import perkalian_rantai
+        catatan_rantai = perkalian_rantai.jalankan_benchmark_rantai(backend_numpy, rantai_diuji, tipe_data_rantai)
+        perkalian_rantai.cetak_ringkasan_rantai(backend_numpy.nama, catatan_rantai)
+
+    if studi_skala_thread:
+        import studi_skala
+        catatan_skala = studi_skala.jalankan_studi_skala(dimensi_studi_skala, tipe_data_diuji, jumlah_thread_studi,
+                                                         strategi_afinitas_studi)
+        studi_skala.cetak_studi_skala(catatan_skala)
+        studi_skala.simpan_studi_skala(catatan_skala)
+
+    if sapuan_sparse:
+        import perkalian_sparse
+        catatan_sparse = perkalian_sparse.jalankan_sapuan_kepadatan(dimensi_sparse, kepadatan_sparse, tipe_data_diuji,
+                                                                    format_sparse)
+        perkalian_sparse.cetak_sapuan_kepadatan(catatan_sparse)
+        for tipe_data in tipe_data_diuji:
+            perkalian_sparse.buat_plot_kepadatan(catatan_sparse, tipe_data,
+                                                 os.path.join(folder_hasil, f"sapuan_kepadatan_{tipe_data}.png"))
+
+    if jalankan_terdistribusi:
+        import perkalian_terdistribusi
+        catatan_terdistribusi = perkalian_terdistribusi.jalankan_studi_terdistribusi(
+            dimensi_terdistribusi, jumlah_worker_terdistribusi, tipe_data_diuji, ukuran_panel_terdistribusi)
+        perkalian_terdistribusi.cetak_studi_terdistribusi(catatan_terdistribusi)
+
+    if benchmark.CACHE_OPERAND is not None:
+        print(benchmark.CACHE_OPERAND.info())
+    print("\nPembuatan dan perkalian matriks NumPy selesai.")
+
+    if cek_regresi:
+        from regresi import periksa_regresi, cetak_hasil_regresi, ada_regresi
+        from penyimpanan_hasil import id_run_sekarang
+        hasil_regresi = periksa_regresi(id_run_sekarang())
+        cetak_hasil_regresi(hasil_regresi)
+        sys.exit(1 if ada_regresi(hasil_regresi) else 0)
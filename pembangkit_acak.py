@@ -0,0 +1,62 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from tipe_data import TIPE_DATA, TIPE_DATA_BAWAAN, NILAI_MIN, NILAI_MAKS, apakah_bulat
+
+# Bit generator yang bisa dipilih; keduanya mendukung substream independen lewat SeedSequence.spawn
+BIT_GENERATOR = {
+    "pcg64": np.random.PCG64,
+    "philox": np.random.Philox,
+}
+BIT_GENERATOR_BAWAAN = "pcg64"
+
+# Jumlah thread default: semua core yang boleh dipakai proses ini
+JUMLAH_THREAD_DEFAULT = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+
+# Buffer dibagi menjadi potongan berukuran tetap, masing-masing dengan substream sendiri.
+# Pembagian tidak bergantung pada jumlah thread, jadi hasil untuk satu seed selalu sama.
+UKURAN_POTONGAN = 1 << 20
+
+
+def _isi_potongan(datar, awal, akhir, seed_potongan, kelas_bit_generator, dtype):
+    rng = np.random.Generator(kelas_bit_generator(seed_potongan))
+    # Bilangan bulat 16 bit ke atas dibangkitkan langsung di tipe tujuan, tanpa int64 sementara.
+    # int8 dan float lewat int16: jalur 8 bit Generator jauh lebih lambat dan float tidak didukung.
+    tipe_bangkit = dtype if apakah_bulat(dtype) and np.dtype(dtype).itemsize >= 2 else np.int16
+    datar[awal:akhir] = rng.integers(NILAI_MIN, NILAI_MAKS, size=akhir - awal, dtype=tipe_bangkit)
+
+
+# Fungsi untuk mengisi buffer yang sudah dialokasikan dengan nilai acak 1..100 dari beberapa thread
+# seed bisa berupa int atau np.random.SeedSequence
+def isi_acak_paralel(matriks, seed=None, jumlah_thread=None, bit_generator=BIT_GENERATOR_BAWAAN):
+    jumlah_thread = jumlah_thread or JUMLAH_THREAD_DEFAULT
+    kelas_bit_generator = BIT_GENERATOR[bit_generator]
+    urutan_seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    if not matriks.flags.c_contiguous:
+        matriks[...] = isi_acak_paralel(np.empty(matriks.shape, dtype=matriks.dtype), urutan_seed,
+                                        jumlah_thread, bit_generator)
+        return matriks
+
+    datar = matriks.reshape(-1)
+    jumlah_potongan = max(1, -(-datar.size // UKURAN_POTONGAN))
+    daftar_seed = urutan_seed.spawn(jumlah_potongan)
+    tugas = [(datar, i * UKURAN_POTONGAN, min((i + 1) * UKURAN_POTONGAN, datar.size), daftar_seed[i],
+              kelas_bit_generator, matriks.dtype) for i in range(jumlah_potongan)]
+
+    if jumlah_thread == 1 or jumlah_potongan == 1:
+        for argumen in tugas:
+            _isi_potongan(*argumen)
+    else:
+        # Generator melepas GIL saat mengisi, jadi thread benar-benar berjalan paralel
+        with ThreadPoolExecutor(max_workers=min(jumlah_thread, jumlah_potongan)) as executor:
+            for masa_depan in [executor.submit(_isi_potongan, *argumen) for argumen in tugas]:
+                masa_depan.result()
+    return matriks
+
+
+# Fungsi untuk membuat matriks acak baru dengan pembangkit paralel
+def buat_matriks_acak_paralel(bentuk, tipe_data=TIPE_DATA_BAWAAN, seed=None, jumlah_thread=None,
+                              bit_generator=BIT_GENERATOR_BAWAAN):
+    matriks = np.empty(bentuk, dtype=TIPE_DATA[tipe_data])
+    return isi_acak_paralel(matriks, seed, jumlah_thread, bit_generator)
@@ -0,0 +1,103 @@
+import time
+import math
+import statistics
+import numpy as np
+
+# Jumlah pemanasan dan ulangan bawaan untuk setiap pengukuran
+PEMANASAN_BAWAAN = 1
+ULANGAN_BAWAAN = 7
+
+# Satu ulangan harus berlangsung minimal selama ini; operasi yang lebih cepat
+# diulang beberapa kali dalam satu ulangan (iterasi adaptif untuk ukuran kecil)
+DURASI_MINIMUM_ULANGAN_NS = 20_000_000
+
+# Batas total waktu ulangan per pengukuran; operasi yang sangat lambat
+# (misalnya perkalian integer 4096x4096) diulang lebih sedikit
+BATAS_WAKTU_PENGUKURAN_NS = 60_000_000_000
+
+# Tingkat kepercayaan untuk interval kepercayaan median
+TINGKAT_KEPERCAYAAN = 0.95
+
+
+def _tanpa_sinkronisasi():
+    pass
+
+
+# Fungsi untuk menghitung interval kepercayaan median dari statistik urutan (tanpa asumsi distribusi)
+def interval_kepercayaan_median(sampel, tingkat=TINGKAT_KEPERCAYAAN):
+    sampel_urut = sorted(sampel)
+    n = len(sampel_urut)
+    z = statistics.NormalDist().inv_cdf((1 + tingkat) / 2)
+    setengah_lebar = z * math.sqrt(n) / 2
+    indeks_bawah = max(0, math.floor(n / 2 - setengah_lebar) - 1)
+    indeks_atas = min(n - 1, math.ceil(1 + n / 2 + setengah_lebar) - 1)
+    return sampel_urut[indeks_bawah], sampel_urut[indeks_atas]
+
+
+# Fungsi untuk merangkum daftar waktu (detik) menjadi median, min, IQR dan interval kepercayaan
+def ringkas_statistik(daftar_waktu, iterasi=1):
+    kuartil_1, kuartil_3 = np.percentile(daftar_waktu, [25, 75])
+    ci_bawah, ci_atas = interval_kepercayaan_median(daftar_waktu)
+    return {
+        "median": float(np.median(daftar_waktu)),
+        "min": float(min(daftar_waktu)),
+        "iqr": float(kuartil_3 - kuartil_1),
+        "ci_bawah": float(ci_bawah),
+        "ci_atas": float(ci_atas),
+        "ulangan": [float(w) for w in daftar_waktu],
+        "iterasi": iterasi,
+    }
+
+
+# Fungsi untuk menjumlahkan statistik beberapa langkah yang diukur terpisah (misalnya pembuatan A dan B)
+# Ulangan ke-i dijumlahkan antar langkah; bila jumlah ulangannya berbeda, dipotong ke yang terpendek
+def jumlahkan_statistik(*daftar_statistik):
+    jumlah_ulangan = min(len(statistik["ulangan"]) for statistik in daftar_statistik)
+    daftar_waktu = np.sum([statistik["ulangan"][:jumlah_ulangan] for statistik in daftar_statistik], axis=0)
+    return ringkas_statistik(list(daftar_waktu), min(statistik["iterasi"] for statistik in daftar_statistik))
+
+
+# Fungsi untuk mengukur waktu eksekusi fungsi dengan pemanasan, ulangan dan iterasi adaptif
+# sinkronisasi dipanggil sebelum mulai dan sesudah setiap ulangan (misalnya untuk GPU)
+# Mengembalikan (hasil pemanggilan terakhir, statistik dalam detik per pemanggilan)
+def ukur(fungsi, pemanasan=PEMANASAN_BAWAAN, ulangan=ULANGAN_BAWAAN, sinkronisasi=None,
+         durasi_minimum_ns=DURASI_MINIMUM_ULANGAN_NS, batas_waktu_ns=BATAS_WAKTU_PENGUKURAN_NS):
+    if sinkronisasi is None:
+        sinkronisasi = _tanpa_sinkronisasi
+
+    # Pemanasan sekaligus kalibrasi lama satu pemanggilan
+    durasi_satu_ns = 0
+    for _ in range(pemanasan):
+        sinkronisasi()
+        mulai = time.perf_counter_ns()
+        hasil = fungsi()
+        sinkronisasi()
+        durasi_satu_ns = time.perf_counter_ns() - mulai
+        del hasil
+
+    iterasi = 1
+    if pemanasan > 0 and durasi_satu_ns < durasi_minimum_ns:
+        iterasi = math.ceil(durasi_minimum_ns / max(durasi_satu_ns, 1))
+    if pemanasan > 0 and durasi_satu_ns * ulangan > batas_waktu_ns:
+        ulangan = max(1, batas_waktu_ns // max(durasi_satu_ns, 1))
+
+    daftar_waktu = []
+    hasil = None
+    for _ in range(ulangan):
+        hasil = None
+        sinkronisasi()
+        mulai = time.perf_counter_ns()
+        for _ in range(iterasi):
+            hasil = fungsi()
+        sinkronisasi()
+        daftar_waktu.append((time.perf_counter_ns() - mulai) / iterasi / 1e9)
+
+    return hasil, ringkas_statistik(daftar_waktu, iterasi)
+
+
+# Fungsi untuk menulis ringkasan statistik dalam satu baris
+def format_statistik(statistik):
+    return (f"median {statistik['median']:.6f} detik (min {statistik['min']:.6f}, "
+            f"IQR {statistik['iqr']:.6f}, CI{int(TINGKAT_KEPERCAYAAN * 100)}% "
+            f"[{statistik['ci_bawah']:.6f}, {statistik['ci_atas']:.6f}], "
+            f"{len(statistik['ulangan'])}x{statistik['iterasi']})")
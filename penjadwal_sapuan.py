@@ -0,0 +1,150 @@
+import math
+import numpy as np
+from pengukuran_waktu import PEMANASAN_BAWAAN, ULANGAN_BAWAAN, DURASI_MINIMUM_ULANGAN_NS, BATAS_WAKTU_PENGUKURAN_NS
+
+# Dimensi pertama dan pengali sapuan kasar
+DIM_AWAL = 8
+FAKTOR_SAPUAN_KASAR = 2
+
+# Dimensi sisipan dibulatkan ke kelipatan ini (bukan pangkat dua, tapi tetap ramah SIMD)
+KELIPATAN_DIM = 8
+
+# Celah antar dimensi terukur yang sudah dianggap cukup rapat
+RASIO_CELAH_MINIMUM = 1.15
+
+# Perkiraan awal rasio waktu dinding sebenarnya terhadap waktu harness yang diprediksi
+# (verifikasi, pembebasan memori, cetak, dsb.), diperbarui dari titik yang sudah diukur
+FAKTOR_OVERHEAD_AWAL = 1.5
+JUMLAH_TITIK_OVERHEAD = 3
+
+# Bobot prioritas celah yang mengapit titik potong dengan backend acuan
+BOBOT_TITIK_POTONG = 10.0
+
+
+# Perkiraan waktu dinding yang dihabiskan pengukuran_waktu.ukur untuk operasi berdurasi t detik
+def waktu_harness(t):
+    durasi_minimum = DURASI_MINIMUM_ULANGAN_NS / 1e9
+    batas_waktu = BATAS_WAKTU_PENGUKURAN_NS / 1e9
+    return PEMANASAN_BAWAAN * t + min(ULANGAN_BAWAAN * max(durasi_minimum, t), max(batas_waktu, t))
+
+
+# Fungsi untuk mencocokkan model t(n) = c + b * n^pangkat dengan kuadrat terkecil berbobot galat relatif
+# Mengembalikan (c, b); b selalu positif agar ekstrapolasi tidak pernah meremehkan ukuran besar
+def cocokkan_model(dimensi, waktu, pangkat):
+    n = np.asarray(dimensi, dtype=np.float64)
+    t = np.asarray(waktu, dtype=np.float64)
+    if len(n) >= 2:
+        matriks = np.stack([np.ones_like(n), n**pangkat], axis=1) / t[:, None]
+        (c, b), *_ = np.linalg.lstsq(matriks, np.ones_like(t), rcond=None)
+        if b > 0:
+            return max(c, 0.0), b
+    # Terlalu sedikit titik atau kemiringan tidak masuk akal: skala dari titik terbesar saja
+    i = int(np.argmax(n))
+    return 0.0, t[i] / n[i]**pangkat
+
+
+# Penjadwal sapuan dimensi untuk satu backend dan satu tipe data.
+# Sapuan kasar menggandakan dimensi selama prediksi biaya muat di anggaran; setelah itu celah antar
+# titik terukur disisipi titik tengah geometris, diprioritaskan di sekitar titik potong dengan backend
+# acuan dan di lutut kurva (perubahan kemiringan log-log terbesar, misalnya batas skala thread BLAS).
+class PenjadwalSapuan:
+    def __init__(self, anggaran_waktu, anggaran_memori, byte_per_elemen, dim_maksimum=None, waktu_acuan=None):
+        self.sisa_waktu = anggaran_waktu
+        self.anggaran_memori = anggaran_memori
+        self.byte_per_elemen = byte_per_elemen
+        self.dim_maksimum = dim_maksimum
+        self.waktu_acuan = dict(waktu_acuan or {})
+        self.titik = {}  # dim -> (waktu perkalian, waktu pembuatan, waktu dinding)
+        self.ditolak = set()
+        self.fase_kasar = True
+
+    # Prediksi waktu dinding untuk mengukur satu dimensi: harness perkalian + dua kali harness pembuatan
+    def prediksi_waktu(self, dim):
+        if not self.titik:
+            return 0.0
+        dimensi = sorted(self.titik)
+        c_kali, b_kali = cocokkan_model(dimensi, [self.titik[d][0] for d in dimensi], 3)
+        c_buat, b_buat = cocokkan_model(dimensi, [self.titik[d][1] for d in dimensi], 2)
+        waktu = waktu_harness(c_kali + b_kali * dim**3) + 2 * waktu_harness(c_buat + b_buat * dim**2)
+        return waktu * self.faktor_overhead()
+
+    # Rasio waktu dinding terhadap waktu harness, diambil terbesar dari beberapa dimensi terbesar
+    # (di dimensi kecil overhead tetap tertutup durasi minimum ulangan sehingga rasionya meremehkan)
+    def faktor_overhead(self):
+        rasio = [self.titik[d][2] / (waktu_harness(self.titik[d][0]) + 2 * waktu_harness(self.titik[d][1]))
+                 for d in sorted(self.titik)[-JUMLAH_TITIK_OVERHEAD:]]
+        return max(FAKTOR_OVERHEAD_AWAL if not rasio else max(rasio), 1.0)
+
+    def prediksi_memori(self, dim):
+        return self.byte_per_elemen * dim * dim
+
+    # Alasan menolak sebuah dimensi, atau None bila muat di kedua anggaran
+    def alasan_tolak(self, dim):
+        if self.dim_maksimum is not None and dim > self.dim_maksimum:
+            return "melewati dimensi maksimum"
+        if self.prediksi_memori(dim) > self.anggaran_memori:
+            return f"butuh {self.prediksi_memori(dim) / (1024**3):.2f} GB > anggaran memori"
+        if self.prediksi_waktu(dim) > self.sisa_waktu:
+            return f"perkiraan {self.prediksi_waktu(dim):.1f} detik > sisa anggaran {self.sisa_waktu:.1f} detik"
+        return None
+
+    # Fungsi untuk mencatat hasil satu dimensi; jejak_memori (byte) terukur memperbarui model memori
+    def catat(self, dim, waktu_perkalian, waktu_pembuatan, waktu_dinding, jejak_memori=None):
+        self.sisa_waktu -= waktu_dinding
+        self.titik[dim] = (waktu_perkalian, waktu_pembuatan, waktu_dinding)
+        if jejak_memori is not None and dim >= 256:
+            self.byte_per_elemen = max(self.byte_per_elemen, jejak_memori / (dim * dim))
+
+    # Dimensi gagal (kehabisan memori, error): jangan coba dimensi sebesar itu atau lebih besar lagi
+    def catat_gagal(self, dim, waktu_dinding=0.0):
+        self.sisa_waktu -= waktu_dinding
+        self.dim_maksimum = dim - 1 if self.dim_maksimum is None else min(self.dim_maksimum, dim - 1)
+
+    def _kemiringan(self, d1, d2):
+        return math.log(self.titik[d2][0] / self.titik[d1][0]) / math.log(d2 / d1)
+
+    # Rasio waktu terhadap backend acuan (interpolasi log-log), None di luar rentang acuan
+    def _rasio_acuan(self, dim):
+        if len(self.waktu_acuan) < 2:
+            return None
+        dimensi_acuan = sorted(self.waktu_acuan)
+        if not dimensi_acuan[0] <= dim <= dimensi_acuan[-1]:
+            return None
+        log_acuan = np.interp(math.log(dim), np.log(dimensi_acuan), np.log([self.waktu_acuan[d] for d in dimensi_acuan]))
+        return self.titik[dim][0] / math.exp(log_acuan)
+
+    # Fungsi untuk memberi skor setiap celah (d1, d2) yang masih bisa disisipi titik tengah
+    def _kandidat_sisipan(self):
+        dimensi = sorted(self.titik)
+        kemiringan = [self._kemiringan(d1, d2) for d1, d2 in zip(dimensi, dimensi[1:])]
+        kandidat = []
+        for i, (d1, d2) in enumerate(zip(dimensi, dimensi[1:])):
+            if d2 / d1 < RASIO_CELAH_MINIMUM:
+                continue
+            tengah = int(round(math.sqrt(d1 * d2) / KELIPATAN_DIM)) * KELIPATAN_DIM
+            if not d1 < tengah < d2 or tengah in self.ditolak:
+                continue
+            # Lutut: perubahan kemiringan di kedua ujung celah
+            skor = sum(abs(kemiringan[i] - kemiringan[j]) for j in (i - 1, i + 1) if 0 <= j < len(kemiringan))
+            rasio_1, rasio_2 = self._rasio_acuan(d1), self._rasio_acuan(d2)
+            if rasio_1 is not None and rasio_2 is not None and (rasio_1 - 1) * (rasio_2 - 1) <= 0:
+                skor += BOBOT_TITIK_POTONG
+            kandidat.append((skor * math.log(d2 / d1), tengah))
+        return sorted(kandidat, reverse=True)
+
+    # Fungsi untuk memilih dimensi berikutnya; None bila tidak ada titik yang muat di anggaran
+    def usul_berikutnya(self):
+        if self.fase_kasar:
+            dim = DIM_AWAL if not self.titik else max(self.titik) * FAKTOR_SAPUAN_KASAR
+            if dim not in self.ditolak and self.alasan_tolak(dim) is None:
+                return dim
+            if dim not in self.ditolak:
+                print(f"Sapuan kasar berhenti di {dim}x{dim}: {self.alasan_tolak(dim)}")
+            self.fase_kasar = False
+
+        for _, dim in self._kandidat_sisipan():
+            alasan = self.alasan_tolak(dim)
+            if alasan is None:
+                return dim
+            self.ditolak.add(dim)
+        return None
@@ -0,0 +1,449 @@
+import os
+import time
+import uuid
+import socket
+import hashlib
+import platform
+import tempfile
+import contextlib
+import numpy as np
+from pengukuran_waktu import ringkas_statistik
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Satu penyimpanan hasil untuk semua backend dan semua run (dibaca oleh perbandingan.py): file utama ini plus
+# segmen append-only di folder_segmen(path). Setiap tambah_catatan() hanya menulis segmen kecil berisi baris
+# barunya; muat_hasil() menggabungkan file utama dan semua segmen.
+PATH_PENYIMPANAN = os.path.join("matrix_results", "hasil_benchmark.npz")
+
+# Bila jumlah segmen satu tingkat melewati batas ini, segmen-segmen itu digabung: segmen per-append (tingkat 0)
+# menjadi satu segmen tingkat 1, dan segmen tingkat 1 ke file utama. Biaya penggabungan terbagi rata ke banyak
+# append, jadi append tetap sebanding dengan jumlah baris barunya, bukan dengan panjang riwayat.
+BATAS_SEGMEN = 64
+
+# Ukuran contoh hasil (pojok kiri atas) yang disimpan per catatan
+UKURAN_CONTOH = 5
+
+# Skema kolom: satu baris per (run, backend, tipe data, dimensi, fase).
+# Waktu setiap ulangan disimpan terpisah di array "ulangan" yang datar; baris menunjuk ke
+# potongan miliknya lewat awal_ulangan dan jumlah_ulangan.
+SKEMA = np.dtype([
+    ("id_run", "U40"),
+    ("waktu_run", "f8"),
+    ("backend", "U32"),
+    ("info_backend", "U96"),
+    ("dtype", "U8"),
+    ("dim", "i8"),
+    ("bentuk", "i8", (3,)),  # (m, k, n); (dim, dim, dim) untuk sapuan persegi, dim = m untuk fase perkalian_bentuk
+    ("ukuran_batch", "i8"),
+    ("kepadatan", "f8"),  # fraksi elemen bukan nol operand; 1.0 untuk backend padat
+    ("mode", "U12"),  # "berurutan", atau "pipeline" bila tahap pembuatan/simpan berjalan bersamaan (pipeline_sapuan.py)
+    ("fase", "U16"),
+    ("jalur", "U16"),
+    ("median", "f8"),
+    ("min", "f8"),
+    ("iqr", "f8"),
+    ("ci_bawah", "f8"),
+    ("ci_atas", "f8"),
+    ("iterasi", "i8"),
+    ("awal_ulangan", "i8"),
+    ("jumlah_ulangan", "i8"),
+    ("contoh", "f8", (UKURAN_CONTOH, UKURAN_CONTOH)),
+    ("checksum", "f8"),
+    ("terverifikasi", "i1"),  # 1 lolos, 0 gagal, -1 tidak diperiksa
+    ("gflops", "f8"),
+    ("byte_dipindahkan", "f8"),
+    ("intensitas_aritmetika", "f8"),
+    ("rss_dasar", "i8"),  # RSS sebelum pembuatan matriks dimensi ini
+    ("rss_puncak", "i8"),
+    ("ru_maxrss", "i8"),
+    ("page_fault_minor", "i8"),
+    ("byte_puncak_alokasi", "i8"),
+    ("byte_bersih_alokasi", "i8"),
+    ("jumlah_blok_alokasi", "i8"),
+    ("memori_perangkat_puncak", "i8"),
+    ("hostname", "U64"),
+    ("sidik_host", "U16"),  # lihat sidik_host(); kosong di file lama
+    ("versi_python", "U16"),
+    ("versi_numpy", "U16"),
+])
+
+# Kolom metrik roofline (roofline.metrik_perkalian), hanya terisi pada baris fase perkalian
+KOLOM_METRIK = ("gflops", "byte_dipindahkan", "intensitas_aritmetika")
+
+# Kolom profil memori per fase (profil_memori.ProfilMemori); -1 bila tidak diukur
+KOLOM_MEMORI = ("rss_puncak", "ru_maxrss", "page_fault_minor", "byte_puncak_alokasi", "byte_bersih_alokasi",
+                "jumlah_blok_alokasi", "memori_perangkat_puncak")
+
+# Fase pembuatan operand: dibangkitkan di backend, atau dimuat dari cache operand (cache_operand.CacheOperand)
+FASE_PEMBUATAN = ("pembuatan", "muat_cache")
+
+_id_run = None
+_sidik_host = None
+
+
+# ID run dibuat sekali per proses sehingga semua backend dalam satu eksekusi berbagi ID yang sama
+def id_run_sekarang():
+    global _id_run
+    if _id_run is None:
+        _id_run = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    return _id_run
+
+
+# Fungsi untuk melanjutkan run lama: baris berikutnya ditulis dengan ID run yang sama
+def atur_id_run(id_run):
+    global _id_run
+    _id_run = id_run
+
+
+def _model_cpu():
+    try:
+        with open("/proc/cpuinfo") as f:
+            for baris in f:
+                if baris.startswith("model name"):
+                    return baris.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+# Sidik host: nama host, arsitektur, model CPU dan jumlah CPU logis. Sengaja tanpa versi pustaka,
+# sehingga baseline regresi (regresi.py) tetap berlaku setelah pustaka atau BLAS diganti.
+def sidik_host():
+    global _sidik_host
+    if _sidik_host is None:
+        teks = "/".join([socket.gethostname(), platform.machine(), _model_cpu(), str(os.cpu_count())])
+        _sidik_host = hashlib.sha256(teks.encode()).hexdigest()[:16]
+    return _sidik_host
+
+
+def _tabel_kosong(skema=SKEMA):
+    return np.zeros(0, dtype=skema), np.zeros(0, dtype=np.float64)
+
+
+def folder_segmen(path=PATH_PENYIMPANAN):
+    return path + ".d"
+
+
+# Nama segmen: waktu (ns), tingkat, pid dan acak; urutan nama = urutan penulisan
+def _nama_segmen(tingkat, waktu_ns=None):
+    return f"{waktu_ns or time.time_ns():020d}-{tingkat}-{os.getpid()}-{uuid.uuid4().hex[:8]}.npz"
+
+
+def _tingkat_segmen(nama):
+    return int(nama.split("-")[1])
+
+
+def _daftar_segmen(path):
+    try:
+        return sorted(nama for nama in os.listdir(folder_segmen(path)) if nama.endswith(".npz"))
+    except FileNotFoundError:
+        return []
+
+
+# Fungsi untuk membaca satu file (utama atau segmen): (baris, ulangan, nama segmen yang sudah tergabung di dalamnya)
+def _baca_file(path, skema=SKEMA):
+    with np.load(path, allow_pickle=False) as data:
+        tergabung = set(data["tergabung"].tolist()) if "tergabung" in data.files else set()
+        return _sesuaikan_skema(data["baris"], skema), data["ulangan"], tergabung
+
+
+# Gabungkan potongan (baris, ulangan) menjadi satu tabel; awal_ulangan digeser ke posisi barunya
+def _gabung_bagian(bagian, skema=SKEMA):
+    if not bagian:
+        return _tabel_kosong(skema)
+    geser = np.cumsum([0] + [len(ulangan) for _, ulangan in bagian[:-1]])
+    daftar_baris = []
+    for (baris, _), awal in zip(bagian, geser):
+        baris = baris.copy()
+        baris["awal_ulangan"] += awal
+        daftar_baris.append(baris)
+    return np.concatenate(daftar_baris), np.concatenate([ulangan for _, ulangan in bagian])
+
+
+# Segmen dibaca setelah daftar segmen diambil; segmen yang sudah digabung ke file lain dilewati. Segmen yang
+# hilang di tengah pembacaan berarti proses lain sedang memadatkan, jadi pembacaan diulang.
+def _muat_semua(path, skema=SKEMA):
+    daftar_nama = _daftar_segmen(path)
+    tergabung = set()
+    bagian = []
+    if os.path.exists(path):
+        baris, ulangan, tergabung = _baca_file(path, skema)
+        bagian.append((None, baris, ulangan))
+    for nama in daftar_nama:
+        if nama in tergabung:
+            continue
+        baris, ulangan, sudah = _baca_file(os.path.join(folder_segmen(path), nama), skema)
+        tergabung |= sudah
+        bagian.append((nama, baris, ulangan))
+    return _gabung_bagian([(b, u) for nama, b, u in bagian if nama not in tergabung], skema), daftar_nama
+
+
+# Fungsi untuk memuat seluruh riwayat run (file utama dan semua segmen)
+# Mengembalikan (baris, ulangan): array terstruktur SKEMA dan array datar waktu ulangan
+# File lain dengan format yang sama (misalnya studi_skala.SKEMA_STUDI) dimuat dengan skema-nya sendiri
+def muat_hasil(path=PATH_PENYIMPANAN, skema=SKEMA):
+    while True:
+        try:
+            return _muat_semua(path, skema)[0]
+        except FileNotFoundError:
+            continue
+
+
+# File lama yang ditulis dengan skema sebelumnya diubah ke skema sekarang; kolom baru diisi nilai bawaan
+# (nilai bawaan khusus hanya dikenal untuk SKEMA, kolom baru skema lain diisi nol)
+def _sesuaikan_skema(baris, skema=SKEMA):
+    if baris.dtype == skema:
+        return baris
+    hasil = np.zeros(len(baris), dtype=skema)
+    if skema is SKEMA:
+        hasil["terverifikasi"] = -1
+        for kolom in KOLOM_METRIK:
+            hasil[kolom] = np.nan
+        for kolom in KOLOM_MEMORI + ("rss_dasar",):
+            hasil[kolom] = -1
+    for kolom in baris.dtype.names:
+        if kolom in skema.names:
+            hasil[kolom] = baris[kolom]
+    if skema is not SKEMA:
+        return hasil
+    if "bentuk" not in baris.dtype.names:
+        hasil["bentuk"] = hasil["dim"][:, None]
+    if "kepadatan" not in baris.dtype.names:
+        hasil["kepadatan"] = 1.0
+    if "mode" not in baris.dtype.names:
+        hasil["mode"] = "berurutan"
+    return hasil
+
+
+# Fungsi untuk mengambil waktu setiap ulangan milik satu baris
+def ulangan_baris(baris, ulangan):
+    return ulangan[baris["awal_ulangan"]:baris["awal_ulangan"] + baris["jumlah_ulangan"]]
+
+
+# Fungsi untuk memilih baris dengan kondisi kolom == nilai, misalnya pilih(baris, backend="numpy", fase="perkalian")
+def pilih(baris, **kondisi):
+    masker = np.ones(len(baris), dtype=bool)
+    for kolom, nilai in kondisi.items():
+        masker &= baris[kolom] == nilai
+    return baris[masker]
+
+
+# Fungsi untuk mengambil id_run terbaru yang memuat backend tertentu
+def id_run_terbaru(baris, backend=None):
+    if backend is not None:
+        baris = pilih(baris, backend=backend)
+    if len(baris) == 0:
+        return None
+    return baris["id_run"][np.argmax(baris["waktu_run"])]
+
+
+# Fungsi untuk mengambil {dim: median} satu backend, tipe data, fase dan mode dari run terbarunya
+def waktu_per_dimensi(baris, backend, dtype, fase, mode="berurutan"):
+    id_run = id_run_terbaru(baris, backend)
+    if id_run is None:
+        return {}
+    terpilih = pilih(baris, id_run=id_run, backend=backend, dtype=dtype, fase=fase, ukuran_batch=0, mode=mode)
+    return {int(dim): float(median) for dim, median in zip(terpilih["dim"], terpilih["median"])}
+
+
+def _statistik_baris(baris, ulangan):
+    statistik = {kolom: baris[kolom].item() for kolom in ("median", "min", "iqr", "ci_bawah", "ci_atas", "iterasi")}
+    statistik["ulangan"] = ulangan_baris(baris, ulangan).tolist()
+    return statistik
+
+
+# Fungsi untuk menyusun kembali catatan benchmark yang sudah tersimpan untuk satu run dan backend,
+# dipakai saat run dilanjutkan agar ringkasan dan plot tetap mencakup titik yang selesai sebelumnya.
+# Baris pembuatan menyimpan waktu pembuatan A + B per ulangan, jadi mediannya langsung dipakai.
+# Operand dari cache operand tersimpan sebagai fase "muat_cache" dan dipakai sebagai waktu pembuatannya.
+def catatan_tersimpan(id_run, backend, path=PATH_PENYIMPANAN, fase_perkalian="perkalian"):
+    baris, ulangan = muat_hasil(path)
+    baris = pilih(baris, id_run=id_run, backend=backend)
+    daftar_catatan = []
+    for b in pilih(baris, fase=fase_perkalian):
+        baris_buat = pilih(baris, dtype=b["dtype"], dim=b["dim"], ukuran_batch=b["ukuran_batch"])
+        baris_buat = baris_buat[np.isin(baris_buat["fase"], FASE_PEMBUATAN)]
+        statistik_buat = _statistik_baris(baris_buat[-1], ulangan) if len(baris_buat) else None
+        catatan = {
+            "backend": str(b["backend"]),
+            "dtype": str(b["dtype"]),
+            "dim": int(b["dim"]),
+            "jalur": str(b["jalur"]),
+            "waktu_pembuatan": statistik_buat["median"] if statistik_buat else 0.0,
+            "waktu_perkalian": float(b["median"]),
+            "statistik_pembuatan": statistik_buat,
+            "fase_pembuatan": str(baris_buat[-1]["fase"]) if statistik_buat else "pembuatan",
+            "statistik_perkalian": _statistik_baris(b, ulangan),
+            "contoh": b["contoh"].copy(),
+            "checksum": float(b["checksum"]),
+            "terverifikasi": None if b["terverifikasi"] < 0 else bool(b["terverifikasi"]),
+            "rss_dasar": int(b["rss_dasar"]),
+            "memori": {"perkalian": {kolom: None if b[kolom] < 0 else int(b[kolom]) for kolom in KOLOM_MEMORI}},
+        }
+        for kolom in KOLOM_METRIK:
+            catatan[kolom] = float(b[kolom])
+        daftar_catatan.append(catatan)
+    return daftar_catatan
+
+
+# Fungsi untuk mengubah satu fase dari catatan benchmark menjadi baris SKEMA dan daftar waktu ulangan
+def _ke_baris(catatan, fase, statistik, id_run, waktu_run, awal_ulangan, info_backend):
+    baris = np.zeros((), dtype=SKEMA)
+    baris["id_run"] = id_run
+    baris["waktu_run"] = waktu_run
+    baris["backend"] = catatan["backend"]
+    baris["info_backend"] = info_backend
+    baris["dtype"] = catatan["dtype"]
+    baris["dim"] = catatan["dim"]
+    baris["bentuk"] = catatan.get("bentuk", (catatan["dim"],) * 3)
+    baris["ukuran_batch"] = catatan.get("ukuran_batch", 0)
+    baris["kepadatan"] = catatan.get("kepadatan", 1.0)
+    baris["mode"] = catatan.get("mode", "berurutan")
+    baris["fase"] = fase
+    baris["jalur"] = catatan.get("jalur") or ""
+    for kolom in ("median", "min", "iqr", "ci_bawah", "ci_atas", "iterasi"):
+        baris[kolom] = statistik[kolom]
+    baris["awal_ulangan"] = awal_ulangan
+    baris["jumlah_ulangan"] = len(statistik["ulangan"])
+    adalah_perkalian = fase.startswith("perkalian")
+    baris["contoh"] = catatan["contoh"] if adalah_perkalian and catatan.get("contoh") is not None else np.nan
+    baris["checksum"] = catatan.get("checksum", np.nan) if adalah_perkalian else np.nan
+    terverifikasi = catatan.get("terverifikasi") if adalah_perkalian else None
+    baris["terverifikasi"] = -1 if terverifikasi is None else int(terverifikasi)
+    for kolom in KOLOM_METRIK:
+        baris[kolom] = catatan.get(kolom, np.nan) if adalah_perkalian else np.nan
+    fase_profil = "perkalian" if adalah_perkalian else "pembuatan" if fase in FASE_PEMBUATAN else fase
+    profil = catatan.get("memori", {}).get(fase_profil, {})
+    baris["rss_dasar"] = catatan.get("rss_dasar", -1)
+    for kolom in KOLOM_MEMORI:
+        nilai = profil.get(kolom)
+        baris[kolom] = -1 if nilai is None else nilai
+    baris["hostname"] = socket.gethostname()
+    baris["sidik_host"] = sidik_host()
+    baris["versi_python"] = platform.python_version()
+    baris["versi_numpy"] = np.__version__
+    return baris
+
+
+# Fungsi untuk menulis file secara atomik: tulis ke file sementara di folder yang sama lalu os.replace.
+# tergabung mencatat nama segmen yang isinya sudah ikut di file ini (lihat _muat_semua)
+def _simpan_atomik(path, baris, ulangan, tergabung=()):
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, path_sementara = tempfile.mkstemp(dir=folder, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, baris=baris, ulangan=ulangan, tergabung=np.array(sorted(tergabung), dtype=str))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path_sementara, path)
+    except BaseException:
+        os.unlink(path_sementara)
+        raise
+
+
+# Kunci antar-proses (file path + ".lock") untuk penulis file hasil; tanpa fcntl (Windows) tidak mengunci
+@contextlib.contextmanager
+def _kunci_file(path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".lock", "w") as kunci:
+        if fcntl is not None:
+            fcntl.flock(kunci, fcntl.LOCK_EX)
+        yield
+
+
+# Fungsi untuk menggabungkan segmen tingkat 0 menjadi satu segmen tingkat 1, lalu segmen tingkat 1 ke file
+# utama, bila jumlahnya melewati BATAS_SEGMEN. Dipanggil dengan kunci file dipegang. Segmen lama baru dihapus
+# setelah file gabungannya (yang mencatat nama segmen itu) tertulis, jadi pembaca tidak melihat baris ganda.
+def _padatkan_bila_perlu(path, skema=SKEMA):
+    folder = folder_segmen(path)
+    tingkat_0 = [nama for nama in _daftar_segmen(path) if _tingkat_segmen(nama) == 0]
+    if len(tingkat_0) > BATAS_SEGMEN:
+        bagian = [_baca_file(os.path.join(folder, nama), skema)[:2] for nama in tingkat_0]
+        waktu_ns = int(tingkat_0[-1].split("-")[0])
+        _simpan_atomik(os.path.join(folder, _nama_segmen(1, waktu_ns)), *_gabung_bagian(bagian, skema),
+                       tergabung=tingkat_0)
+        for nama in tingkat_0:
+            os.unlink(os.path.join(folder, nama))
+    if sum(_tingkat_segmen(nama) == 1 for nama in _daftar_segmen(path)) > BATAS_SEGMEN:
+        padatkan_penyimpanan(path, skema)
+
+
+# Fungsi untuk menggabungkan file utama dan semua segmen menjadi satu file utama. Dipanggil dengan kunci file
+# dipegang (penulis lain menunggu), pembaca tanpa kunci tetap melihat isi yang utuh
+def padatkan_penyimpanan(path=PATH_PENYIMPANAN, skema=SKEMA):
+    (baris, ulangan), daftar_nama = _muat_semua(path, skema)
+    if not daftar_nama:
+        return
+    _simpan_atomik(path, baris, ulangan, tergabung=daftar_nama)
+    for nama in daftar_nama:
+        os.unlink(os.path.join(folder_segmen(path), nama))
+
+
+# Fungsi untuk menulis ulang seluruh isi sebuah penyimpanan (bukan append), misalnya baseline regresi yang
+# memangkas entri lama. ubah(baris, ulangan) menerima isi sekarang (file utama dan semua segmen) dan
+# mengembalikan isi barunya. Baca-ubah-tulis berjalan dengan kunci file dipegang, jadi penulis lain tidak
+# kehilangan barisnya; segmen yang sudah terbaca dicatat tergabung di file baru lalu dihapus
+def tulis_ulang_penyimpanan(ubah, path=PATH_PENYIMPANAN, skema=SKEMA):
+    with _kunci_file(path):
+        (baris, ulangan), daftar_nama = _muat_semua(path, skema)
+        baris, ulangan = ubah(baris, ulangan)
+        _simpan_atomik(path, baris, ulangan, tergabung=daftar_nama)
+        for nama in daftar_nama:
+            os.unlink(os.path.join(folder_segmen(path), nama))
+    return baris, ulangan
+
+
+# Fungsi untuk menambahkan baris yang sudah tersusun ke penyimpanan (append-only, atomik): baris dengan
+# dtype skema dan ulangan datarnya, awal_ulangan dihitung dari 0 di dalam ulangan ini. Baris ditulis sebagai
+# satu segmen baru dengan kunci file dipegang; riwayat lama tidak dibaca ulang. Dipakai juga untuk file lain
+# dengan format yang sama, misalnya studi_skala.PATH_STUDI dengan SKEMA_STUDI
+def tambah_baris(baris, ulangan, path=PATH_PENYIMPANAN, skema=SKEMA):
+    if len(baris) == 0:
+        return
+    # Kunci antar-proses agar penggabungan segmen tidak berjalan bersamaan dengan penulis lain
+    with _kunci_file(path):
+        _simpan_atomik(os.path.join(folder_segmen(path), _nama_segmen(0)), baris, ulangan)
+        _padatkan_bila_perlu(path, skema)
+
+
+# Fungsi untuk menambahkan catatan benchmark ke penyimpanan (lewat tambah_baris)
+# Setiap catatan menjadi baris "pembuatan" (atau "muat_cache" untuk operand dari cache operand, bila ada
+# statistiknya), baris perkalian dan baris "simpan" (bila fasenya diprofilkan)
+def tambah_catatan(daftar_catatan, path=PATH_PENYIMPANAN, info_backend="", fase_perkalian="perkalian"):
+    id_run = id_run_sekarang()
+    waktu_run = time.time()
+    baris_baru = []
+    ulangan_baru = []
+    awal = 0
+    for catatan in daftar_catatan:
+        # Fase simpan hanya punya satu durasi dari profil memorinya
+        profil_simpan = catatan.get("memori", {}).get("simpan")
+        daftar_fase = [(catatan.get("fase_pembuatan", "pembuatan"), catatan.get("statistik_pembuatan")),
+                       (fase_perkalian, catatan.get("statistik_perkalian")),
+                       ("simpan", None if profil_simpan is None else ringkas_statistik([profil_simpan["durasi"]]))]
+        for fase, statistik in daftar_fase:
+            if statistik is None:
+                continue
+            baris_baru.append(_ke_baris(catatan, fase, statistik, id_run, waktu_run, awal, info_backend))
+            ulangan_baru.append(np.asarray(statistik["ulangan"], dtype=np.float64))
+            awal += len(statistik["ulangan"])
+    if not baris_baru:
+        return
+    tambah_baris(np.stack(baris_baru), np.concatenate(ulangan_baru), path)
+    print(f"{len(baris_baru)} baris hasil (run {id_run}) ditambahkan ke {path}")
+
+
+# Fungsi untuk mencetak ringkasan isi penyimpanan (jumlah run, baris, host, versi)
+def cetak_ringkasan_penyimpanan(path=PATH_PENYIMPANAN):
+    baris, ulangan = muat_hasil(path)
+    print(f"\nPenyimpanan {path}: {len(np.unique(baris['id_run']))} run, {len(baris)} baris, {len(ulangan)} waktu ulangan, "
+          f"{len(_daftar_segmen(path))} segmen")
+    for id_run in np.unique(baris["id_run"]):
+        terpilih = pilih(baris, id_run=id_run)
+        print(f"  {id_run}: {', '.join(np.unique(terpilih['backend']))} di {terpilih['hostname'][0]} "
+              f"(Python {terpilih['versi_python'][0]}, NumPy {terpilih['versi_numpy'][0]})")
@@ -1,231 +1,382 @@
-import matplotlib.pyplot as plt
-import json
 import os
+import json
+import time
+import warnings
+import hashlib
 import numpy as np
+from penyimpanan_hasil import PATH_PENYIMPANAN, muat_hasil, id_run_terbaru
+from roofline import flop_perkalian
 
-# Buat direktori untuk plot jika belum ada
-os.makedirs("matrix_results", exist_ok=True)
-
-# Muat data waktu untuk pembuatan matriks
-try:
-    with open("matrix_results/numpy_generation_times.json", "r") as f:
-        numpy_gen_times_dict = json.load(f)
-    print("Data waktu pembuatan NumPy berhasil dimuat")
-except FileNotFoundError:
-    try:
-        with open("matrix_results/waktu_pembuatan_numpy.json", "r") as f:
-            numpy_gen_times_dict = json.load(f)
-        print("Data waktu pembuatan NumPy berhasil dimuat (jalur alternatif)")
-    except FileNotFoundError:
-        print("Data waktu pembuatan NumPy tidak ditemukan")
-        numpy_gen_times_dict = {}
-
-try:
-    with open("matrix_results/cupy_generation_times.json", "r") as f:
-        cupy_gen_times_dict = json.load(f)
-    print("Data waktu pembuatan CuPy berhasil dimuat")
-except FileNotFoundError:
-    try:
-        with open("matrix_results/waktu_pembuatan_cupy.json", "r") as f:
-            cupy_gen_times_dict = json.load(f)
-        print("Data waktu pembuatan CuPy berhasil dimuat (jalur alternatif)")
-    except FileNotFoundError:
-        print("Data waktu pembuatan CuPy tidak ditemukan")
-        cupy_gen_times_dict = {}
-
-# Muat data waktu untuk perkalian matriks
-try:
-    with open("matrix_results/numpy_multiplication_times.json", "r") as f:
-        numpy_mult_times_dict = json.load(f)
-    print("Data waktu perkalian NumPy berhasil dimuat")
-except FileNotFoundError:
-    try:
-        with open("matrix_results/waktu_perkalian_numpy.json", "r") as f:
-            numpy_mult_times_dict = json.load(f)
-        print("Data waktu perkalian NumPy berhasil dimuat (jalur alternatif)")
-    except FileNotFoundError:
-        print("Data waktu perkalian NumPy tidak ditemukan")
-        numpy_mult_times_dict = {}
-
-try:
-    with open("matrix_results/cupy_multiplication_times.json", "r") as f:
-        cupy_mult_times_dict = json.load(f)
-    print("Data waktu perkalian CuPy berhasil dimuat")
-except FileNotFoundError:
-    try:
-        with open("matrix_results/waktu_perkalian_cupy.json", "r") as f:
-            cupy_mult_times_dict = json.load(f)
-        print("Data waktu perkalian CuPy berhasil dimuat (jalur alternatif)")
-    except FileNotFoundError:
-        print("Data waktu perkalian CuPy tidak ditemukan")
-        cupy_mult_times_dict = {}
-
-# Ubah kunci string menjadi integer (JSON mengubah kunci menjadi string)
-numpy_gen_times_dict = {int(k): v for k, v in numpy_gen_times_dict.items()}
-cupy_gen_times_dict = {int(k): v for k, v in cupy_gen_times_dict.items()}
-numpy_mult_times_dict = {int(k): v for k, v in numpy_mult_times_dict.items()}
-cupy_mult_times_dict = {int(k): v for k, v in cupy_mult_times_dict.items()}
+# Tipe data yang dibandingkan (sama dengan tipe data skrip sebelumnya)
+tipe_data_dibandingkan = "int64"
 
-# Fungsi visualisasi untuk menghindari duplikasi kode
-def buat_plot_perbandingan(waktu_numpy, waktu_cupy, judul, nama_file, tipe_operasi):
-    if not waktu_numpy or not waktu_cupy:
-        print(f"Data tidak cukup untuk membuat plot perbandingan {tipe_operasi}.")
+# Mode sapuan yang dibandingkan: "berurutan" atau "pipeline" (kolom mode penyimpanan hasil). Waktu kedua mode
+# tidak pernah dicampur dalam satu tabel atau riwayat.
+mode_dibandingkan = "berurutan"
+
+# Folder plot perbandingan
+FOLDER_PLOT = "matrix_results"
+
+# File indeks sidik plot di folder plot (nama file -> sidik rekaman sumbernya)
+PATH_INDEKS_PLOT = "indeks_plot.json"
+
+# Jumlah run terakhir yang ditampilkan di tabel riwayat
+JUMLAH_RUN_RIWAYAT = 8
+
+# Label backend di plot dan tabel
+LABEL_BACKEND = {"numpy": "NumPy", "cupy": "CuPy (CUDA)"}
+
+
+def _label(nama_backend):
+    return LABEL_BACKEND.get(nama_backend, nama_backend)
+
+
+# Baris satu fase, tipe data dan mode sapuan, tanpa baris mode batch
+def _baris_fase(baris, tipe_data, fase, mode=mode_dibandingkan):
+    return baris[(baris["fase"] == fase) & (baris["dtype"] == tipe_data) & (baris["ukuran_batch"] == 0)
+                 & (baris["mode"] == mode)]
+
+
+# Akhiran nama file plot agar plot mode pipeline tidak menimpa plot mode berurutan
+def _akhiran_mode(mode):
+    return "" if mode == "berurutan" else f"_{mode}"
+
+
+# Sidik isi rekaman sumber (dan parameter gambar): plot hanya digambar ulang bila sidiknya berubah
+def sidik(*bagian):
+    h = hashlib.sha256()
+    for b in bagian:
+        h.update(np.ascontiguousarray(b).tobytes() if isinstance(b, np.ndarray) else repr(b).encode())
+    return h.hexdigest()
+
+
+# Fungsi untuk menyusun tabel waktu median [backend, dimensi] dari run terbaru setiap backend (atau id_run tertentu)
+# dalam satu lintasan vektor atas baris penyimpanan. Sel tanpa data bernilai NaN.
+# Mengembalikan (dimensi, waktu, sidik rekaman sumber)
+def tabel_waktu(baris, daftar_backend, tipe_data=tipe_data_dibandingkan, fase="perkalian", id_run=None,
+                mode=mode_dibandingkan):
+    terpilih = _baris_fase(baris, tipe_data, fase, mode)
+    masker = np.zeros(len(terpilih), dtype=bool)
+    for nama_backend in daftar_backend:
+        run = id_run or id_run_terbaru(terpilih, nama_backend)
+        masker |= (terpilih["backend"] == nama_backend) & (terpilih["id_run"] == run)
+    terpilih = terpilih[masker]
+
+    nama = np.asarray(daftar_backend)
+    urutan = np.argsort(nama)
+    indeks_backend = urutan[np.searchsorted(nama[urutan], terpilih["backend"])]
+    dimensi, indeks_dimensi = np.unique(terpilih["dim"], return_inverse=True)
+    waktu = np.full((len(nama), len(dimensi)), np.nan)
+    waktu[indeks_backend, indeks_dimensi] = terpilih["median"]
+    return dimensi, waktu, sidik(terpilih)
+
+
+# Fungsi untuk menyusun riwayat waktu median [run, dimensi] satu backend atas semua run yang tersimpan,
+# diurutkan menurut waktu mulai run. Mengembalikan (id_run, waktu_mulai, dimensi, waktu, sidik rekaman sumber)
+def riwayat_waktu(baris, nama_backend, tipe_data=tipe_data_dibandingkan, fase="perkalian", mode=mode_dibandingkan):
+    terpilih = _baris_fase(baris, tipe_data, fase, mode)
+    terpilih = terpilih[terpilih["backend"] == nama_backend]
+    daftar_run, indeks_run = np.unique(terpilih["id_run"], return_inverse=True)
+    # Baris satu run ditulis per titik, jadi waktu mulai run adalah waktu_run terkecilnya
+    waktu_mulai = np.full(len(daftar_run), np.inf)
+    np.minimum.at(waktu_mulai, indeks_run, terpilih["waktu_run"])
+    dimensi, indeks_dimensi = np.unique(terpilih["dim"], return_inverse=True)
+    waktu = np.full((len(daftar_run), len(dimensi)), np.nan)
+    waktu[indeks_run, indeks_dimensi] = terpilih["median"]
+
+    urutan = np.argsort(waktu_mulai)
+    return daftar_run[urutan], waktu_mulai[urutan], dimensi, waktu[urutan], sidik(terpilih)
+
+
+# Fungsi untuk menggambar plot hanya bila sidik sumbernya berbeda dari gambar yang sudah ada
+# Sidik setiap file disimpan di indeks JSON di folder plot. Mengembalikan True bila plot digambar ulang.
+def gambar_jika_berubah(path, sidik_sumber, gambar):
+    path_indeks = os.path.join(os.path.dirname(path) or ".", PATH_INDEKS_PLOT)
+    indeks = {}
+    if os.path.exists(path_indeks):
+        with open(path_indeks) as f:
+            indeks = json.load(f)
+    nama = os.path.basename(path)
+    if indeks.get(nama) == sidik_sumber and os.path.exists(path):
+        print(f"Plot '{path}' tidak berubah, dilewati")
         return False
-        
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    gambar()
+    indeks[nama] = sidik_sumber
+    with open(path_indeks + ".tmp", "w") as f:
+        json.dump(indeks, f, indent=2)
+    os.replace(path_indeks + ".tmp", path_indeks)
+    return True
+
+
+# Fungsi untuk mencetak percepatan backend pembanding terhadap backend dasar (GFLOP/s untuk perkalian)
+def cetak_percepatan_perbandingan(waktu_dasar, waktu_pembanding, tipe_operasi, dasar="numpy", pembanding="cupy"):
+    label_dasar, label_pembanding = _label(dasar), _label(pembanding)
+    print(f"\nRingkasan Percepatan {tipe_operasi.capitalize()}:")
+    print("=" * 90)
+    print(f"{'Dimensi':<10} {'Waktu ' + label_dasar + ' (s)':<15} {'Waktu ' + label_pembanding + ' (s)':<15} {'Percepatan':<12} "
+          f"{'GFLOP/s ' + label_dasar:<15} {'GFLOP/s ' + label_pembanding:<15}")
+    print("-" * 90)
+
+    dimensi_umum = sorted(set(waktu_dasar.keys()) & set(waktu_pembanding.keys()))
+
+    percepatan = []
+    for dim in dimensi_umum:
+        waktu_1 = waktu_dasar.get(dim, float('nan'))
+        waktu_2 = waktu_pembanding.get(dim, float('nan'))
+
+        if waktu_1 > 0 and waktu_2 > 0:
+            speedup = waktu_1 / waktu_2
+            percepatan.append(speedup)
+            gflops_dasar = flop_perkalian(dim, dim, dim) / waktu_1 / 1e9
+            gflops_pembanding = flop_perkalian(dim, dim, dim) / waktu_2 / 1e9
+            if tipe_operasi == "perkalian":
+                print(f"{dim:<10} {waktu_1:<15.6f} {waktu_2:<15.6f} {speedup:<10.2f}x  {gflops_dasar:<15.2f} {gflops_pembanding:<15.2f}")
+            else:
+                print(f"{dim:<10} {waktu_1:<15.6f} {waktu_2:<15.6f} {speedup:<10.2f}x")
+        else:
+            print(f"{dim:<10} {waktu_1:<15.6f} {waktu_2:<15.6f} {'N/A':<10}")
+
+    if percepatan:
+        rata_rata_percepatan = np.mean(percepatan)
+        print(f"Rata-rata Percepatan: {rata_rata_percepatan:.2f}x")
+
+
+# Fungsi untuk memilih maksimal sekitar `jumlah` tick dimensi yang terdistribusi merata, termasuk dimensi terbesar
+def _tick_dimensi(semua_dimensi, jumlah):
+    step = max(1, len(semua_dimensi) // jumlah)
+    tick_dimensions = semua_dimensi[::step]
+    if semua_dimensi[-1] not in tick_dimensions:
+        tick_dimensions.append(semua_dimensi[-1])
+    return tick_dimensions
+
+
+# Fungsi visualisasi untuk menghindari duplikasi kode
+def buat_plot_perbandingan(waktu_numpy, waktu_cupy, judul, nama_file, tipe_operasi, dasar="numpy", pembanding="cupy"):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 7))
-    
-    # Plot waktu NumPy
+
+    # Plot waktu backend dasar
     np_dims = sorted(waktu_numpy.keys())
     np_times = [waktu_numpy[d] for d in np_dims]
-    plt.plot(np_dims, np_times, 'o-', label='NumPy', color='blue', linewidth=2, markersize=8)
-    
-    # Plot waktu CuPy
+    plt.plot(np_dims, np_times, 'o-', label=_label(dasar), color='blue', linewidth=2, markersize=8)
+
+    # Plot waktu backend pembanding
     cp_dims = sorted(waktu_cupy.keys())
     cp_times = [waktu_cupy[d] for d in cp_dims]
-    plt.plot(cp_dims, cp_times, 's-', label='CuPy (CUDA)', color='green', linewidth=2, markersize=8)
-    
+    plt.plot(cp_dims, cp_times, 's-', label=_label(pembanding), color='green', linewidth=2, markersize=8)
+
     plt.xlabel('Dimensi Matriks', fontsize=12)
     plt.ylabel('Waktu Eksekusi (detik)', fontsize=12)
     plt.title(judul, fontsize=14)
     plt.legend(fontsize=12)
-    
+
     # Tambahkan grid untuk keterbacaan yang lebih baik
     plt.grid(True)
-    
+
     # Buat ticks yang lebih rapi (tidak terlalu padat)
     semua_dimensi = sorted(list(set(list(waktu_numpy.keys()) + list(waktu_cupy.keys()))))
-    
-    # Jika jumlah dimensi terlalu banyak, pilih subset untuk ditampilkan
+
+    # Jika jumlah dimensi terlalu banyak, pilih maksimal 10 dimensi yang terdistribusi merata
     if len(semua_dimensi) > 10:
-        # Pilih maksimal 10 dimensi yang terdistribusi merata
-        step = max(1, len(semua_dimensi) // 10)
-        tick_dimensions = semua_dimensi[::step]
-        
-        # Pastikan dimensi terbesar selalu ditampilkan
-        if semua_dimensi[-1] not in tick_dimensions:
-            tick_dimensions.append(semua_dimensi[-1])
-            
+        tick_dimensions = _tick_dimensi(semua_dimensi, 10)
         plt.xticks(tick_dimensions, [str(d) for d in tick_dimensions], rotation=45)
     else:
         plt.xticks(semua_dimensi, [str(d) for d in semua_dimensi], rotation=45)
-    
+
     # Buat skala y-axis yang lebih rapi
     y_data = np_times + cp_times
     y_min, y_max = min(y_data), max(y_data)
-    
+
     # Atur ticks pada sumbu y agar lebih terdistribusi merata
     y_range = y_max - y_min
     if y_range > 0:
         num_ticks = min(10, max(5, len(y_data)))  # Antara 5-10 ticks
         plt.yticks(np.linspace(0, y_max * 1.05, num_ticks))
-    
+
     plt.tight_layout()
     plt.savefig(nama_file)
+    plt.close()
     print(f"Plot perbandingan {tipe_operasi} disimpan ke '{nama_file}'")
-    
-    # Hitung dan cetak percepatan
-    print(f"\nRingkasan Percepatan {tipe_operasi.capitalize()}:")
-    print("=" * 70)
-    print(f"{'Dimensi':<10} {'Waktu NumPy (s)':<15} {'Waktu CuPy (s)':<15} {'Percepatan':<10}")
-    print("-" * 70)
-    
-    dimensi_umum = sorted(set(waktu_numpy.keys()) & set(waktu_cupy.keys()))
-    
-    percepatan = []
-    for dim in dimensi_umum:
-        np_time = waktu_numpy.get(dim, float('nan'))
-        cp_time = waktu_cupy.get(dim, float('nan'))
-        
-        if np_time > 0 and cp_time > 0:
-            speedup = np_time / cp_time
-            percepatan.append(speedup)
-            print(f"{dim:<10} {np_time:<15.6f} {cp_time:<15.6f} {speedup:<10.2f}x")
-        else:
-            print(f"{dim:<10} {np_time:<15.6f} {cp_time:<15.6f} {'N/A':<10}")
-    
-    if percepatan:
-        rata_rata_percepatan = np.mean(percepatan)
-        print(f"Rata-rata Percepatan: {rata_rata_percepatan:.2f}x")
-    
-    return True
 
-# Buat visualisasi untuk perbandingan pembuatan matriks
-plot_pembuatan_dibuat = buat_plot_perbandingan(
-    numpy_gen_times_dict,
-    cupy_gen_times_dict,
-    'Performa Pembuatan Matriks: NumPy vs CuPy (CUDA)',
-    'matrix_results/generation_comparison.png',
-    'pembuatan'
-)
-
-# Buat visualisasi untuk perbandingan perkalian matriks
-plot_perkalian_dibuat = buat_plot_perbandingan(
-    numpy_mult_times_dict,
-    cupy_mult_times_dict,
-    'Performa Perkalian Matriks: NumPy vs CuPy (CUDA)',
-    'matrix_results/multiplication_comparison.png',
-    'perkalian'
-)
-
-# Buat visualisasi gabungan jika kedua operasi memiliki data
-if plot_pembuatan_dibuat and plot_perkalian_dibuat:
+
+# Fungsi untuk menggambar perbandingan pembuatan dan perkalian dalam satu gambar
+def buat_plot_gabungan(waktu, nama_file, dasar="numpy", pembanding="cupy"):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(15, 10))
-    
-    # Subplot perbandingan pembuatan
-    plt.subplot(2, 1, 1)
-    np_dims = sorted(numpy_gen_times_dict.keys())
-    np_times = [numpy_gen_times_dict[d] for d in np_dims]
-    plt.plot(np_dims, np_times, 'o-', label='NumPy', color='blue', linewidth=2)
-    
-    cp_dims = sorted(cupy_gen_times_dict.keys())
-    cp_times = [cupy_gen_times_dict[d] for d in cp_dims]
-    plt.plot(cp_dims, cp_times, 's-', label='CuPy (CUDA)', color='green', linewidth=2)
-    
-    plt.xlabel('Dimensi Matriks')
-    plt.ylabel('Waktu (detik)')
-    plt.title('Perbandingan Performa Pembuatan Matriks')
-    plt.legend()
-    plt.grid(True)
-    
-    # Buat ticks yang lebih rapi
-    semua_dimensi = sorted(list(set(list(numpy_gen_times_dict.keys()) + list(cupy_gen_times_dict.keys()))))
-    if len(semua_dimensi) > 10:
-        step = max(1, len(semua_dimensi) // 8)
-        tick_dimensions = semua_dimensi[::step]
-        if semua_dimensi[-1] not in tick_dimensions:
-            tick_dimensions.append(semua_dimensi[-1])
-        plt.xticks(tick_dimensions, [str(d) for d in tick_dimensions], rotation=45)
-    
-    # Subplot perbandingan perkalian
-    plt.subplot(2, 1, 2)
-    np_dims = sorted(numpy_mult_times_dict.keys())
-    np_times = [numpy_mult_times_dict[d] for d in np_dims]
-    plt.plot(np_dims, np_times, 'o-', label='NumPy', color='blue', linewidth=2)
-    
-    cp_dims = sorted(cupy_mult_times_dict.keys())
-    cp_times = [cupy_mult_times_dict[d] for d in cp_dims]
-    plt.plot(cp_dims, cp_times, 's-', label='CuPy (CUDA)', color='green', linewidth=2)
-    
-    plt.xlabel('Dimensi Matriks')
-    plt.ylabel('Waktu (detik)')
-    plt.title('Perbandingan Performa Perkalian Matriks')
-    plt.legend()
+    for posisi, (fase, judul) in enumerate([("pembuatan", 'Perbandingan Performa Pembuatan Matriks'),
+                                            ("perkalian", 'Perbandingan Performa Perkalian Matriks')], start=1):
+        waktu_dasar, waktu_pembanding = waktu[fase]
+        plt.subplot(2, 1, posisi)
+        np_dims = sorted(waktu_dasar.keys())
+        plt.plot(np_dims, [waktu_dasar[d] for d in np_dims], 'o-', label=_label(dasar), color='blue', linewidth=2)
+
+        cp_dims = sorted(waktu_pembanding.keys())
+        plt.plot(cp_dims, [waktu_pembanding[d] for d in cp_dims], 's-', label=_label(pembanding), color='green', linewidth=2)
+
+        plt.xlabel('Dimensi Matriks')
+        plt.ylabel('Waktu (detik)')
+        plt.title(judul)
+        plt.legend()
+        plt.grid(True)
+
+        # Buat ticks yang lebih rapi
+        semua_dimensi = sorted(set(waktu_dasar.keys()) | set(waktu_pembanding.keys()))
+        if len(semua_dimensi) > 10:
+            tick_dimensions = _tick_dimensi(semua_dimensi, 8)
+            plt.xticks(tick_dimensions, [str(d) for d in tick_dimensions], rotation=45)
+
+    plt.tight_layout()
+    plt.savefig(nama_file)
+    plt.close()
+    print(f"Perbandingan performa gabungan disimpan ke '{nama_file}'")
+
+
+# Satu baris tabel waktu sebagai {dimensi: waktu}, tanpa sel NaN
+def _ke_dict(dimensi, waktu):
+    ada = ~np.isnan(waktu)
+    return dict(zip(dimensi[ada].tolist(), waktu[ada].tolist()))
+
+
+# Fungsi untuk membandingkan run terbaru dua backend: tabel percepatan, dan plot bila plot=True
+# Plot hanya digambar ulang bila rekaman sumbernya berubah sejak plot terakhir
+def bandingkan(dasar="numpy", pembanding="cupy", tipe_data=tipe_data_dibandingkan, path=PATH_PENYIMPANAN,
+               plot=True, folder=FOLDER_PLOT, mode=mode_dibandingkan):
+    baris, _ = muat_hasil(path)
+    judul = f'{_label(dasar)} vs {_label(pembanding)}'
+    akhiran = _akhiran_mode(mode)
+    nama_file = {"pembuatan": f"generation_comparison{akhiran}.png", "perkalian": f"multiplication_comparison{akhiran}.png"}
+
+    waktu, sidik_fase, lengkap = {}, {}, {}
+    for fase in ("pembuatan", "perkalian"):
+        dimensi, tabel, sidik_fase[fase] = tabel_waktu(baris, [dasar, pembanding], tipe_data, fase, mode=mode)
+        waktu_dasar, waktu_pembanding = _ke_dict(dimensi, tabel[0]), _ke_dict(dimensi, tabel[1])
+        waktu[fase] = (waktu_dasar, waktu_pembanding)
+        lengkap[fase] = bool(waktu_dasar and waktu_pembanding)
+        if not lengkap[fase]:
+            print(f"Data tidak cukup untuk membandingkan {fase}.")
+            continue
+        if plot:
+            path_plot = os.path.join(folder, nama_file[fase])
+            gambar_jika_berubah(path_plot, sidik(sidik_fase[fase], dasar, pembanding),
+                                lambda: buat_plot_perbandingan(waktu_dasar, waktu_pembanding,
+                                                               f'Performa {fase.capitalize()} Matriks: {judul}',
+                                                               path_plot, fase, dasar, pembanding))
+        cetak_percepatan_perbandingan(waktu_dasar, waktu_pembanding, fase, dasar, pembanding)
+
+    # Buat visualisasi gabungan jika kedua operasi memiliki data
+    if plot and all(lengkap.values()):
+        path_plot = os.path.join(folder, f"combined_performance_comparison{akhiran}.png")
+        gambar_jika_berubah(path_plot, sidik(sidik_fase["pembuatan"], sidik_fase["perkalian"], dasar, pembanding),
+                            lambda: buat_plot_gabungan(waktu, path_plot, dasar, pembanding))
+
+    if not any(lengkap.values()):
+        print(f"Data tidak cukup untuk perbandingan. Pastikan benchmark {dasar} dan {pembanding} telah dijalankan.")
+    return lengkap
+
+
+# Fungsi untuk mencetak tabel percepatan banyak pasangan (dasar, pembanding) sekaligus dari run terbaru
+# setiap backend. Percepatan = waktu dasar / waktu pembanding, dihitung vektor per kolom pasangan.
+# Mengembalikan (dimensi, percepatan [pasangan, dimensi], sidik rekaman sumber)
+def cetak_tabel_percepatan(baris, pasangan, tipe_data=tipe_data_dibandingkan, fase="perkalian",
+                           mode=mode_dibandingkan):
+    daftar_backend = list(dict.fromkeys(nama for pasang in pasangan for nama in pasang))
+    dimensi, waktu, sidik_sumber = tabel_waktu(baris, daftar_backend, tipe_data, fase, mode=mode)
+    indeks = {nama: i for i, nama in enumerate(daftar_backend)}
+    indeks_dasar = [indeks[dasar] for dasar, _ in pasangan]
+    indeks_pembanding = [indeks[pembanding] for _, pembanding in pasangan]
+    percepatan = waktu[indeks_dasar] / waktu[indeks_pembanding]
+
+    kolom = [f"{pembanding}/{dasar}" for dasar, pembanding in pasangan]
+    lebar = max(12, *(len(k) + 2 for k in kolom))
+    print(f"\nPercepatan {fase} ({tipe_data}, mode {mode}), waktu dasar / waktu pembanding:")
+    print("=" * (10 + lebar * len(kolom)))
+    print(f"{'Dimensi':<10}" + "".join(f"{k:>{lebar}}" for k in kolom))
+    print("-" * (10 + lebar * len(kolom)))
+    for j, dim in enumerate(dimensi):
+        sel = ["N/A" if np.isnan(x) else f"{x:.2f}x" for x in percepatan[:, j]]
+        print(f"{dim:<10}" + "".join(f"{s:>{lebar}}" for s in sel))
+    # Pasangan tanpa dimensi bersama tidak punya rata-rata (NaN), bukan peringatan
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        rata_rata = np.exp(np.nanmean(np.log(percepatan), axis=1)) if dimensi.size else np.full(len(kolom), np.nan)
+    print("-" * (10 + lebar * len(kolom)))
+    print(f"{'Geomean':<10}" + "".join(f"{'N/A' if np.isnan(x) else f'{x:.2f}x':>{lebar}}" for x in rata_rata))
+    return dimensi, percepatan, sidik_sumber
+
+
+# Fungsi untuk mencetak riwayat waktu satu backend atas run terakhir: waktu median per dimensi per run,
+# plus rasio run terbaru terhadap median run-run sebelumnya (>1 berarti lebih lambat)
+def cetak_riwayat(baris, nama_backend, tipe_data=tipe_data_dibandingkan, fase="perkalian",
+                  jumlah_run=JUMLAH_RUN_RIWAYAT, mode=mode_dibandingkan):
+    daftar_run, waktu_mulai, dimensi, waktu, sidik_sumber = riwayat_waktu(baris, nama_backend, tipe_data, fase, mode)
+    if len(daftar_run) == 0:
+        print(f"Tidak ada riwayat {nama_backend} ({tipe_data}, {fase}, mode {mode}).")
+        return daftar_run, waktu_mulai, dimensi, waktu, sidik_sumber
+
+    tampil = slice(max(0, len(daftar_run) - jumlah_run), None)
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        rasio = waktu[-1] / np.nanmedian(waktu[:-1], axis=0) if len(daftar_run) > 1 else np.full(len(dimensi), np.nan)
+
+    print(f"\nRiwayat {fase} {nama_backend} ({tipe_data}, mode {mode}), {len(daftar_run)} run, waktu median (s):")
+    kolom = [time.strftime("%m-%d %H:%M", time.localtime(t)) for t in waktu_mulai[tampil]]
+    lebar_tabel = 10 + 13 * (len(kolom) + 1)
+    print("=" * lebar_tabel)
+    print(f"{'Dimensi':<10}" + "".join(f"{k:>13}" for k in kolom) + f"{'Terbaru/med':>13}")
+    print("-" * lebar_tabel)
+    for j, dim in enumerate(dimensi):
+        sel = ["-" if np.isnan(x) else f"{x:.6f}" for x in waktu[tampil, j]]
+        print(f"{dim:<10}" + "".join(f"{s:>13}" for s in sel) +
+              f"{'N/A' if np.isnan(rasio[j]) else f'{rasio[j]:.2f}x':>13}")
+    return daftar_run, waktu_mulai, dimensi, waktu, sidik_sumber
+
+
+# Fungsi untuk menggambar riwayat waktu per dimensi terhadap urutan run
+def buat_plot_riwayat(nama_backend, waktu_mulai, dimensi, waktu, nama_file, fase="perkalian"):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 7))
+    x = np.arange(len(waktu_mulai))
+    # Terlalu banyak dimensi membuat plot tidak terbaca: ambil maksimal 8 yang terdistribusi merata
+    for j in _tick_dimensi(list(range(len(dimensi))), 8):
+        ada = ~np.isnan(waktu[:, j])
+        plt.plot(x[ada], waktu[ada, j], 'o-', label=str(dimensi[j]), linewidth=2, markersize=5)
+    plt.yscale('log')
+    plt.xlabel('Run (urut waktu)', fontsize=12)
+    plt.ylabel('Waktu Eksekusi (detik)', fontsize=12)
+    plt.title(f'Riwayat Performa {fase.capitalize()} {_label(nama_backend)}', fontsize=14)
+    tick = _tick_dimensi(list(x), 10)
+    plt.xticks(tick, [time.strftime("%m-%d", time.localtime(waktu_mulai[i])) for i in tick], rotation=45)
+    plt.legend(title="Dimensi", fontsize=10)
     plt.grid(True)
-    
-    # Buat ticks yang lebih rapi
-    semua_dimensi = sorted(list(set(list(numpy_mult_times_dict.keys()) + list(cupy_mult_times_dict.keys()))))
-    if len(semua_dimensi) > 10:
-        step = max(1, len(semua_dimensi) // 8)
-        tick_dimensions = semua_dimensi[::step]
-        if semua_dimensi[-1] not in tick_dimensions:
-            tick_dimensions.append(semua_dimensi[-1])
-        plt.xticks(tick_dimensions, [str(d) for d in tick_dimensions], rotation=45)
-    
     plt.tight_layout()
-    plt.savefig('matrix_results/combined_performance_comparison.png')
-    print("Perbandingan performa gabungan disimpan ke 'matrix_results/combined_performance_comparison.png'")
+    plt.savefig(nama_file)
+    plt.close()
+    print(f"Plot riwayat {nama_backend} disimpan ke '{nama_file}'")
+
+
+# Fungsi laporan atas seluruh penyimpanan: tabel percepatan semua pasangan dan riwayat setiap backend
+# yang diminta, dengan plot riwayat yang hanya digambar ulang bila rekaman sumbernya berubah
+def laporan_perbandingan(pasangan=(), riwayat=(), tipe_data=tipe_data_dibandingkan, fase="perkalian",
+                         path=PATH_PENYIMPANAN, plot=False, folder=FOLDER_PLOT, mode=mode_dibandingkan):
+    baris, _ = muat_hasil(path)
+    if len(baris) == 0:
+        print("Penyimpanan hasil masih kosong.")
+        return False
+    if pasangan:
+        cetak_tabel_percepatan(baris, pasangan, tipe_data, fase, mode)
+    for nama_backend in riwayat:
+        _, waktu_mulai, dimensi, waktu, sidik_sumber = cetak_riwayat(baris, nama_backend, tipe_data, fase, mode=mode)
+        if plot and len(waktu_mulai):
+            path_plot = os.path.join(folder, f"riwayat_{fase}_{nama_backend}_{tipe_data}{_akhiran_mode(mode)}.png")
+            gambar_jika_berubah(path_plot, sidik_sumber,
+                                lambda: buat_plot_riwayat(nama_backend, waktu_mulai, dimensi, waktu, path_plot, fase))
+    return True
 
-if not plot_pembuatan_dibuat and not plot_perkalian_dibuat:
-    print("Data tidak cukup untuk membuat plot perbandingan. Pastikan skrip NumPy dan CuPy telah dijalankan.")
 
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    bandingkan()
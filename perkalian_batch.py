@@ -0,0 +1,101 @@
+import time
+from tipe_data import TIPE_DATA, TIPE_DATA_BAWAAN, byte_per_elemen_perkalian, jalur_perkalian
+from pengukuran_waktu import ringkas_statistik
+from verifikasi import JUMLAH_PUTARAN_BAWAAN, verifikasi_freivalds
+from roofline import metrik_perkalian
+
+# Dimensi kecil yang mendominasi beban produksi dan ukuran batch yang diuji
+DIMENSI_BATCH_BAWAAN = [8, 16, 32, 64, 128]
+UKURAN_BATCH_BAWAAN = [1, 16, 256, 4096]
+
+# Jumlah pasangan matriks yang dialirkan untuk setiap kombinasi dimensi x ukuran batch
+JUMLAH_MATRIKS_BAWAAN = 16384
+
+# Bagian dari memori backend yang boleh dipakai satu batch (A, B dan C sekaligus)
+FRAKSI_ANGGARAN_MEMORI = 0.25
+
+
+# Fungsi untuk menentukan anggaran memori default (byte) untuk satu batch di backend
+def anggaran_memori_batch(backend):
+    return int(backend.memori_tersedia() * FRAKSI_ANGGARAN_MEMORI)
+
+
+# Fungsi untuk membatasi ukuran batch agar A, B dan C satu batch muat di anggaran memori
+def ukuran_batch_maksimum(dim, tipe_data=TIPE_DATA_BAWAAN, anggaran_memori=None):
+    byte_per_matriks = dim * dim * byte_per_elemen_perkalian(TIPE_DATA[tipe_data])
+    return max(1, anggaran_memori // byte_per_matriks)
+
+
+# Generator batch: menghasilkan (A, B) bertumpuk berbentuk (batch, dim, dim) sampai jumlah_matriks
+# pasangan habis. Batch terakhir bisa lebih kecil. Hanya satu batch yang hidup sekaligus.
+def aliran_batch(backend, dim, ukuran_batch, jumlah_matriks, tipe_data=TIPE_DATA_BAWAAN):
+    sisa = jumlah_matriks
+    while sisa > 0:
+        batch = min(ukuran_batch, sisa)
+        yield (backend.buat_acak((batch, dim, dim), tipe_data),
+               backend.buat_acak((batch, dim, dim), tipe_data))
+        sisa -= batch
+
+
+# Fungsi untuk mengalirkan jumlah_matriks perkalian dim x dim dalam batch dan mengukur throughput
+# Waktu pembuatan dan perkalian dijumlahkan per batch; statistik dihitung dari waktu per matriks
+# setiap batch. Batch terakhir diperiksa dengan Freivalds. Mengembalikan (catatan, batch hasil terakhir)
+def jalankan_aliran_batch(backend, dim, ukuran_batch, jumlah_matriks=JUMLAH_MATRIKS_BAWAAN,
+                          tipe_data=TIPE_DATA_BAWAAN, anggaran_memori=None, putaran_verifikasi=JUMLAH_PUTARAN_BAWAAN):
+    if anggaran_memori is None:
+        anggaran_memori = anggaran_memori_batch(backend)
+    ukuran_batch = min(ukuran_batch, ukuran_batch_maksimum(dim, tipe_data, anggaran_memori), jumlah_matriks)
+
+    # Pemanasan satu batch agar inisialisasi BLAS/kernel GPU tidak ikut terukur
+    for matriks_a, matriks_b in aliran_batch(backend, dim, ukuran_batch, ukuran_batch, tipe_data):
+        backend.kalikan(matriks_a, matriks_b)
+    backend.sinkronisasi()
+
+    total_pembuatan_ns = 0
+    total_perkalian_ns = 0
+    waktu_per_matriks = []
+    jalur = None
+    hasil = None
+    aliran = aliran_batch(backend, dim, ukuran_batch, jumlah_matriks, tipe_data)
+    while True:
+        mulai = time.perf_counter_ns()
+        pasangan = next(aliran, None)
+        backend.sinkronisasi()
+        total_pembuatan_ns += time.perf_counter_ns() - mulai
+        if pasangan is None:
+            break
+        matriks_a, matriks_b = pasangan
+        if jalur is None:
+            jalur = backend.jalur(matriks_a, matriks_b)
+        # Jalur eksak bergantung pada nilai batch ini; dipilih sebelum waktu perkalian mulai diukur
+        jalur_batch = jalur_perkalian(matriks_a, matriks_b)
+
+        hasil = None
+        mulai = time.perf_counter_ns()
+        hasil = backend.kalikan(matriks_a, matriks_b, jalur_batch)
+        backend.sinkronisasi()
+        durasi_ns = time.perf_counter_ns() - mulai
+        total_perkalian_ns += durasi_ns
+        waktu_per_matriks.append(durasi_ns / matriks_a.shape[0] / 1e9)
+
+    terverifikasi = None
+    if putaran_verifikasi > 0 and hasil is not None:
+        terverifikasi = verifikasi_freivalds(matriks_a, matriks_b, hasil, putaran_verifikasi)
+
+    waktu_pembuatan = total_pembuatan_ns / 1e9
+    waktu_perkalian = total_perkalian_ns / 1e9
+    catatan = {
+        "backend": backend.nama,
+        "dtype": tipe_data,
+        "dim": dim,
+        "ukuran_batch": ukuran_batch,
+        "jumlah_matriks": jumlah_matriks,
+        "jalur": jalur,
+        "waktu_pembuatan": waktu_pembuatan,
+        "waktu_perkalian": waktu_perkalian,
+        "matriks_per_detik": jumlah_matriks / waktu_perkalian if waktu_perkalian > 0 else 0.0,
+        "statistik_perkalian": ringkas_statistik(waktu_per_matriks),
+        "terverifikasi": terverifikasi,
+    }
+    catatan.update(metrik_perkalian(dim, TIPE_DATA[tipe_data], jalur, waktu_perkalian, jumlah_matriks))
+    return catatan, hasil
@@ -0,0 +1,187 @@
+import numpy as np
+import os
+import shutil
+import psutil
+from tipe_data import (TIPE_DATA_BAWAAN, TIPE_DATA, tipe_hasil, buat_matriks_acak, byte_per_elemen_perkalian,
+                       jalur_perkalian, kalikan)
+from pengukuran_waktu import ukur, format_statistik
+from verifikasi import ChecksumAliran
+from benchmark import FOLDER_HASIL
+
+# Folder default untuk menyimpan file memmap matriks A, B dan C
+FOLDER_MEMMAP = os.path.join(FOLDER_HASIL, "memmap")
+
+# Bagian memori tersedia yang boleh dipakai oleh mode blok
+FRAKSI_ANGGARAN_MEMORI = 0.25
+
+
+# Fungsi untuk menentukan anggaran memori default (byte) untuk mode blok
+def anggaran_memori_default():
+    return int(psutil.virtual_memory().available * FRAKSI_ANGGARAN_MEMORI)
+
+
+# Fungsi untuk menghitung jumlah baris per panel agar muat di anggaran memori
+# byte_per_elemen: byte per kolom satu baris panel, dijumlahkan atas semua panel t x dim yang hidup bersamaan
+def hitung_ukuran_panel(dim, byte_per_elemen, anggaran_memori):
+    ukuran_panel = int(anggaran_memori // (dim * byte_per_elemen))
+    return max(1, min(dim, ukuran_panel))
+
+
+# Byte per elemen panel satu langkah perkalian blok: panel A, B dan C beserta salinan float jalur eksak
+# (byte_per_elemen_perkalian), ditambah hasil sementara kalikan() sebelum dijumlahkan ke panel C
+def byte_per_elemen_blok(dtype):
+    return byte_per_elemen_perkalian(dtype) + tipe_hasil(dtype).itemsize
+
+
+# Fungsi untuk memeriksa apakah disk cukup untuk menampung A, B dan C
+def periksa_disk_tersedia(dim, tipe_data=TIPE_DATA_BAWAAN, folder=FOLDER_MEMMAP):
+    os.makedirs(folder, exist_ok=True)
+    dtype = np.dtype(TIPE_DATA[tipe_data])
+    disk_dibutuhkan = dim * dim * (2 * dtype.itemsize + tipe_hasil(dtype).itemsize)
+    disk_tersedia = shutil.disk_usage(folder).free
+
+    disk_cukup = disk_dibutuhkan <= disk_tersedia * 0.95
+
+    print(f"Matriks Ukuran: {dim}x{dim} Membutuhkan {disk_dibutuhkan / (1024**3):.2f} GB disk untuk perkalian blok")
+    print(f"Disk Tersedia: {disk_tersedia / (1024**3):.2f} GB")
+    print(f"Disk Cukup: {disk_cukup}")
+
+    return disk_cukup
+
+
+# Fungsi untuk memetakan sebagian baris dari file memmap saja
+# (peta dilepas setelah dipakai agar halaman file tidak menumpuk di RSS)
+def _petakan_panel(matriks, baris_awal, jumlah_baris, mode):
+    dim_kolom = matriks.shape[1]
+    offset = matriks.offset + baris_awal * dim_kolom * matriks.dtype.itemsize
+    return np.memmap(matriks.filename, dtype=matriks.dtype, mode=mode,
+                     offset=offset, shape=(jumlah_baris, dim_kolom))
+
+
+def _baca_panel(matriks, baris_awal, jumlah_baris):
+    panel = _petakan_panel(matriks, baris_awal, jumlah_baris, "r")
+    salinan = np.array(panel)
+    del panel
+    return salinan
+
+
+def _tulis_panel(matriks, baris_awal, data):
+    panel = _petakan_panel(matriks, baris_awal, data.shape[0], "r+")
+    panel[:] = data
+    panel.flush()
+    del panel
+
+
+# Fungsi untuk membuat file memmap kosong berukuran dim x dim
+def _buat_file_memmap(path, dim, dtype):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    matriks = np.memmap(path, dtype=dtype, mode="w+", shape=(dim, dim))
+    del matriks
+    return np.memmap(path, dtype=dtype, mode="r", shape=(dim, dim))
+
+
+# Fungsi untuk membuat matriks acak langsung di disk, diisi per panel baris
+def buat_matriks_memmap(dim, path, tipe_data=TIPE_DATA_BAWAAN, anggaran_memori=None):
+    if anggaran_memori is None:
+        anggaran_memori = anggaran_memori_default()
+    dtype = TIPE_DATA[tipe_data]
+
+    def isi_matriks():
+        matriks = _buat_file_memmap(path, dim, dtype)
+        # Panel yang dibangkitkan ditambah salinan sementara pembangkit (int32 lalu astype untuk float)
+        ukuran_panel = hitung_ukuran_panel(dim, 4 * np.dtype(dtype).itemsize, anggaran_memori)
+        for baris_awal in range(0, dim, ukuran_panel):
+            jumlah_baris = min(ukuran_panel, dim - baris_awal)
+            panel = buat_matriks_acak(np, (jumlah_baris, dim), tipe_data)
+            _tulis_panel(matriks, baris_awal, panel)
+            del panel
+        return matriks
+
+    try:
+        # Matriks out-of-core terlalu besar untuk diulang, cukup diukur sekali
+        matriks, statistik = ukur(isi_matriks, pemanasan=0, ulangan=1)
+        print(f"NumPy memmap {dim}x{dim} ({tipe_data}) dibuat dalam {format_statistik(statistik)}")
+        return matriks, statistik
+    except OSError as e:
+        print(f"Kesalahan disk saat membuat matriks memmap {dim}x{dim}: {str(e)}")
+        return None, None
+
+
+# Fungsi untuk menghitung satu baris panel hasil C[i:i+baris_i, :] dari panel A dan semua panel B
+def _kalikan_baris_panel(matriks_b, panel_a, ukuran_panel, dtype, jalur):
+    dim = matriks_b.shape[0]
+    panel_c = np.zeros((panel_a.shape[0], matriks_b.shape[1]), dtype=dtype)
+    for k in range(0, dim, ukuran_panel):
+        baris_k = min(ukuran_panel, dim - k)
+        panel_b = _baca_panel(matriks_b, k, baris_k)
+        panel_c += kalikan(np, panel_a[:, k:k + baris_k], panel_b, jalur)
+        del panel_b
+    return panel_c
+
+
+# Fungsi untuk menjalankan baris panel pertama perkalian blok tanpa menulis hasil, dipakai untuk profil
+# memori di luar waktu terukur. Jejak memori perkalian blok dibatasi per panel, jadi satu baris panel
+# sudah mencapai puncaknya tanpa mengulang seluruh lintasan out-of-core
+def profil_panel_blok(matriks_a, matriks_b, anggaran_memori=None):
+    if anggaran_memori is None:
+        anggaran_memori = anggaran_memori_default()
+    dim = matriks_a.shape[0]
+    dtype_masuk = np.result_type(matriks_a.dtype, matriks_b.dtype)
+    ukuran_panel = hitung_ukuran_panel(dim, byte_per_elemen_blok(dtype_masuk), anggaran_memori)
+    panel_a = _baca_panel(matriks_a, 0, min(ukuran_panel, dim))
+    return _kalikan_baris_panel(matriks_b, panel_a, ukuran_panel, tipe_hasil(dtype_masuk),
+                                jalur_perkalian(matriks_a, matriks_b))
+
+
+# Fungsi untuk melakukan perkalian matriks out-of-core secara blok
+# C[i, :] = sum_k A[i, k] @ B[k, :], dengan panel B dan C dibaca/ditulis per baris
+# Checksum aliran (verifikasi.ChecksumAliran) diakumulasi per panel, lalu dicocokkan dengan satu
+# lintasan tambahan atas B di luar waktu terukur; hasilnya ada di statistik["terverifikasi"]
+def perkalian_matriks_numpy_blok(matriks_a, matriks_b, path_hasil, anggaran_memori=None):
+    if anggaran_memori is None:
+        anggaran_memori = anggaran_memori_default()
+
+    dim = matriks_a.shape[0]
+    dtype_masuk = np.result_type(matriks_a.dtype, matriks_b.dtype)
+    dtype = tipe_hasil(dtype_masuk)
+    ukuran_panel = hitung_ukuran_panel(dim, byte_per_elemen_blok(dtype_masuk), anggaran_memori)
+    checksum = ChecksumAliran(dim, dtype)
+    # Batas nilai operand utuh berlaku untuk setiap panel, jadi jalur cukup dipilih sekali di luar waktu terukur
+    jalur = jalur_perkalian(matriks_a, matriks_b)
+
+    def kalikan_per_panel():
+        hasil = _buat_file_memmap(path_hasil, dim, dtype)
+        for i in range(0, dim, ukuran_panel):
+            baris_i = min(ukuran_panel, dim - i)
+            panel_a = _baca_panel(matriks_a, i, baris_i)
+            checksum.tambah_a(panel_a)
+            panel_c = _kalikan_baris_panel(matriks_b, panel_a, ukuran_panel, dtype, jalur)
+            _tulis_panel(hasil, i, panel_c)
+            checksum.tambah_hasil(panel_c)
+            del panel_a, panel_c
+        return hasil
+
+    try:
+        hasil, statistik = ukur(kalikan_per_panel, pemanasan=0, ulangan=1)
+    except Exception as e:
+        print(f"Kesalahan selama perkalian matriks blok: {str(e)}")
+        return None, None
+
+    for k in range(0, dim, ukuran_panel):
+        panel_b = _baca_panel(matriks_b, k, min(ukuran_panel, dim - k))
+        checksum.tambah_b(k, panel_b)
+        del panel_b
+    statistik["checksum"] = checksum.total()
+    statistik["terverifikasi"] = checksum.cocok()
+    return hasil, statistik
+
+
+# Fungsi untuk menghapus file memmap setelah selesai dipakai
+def hapus_matriks_memmap(*daftar_matriks):
+    for matriks in daftar_matriks:
+        if matriks is None:
+            continue
+        path = matriks.filename
+        del matriks
+        if path and os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,136 @@
+import numpy as np
+import os
+import math
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from tipe_data import tipe_hasil, jalur_perkalian, kalikan
+from pengukuran_waktu import ukur, PEMANASAN_BAWAAN, ULANGAN_BAWAAN
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+# Jumlah worker default: semua core yang boleh dipakai proses ini
+JUMLAH_WORKER_DEFAULT = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+
+# Pool disimpan agar biaya membuat proses tidak ikut terukur di setiap perkalian
+_pool = None
+_jumlah_worker_pool = 0
+
+
+# Inisialisasi worker: batasi BLAS ke satu thread agar worker tidak saling berebut core
+def _inisialisasi_worker():
+    if threadpool_limits is not None:
+        threadpool_limits(limits=1)
+
+
+def dapatkan_pool(jumlah_worker):
+    global _pool, _jumlah_worker_pool
+    if _pool is None or _jumlah_worker_pool != jumlah_worker:
+        tutup_pool()
+        _pool = ProcessPoolExecutor(max_workers=jumlah_worker, initializer=_inisialisasi_worker)
+        _jumlah_worker_pool = jumlah_worker
+    return _pool
+
+
+def tutup_pool():
+    global _pool, _jumlah_worker_pool
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = None
+    _jumlah_worker_pool = 0
+
+
+# Fungsi untuk menyalin array ke shared memory agar bisa dibaca worker tanpa disalin lagi
+def _ke_shared_memory(matriks):
+    shm = shared_memory.SharedMemory(create=True, size=max(1, matriks.nbytes))
+    salinan = np.ndarray(matriks.shape, dtype=matriks.dtype, buffer=shm.buf)
+    salinan[:] = matriks
+    return shm
+
+
+# Tugas worker: hitung satu blok C[i0:i1, j0:j1] langsung ke shared memory
+# jalur dipilih sekali untuk seluruh operand; batas nilai operand utuh juga berlaku untuk setiap bloknya
+def _hitung_blok(nama_a, nama_b, nama_c, bentuk_a, bentuk_b, dtype_a, dtype_b, dtype_c, i0, i1, j0, j1, jalur=None):
+    shm_a = shared_memory.SharedMemory(name=nama_a)
+    shm_b = shared_memory.SharedMemory(name=nama_b)
+    shm_c = shared_memory.SharedMemory(name=nama_c)
+    try:
+        a = np.ndarray(bentuk_a, dtype=dtype_a, buffer=shm_a.buf)
+        b = np.ndarray(bentuk_b, dtype=dtype_b, buffer=shm_b.buf)
+        c = np.ndarray((bentuk_a[0], bentuk_b[1]), dtype=dtype_c, buffer=shm_c.buf)
+        c[i0:i1, j0:j1] = kalikan(np, a[i0:i1], b[:, j0:j1], jalur)
+        del a, b, c
+    finally:
+        shm_a.close()
+        shm_b.close()
+        shm_c.close()
+
+
+# Fungsi untuk membagi matriks hasil menjadi blok-blok (i0, i1, j0, j1)
+def bagi_blok(baris, kolom, ukuran_blok):
+    return [(i, min(i + ukuran_blok, baris), j, min(j + ukuran_blok, kolom))
+            for i in range(0, baris, ukuran_blok)
+            for j in range(0, kolom, ukuran_blok)]
+
+
+# Ukuran blok default: sekitar 4 blok per worker agar beban terbagi rata
+def ukuran_blok_default(dim, jumlah_worker):
+    jumlah_blok_per_sisi = math.ceil(math.sqrt(4 * jumlah_worker))
+    return max(64, math.ceil(dim / jumlah_blok_per_sisi))
+
+
+# Fungsi untuk melakukan perkalian matriks paralel dengan ProcessPoolExecutor
+def perkalian_matriks_numpy_paralel(matriks_a, matriks_b, jumlah_worker=None, ukuran_blok=None,
+                                    pemanasan=PEMANASAN_BAWAAN, ulangan=ULANGAN_BAWAAN, jalur=None):
+    if jumlah_worker is None:
+        jumlah_worker = JUMLAH_WORKER_DEFAULT
+    if ukuran_blok is None:
+        ukuran_blok = ukuran_blok_default(max(matriks_a.shape[0], matriks_b.shape[1]), jumlah_worker)
+
+    daftar_shm = []
+    try:
+        dtype_c = tipe_hasil(np.result_type(matriks_a.dtype, matriks_b.dtype))
+        bentuk_c = (matriks_a.shape[0], matriks_b.shape[1])
+        pool = dapatkan_pool(jumlah_worker)
+
+        # Operand disalin sekali ke shared memory di luar pengukuran waktu
+        shm_a = _ke_shared_memory(matriks_a)
+        daftar_shm.append(shm_a)
+        shm_b = _ke_shared_memory(matriks_b)
+        daftar_shm.append(shm_b)
+        shm_c = shared_memory.SharedMemory(create=True, size=max(1, bentuk_c[0] * bentuk_c[1] * dtype_c.itemsize))
+        daftar_shm.append(shm_c)
+
+        daftar_blok = bagi_blok(bentuk_c[0], bentuk_c[1], ukuran_blok)
+        if jalur is None:
+            jalur = jalur_perkalian(matriks_a, matriks_b)
+
+        def kalikan_semua_blok():
+            tugas = [pool.submit(_hitung_blok, shm_a.name, shm_b.name, shm_c.name,
+                                 matriks_a.shape, matriks_b.shape, matriks_a.dtype, matriks_b.dtype, dtype_c,
+                                 i0, i1, j0, j1, jalur)
+                     for i0, i1, j0, j1 in daftar_blok]
+            for t in tugas:
+                t.result()
+
+        _, statistik = ukur(kalikan_semua_blok, pemanasan=pemanasan, ulangan=ulangan)
+
+        hasil = np.ndarray(bentuk_c, dtype=dtype_c, buffer=shm_c.buf).copy()
+        return hasil, statistik
+    except Exception as e:
+        print(f"Kesalahan selama perkalian matriks paralel: {str(e)}")
+        return None, None
+    finally:
+        for shm in daftar_shm:
+            shm.close()
+            shm.unlink()
+
+
+# Fungsi untuk perkalian paralel sekali jalan tanpa statistik (dipakai backend "numpy-paralel",
+# sehingga salinan ke shared memory ikut terukur oleh pemanggil)
+def kalikan_paralel(matriks_a, matriks_b, jumlah_worker=None, ukuran_blok=None, jalur=None):
+    hasil, _ = perkalian_matriks_numpy_paralel(matriks_a, matriks_b, jumlah_worker, ukuran_blok,
+                                               pemanasan=0, ulangan=1, jalur=jalur)
+    return hasil
@@ -0,0 +1,281 @@
+import math
+import functools
+import numpy as np
+from backend import Backend
+from tipe_data import TIPE_DATA, TIPE_DATA_BAWAAN, apakah_bulat, jalur_perkalian
+from pengukuran_waktu import ukur, format_statistik
+from verifikasi import JUMLAH_PUTARAN_BAWAAN, verifikasi_freivalds_rantai
+from roofline import flop_perkalian
+import benchmark
+
+# Jumlah rencana (per tanda tangan bentuk rantai) yang disimpan di cache
+UKURAN_CACHE_RENCANA = 256
+
+# Rantai bawaan p0..pn (matriks ke-i berbentuk (p[i], p[i+1])), dipilih agar urutan kiri-ke-kanan
+# jauh lebih mahal dari urutan optimal
+RANTAI_BAWAAN = [
+    (1024, 1024, 1024, 1024),
+    (2048, 32, 2048, 32, 2048),
+    (1024, 2048, 2048, 2048, 1),
+    (4096, 16, 4096, 16, 4096, 16),
+]
+
+# Fase penyimpanan hasil untuk waktu rantai urutan optimal dan urutan kiri-ke-kanan (lihat jalankan_benchmark_rantai)
+FASE_RANTAI_OPTIMAL = "perkalian_rantai"
+FASE_RANTAI_NAIF = "perkalian_naif"
+
+# Buffer hasil antara: (modul array, dtype) -> daftar buffer datar, satu per register rencana.
+# Buffer hanya diperbesar bila perlu, jadi rantai berulang (dan rantai lain yang lebih kecil) memakainya ulang.
+_ruang_kerja = {}
+
+
+def _register(xp, dtype, indeks, jumlah_elemen):
+    daftar = _ruang_kerja.setdefault((xp.__name__, np.dtype(dtype).str), [])
+    while len(daftar) <= indeks:
+        daftar.append(xp.empty(0, dtype=dtype))
+    if daftar[indeks].size < jumlah_elemen:
+        daftar[indeks] = None
+        daftar[indeks] = xp.empty(jumlah_elemen, dtype=dtype)
+    return daftar[indeks]
+
+
+def bebaskan_ruang_kerja():
+    _ruang_kerja.clear()
+
+
+# Fungsi untuk mengambil tanda tangan bentuk rantai p0..pn dan memeriksa bahwa bentuknya cocok
+def bentuk_rantai(daftar_matriks):
+    if len(daftar_matriks) < 2:
+        raise ValueError("Rantai perkalian membutuhkan minimal dua matriks")
+    dimensi = [daftar_matriks[0].shape[0]]
+    for i, matriks in enumerate(daftar_matriks):
+        if matriks.ndim != 2 or matriks.shape[0] != dimensi[-1]:
+            raise ValueError(f"Bentuk matriks ke-{i} {matriks.shape} tidak cocok dengan kolom matriks sebelumnya "
+                             f"({dimensi[-1]})")
+        dimensi.append(matriks.shape[1])
+    return tuple(dimensi)
+
+
+# Fungsi untuk menyusun pohon rencana menjadi langkah perkalian (urutan pasca) dengan alokasi register hasil antara.
+# Setiap langkah: (sumber kiri, sumber kanan, bentuk hasil, register hasil); sumber berupa ("operand", i) atau
+# ("register", r). Register dipakai ulang setelah isinya dikonsumsi, tetapi tidak pernah menjadi keluaran langkah
+# yang membacanya. Langkah terakhir (akar) tidak memakai register karena hasilnya dikembalikan ke pemanggil.
+# Mengembalikan (langkah, jumlah elemen terbesar per register)
+def _susun_langkah(pohon, dimensi):
+    langkah, ukuran_register, bebas = [], [], []
+
+    def kunjungi(simpul, akar=False):
+        if isinstance(simpul, int):
+            return ("operand", simpul), dimensi[simpul], dimensi[simpul + 1]
+        kiri, baris, _ = kunjungi(simpul[0])
+        kanan, _, kolom = kunjungi(simpul[1])
+        register = None
+        if not akar:
+            register = min(bebas) if bebas else len(ukuran_register)
+            if register in bebas:
+                bebas.remove(register)
+            else:
+                ukuran_register.append(0)
+            ukuran_register[register] = max(ukuran_register[register], baris * kolom)
+        for jenis, indeks in (kiri, kanan):
+            if jenis == "register":
+                bebas.append(indeks)
+        langkah.append((kiri, kanan, (baris, kolom), register))
+        return ("register", register), baris, kolom
+
+    kunjungi(pohon, akar=True)
+    return tuple(langkah), tuple(ukuran_register)
+
+
+def _pohon(pisah, i, j):
+    if i == j:
+        return i
+    return (_pohon(pisah, i, pisah[i][j]), _pohon(pisah, pisah[i][j] + 1, j))
+
+
+# Fungsi untuk menghitung urutan perkalian rantai optimal dengan pemrograman dinamis (matrix-chain order)
+# atas jumlah FLOP, O(n^3) untuk n matriks. Rencana di-cache per tanda tangan bentuk p0..pn.
+# Mengembalikan (pohon, FLOP optimal, FLOP kiri-ke-kanan, langkah, ukuran register)
+@functools.lru_cache(maxsize=UKURAN_CACHE_RENCANA)
+def rencana_rantai(dimensi):
+    n = len(dimensi) - 1
+    biaya = [[0] * n for _ in range(n)]
+    pisah = [[0] * n for _ in range(n)]
+    for panjang in range(2, n + 1):
+        for i in range(n - panjang + 1):
+            j = i + panjang - 1
+            biaya[i][j] = math.inf
+            for s in range(i, j):
+                kandidat = biaya[i][s] + biaya[s + 1][j] + flop_perkalian(dimensi[i], dimensi[s + 1], dimensi[j + 1])
+                if kandidat < biaya[i][j]:
+                    biaya[i][j], pisah[i][j] = kandidat, s
+
+    pohon = _pohon(pisah, 0, n - 1)
+    kiri_ke_kanan = sum(flop_perkalian(dimensi[0], dimensi[i], dimensi[i + 1]) for i in range(1, n))
+    return (pohon, biaya[0][n - 1], kiri_ke_kanan) + _susun_langkah(pohon, dimensi)
+
+
+# Rencana naif ((A1 A2) A3) ... sebagai pembanding, dengan format yang sama seperti rencana_rantai
+@functools.lru_cache(maxsize=UKURAN_CACHE_RENCANA)
+def rencana_kiri_ke_kanan(dimensi):
+    pohon = 0
+    for i in range(1, len(dimensi) - 1):
+        pohon = (pohon, i)
+    kiri_ke_kanan = sum(flop_perkalian(dimensi[0], dimensi[i], dimensi[i + 1]) for i in range(1, len(dimensi) - 1))
+    return (pohon, kiri_ke_kanan, kiri_ke_kanan) + _susun_langkah(pohon, dimensi)
+
+
+# Fungsi untuk menulis pohon rencana sebagai tanda kurung, misalnya ((A1 A2) A3)
+def format_rencana(pohon):
+    if isinstance(pohon, int):
+        return f"A{pohon + 1}"
+    return f"({format_rencana(pohon[0])} {format_rencana(pohon[1])})"
+
+
+# Fungsi untuk mengalikan rantai matriks di backend mengikuti rencana (bawaan: rencana optimal dari cache).
+# Hasil antara jalur BLAS ditulis langsung ke register ruang kerja (matmul out=) bila backend memakai
+# kalikan() bawaan; backend dengan kalikan() sendiri (Strassen, paralel, threadpool) dan jalur eksak
+# bilangan bulat tetap lewat backend.kalikan() agar perilaku backend tidak berubah.
+# daftar_jalur (lihat jalur_rantai) berisi jalur setiap langkah yang sudah dipilih di luar waktu terukur.
+def kalikan_rantai(backend, daftar_matriks, rencana=None, daftar_jalur=None):
+    return _jalankan_rantai(backend, daftar_matriks, rencana, daftar_jalur)[0]
+
+
+# Fungsi untuk memilih jalur perkalian setiap langkah rantai sekali saja. Jalur eksak bilangan bulat bergantung
+# pada nilai hasil antara, jadi rantai bulat dijalankan sekali tanpa pengukuran; rantai float selalu "blas".
+def jalur_rantai(backend, daftar_matriks, rencana=None):
+    rencana = rencana or rencana_rantai(bentuk_rantai(daftar_matriks))
+    if not any(apakah_bulat(matriks.dtype) for matriks in daftar_matriks):
+        return ["blas"] * len(rencana[3])
+    return _jalankan_rantai(backend, daftar_matriks, rencana)[1]
+
+
+# Mengembalikan (hasil, jalur yang dipakai setiap langkah)
+def _jalankan_rantai(backend, daftar_matriks, rencana=None, daftar_jalur=None):
+    rencana = rencana or rencana_rantai(bentuk_rantai(daftar_matriks))
+    langkah, ukuran_register = rencana[3], rencana[4]
+    langsung = type(backend).kalikan is Backend.kalikan
+
+    nilai = {}
+    hasil = None
+    jalur_terpakai = []
+    for i, (kiri, kanan, (baris, kolom), register) in enumerate(langkah):
+        matriks_kiri = daftar_matriks[kiri[1]] if kiri[0] == "operand" else nilai[kiri[1]]
+        matriks_kanan = daftar_matriks[kanan[1]] if kanan[0] == "operand" else nilai[kanan[1]]
+        jalur = daftar_jalur[i] if daftar_jalur is not None else jalur_perkalian(matriks_kiri, matriks_kanan)
+        jalur_terpakai.append(jalur)
+        if langsung and register is not None and jalur == "blas":
+            dtype = np.result_type(matriks_kiri.dtype, matriks_kanan.dtype)
+            keluaran = _register(backend.xp, dtype, register, ukuran_register[register])[:baris * kolom]
+            hasil = backend.xp.matmul(matriks_kiri, matriks_kanan, out=keluaran.reshape(baris, kolom))
+        else:
+            hasil = backend.kalikan(matriks_kiri, matriks_kanan, jalur)
+        if register is not None:
+            nilai[register] = hasil
+    return hasil, jalur_terpakai
+
+
+# Fungsi untuk mengalikan rantai matriks dan mengukur waktu, dengan signature dan nilai kembali seperti
+# benchmark.perkalian_matriks; hasil diperiksa dengan Freivalds rantai di luar waktu terukur
+def perkalian_rantai(backend, daftar_matriks, putaran_verifikasi=JUMLAH_PUTARAN_BAWAAN, rencana=None):
+    try:
+        rencana = rencana or rencana_rantai(bentuk_rantai(daftar_matriks))
+        daftar_jalur = jalur_rantai(backend, daftar_matriks, rencana)
+        hasil, statistik = ukur(lambda: kalikan_rantai(backend, daftar_matriks, rencana, daftar_jalur),
+                                sinkronisasi=backend.sinkronisasi)
+    except Exception as e:
+        print(f"Kesalahan selama perkalian rantai {backend.nama}: {str(e)}")
+        return None, None
+
+    statistik["terverifikasi"] = None
+    if putaran_verifikasi > 0:
+        statistik["terverifikasi"] = verifikasi_freivalds_rantai(daftar_matriks, hasil, putaran_verifikasi)
+        if not statistik["terverifikasi"]:
+            print(f"Peringatan: hasil perkalian rantai {backend.nama} {format_rencana(rencana[0])} "
+                  f"GAGAL verifikasi Freivalds!")
+    return hasil, statistik
+
+
+# Fungsi untuk menyimpan waktu satu urutan rantai ke penyimpanan hasil dengan fasenya sendiri (tanpa baris pembuatan).
+# Skema hanya punya bentuk (m, k, n), jadi rantai p0..pn disimpan sebagai dim = p0 dan bentuk (p0, p1, pn);
+# GFLOP/s dihitung dari FLOP urutan yang diukur
+def simpan_rantai(backend, dimensi, tipe_data, flop, statistik, fase, contoh=None, checksum=float("nan")):
+    benchmark.simpan_hasil(backend, [{
+        "backend": backend.nama,
+        "dtype": tipe_data,
+        "dim": dimensi[0],
+        "bentuk": (dimensi[0], dimensi[1], dimensi[-1]),
+        "contoh": contoh,
+        "checksum": checksum,
+        "terverifikasi": statistik["terverifikasi"],
+        "gflops": flop / statistik["median"] / 1e9 if statistik["median"] > 0 else 0.0,
+        "statistik_perkalian": statistik,
+    }], fase_perkalian=fase)
+
+
+# Fungsi untuk membandingkan urutan optimal dengan urutan kiri-ke-kanan untuk setiap rantai dan tipe data
+# Kedua waktu disimpan ke penyimpanan hasil dengan fase FASE_RANTAI_OPTIMAL dan FASE_RANTAI_NAIF
+# Mengembalikan daftar catatan {rantai, dtype, rencana, flop_optimal, flop_kiri_ke_kanan, statistik_*, percepatan}
+def jalankan_benchmark_rantai(backend, daftar_rantai=RANTAI_BAWAAN, tipe_data_diuji=(TIPE_DATA_BAWAAN,)):
+    print(f"\n--- Memulai benchmark rantai {backend.info()} ---")
+    daftar_catatan = []
+    for dimensi in daftar_rantai:
+        dimensi = tuple(dimensi)
+        if len(dimensi) < 3:
+            print(f"Rantai {dimensi} membutuhkan minimal dua matriks (tiga dimensi). Melewati.")
+            continue
+        for tipe_data in tipe_data_diuji:
+            byte_operand = sum(p * q for p, q in zip(dimensi, dimensi[1:])) * np.dtype(TIPE_DATA[tipe_data]).itemsize
+            if byte_operand > backend.memori_tersedia() * 0.5:
+                print(f"Memori tidak cukup untuk rantai {dimensi} ({tipe_data}). Melewati.")
+                continue
+            daftar_matriks = [backend.buat_acak((p, q), tipe_data) for p, q in zip(dimensi, dimensi[1:])]
+            rencana = rencana_rantai(dimensi)
+            naif = rencana_kiri_ke_kanan(dimensi)
+            print(f"Rantai {dimensi} ({tipe_data}): rencana {format_rencana(rencana[0])}, "
+                  f"{rencana[1] / 1e9:.3f} GFLOP (kiri-ke-kanan {naif[1] / 1e9:.3f} GFLOP)")
+
+            hasil, statistik_optimal = perkalian_rantai(backend, daftar_matriks, rencana=rencana)
+            contoh, checksum = (None, None) if hasil is None else benchmark.ambil_contoh_hasil(backend, hasil)
+            del hasil
+            hasil, statistik_naif = perkalian_rantai(backend, daftar_matriks, 0, rencana=naif)
+            del hasil, daftar_matriks
+            backend.bebaskan()
+            if statistik_optimal is None or statistik_naif is None:
+                continue
+            print(f"  optimal: {format_statistik(statistik_optimal)}")
+            print(f"  kiri-ke-kanan: {format_statistik(statistik_naif)}")
+            simpan_rantai(backend, dimensi, tipe_data, rencana[1], statistik_optimal, FASE_RANTAI_OPTIMAL,
+                          contoh, checksum)
+            simpan_rantai(backend, dimensi, tipe_data, naif[1], statistik_naif, FASE_RANTAI_NAIF)
+            daftar_catatan.append({
+                "backend": backend.nama,
+                "rantai": dimensi,
+                "dtype": tipe_data,
+                "rencana": format_rencana(rencana[0]),
+                "flop_optimal": rencana[1],
+                "flop_kiri_ke_kanan": naif[1],
+                "statistik_optimal": statistik_optimal,
+                "statistik_kiri_ke_kanan": statistik_naif,
+                "percepatan": statistik_naif["median"] / statistik_optimal["median"],
+                "terverifikasi": statistik_optimal["terverifikasi"],
+            })
+    bebaskan_ruang_kerja()
+    backend.tutup()
+    return daftar_catatan
+
+
+# Fungsi untuk mencetak ringkasan benchmark rantai dan statistik cache rencana
+def cetak_ringkasan_rantai(nama_backend, daftar_catatan):
+    print(f"\nRingkasan Rantai {nama_backend}:")
+    print("=" * 120)
+    print(f"{'Rantai':<34} {'Tipe':<8} {'Rencana':<26} {'FLOP opt/naif':<14} {'Optimal (s)':<13} "
+          f"{'Naif (s)':<13} {'Percepatan':<11} {'Verifikasi':<10}")
+    print("-" * 120)
+    for c in daftar_catatan:
+        verifikasi = "-" if c["terverifikasi"] is None else ("OK" if c["terverifikasi"] else "GAGAL")
+        print(f"{'x'.join(map(str, c['rantai'])):<34} {c['dtype']:<8} {c['rencana']:<26} "
+              f"{c['flop_optimal'] / c['flop_kiri_ke_kanan']:<14.4f} {c['statistik_optimal']['median']:<13.6f} "
+              f"{c['statistik_kiri_ke_kanan']['median']:<13.6f} {c['percepatan']:<10.2f}x {verifikasi:<10}")
+    info = rencana_rantai.cache_info()
+    print(f"Cache rencana: {info.currsize} rencana, {info.hits} hit, {info.misses} miss")
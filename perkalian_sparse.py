@@ -0,0 +1,220 @@
+import numpy as np
+import scipy.sparse as sp
+from backend import dapatkan_backend
+from tipe_data import TIPE_DATA, TIPE_DATA_BAWAAN, NILAI_MIN, NILAI_MAKS, tipe_hasil, byte_per_elemen_perkalian
+from pengukuran_waktu import ukur, format_statistik
+import benchmark
+
+# Perkalian matriks sparse (scipy.sparse, format CSR/CSC) dan sapuan kepadatan x dimensi yang membandingkannya
+# dengan perkalian padat BLAS backend numpy
+
+# Format sparse yang didukung; hasil CSR @ CSR tetap CSR, CSC @ CSC tetap CSC
+FORMAT_SPARSE = ("csr", "csc")
+FORMAT_BAWAAN = "csr"
+
+# Kepadatan bawaan backend scipy-sparse (fraksi elemen bukan nol)
+KEPADATAN_BAWAAN = 0.01
+
+# Grid bawaan sapuan kepadatan x dimensi
+KEPADATAN_SAPUAN_BAWAAN = [0.001, 0.005, 0.01, 0.05, 0.1, 0.2, 0.5]
+DIMENSI_SAPUAN_BAWAAN = [256, 512, 1024, 2048, 4096]
+
+
+# Fungsi untuk membuat matriks sparse acak: tepat round(kepadatan * m * n) posisi unik, nilai 1..100 seperti
+# tipe_data.buat_matriks_acak, langsung dalam format yang diminta
+def buat_matriks_sparse(bentuk, tipe_data=TIPE_DATA_BAWAAN, kepadatan=KEPADATAN_BAWAAN, format=FORMAT_BAWAAN,
+                        rng=None):
+    rng = rng if rng is not None else np.random.default_rng()
+    m, n = bentuk
+    jumlah_bukan_nol = int(round(kepadatan * m * n))
+    posisi = rng.choice(m * n, size=jumlah_bukan_nol, replace=False)
+    baris, kolom = np.divmod(posisi, n)
+    data = rng.integers(NILAI_MIN, NILAI_MAKS, size=jumlah_bukan_nol).astype(TIPE_DATA[tipe_data])
+    return sp.coo_array((data, (baris, kolom)), shape=bentuk).asformat(format)
+
+
+def apakah_sparse(matriks):
+    return sp.issparse(matriks)
+
+
+# Matriks padat (misalnya memmap dari cache_operand.py) sebagai matriks sparse; nol tidak disimpan
+def buat_dari_padat(matriks, format=FORMAT_BAWAAN):
+    return sp.csr_array(np.asarray(matriks)).asformat(format)
+
+
+# Byte yang benar-benar dipakai matriks sparse (data + indeks + penunjuk baris/kolom) atau array padat
+def byte_matriks(matriks):
+    if apakah_sparse(matriks):
+        return matriks.data.nbytes + matriks.indices.nbytes + matriks.indptr.nbytes
+    return matriks.nbytes
+
+
+# Jumlah FLOP yang benar-benar dikerjakan SpGEMM: 2 * sum_k nnz(A[:, k]) * nnz(B[k, :])
+def flop_sparse(matriks_a, matriks_b):
+    nnz_kolom_a = np.diff(sp.csc_array(matriks_a).indptr).astype(np.float64)
+    nnz_baris_b = np.diff(sp.csr_array(matriks_b).indptr).astype(np.float64)
+    return 2 * float(nnz_kolom_a @ nnz_baris_b)
+
+
+# Perkiraan memori perkalian sparse dim x dim: A dan B (data + indeks kolom) ditambah hasil, yang untuk operand
+# acak punya kepadatan 1 - (1 - d^2)^dim; hasil dihitung dua kali untuk temporer SpGEMM dan salinan int64
+def perkiraan_byte_sparse(dim, kepadatan, tipe_data=TIPE_DATA_BAWAAN):
+    dtype = np.dtype(TIPE_DATA[tipe_data])
+    byte_indeks = 4 if dim * dim < 2**31 else 8
+    kepadatan_hasil = 1 - (1 - kepadatan**2) ** dim
+    byte_operand = 2 * kepadatan * (dtype.itemsize + byte_indeks + (8 if dtype != tipe_hasil(dtype) else 0))
+    return dim * dim * (byte_operand + 2 * kepadatan_hasil * (tipe_hasil(dtype).itemsize + byte_indeks))
+
+
+# Fungsi untuk mengalikan dua matriks sparse (SpGEMM scipy). Operand padat (misalnya dari checkpoint atau
+# cache operand) diubah dulu ke format sparse, dan operand bilangan bulat diakumulasi di int64 seperti
+# jalur padat karena scipy.sparse tidak menaikkan int8/int16 sendiri
+def kalikan_sparse(matriks_a, matriks_b, format=FORMAT_BAWAAN):
+    dtype = tipe_hasil(np.result_type(matriks_a.dtype, matriks_b.dtype))
+    operand = []
+    for matriks in (matriks_a, matriks_b):
+        if not apakah_sparse(matriks):
+            matriks = buat_dari_padat(matriks, format)
+        operand.append(matriks.astype(dtype, copy=False))
+    return operand[0] @ operand[1]
+
+
+# Fungsi untuk mencari kepadatan titik potong: kepadatan di mana SpGEMM sama cepatnya dengan perkalian padat,
+# diinterpolasi linier di skala log antara titik terakhir yang sparse-nya lebih cepat dan titik pertama yang
+# padatnya lebih cepat. None bila padat selalu lebih cepat, inf bila sparse lebih cepat di semua kepadatan
+def titik_potong_kepadatan(kepadatan, waktu_sparse, waktu_padat):
+    rasio = np.log(np.asarray(waktu_sparse, dtype=np.float64) / waktu_padat)
+    if rasio[0] >= 0:
+        return None
+    for i in range(1, len(rasio)):
+        if rasio[i] >= 0:
+            log_d0, log_d1 = np.log(kepadatan[i - 1]), np.log(kepadatan[i])
+            return float(np.exp(log_d0 + (log_d1 - log_d0) * -rasio[i - 1] / (rasio[i] - rasio[i - 1])))
+    return float("inf")
+
+
+# Fungsi untuk menjalankan sapuan kepadatan x dimensi x tipe data. Per (dimensi, tipe data) perkalian padat
+# diukur sekali (waktunya tidak bergantung pada kepadatan), lalu SpGEMM diukur untuk setiap kepadatan.
+# Memori sparse dibandingkan dengan perkiraan padat periksa_memori_tersedia (byte_per_elemen_perkalian * dim^2).
+# Setiap titik langsung disimpan ke penyimpanan hasil dengan fase "perkalian_sparse" dan kolom kepadatan.
+# Mengembalikan daftar catatan sparse dengan kunci tambahan waktu_padat, percepatan dan memori
+def jalankan_sapuan_kepadatan(dimensi=DIMENSI_SAPUAN_BAWAAN, kepadatan_diuji=KEPADATAN_SAPUAN_BAWAAN,
+                              tipe_data_diuji=(TIPE_DATA_BAWAAN,), format=FORMAT_BAWAAN, seed=None):
+    backend_numpy = dapatkan_backend("numpy")
+    print(f"\nSapuan kepadatan {format.upper()}: kepadatan {list(kepadatan_diuji)}, dimensi {list(dimensi)}")
+    kepadatan_diuji = sorted(kepadatan_diuji)
+
+    daftar_catatan = []
+    for tipe_data in tipe_data_diuji:
+        for dim in dimensi:
+            perkiraan_padat = dim * dim * byte_per_elemen_perkalian(TIPE_DATA[tipe_data])
+            waktu_padat = float("nan")
+            if benchmark.periksa_memori_tersedia(backend_numpy, dim, tipe_data):
+                matriks_a = backend_numpy.buat_acak((dim, dim), tipe_data)
+                matriks_b = backend_numpy.buat_acak((dim, dim), tipe_data)
+                hasil, statistik = benchmark.perkalian_matriks(backend_numpy, matriks_a, matriks_b, 0)
+                if statistik is not None:
+                    waktu_padat = statistik["median"]
+                    print(f"Padat {dim}x{dim} ({tipe_data}): {format_statistik(statistik)}")
+                del matriks_a, matriks_b, hasil
+                backend_numpy.bebaskan()
+
+            for kepadatan in kepadatan_diuji:
+                backend = dapatkan_backend("scipy-sparse", kepadatan=kepadatan, format=format, seed=seed)
+                if perkiraan_byte_sparse(dim, kepadatan, tipe_data) > backend.memori_tersedia() * 0.95:
+                    print(f"Memori tidak cukup untuk {dim}x{dim} kepadatan {kepadatan}. Melewati.")
+                    continue
+                try:
+                    matriks_a, statistik_buat_a = ukur(lambda: backend.buat_acak((dim, dim), tipe_data), 0, 1)
+                    matriks_b, statistik_buat_b = ukur(lambda: backend.buat_acak((dim, dim), tipe_data), 0, 1)
+                except MemoryError as e:
+                    print(f"Kesalahan memori saat membuat matriks sparse {dim}x{dim}: {str(e)}")
+                    continue
+                hasil, statistik = benchmark.perkalian_matriks(backend, matriks_a, matriks_b)
+                if statistik is None:
+                    del matriks_a, matriks_b
+                    continue
+
+                catatan = benchmark.buat_catatan(backend, dim, tipe_data, backend.jalur(matriks_a, matriks_b),
+                                                 statistik_buat_a, statistik_buat_b, statistik)
+                catatan["contoh"], catatan["checksum"] = benchmark.ambil_contoh_hasil(backend, hasil)
+                # GFLOP/s dari FLOP yang benar-benar dikerjakan, bukan 2 * dim^3 padat
+                catatan["flop_sparse"] = flop_sparse(matriks_a, matriks_b)
+                catatan["gflops"] = catatan["flop_sparse"] / statistik["median"] / 1e9
+                catatan["byte_dipindahkan"] = byte_matriks(matriks_a) + byte_matriks(matriks_b) + byte_matriks(hasil)
+                catatan["intensitas_aritmetika"] = catatan["flop_sparse"] / catatan["byte_dipindahkan"]
+                catatan["kepadatan_hasil"] = hasil.nnz / (dim * dim)
+                catatan["memori_sparse"] = catatan["byte_dipindahkan"]
+                catatan["memori_padat"] = perkiraan_padat
+                catatan["waktu_padat"] = waktu_padat
+                catatan["percepatan"] = waktu_padat / statistik["median"]
+                print(f"Sparse {dim}x{dim} ({tipe_data}, kepadatan {kepadatan}, hasil {catatan['kepadatan_hasil']:.3f}): "
+                      f"{format_statistik(statistik)}, {catatan['percepatan']:.2f}x terhadap padat, "
+                      f"verifikasi {benchmark.format_verifikasi(catatan['terverifikasi'])}")
+                # Tanpa baris "pembuatan": baris itu tidak membawa fase sparse, sehingga setiap kepadatan akan
+                # bertumpuk di (run, backend, tipe data, dim) yang sama pada tabel perbandingan
+                benchmark.simpan_hasil(backend, [dict(catatan, statistik_pembuatan=None)],
+                                       fase_perkalian="perkalian_sparse")
+                daftar_catatan.append(catatan)
+                del matriks_a, matriks_b, hasil
+            backend_numpy.bebaskan()
+    return daftar_catatan
+
+
+# Fungsi untuk mencetak waktu, percepatan dan memori per titik, lalu kepadatan titik potong per dimensi
+def cetak_sapuan_kepadatan(daftar_catatan):
+    if not daftar_catatan:
+        return
+    print("\nSapuan Kepadatan (SpGEMM vs padat):")
+    print("=" * 120)
+    print(f"{'Dimensi':<9} {'Tipe':<8} {'Kepadatan':<10} {'Hasil':<8} {'Sparse (s)':<12} {'Padat (s)':<12} "
+          f"{'Percepatan':<11} {'GFLOP/s':<9} {'Memori (MB)':<12} {'Padat (MB)':<12} {'Hemat':<8} {'Verifikasi':<10}")
+    print("-" * 120)
+    for c in daftar_catatan:
+        print(f"{c['dim']:<9} {c['dtype']:<8} {c['kepadatan']:<10g} {c['kepadatan_hasil']:<8.3f} "
+              f"{c['waktu_perkalian']:<12.6f} {c['waktu_padat']:<12.6f} {c['percepatan']:<10.2f}x "
+              f"{c['gflops']:<9.2f} {c['memori_sparse'] / (1024**2):<12.2f} {c['memori_padat'] / (1024**2):<12.2f} "
+              f"{1 - c['memori_sparse'] / c['memori_padat']:<8.1%} {benchmark.format_verifikasi(c['terverifikasi']):<10}")
+
+    print("\nTitik potong kepadatan (di bawahnya SpGEMM lebih cepat dari perkalian padat):")
+    for tipe_data in dict.fromkeys(c["dtype"] for c in daftar_catatan):
+        for dim in sorted({c["dim"] for c in daftar_catatan if c["dtype"] == tipe_data}):
+            titik = sorted((c["kepadatan"], c["waktu_perkalian"], c["waktu_padat"]) for c in daftar_catatan
+                           if c["dtype"] == tipe_data and c["dim"] == dim)
+            if np.isnan(titik[0][2]):
+                print(f"  {tipe_data:<8} {dim:>6}: N/A (perkalian padat tidak diukur)")
+                continue
+            potong = titik_potong_kepadatan([t[0] for t in titik], [t[1] for t in titik], titik[0][2])
+            if potong is None:
+                teks = f"padat selalu lebih cepat (kepadatan >= {titik[0][0]:g})"
+            elif potong == float("inf"):
+                teks = f"sparse selalu lebih cepat (kepadatan <= {titik[-1][0]:g})"
+            else:
+                teks = f"kepadatan ~{potong:.4f}"
+            print(f"  {tipe_data:<8} {dim:>6}: {teks}")
+
+
+# Fungsi untuk membuat plot waktu SpGEMM terhadap kepadatan per dimensi, dengan waktu padat sebagai garis datar
+def buat_plot_kepadatan(daftar_catatan, tipe_data, path):
+    import matplotlib.pyplot as plt
+
+    catatan_tipe = [c for c in daftar_catatan if c["dtype"] == tipe_data]
+    if not catatan_tipe:
+        return
+    plt.figure(figsize=(10, 6))
+    for dim in sorted({c["dim"] for c in catatan_tipe}):
+        titik = sorted((c["kepadatan"], c["waktu_perkalian"], c["waktu_padat"]) for c in catatan_tipe if c["dim"] == dim)
+        garis, = plt.plot([t[0] for t in titik], [t[1] for t in titik], 'o-', label=f"{dim} sparse", linewidth=2,
+                          markersize=6)
+        plt.axhline(titik[0][2], color=garis.get_color(), linestyle='--', linewidth=1)
+    plt.title(f'SpGEMM vs Perkalian Padat ({tipe_data}, garis putus-putus: padat)', fontsize=13)
+    plt.xlabel('Kepadatan', fontsize=11)
+    plt.ylabel('Waktu (detik)', fontsize=11)
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.legend(title="Dimensi")
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+    print(f"Plot sapuan kepadatan disimpan ke '{path}'")
@@ -0,0 +1,121 @@
+import numpy as np
+from tipe_data import apakah_bulat, tipe_hasil, kalikan
+
+# Ukuran daun bawaan: di bawah ukuran ini rekursi berhenti dan perkalian diserahkan ke BLAS
+UKURAN_CUTOFF_BAWAAN = 128
+
+# Ruang kerja disimpan agar perkalian berulang dengan ukuran yang sama tidak mengalokasikan ulang
+_ruang_kerja = {}
+
+
+# Fungsi untuk menghitung jumlah tingkat rekursi dan ukuran setelah padding
+# Ukuran dibulatkan ke kelipatan 2^tingkat terkecil, bukan ke pangkat dua berikutnya,
+# sehingga padding paling banyak 2^tingkat - 1 baris/kolom
+def hitung_ukuran_padding(dim, ukuran_cutoff=UKURAN_CUTOFF_BAWAAN):
+    tingkat = 0
+    ukuran = dim
+    while ukuran > ukuran_cutoff:
+        ukuran = (ukuran + 1) // 2
+        tingkat += 1
+    return tingkat, ukuran << tingkat
+
+
+# Fungsi untuk mengambil dua buffer sementara (X, Y) per tingkat rekursi, dialokasikan sekali saja
+# Total ruang kerja sekitar 2/3 n^2 elemen untuk seluruh rekursi
+def dapatkan_ruang_kerja(ukuran, tingkat, dtype):
+    kunci = (ukuran, tingkat, np.dtype(dtype))
+    if kunci not in _ruang_kerja:
+        bebaskan_ruang_kerja()
+        daftar = []
+        for _ in range(tingkat):
+            ukuran //= 2
+            daftar.append((np.empty((ukuran, ukuran), dtype=dtype), np.empty((ukuran, ukuran), dtype=dtype)))
+        _ruang_kerja[kunci] = daftar
+    return _ruang_kerja[kunci]
+
+
+def bebaskan_ruang_kerja():
+    _ruang_kerja.clear()
+
+
+def _kuadran(m, h):
+    return m[:h, :h], m[:h, h:], m[h:, :h], m[h:, h:]
+
+
+# Perkalian daun: BLAS langsung ke buffer hasil, atau jalur eksak tipe_data untuk bilangan bulat
+def _kalikan_daun(a, b, c):
+    if apakah_bulat(c.dtype):
+        c[...] = kalikan(np, a, b)
+    else:
+        np.matmul(a, b, out=c)
+
+
+# Rekursi Strassen-Winograd (7 perkalian, 15 penjumlahan) dengan dua buffer sementara per tingkat.
+# Urutan langkah mengikuti jadwal hemat memori Boyer dkk.: hasil antara ditulis ke kuadran C
+# sehingga tidak ada alokasi baru di dalam rekursi.
+def _winograd(a, b, c, ruang_kerja):
+    if not ruang_kerja:
+        _kalikan_daun(a, b, c)
+        return
+
+    x, y = ruang_kerja[0]
+    sisa = ruang_kerja[1:]
+    h = x.shape[0]
+    a11, a12, a21, a22 = _kuadran(a, h)
+    b11, b12, b21, b22 = _kuadran(b, h)
+    c11, c12, c21, c22 = _kuadran(c, h)
+
+    np.subtract(a11, a21, out=x)         # S3 = A11 - A21
+    np.subtract(b22, b12, out=y)         # T3 = B22 - B12
+    _winograd(x, y, c21, sisa)           # P7 = S3 T3
+    np.add(a21, a22, out=x)              # S1 = A21 + A22
+    np.subtract(b12, b11, out=y)         # T1 = B12 - B11
+    _winograd(x, y, c22, sisa)           # P5 = S1 T1
+    np.subtract(b22, y, out=y)           # T2 = B22 - T1
+    np.subtract(x, a11, out=x)           # S2 = S1 - A11
+    _winograd(x, y, c12, sisa)           # P6 = S2 T2
+    np.subtract(a12, x, out=x)           # S4 = A12 - S2
+    _winograd(x, b22, c11, sisa)         # P3 = S4 B22
+    _winograd(a11, b11, x, sisa)         # P1 = A11 B11
+    np.add(x, c12, out=c12)              # U2 = P1 + P6
+    np.add(c12, c21, out=c21)            # U3 = U2 + P7
+    np.add(c12, c22, out=c12)            # U4 = U2 + P5
+    np.add(c21, c22, out=c22)            # U7 = U3 + P5  -> C22
+    np.add(c12, c11, out=c12)            # U5 = U4 + P3  -> C12
+    np.subtract(y, b21, out=y)           # T4 = T2 - B21
+    _winograd(a22, y, c11, sisa)         # P4 = A22 T4
+    np.subtract(c21, c11, out=c21)       # U6 = U3 - P4  -> C21
+    _winograd(a12, b21, c11, sisa)       # P2 = A12 B21
+    np.add(c11, x, out=c11)              # U1 = P1 + P2  -> C11
+
+
+# Fungsi untuk menyalin matriks ke buffer persegi berukuran padding (diisi nol) dalam tipe kerja
+def _pad(matriks, ukuran, dtype):
+    if matriks.shape == (ukuran, ukuran) and matriks.dtype == dtype:
+        return matriks
+    hasil = np.zeros((ukuran, ukuran), dtype=dtype)
+    hasil[:matriks.shape[0], :matriks.shape[1]] = matriks
+    return hasil
+
+
+# Fungsi untuk mengalikan dua matriks dengan Strassen-Winograd rekursif
+# Ukuran yang bukan pangkat dua di-padding dengan nol; di bawah ukuran_cutoff dipakai BLAS biasa.
+# Bilangan bulat dihitung di int64 dan daunnya memakai jalur eksak dari tipe_data.kalikan,
+# sedangkan untuk float urutan penjumlahan berbeda dari BLAS sehingga galat pembulatan sedikit berbeda.
+# jalur hasil hitungan pemanggil hanya dipakai bila tidak ada rekursi: daun rekursi mengalikan jumlah/selisih
+# kuadran yang nilainya lebih besar dari operand asli, jadi jalurnya tetap dipilih per daun.
+def kalikan_strassen(matriks_a, matriks_b, ukuran_cutoff=UKURAN_CUTOFF_BAWAAN, jalur=None):
+    baris, kolom = matriks_a.shape[0], matriks_b.shape[1]
+    dim = max(baris, matriks_a.shape[1], kolom)
+    tingkat, ukuran = hitung_ukuran_padding(dim, ukuran_cutoff)
+    if tingkat == 0:
+        return kalikan(np, matriks_a, matriks_b, jalur)
+
+    dtype = tipe_hasil(np.result_type(matriks_a.dtype, matriks_b.dtype))
+    a = _pad(matriks_a, ukuran, dtype)
+    b = _pad(matriks_b, ukuran, dtype)
+    c = np.empty((ukuran, ukuran), dtype=dtype)
+    _winograd(a, b, c, dapatkan_ruang_kerja(ukuran, tingkat, dtype))
+    if ukuran == baris and ukuran == kolom:
+        return c
+    return c[:baris, :kolom].copy()
@@ -0,0 +1,416 @@
+import os
+import sys
+import json
+import math
+import time
+import queue
+import socket
+import struct
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from tipe_data import TIPE_DATA_BAWAAN, tipe_hasil, jalur_perkalian, kalikan
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+# Perkalian matriks terdistribusi blok 2D lewat hub. Koordinator membagi C menjadi grid proses pr x pc; worker
+# (i, j) memegang blok C_ij dan menerima, untuk setiap panel k selebar ukuran_panel, panel A[baris_i, k] dan
+# B[k, kolom_j] lalu mengakumulasi C_ij += A_ik B_kj. Semua panel dikirim koordinator (hub) lewat socket TCP,
+# bukan disiarkan antar worker di baris/kolom grid seperti SUMMA: setiap panel A dikirim pc kali dan setiap
+# panel B pr kali, jadi volume yang keluar dari hub adalah (pc * m * k + pr * k * n) elemen per perkalian.
+# Worker bisa proses lokal (pengganti node) atau proses di mesin lain:
+#
+#     python perkalian_terdistribusi.py worker HOST PORT
+#
+# Framing pesan: panjang header (4 byte) + header JSON (op, dtype dan bentuk array) + isi array mentah. Array
+# dikirim dan diterima lewat buffer protocol (sendmsg/recvmsg_into per baris, tanpa salinan ke bytes), sehingga
+# panel yang merupakan irisan A/B dan blok C di dalam matriks hasil tidak perlu disalin dulu.
+
+# Jumlah worker bawaan (grid 2x2)
+JUMLAH_WORKER_BAWAAN = 4
+
+# Lebar panel k bawaan; panel lebih lebar berarti pesan lebih sedikit tetapi tumpang tindih lebih kasar
+UKURAN_PANEL_BAWAAN = 256
+
+# Jumlah panel yang boleh menunggu di worker (penerimaan panel berikutnya tumpang tindih dengan perkalian)
+UKURAN_ANTREAN_PANEL = 2
+
+# Batas waktu (detik) menunggu worker tersambung ke koordinator
+BATAS_WAKTU_KONEKSI = 60
+
+# Jumlah buffer maksimum per pemanggilan sendmsg/recvmsg_into (IOV_MAX Linux)
+IOV_MAKS = 1024
+
+_PANJANG_HEADER = struct.Struct("!I")
+
+# Klaster disimpan agar biaya menyalakan worker tidak ikut terukur di setiap perkalian
+_klaster = None
+
+
+# Fungsi untuk memilih grid proses pr x pc (pr <= pc) yang paling mendekati persegi untuk jumlah worker
+def grid_proses(jumlah_worker):
+    pr = int(math.isqrt(jumlah_worker))
+    while jumlah_worker % pr:
+        pr -= 1
+    return pr, jumlah_worker // pr
+
+
+# Fungsi untuk membagi rentang 0..n menjadi p potongan yang hampir sama besar: [(awal, akhir), ...]
+def bagi_rata(n, p):
+    batas = [n * i // p for i in range(p + 1)]
+    return list(zip(batas[:-1], batas[1:]))
+
+
+# Buffer byte per baris array 2D (satu buffer bila kontigu); baris irisan array C-kontigu selalu kontigu
+def _buffer_baris(matriks):
+    if matriks.flags.c_contiguous:
+        return [memoryview(matriks).cast("B")] if matriks.nbytes else []
+    if matriks.ndim != 2 or matriks.strides[1] != matriks.itemsize:
+        raise ValueError("Array harus C-kontigu atau irisan baris-kontigu untuk dikirim tanpa salinan")
+    return [memoryview(baris).cast("B") for baris in matriks] if matriks.nbytes else []
+
+
+# Kirim/terima sampai semua buffer penuh; sendmsg/recvmsg_into boleh memproses sebagian saja
+def _kirim_buffer(sock, daftar_buffer):
+    daftar_buffer = list(daftar_buffer)
+    i = 0
+    while i < len(daftar_buffer):
+        jumlah = sock.sendmsg(daftar_buffer[i:i + IOV_MAKS])
+        while jumlah:
+            if jumlah >= daftar_buffer[i].nbytes:
+                jumlah -= daftar_buffer[i].nbytes
+                i += 1
+            else:
+                daftar_buffer[i] = daftar_buffer[i][jumlah:]
+                jumlah = 0
+
+
+def _terima_buffer(sock, daftar_buffer):
+    daftar_buffer = list(daftar_buffer)
+    i = 0
+    while i < len(daftar_buffer):
+        jumlah = sock.recvmsg_into(daftar_buffer[i:i + IOV_MAKS])[0]
+        if jumlah == 0:
+            raise ConnectionError("Koneksi terputus di tengah pesan")
+        while jumlah:
+            if jumlah >= daftar_buffer[i].nbytes:
+                jumlah -= daftar_buffer[i].nbytes
+                i += 1
+            else:
+                daftar_buffer[i] = daftar_buffer[i][jumlah:]
+                jumlah = 0
+
+
+# Fungsi untuk mengirim satu pesan: header (dict) dan array 2D sesudahnya
+def _kirim(sock, header, *daftar_array):
+    header = dict(header, array=[[a.dtype.str, list(a.shape)] for a in daftar_array])
+    teks = json.dumps(header).encode()
+    daftar_buffer = [memoryview(_PANJANG_HEADER.pack(len(teks)) + teks)]
+    for matriks in daftar_array:
+        daftar_buffer += _buffer_baris(matriks)
+    _kirim_buffer(sock, daftar_buffer)
+    return sum(b.nbytes for b in daftar_buffer)
+
+
+# Fungsi untuk menerima satu pesan. Array ditulis langsung ke tujuan (misalnya blok di dalam matriks hasil)
+# bila diberikan, selain itu ke array baru. Mengembalikan (header, daftar array)
+def _terima(sock, tujuan=None):
+    awal = bytearray(_PANJANG_HEADER.size)
+    _terima_buffer(sock, [memoryview(awal)])
+    teks = bytearray(_PANJANG_HEADER.unpack(awal)[0])
+    _terima_buffer(sock, [memoryview(teks)])
+    header = json.loads(teks)
+    daftar_array = []
+    for i, (dtype, bentuk) in enumerate(header["array"]):
+        matriks = tujuan[i] if tujuan is not None else np.empty(bentuk, dtype=dtype)
+        if matriks.shape != tuple(bentuk) or matriks.dtype != np.dtype(dtype):
+            raise ValueError(f"Array diterima {dtype} {bentuk} tidak cocok dengan tujuan {matriks.dtype} {matriks.shape}")
+        _terima_buffer(sock, _buffer_baris(matriks))
+        daftar_array.append(matriks)
+    return header, daftar_array
+
+
+def _siapkan_socket(sock):
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+# Thread penerima worker: panel masuk ke antrean terbatas sehingga panel berikutnya diterima selama perkalian
+def _terima_panel(sock, jumlah_panel, antrean):
+    try:
+        for _ in range(jumlah_panel):
+            antrean.put(_terima(sock)[1])
+    except BaseException as e:
+        antrean.put(e)
+
+
+# Fungsi worker untuk satu perkalian: akumulasi C_ij dari semua panel.
+# Mengembalikan (blok C, waktu komputasi, waktu menunggu panel, pesan galat atau None)
+def _hitung_blok(sock, header):
+    blok = np.zeros(header["bentuk"], dtype=header["dtype"])
+    antrean = queue.Queue(maxsize=UKURAN_ANTREAN_PANEL)
+    penerima = threading.Thread(target=_terima_panel, args=(sock, header["jumlah_panel"], antrean), daemon=True)
+    penerima.start()
+    waktu_komputasi = waktu_tunggu = 0.0
+    galat = None
+    for _ in range(header["jumlah_panel"]):
+        mulai = time.perf_counter()
+        item = antrean.get()
+        waktu_tunggu += time.perf_counter() - mulai
+        if isinstance(item, BaseException):
+            raise item
+        if galat is not None:
+            continue  # tetap habiskan panel agar aliran pesan tetap sinkron
+        panel_a, panel_b = item
+        mulai = time.perf_counter()
+        try:
+            blok += kalikan(np, panel_a, panel_b, header.get("jalur"))
+        except Exception as e:
+            galat = f"{type(e).__name__}: {e}"
+        waktu_komputasi += time.perf_counter() - mulai
+        del item, panel_a, panel_b
+    penerima.join()
+    return blok, waktu_komputasi, waktu_tunggu, galat
+
+
+# Fungsi utama worker (proses lokal atau node lain): sambung ke koordinator lalu layani perkalian sampai "selesai"
+def jalankan_worker(host, port):
+    sock = _siapkan_socket(socket.create_connection((host, port), timeout=BATAS_WAKTU_KONEKSI))
+    sock.settimeout(None)
+    header, _ = _terima(sock)
+    if threadpool_limits is not None and header.get("thread"):
+        threadpool_limits(limits=header["thread"], user_api="blas")
+    try:
+        while True:
+            header, _ = _terima(sock)
+            if header["op"] == "selesai":
+                break
+            blok, waktu_komputasi, waktu_tunggu, galat = _hitung_blok(sock, header)
+            if galat is not None:
+                _kirim(sock, {"op": "galat", "pesan": galat})
+            else:
+                _kirim(sock, {"op": "hasil", "komputasi": waktu_komputasi, "tunggu": waktu_tunggu}, blok)
+            del blok
+    finally:
+        sock.close()
+
+
+# Koordinator: socket server, worker (lokal atau eksternal) dan satu thread pengirim per worker
+class Klaster:
+    def __init__(self, jumlah_worker, worker_lokal=True, host="127.0.0.1", port=0, jumlah_thread=None):
+        self.jumlah_worker = jumlah_worker
+        self.grid = grid_proses(jumlah_worker)
+        self.proses = []
+        self.soket = []
+        self.riwayat = []
+        self._server = socket.create_server((host, port))
+        self._server.settimeout(BATAS_WAKTU_KONEKSI)
+        self.host, self.port = self._server.getsockname()[:2]
+        try:
+            if worker_lokal:
+                # spawn: worker tidak mewarisi state koordinator, seperti node terpisah
+                konteks = multiprocessing.get_context("spawn")
+                for _ in range(jumlah_worker):
+                    proses = konteks.Process(target=jalankan_worker, args=(self.host, self.port), daemon=True)
+                    proses.start()
+                    self.proses.append(proses)
+                # Worker lokal berbagi core mesin ini; node sungguhan memakai semua core-nya
+                jumlah_thread = jumlah_thread or max(1, (os.cpu_count() or 1) // jumlah_worker)
+            else:
+                print(f"Menunggu {jumlah_worker} worker di {self.host}:{self.port} "
+                      f"(python perkalian_terdistribusi.py worker HOST {self.port})")
+            for rank in range(jumlah_worker):
+                sock, _ = self._server.accept()
+                sock.settimeout(None)
+                self.soket.append(_siapkan_socket(sock))
+                _kirim(sock, {"op": "init", "rank": rank, "thread": jumlah_thread})
+        except BaseException:
+            self.tutup()
+            raise
+        self._pengirim = ThreadPoolExecutor(max_workers=jumlah_worker, thread_name_prefix="pengirim-panel")
+
+    def info(self):
+        return f"{self.jumlah_worker} worker, grid {self.grid[0]}x{self.grid[1]}"
+
+    # Satu worker: kirim header dan semua panel, lalu terima blok C langsung ke tempatnya di matriks hasil
+    def _layani(self, rank, matriks_a, matriks_b, blok_c, baris, kolom, daftar_panel, jalur):
+        sock = self.soket[rank]
+        (i0, i1), (j0, j1) = baris, kolom
+        mulai = time.perf_counter()
+        byte = _kirim(sock, {"op": "kalikan", "jumlah_panel": len(daftar_panel), "bentuk": [i1 - i0, j1 - j0],
+                             "dtype": blok_c.dtype.str, "jalur": jalur})
+        for k0, k1 in daftar_panel:
+            byte += _kirim(sock, {"op": "panel"}, matriks_a[i0:i1, k0:k1], matriks_b[k0:k1, j0:j1])
+        waktu_kirim = time.perf_counter() - mulai
+        header, _ = _terima(sock, [blok_c])
+        if header["op"] == "galat":
+            raise RuntimeError(f"Worker {rank}: {header['pesan']}")
+        return {"komputasi": header["komputasi"], "tunggu": header["tunggu"], "kirim": waktu_kirim,
+                "byte": byte + blok_c.nbytes}
+
+    # Fungsi untuk mengalikan A @ B di grid proses, panel dikirim dari hub ke setiap worker.
+    # Waktu setiap pemanggilan dicatat di riwayat:
+    #   total      - waktu dinding koordinator
+    #   komputasi  - waktu perkalian worker terlama (jalur kritis komputasi)
+    #   komunikasi - sisa waktu dinding: pengiriman panel, pengumpulan C dan tunggu yang tidak tertutup komputasi
+    # jalur dipilih sekali untuk operand utuh (batasnya juga berlaku untuk setiap panel) lalu dikirim ke worker
+    def kalikan(self, matriks_a, matriks_b, ukuran_panel=None, jalur=None):
+        if matriks_a.shape[1] != matriks_b.shape[0]:
+            raise ValueError(f"Bentuk operand tidak cocok: {matriks_a.shape} @ {matriks_b.shape}")
+        ukuran_panel = ukuran_panel or UKURAN_PANEL_BAWAAN
+        matriks_a, matriks_b = np.ascontiguousarray(matriks_a), np.ascontiguousarray(matriks_b)
+        dtype_c = tipe_hasil(np.result_type(matriks_a.dtype, matriks_b.dtype))
+        hasil = np.empty((matriks_a.shape[0], matriks_b.shape[1]), dtype=dtype_c)
+        pr, pc = self.grid
+        daftar_panel = [(k, min(k + ukuran_panel, matriks_a.shape[1]))
+                        for k in range(0, matriks_a.shape[1], ukuran_panel)]
+        if jalur is None:
+            jalur = jalur_perkalian(matriks_a, matriks_b)
+
+        mulai = time.perf_counter()
+        tugas = []
+        for i, baris in enumerate(bagi_rata(hasil.shape[0], pr)):
+            for j, kolom in enumerate(bagi_rata(hasil.shape[1], pc)):
+                blok_c = hasil[baris[0]:baris[1], kolom[0]:kolom[1]]
+                tugas.append(self._pengirim.submit(self._layani, i * pc + j, matriks_a, matriks_b, blok_c, baris,
+                                                   kolom, daftar_panel, jalur))
+        laporan = [t.result() for t in tugas]
+        total = time.perf_counter() - mulai
+
+        komputasi = max(l["komputasi"] for l in laporan)
+        self.riwayat.append({
+            "total": total,
+            "komputasi": komputasi,
+            "komunikasi": max(0.0, total - komputasi),
+            "tunggu_worker": max(l["tunggu"] for l in laporan),
+            "byte": sum(l["byte"] for l in laporan),
+        })
+        return hasil
+
+    def tutup(self):
+        if getattr(self, "_pengirim", None) is not None:
+            self._pengirim.shutdown()
+        for sock in self.soket:
+            try:
+                _kirim(sock, {"op": "selesai"})
+            except OSError:
+                pass
+            sock.close()
+        self.soket = []
+        for proses in self.proses:
+            proses.join(timeout=5)
+            if proses.is_alive():
+                proses.terminate()
+        self.proses = []
+        self._server.close()
+
+
+def dapatkan_klaster(jumlah_worker, **opsi):
+    global _klaster
+    if _klaster is None or _klaster.jumlah_worker != jumlah_worker:
+        tutup_klaster()
+        _klaster = Klaster(jumlah_worker, **opsi)
+    return _klaster
+
+
+def tutup_klaster():
+    global _klaster
+    if _klaster is not None:
+        _klaster.tutup()
+    _klaster = None
+
+
+# Fungsi untuk perkalian terdistribusi sekali jalan (dipakai backend "numpy-terdistribusi"). Klaster yang gagal
+# (misalnya worker mati) ditutup agar pemanggilan berikutnya menyalakan worker baru.
+def kalikan_terdistribusi(matriks_a, matriks_b, jumlah_worker, ukuran_panel=None, jalur=None):
+    klaster = dapatkan_klaster(jumlah_worker)
+    try:
+        return klaster.kalikan(matriks_a, matriks_b, ukuran_panel, jalur)
+    except (OSError, RuntimeError):
+        tutup_klaster()
+        raise
+
+
+# Ringkasan median sebagian riwayat klaster (misalnya semua pemanggilan satu ukur(), termasuk pemanasan)
+def ringkas_riwayat(riwayat):
+    return {kunci: float(np.median([r[kunci] for r in riwayat])) for kunci in riwayat[0]}
+
+
+# Fungsi untuk mengukur skala perkalian terdistribusi: untuk setiap dimensi dan jumlah worker, waktu perkalian
+# dibagi menjadi komputasi dan komunikasi, dan dibandingkan dengan perkalian NumPy satu proses
+# (beban perkalian_matriks_numpy). Mengembalikan daftar catatan
+def jalankan_studi_terdistribusi(dimensi, daftar_jumlah_worker, tipe_data_diuji=(TIPE_DATA_BAWAAN,),
+                                 ukuran_panel=None):
+    # Diimpor di sini agar proses worker (yang mengimpor modul ini) tetap ringan
+    import benchmark
+    from backend import dapatkan_backend
+    from pengukuran_waktu import format_statistik
+
+    backend_numpy = dapatkan_backend("numpy")
+    daftar_catatan = []
+    for tipe_data in tipe_data_diuji:
+        for dim in dimensi:
+            if not benchmark.periksa_memori_tersedia(backend_numpy, dim, tipe_data):
+                print(f"Memori tidak cukup untuk matriks {dim}x{dim}. Melewati.")
+                continue
+            matriks_a = backend_numpy.buat_acak((dim, dim), tipe_data)
+            matriks_b = backend_numpy.buat_acak((dim, dim), tipe_data)
+            hasil, statistik_numpy = benchmark.perkalian_matriks(backend_numpy, matriks_a, matriks_b, 0)
+            del hasil
+            if statistik_numpy is None:
+                continue
+            print(f"NumPy satu proses {dim}x{dim} ({tipe_data}): {format_statistik(statistik_numpy)}")
+
+            for jumlah_worker in daftar_jumlah_worker:
+                backend = dapatkan_backend("numpy-terdistribusi", jumlah_worker=jumlah_worker,
+                                           ukuran_panel=ukuran_panel)
+                klaster = dapatkan_klaster(jumlah_worker)
+                awal = len(klaster.riwayat)
+                hasil, statistik = benchmark.perkalian_matriks(backend, matriks_a, matriks_b)
+                del hasil
+                if statistik is None:
+                    continue
+                waktu = ringkas_riwayat(klaster.riwayat[awal:])
+                catatan = {
+                    "dtype": tipe_data, "dim": dim, "jumlah_worker": jumlah_worker, "grid": klaster.grid,
+                    "statistik": statistik, "waktu_numpy": statistik_numpy["median"],
+                    "percepatan": statistik_numpy["median"] / statistik["median"],
+                    "terverifikasi": statistik["terverifikasi"], **waktu,
+                }
+                catatan["efisiensi"] = catatan["percepatan"] / jumlah_worker
+                print(f"Terdistribusi {klaster.info()} {dim}x{dim} ({tipe_data}): {format_statistik(statistik)}, "
+                      f"komputasi {waktu['komputasi']:.6f}, komunikasi {waktu['komunikasi']:.6f} detik, "
+                      f"verifikasi {benchmark.format_verifikasi(statistik['terverifikasi'])}")
+                daftar_catatan.append(catatan)
+            del matriks_a, matriks_b
+            backend_numpy.bebaskan()
+    tutup_klaster()
+    return daftar_catatan
+
+
+# Fungsi untuk mencetak tabel skala terdistribusi: waktu, pembagian komputasi/komunikasi dan volume data
+def cetak_studi_terdistribusi(daftar_catatan):
+    if not daftar_catatan:
+        return
+    print("\nStudi Perkalian Terdistribusi (blok 2D lewat hub) vs NumPy satu proses:")
+    print("=" * 125)
+    print(f"{'Dimensi':<9} {'Tipe':<8} {'Worker':<7} {'Grid':<6} {'Total (s)':<12} {'Komputasi (s)':<14} "
+          f"{'Komunikasi (s)':<15} {'% Kom.':<8} {'Data (MB)':<11} {'Percepatan':<11} {'Efisiensi':<10} {'Verifikasi':<10}")
+    print("-" * 125)
+    for c in daftar_catatan:
+        print(f"{c['dim']:<9} {c['dtype']:<8} {c['jumlah_worker']:<7} {c['grid'][0]}x{c['grid'][1]:<4} "
+              f"{c['statistik']['median']:<12.6f} {c['komputasi']:<14.6f} {c['komunikasi']:<15.6f} "
+              f"{c['komunikasi'] / c['total']:<8.1%} {c['byte'] / (1024**2):<11.1f} {c['percepatan']:<10.2f}x "
+              f"{c['efisiensi']:<10.1%} {'OK' if c['terverifikasi'] else 'GAGAL':<10}")
+
+
+if __name__ == "__main__":
+    # Worker di node lain: python perkalian_terdistribusi.py worker HOST PORT
+    if len(sys.argv) != 4 or sys.argv[1] != "worker":
+        print("Penggunaan: python perkalian_terdistribusi.py worker HOST PORT")
+        sys.exit(2)
+    jalankan_worker(sys.argv[2], int(sys.argv[3]))
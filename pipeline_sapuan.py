@@ -0,0 +1,208 @@
+import os
+import time
+import queue
+import threading
+import numpy as np
+from tipe_data import TIPE_DATA, byte_per_elemen_perkalian
+from pengukuran_waktu import ringkas_statistik, format_statistik
+import benchmark
+
+# Mode pipeline sapuan: tiga tahap yang berjalan bersamaan
+#   produsen (thread)  - mengisi operand A dan B sel k+1 ke slot buffer yang bebas
+#   konsumen (utama)   - mengalikan operand sel k dan mengukurnya seperti benchmark.perkalian_matriks
+#   penulis (thread)   - mengambil contoh/checksum hasil sel k-1 dan menyimpannya ke penyimpanan hasil
+# Operand ditulis ke JUMLAH_SLOT slot (ping-pong) yang dialokasikan sekali untuk sel terbesar lalu dipakai
+# ulang untuk setiap dimensi dan tipe data, sehingga tidak ada alokasi + del + gc.collect() per sel.
+
+# Jumlah slot operand; 2 cukup untuk menumpuk pembuatan satu sel dengan perkalian sel sebelumnya
+JUMLAH_SLOT = 2
+
+# Jumlah hasil yang boleh menunggu penulis; membatasi memori hasil perkalian yang belum disimpan
+UKURAN_ANTREAN_TULIS = 1
+
+_SELESAI = object()
+
+
+# Satu slot ping-pong: buffer byte untuk operand A dan B, dilihat sebagai (dim, dim) bertipe apa pun
+class SlotOperand:
+    def __init__(self, backend, byte_maksimum):
+        self.buffer = [backend.xp.empty(byte_maksimum, dtype=np.uint8) for _ in range(2)]
+
+    def operand(self, dim, tipe_data):
+        dtype = np.dtype(TIPE_DATA[tipe_data])
+        jumlah_byte = dim * dim * dtype.itemsize
+        return [buffer[:jumlah_byte].view(dtype).reshape(dim, dim) for buffer in self.buffer]
+
+
+# Fungsi untuk membagi sel menjadi sel pipeline dan sel yang dijalankan berurutan (tidak muat bersama slot)
+# Kebutuhan memori: semua slot untuk operand terbesar, ditambah hasil dan temporer perkalian sel ini dan satu
+# hasil sebelumnya yang masih dipegang penulis. Mengembalikan (sel pipeline, sel sisa, byte per operand slot)
+def bagi_sel(backend, daftar_sel, jumlah_slot=JUMLAH_SLOT):
+    batas = backend.memori_tersedia() * 0.95
+    sel_pipeline, sel_sisa = [], []
+    byte_slot = 0
+    for dim, tipe_data in daftar_sel:
+        dtype = np.dtype(TIPE_DATA[tipe_data])
+        byte_slot_baru = max(byte_slot, dim * dim * dtype.itemsize)
+        temporer = byte_per_elemen_perkalian(dtype) - 2 * dtype.itemsize
+        kebutuhan = jumlah_slot * 2 * byte_slot_baru + dim * dim * (temporer + 8)
+        if kebutuhan <= batas:
+            sel_pipeline.append((dim, tipe_data))
+            byte_slot = byte_slot_baru
+        else:
+            sel_sisa.append((dim, tipe_data))
+    return sel_pipeline, sel_sisa, byte_slot
+
+
+# Fungsi untuk mengisi satu operand slot: dari cache operand bila dipakai, selain itu dengan isi acak backend
+def _isi_operand(backend, matriks, tipe_data, indeks):
+    if benchmark.CACHE_OPERAND is not None:
+        path_cache = benchmark.CACHE_OPERAND.path_operand(matriks.shape, tipe_data, indeks)
+        if path_cache is not None:
+            matriks[...] = backend.dari_numpy(np.load(path_cache, mmap_mode="r"))
+            return
+    backend.isi_acak(matriks, tipe_data)
+
+
+def _produsen(backend, daftar_sel, slot_bebas, antrean_siap, waktu_sibuk):
+    try:
+        for dim, tipe_data in daftar_sel:
+            slot = slot_bebas.get()
+            if slot is _SELESAI:
+                break
+            matriks_a, matriks_b = slot.operand(dim, tipe_data)
+            statistik = []
+            for indeks, matriks in enumerate((matriks_a, matriks_b)):
+                mulai = time.perf_counter_ns()
+                _isi_operand(backend, matriks, tipe_data, indeks)
+                backend.sinkronisasi()
+                durasi = (time.perf_counter_ns() - mulai) / 1e9
+                waktu_sibuk["pembuatan"] += durasi
+                statistik.append(ringkas_statistik([durasi]))
+            antrean_siap.put((dim, tipe_data, slot, matriks_a, matriks_b, statistik[0], statistik[1]))
+    except BaseException as e:
+        antrean_siap.put(e)
+    antrean_siap.put(_SELESAI)
+
+
+def _penulis(backend, antrean_tulis, daftar_catatan, waktu_sibuk, galat):
+    while True:
+        item = antrean_tulis.get()
+        if item is _SELESAI:
+            return
+        if galat:
+            continue  # kosongkan antrean agar konsumen tidak tertahan
+        catatan, hasil = item
+        try:
+            mulai = time.perf_counter_ns()
+            catatan["contoh"], catatan["checksum"] = benchmark.ambil_contoh_hasil(backend, hasil)
+            del item, hasil
+            catatan["memori"] = {"simpan": {"durasi": (time.perf_counter_ns() - mulai) / 1e9}}
+            benchmark.simpan_hasil(backend, [catatan])
+            waktu_sibuk["simpan"] += (time.perf_counter_ns() - mulai) / 1e9
+            daftar_catatan.append(catatan)
+        except BaseException as e:
+            galat.append(e)
+
+
+# Fungsi untuk menjalankan sel-sel yang muat bersama slot dalam pipeline. Waktu pembuatan setiap operand diukur
+# sekali di thread produsen (satu ulangan), waktu perkalian diukur penuh dengan ukur(); keduanya bisa sedikit
+# lebih lambat dari mode berurutan karena tahap lain berjalan bersamaan, dan profil memori per fase tidak
+# dicatat karena RSS proses tidak bisa dipisahkan per tahap.
+# Mengembalikan (daftar catatan, {tahap: waktu sibuk}, waktu dinding)
+def jalankan_pipeline(backend, daftar_sel, byte_slot, jumlah_slot=JUMLAH_SLOT):
+    slot_bebas = queue.Queue()
+    for _ in range(jumlah_slot):
+        slot_bebas.put(SlotOperand(backend, byte_slot))
+    antrean_siap = queue.Queue()
+    antrean_tulis = queue.Queue(maxsize=UKURAN_ANTREAN_TULIS)
+    waktu_sibuk = {"pembuatan": 0.0, "perkalian": 0.0, "simpan": 0.0}
+    daftar_catatan, galat = [], []
+
+    mulai_dinding = time.perf_counter_ns()
+    produsen = threading.Thread(target=_produsen, args=(backend, daftar_sel, slot_bebas, antrean_siap, waktu_sibuk),
+                                name="produsen-operand", daemon=True)
+    penulis = threading.Thread(target=_penulis, args=(backend, antrean_tulis, daftar_catatan, waktu_sibuk, galat),
+                               name="penulis-hasil", daemon=True)
+    produsen.start()
+    penulis.start()
+    try:
+        while True:
+            item = antrean_siap.get()
+            if item is _SELESAI:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            dim, tipe_data, slot, matriks_a, matriks_b, statistik_buat_a, statistik_buat_b = item
+            print(f"\nPipeline {backend.nama} {dim}x{dim} ({tipe_data}): operand dibuat dalam "
+                  f"{statistik_buat_a['median'] + statistik_buat_b['median']:.6f} detik")
+
+            mulai = time.perf_counter_ns()
+            hasil, statistik_perkalian = benchmark.perkalian_matriks(backend, matriks_a, matriks_b)
+            waktu_sibuk["perkalian"] += (time.perf_counter_ns() - mulai) / 1e9
+            jalur = backend.jalur(matriks_a, matriks_b)
+            # Operand tidak dipakai lagi: slot langsung boleh diisi untuk sel berikutnya
+            del matriks_a, matriks_b
+            slot_bebas.put(slot)
+            if hasil is None:
+                continue
+            print(f"Perkalian matriks {dim}x{dim} (jalur {jalur}) selesai dalam {format_statistik(statistik_perkalian)}, "
+                  f"verifikasi {benchmark.format_verifikasi(statistik_perkalian['terverifikasi'])}")
+            catatan = benchmark.buat_catatan(backend, dim, tipe_data, jalur, statistik_buat_a, statistik_buat_b,
+                                             statistik_perkalian)
+            # Waktu pipeline diukur selagi tahap lain berjalan, jadi disimpan terpisah dari mode berurutan
+            catatan["mode"] = "pipeline"
+            antrean_tulis.put((catatan, hasil))
+            del hasil
+            if galat:
+                raise galat[0]
+    finally:
+        # Hentikan produsen yang mungkin menunggu slot, lalu tunggu penulis menyimpan hasil yang tersisa
+        slot_bebas.put(_SELESAI)
+        antrean_tulis.put(_SELESAI)
+        penulis.join()
+        produsen.join()
+    if galat:
+        raise galat[0]
+    return daftar_catatan, waktu_sibuk, (time.perf_counter_ns() - mulai_dinding) / 1e9
+
+
+# Fungsi untuk menjalankan sapuan dimensi x tipe data dalam mode pipeline. Sel yang sudah tersimpan di run ini
+# dilewati; sel yang tidak muat bersama slot (termasuk mode blok out-of-core) dijalankan berurutan sesudahnya.
+def jalankan_benchmark_pipeline(backend, dimensi=benchmark.DIMENSI_BAWAAN,
+                                tipe_data_diuji=benchmark.TIPE_DATA_DIUJI_BAWAAN, folder=benchmark.FOLDER_HASIL,
+                                jumlah_slot=JUMLAH_SLOT):
+    os.makedirs(folder, exist_ok=True)
+    print(f"\n--- Memulai benchmark pipeline {backend.info()} ---")
+    selesai = benchmark.sel_selesai(backend)
+    daftar_sel = [(dim, tipe_data) for dim in dimensi for tipe_data in tipe_data_diuji
+                  if (tipe_data, dim) not in selesai]
+    sel_pipeline, sel_sisa, byte_slot = bagi_sel(backend, daftar_sel, jumlah_slot)
+
+    daftar_catatan = list(selesai.values())
+    if sel_pipeline:
+        print(f"{len(sel_pipeline)} sel dalam pipeline, {jumlah_slot} slot x 2 operand x "
+              f"{byte_slot / (1024**2):.1f} MB")
+        catatan_pipeline, waktu_sibuk, waktu_dinding = jalankan_pipeline(backend, sel_pipeline, byte_slot, jumlah_slot)
+        daftar_catatan += catatan_pipeline
+        total_sibuk = sum(waktu_sibuk.values())
+        print(f"\nPipeline {backend.nama}: waktu dinding {waktu_dinding:.3f} detik; sibuk pembuatan "
+              f"{waktu_sibuk['pembuatan']:.3f}, perkalian {waktu_sibuk['perkalian']:.3f}, simpan "
+              f"{waktu_sibuk['simpan']:.3f} detik (tumpang tindih {max(0.0, total_sibuk - waktu_dinding):.3f} detik)")
+        backend.bebaskan()
+
+    # Sisa sel berurutan seperti jalankan_benchmark: tipe data yang gagal memori tidak dicoba di dimensi lebih besar
+    tipe_gagal_memori = set()
+    for dim, tipe_data in sel_sisa:
+        if tipe_data in tipe_gagal_memori:
+            continue
+        lanjut, catatan = benchmark.uji_sel(backend, dim, tipe_data, folder)
+        if catatan is not None:
+            daftar_catatan.append(catatan)
+        if not lanjut:
+            tipe_gagal_memori.add(tipe_data)
+
+    backend.tutup()
+    urutan_tipe = {tipe_data: i for i, tipe_data in enumerate(tipe_data_diuji)}
+    daftar_catatan.sort(key=lambda c: (c["dim"], urutan_tipe.get(c["dtype"], 0)))
+    return daftar_catatan
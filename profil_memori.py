@@ -0,0 +1,122 @@
+import time
+import threading
+import tracemalloc
+import psutil
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Selang pengambilan sampel RSS oleh thread latar belakang
+INTERVAL_SAMPEL_DETIK = 0.002
+
+
+def _rusage():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF)
+
+
+# Profil memori satu fase (pembuatan, perkalian, simpan), dipakai sebagai context manager:
+#
+#     with ProfilMemori(backend) as profil:
+#         ...
+#     profil.hasil  -> dict metrik fase
+#
+# - RSS puncak dari thread sampler (psutil), termasuk temporer tersembunyi di dalam BLAS/NumPy
+# - ru_maxrss dan page fault minor dari resource.getrusage (page fault = halaman baru yang disentuh allocator)
+# - byte puncak, byte bersih dan jumlah blok bersih yang dialokasikan lewat tracemalloc
+#   (NumPy melaporkan buffer array ke tracemalloc), bila lacak_alokasi=True
+# - memori perangkat terpakai (misalnya pool CuPy) bila backend melaporkannya
+class ProfilMemori:
+    def __init__(self, backend=None, lacak_alokasi=True, interval=INTERVAL_SAMPEL_DETIK):
+        self.backend = backend
+        self.lacak_alokasi = lacak_alokasi
+        self.interval = interval
+        self.hasil = None
+        self._proses = psutil.Process()
+        self._berhenti = threading.Event()
+        self._thread = None
+
+    def _memori_perangkat(self):
+        if self.backend is None:
+            return None
+        return self.backend.memori_terpakai()
+
+    def _sampel(self):
+        while not self._berhenti.wait(self.interval):
+            self._rss_puncak = max(self._rss_puncak, self._proses.memory_info().rss)
+            perangkat = self._memori_perangkat()
+            if perangkat is not None:
+                self._perangkat_puncak = max(self._perangkat_puncak, perangkat)
+
+    def __enter__(self):
+        self._mulai_tracemalloc = False
+        if self.lacak_alokasi:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._mulai_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._traced_awal = tracemalloc.get_traced_memory()[0]
+            self._jumlah_blok_awal = len(tracemalloc.take_snapshot().traces)
+
+        self._rusage_awal = _rusage()
+        self._rss_awal = self._proses.memory_info().rss
+        self._rss_puncak = self._rss_awal
+        self._perangkat_awal = self._memori_perangkat()
+        self._perangkat_puncak = self._perangkat_awal or 0
+        self._mulai = time.perf_counter_ns()
+        self._thread = threading.Thread(target=self._sampel, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        durasi_ns = time.perf_counter_ns() - self._mulai
+        self._berhenti.set()
+        self._thread.join()
+        rss_akhir = self._proses.memory_info().rss
+        self._rss_puncak = max(self._rss_puncak, rss_akhir)
+
+        self.hasil = {
+            "durasi": durasi_ns / 1e9,
+            "rss_awal": self._rss_awal,
+            "rss_akhir": rss_akhir,
+            "rss_puncak": self._rss_puncak,
+            "ru_maxrss": None,
+            "page_fault_minor": None,
+            "byte_puncak_alokasi": None,
+            "byte_bersih_alokasi": None,
+            "jumlah_blok_alokasi": None,
+            "memori_perangkat_puncak": None,
+        }
+        rusage_akhir = _rusage()
+        if rusage_akhir is not None:
+            # ru_maxrss dalam KB di Linux
+            self.hasil["ru_maxrss"] = rusage_akhir.ru_maxrss * 1024
+            self.hasil["page_fault_minor"] = rusage_akhir.ru_minflt - self._rusage_awal.ru_minflt
+        if self.lacak_alokasi:
+            sekarang, puncak = tracemalloc.get_traced_memory()
+            self.hasil["byte_puncak_alokasi"] = puncak - self._traced_awal
+            self.hasil["byte_bersih_alokasi"] = sekarang - self._traced_awal
+            self.hasil["jumlah_blok_alokasi"] = len(tracemalloc.take_snapshot().traces) - self._jumlah_blok_awal
+            if self._mulai_tracemalloc:
+                tracemalloc.stop()
+        if self._perangkat_awal is not None:
+            self._perangkat_puncak = max(self._perangkat_puncak, self._memori_perangkat())
+            self.hasil["memori_perangkat_puncak"] = self._perangkat_puncak
+        return False
+
+
+# Fungsi untuk menulis ringkasan profil satu fase dalam satu baris
+def format_profil(profil):
+    teks = (f"RSS puncak {profil['rss_puncak'] / (1024**2):.1f} MB "
+            f"(+{(profil['rss_puncak'] - profil['rss_awal']) / (1024**2):.1f} MB)")
+    if profil["byte_puncak_alokasi"] is not None:
+        teks += (f", alokasi puncak {profil['byte_puncak_alokasi'] / (1024**2):.1f} MB "
+                 f"dalam {profil['jumlah_blok_alokasi']} blok bersih")
+    if profil["page_fault_minor"] is not None:
+        teks += f", {profil['page_fault_minor']} page fault"
+    if profil["memori_perangkat_puncak"] is not None:
+        teks += f", memori perangkat puncak {profil['memori_perangkat_puncak'] / (1024**2):.1f} MB"
+    return teks
@@ -0,0 +1,215 @@
+import os
+import math
+import itertools
+import numpy as np
+from penyimpanan_hasil import (PATH_PENYIMPANAN, SKEMA, muat_hasil, id_run_terbaru, ulangan_baris,
+                               tulis_ulang_penyimpanan)
+
+# Baseline regresi: file dengan format yang sama dengan penyimpanan hasil (baris SKEMA + ulangan),
+# sampai JUMLAH_RUN_BASELINE baris (run berbeda) per (sidik host, backend, tipe data, dimensi, bentuk, kepadatan,
+# mode, fase)
+PATH_BASELINE = os.path.join("matrix_results", "baseline.npz")
+
+# Kolom yang menentukan entri baseline
+# Bentuk dan kepadatan ikut menjadi kunci: sapuan bentuk persegi panjang dan sapuan kepadatan sparse menulis
+# banyak baris dengan dim yang sama dalam satu run. Mode memisahkan waktu pipeline dari waktu berurutan.
+KOLOM_KUNCI = ("sidik_host", "backend", "dtype", "dim", "bentuk", "kepadatan", "mode", "fase")
+
+# Fase yang diperiksa secara bawaan
+FASE_DIPERIKSA = ("perkalian",)
+
+# Regresi dilaporkan bila median lebih lambat dari ambang relatif ini DAN ujinya signifikan pada tingkat ALFA
+AMBANG_PERLAMBATAN = 0.05
+ALFA = 0.01
+
+# Variasi antar-run (frekuensi CPU, suhu, tetangga di mesin yang sama) sering lebih besar dari variasi ulangan
+# di dalam satu run, jadi baseline menyimpan beberapa run terakhir per titik. Regresi baru dilaporkan bila
+# baseline punya minimal RUN_BASELINE_MINIMUM run dan run baru lebih lambat dari median SETIAP run baseline.
+JUMLAH_RUN_BASELINE = 5
+RUN_BASELINE_MINIMUM = 3
+
+# Jumlah permutasi uji; bila jumlah kombinasi lebih kecil dari ini, semua kombinasi dihitung (uji eksak)
+JUMLAH_PERMUTASI = 20000
+
+
+# Kolom larik (bentuk) menjadi tuple agar kuncinya bisa di-hash
+def _kunci(baris):
+    return tuple(tuple(nilai) if isinstance(nilai, list) else nilai
+                 for nilai in (baris[kolom].tolist() for kolom in KOLOM_KUNCI))
+
+
+# Peringkat 1..n dengan peringkat rata-rata untuk nilai kembar
+def _peringkat(nilai):
+    urutan = np.argsort(nilai, kind="stable")
+    nilai_urut = nilai[urutan]
+    kelompok = np.cumsum(np.r_[True, nilai_urut[1:] != nilai_urut[:-1]]) - 1
+    rata_rata = np.bincount(kelompok, np.arange(1, len(nilai) + 1)) / np.bincount(kelompok)
+    peringkat = np.empty(len(nilai))
+    peringkat[urutan] = rata_rata[kelompok]
+    return peringkat
+
+
+# Uji Mann-Whitney satu sisi lewat permutasi jumlah peringkat: p-value hipotesis bahwa waktu_baru
+# cenderung lebih besar (lebih lambat) dari waktu_dasar. Tanpa asumsi distribusi, cocok untuk waktu ulangan
+# yang miring ke kanan. Eksak bila jumlah kombinasinya tidak lebih dari jumlah_permutasi.
+def uji_perlambatan(waktu_dasar, waktu_baru, jumlah_permutasi=JUMLAH_PERMUTASI, seed=0):
+    gabungan = np.concatenate([np.asarray(waktu_dasar, dtype=np.float64), np.asarray(waktu_baru, dtype=np.float64)])
+    n, n_baru = len(gabungan), len(waktu_baru)
+    peringkat = _peringkat(gabungan)
+    jumlah_amatan = peringkat[n - n_baru:].sum()
+
+    if math.comb(n, n_baru) <= jumlah_permutasi:
+        indeks = np.array(list(itertools.combinations(range(n), n_baru)))
+        jumlah = peringkat[indeks].sum(axis=1)
+        return np.count_nonzero(jumlah >= jumlah_amatan - 1e-9) / len(jumlah)
+
+    rng = np.random.default_rng(seed)
+    indeks = rng.random((jumlah_permutasi, n)).argsort(axis=1)[:, :n_baru]
+    jumlah = peringkat[indeks].sum(axis=1)
+    return (1 + np.count_nonzero(jumlah >= jumlah_amatan - 1e-9)) / (1 + jumlah_permutasi)
+
+
+# p-value terkecil yang bisa dicapai uji peringkat: satu susunan dari semua kombinasi n_baru di antara
+# n_dasar + n_baru waktu. Bila tidak di bawah alfa (misalnya 3 vs 3 ulangan: 1/20 = 0.05 pada dimensi besar yang
+# dibatasi BATAS_WAKTU_PENGUKURAN_NS), uji tidak mungkin signifikan dan titiknya hanya ditandai "kurang ulangan"
+def p_minimum(n_dasar, n_baru):
+    return 1 / math.comb(n_dasar + n_baru, n_baru)
+
+
+# Baris satu run yang ikut diperiksa: fase yang diminta, tanpa mode batch, dan punya waktu ulangan
+def _baris_diperiksa(baris, id_run, backend=None, fase=FASE_DIPERIKSA):
+    masker = (baris["id_run"] == id_run) & (baris["ukuran_batch"] == 0) & (baris["jumlah_ulangan"] > 0)
+    masker &= np.isin(baris["fase"], list(fase))
+    if backend:
+        masker &= np.isin(baris["backend"], list(backend))
+    return baris[masker]
+
+
+# Susun ulang (baris, ulangan) agar array ulangan hanya memuat potongan milik baris yang disimpan
+def _kemas(daftar_baris_ulangan):
+    if not daftar_baris_ulangan:
+        return np.zeros(0, dtype=SKEMA), np.zeros(0, dtype=np.float64)
+    baris = np.stack([b for b, _ in daftar_baris_ulangan])
+    panjang = np.array([len(u) for _, u in daftar_baris_ulangan], dtype=np.int64)
+    baris["awal_ulangan"] = np.concatenate([[0], np.cumsum(panjang)[:-1]])
+    baris["jumlah_ulangan"] = panjang
+    return baris, np.concatenate([u for _, u in daftar_baris_ulangan])
+
+
+# Fungsi untuk menambahkan satu run (bawaan: run terbaru) ke baseline. Per kunci hanya JUMLAH_RUN_BASELINE run
+# terbaru yang dipertahankan (run yang sama ditetapkan ulang menggantikan dirinya sendiri); entri lain (host,
+# backend, tipe data atau dimensi lain) tidak berubah. Mengembalikan jumlah entri yang ditetapkan
+def tetapkan_baseline(id_run=None, backend=None, path=PATH_PENYIMPANAN, path_baseline=PATH_BASELINE,
+                      fase=FASE_DIPERIKSA):
+    baris, ulangan = muat_hasil(path)
+    id_run = id_run or id_run_terbaru(baris)
+    if id_run is None:
+        print("Penyimpanan hasil masih kosong.")
+        return 0
+    baru = _baris_diperiksa(baris, id_run, backend, fase)
+    kunci_baru = {_kunci(b) for b in baru}
+
+    def ubah(dasar, ulangan_dasar):
+        entri = [(b, ulangan_baris(b, ulangan_dasar)) for b in dasar if _kunci(b) not in kunci_baru]
+        lama = {}
+        for b in dasar[np.argsort(dasar["waktu_run"], kind="stable")]:
+            if _kunci(b) in kunci_baru and b["id_run"] != id_run:
+                lama.setdefault(_kunci(b), []).append(b)
+        for daftar in lama.values():
+            entri += [(b, ulangan_baris(b, ulangan_dasar)) for b in daftar[-(JUMLAH_RUN_BASELINE - 1):]]
+        entri += [(b, ulangan_baris(b, ulangan)) for b in baru]
+        return _kemas(entri)
+
+    total, _ = tulis_ulang_penyimpanan(ubah, path_baseline)
+    print(f"{len(baru)} entri baseline dari run {id_run} ditetapkan di {path_baseline} ({len(total)} entri total)")
+    return len(baru)
+
+
+# Fungsi untuk membandingkan satu run (bawaan: run terbaru) dengan baseline host yang sama.
+# Ulangan semua run baseline digabung untuk uji peringkat, sedangkan efeknya diukur terhadap median per run:
+# regresi bila ujinya signifikan DAN median baru melewati (1 + ambang) x median run baseline yang paling lambat,
+# sehingga perlambatan yang masih di dalam sebaran antar-run baseline tidak dilaporkan.
+# Setiap titik diberi status "regresi", "lebih cepat", "stabil", "kurang ulangan", "baseline kurang"
+# (kurang dari RUN_BASELINE_MINIMUM run) atau "tanpa baseline".
+def periksa_regresi(id_run=None, backend=None, path=PATH_PENYIMPANAN, path_baseline=PATH_BASELINE,
+                    ambang=AMBANG_PERLAMBATAN, alfa=ALFA, fase=FASE_DIPERIKSA):
+    baris, ulangan = muat_hasil(path)
+    id_run = id_run or id_run_terbaru(baris)
+    dasar, ulangan_dasar = muat_hasil(path_baseline)
+    indeks_dasar = {}
+    for i, b in enumerate(dasar):
+        indeks_dasar.setdefault(_kunci(b), []).append(i)
+
+    hasil = []
+    for b in _baris_diperiksa(baris, id_run, backend, fase):
+        entri = {"backend": b["backend"].item(), "dtype": b["dtype"].item(), "dim": int(b["dim"]),
+                 "bentuk": tuple(b["bentuk"].tolist()), "kepadatan": float(b["kepadatan"]), "mode": b["mode"].item(),
+                 "fase": b["fase"].item(),
+                 "median_baru": float(b["median"]), "median_dasar": float("nan"), "sebaran_dasar": float("nan"),
+                 "rasio": float("nan"), "p": float("nan"), "run_baseline": ()}
+        daftar_indeks = indeks_dasar.get(_kunci(b))
+        if daftar_indeks is None:
+            entri["status"] = "tanpa baseline"
+            hasil.append(entri)
+            continue
+
+        median_run = dasar["median"][daftar_indeks]
+        waktu_dasar = np.concatenate([ulangan_baris(dasar[i], ulangan_dasar) for i in daftar_indeks])
+        waktu_baru = ulangan_baris(b, ulangan)
+        entri["median_dasar"] = float(np.median(median_run))
+        entri["sebaran_dasar"] = float((median_run.max() - median_run.min()) / entri["median_dasar"])
+        entri["rasio"] = entri["median_baru"] / entri["median_dasar"]
+        entri["run_baseline"] = tuple(dasar["id_run"][daftar_indeks].tolist())
+        if len(daftar_indeks) < RUN_BASELINE_MINIMUM:
+            entri["status"] = "baseline kurang"
+        elif p_minimum(len(waktu_dasar), len(waktu_baru)) >= alfa:
+            entri["status"] = "kurang ulangan"
+        else:
+            entri["p"] = uji_perlambatan(waktu_dasar, waktu_baru)
+            if entri["p"] < alfa and entri["median_baru"] > median_run.max() * (1 + ambang):
+                entri["status"] = "regresi"
+            elif (uji_perlambatan(waktu_baru, waktu_dasar) < alfa
+                  and entri["median_baru"] < median_run.min() / (1 + ambang)):
+                entri["status"] = "lebih cepat"
+            else:
+                entri["status"] = "stabil"
+        hasil.append(entri)
+    return hasil
+
+
+def ada_regresi(hasil):
+    return any(entri["status"] == "regresi" for entri in hasil)
+
+
+# Label titik untuk tabel: dim, atau MxKxN untuk bentuk persegi panjang, ditambah kepadatan bila sparse
+# dan mode bila bukan berurutan
+def _label_titik(entri):
+    m, k, n = entri.get("bentuk", (entri["dim"],) * 3)
+    label = str(entri["dim"]) if m == k == n == entri["dim"] else f"{m}x{k}x{n}"
+    if entri.get("kepadatan", 1.0) < 1.0:
+        label += f" d={entri['kepadatan']:g}"
+    if entri.get("mode", "berurutan") != "berurutan":
+        label += f" {entri['mode']}"
+    return label
+
+
+# Fungsi untuk mencetak hasil pemeriksaan regresi per titik dan ringkasannya
+def cetak_hasil_regresi(hasil, ambang=AMBANG_PERLAMBATAN, alfa=ALFA):
+    print(f"\nPemeriksaan regresi terhadap baseline (ambang {ambang:.0%}, alfa {alfa}):")
+    print("=" * 134)
+    print(f"{'Backend':<16} {'Tipe':<8} {'Titik':<20} {'Fase':<16} {'Baseline (s)':<14} {'Run':<4} {'Sebaran':<8} "
+          f"{'Baru (s)':<14} {'Rasio':<8} {'p':<8} {'Status':<15}")
+    print("-" * 134)
+    for entri in hasil:
+        rasio = "N/A" if math.isnan(entri["rasio"]) else f"{entri['rasio']:.3f}"
+        p = "N/A" if math.isnan(entri["p"]) else f"{entri['p']:.4f}"
+        penanda = "  <<<" if entri["status"] == "regresi" else ""
+        sebaran = "N/A" if math.isnan(entri["sebaran_dasar"]) else f"{entri['sebaran_dasar']:.1%}"
+        print(f"{entri['backend']:<16} {entri['dtype']:<8} {_label_titik(entri):<20} {entri['fase']:<16} "
+              f"{entri['median_dasar']:<14.6f} {len(entri['run_baseline']):<4} {sebaran:<8} "
+              f"{entri['median_baru']:<14.6f} {rasio:<8} {p:<8} {entri['status']:<15}{penanda}")
+    print("-" * 134)
+    jumlah = {}
+    for entri in hasil:
+        jumlah[entri["status"]] = jumlah.get(entri["status"], 0) + 1
+    print(", ".join(f"{n} {status}" for status, n in sorted(jumlah.items())) or "Tidak ada titik yang diperiksa.")
@@ -0,0 +1,161 @@
+import os
+import json
+import socket
+import numpy as np
+from pengukuran_waktu import ukur
+
+# File cache hasil kalibrasi per host dan backend, agar microbenchmark cukup dijalankan sekali
+PATH_KALIBRASI = os.path.join("matrix_results", "kalibrasi_roofline.json")
+
+# Ukuran matmul float untuk mengukur puncak FLOP praktis (BLAS/cuBLAS)
+DIM_KALIBRASI_FLOP = 2048
+
+# Jumlah elemen float64 per array untuk uji bandwidth ala STREAM (256 MB per array),
+# jauh lebih besar dari cache terakhir sehingga yang terukur adalah bandwidth memori utama
+ELEMEN_KALIBRASI_STREAM = 1 << 25
+
+# Bagian memori tersedia yang boleh dipakai kalibrasi
+FRAKSI_MEMORI_KALIBRASI = 0.25
+
+
+# Jumlah operasi floating point perkalian (m x k) @ (k x n) klasik
+def flop_perkalian(m, k, n):
+    return 2 * m * k * n
+
+
+# Fungsi untuk memperkirakan byte yang minimal harus dipindahkan dari/ke memori utama oleh satu perkalian
+# (A dan B dibaca sekali, C ditulis sekali) ditambah salinan konversi pada jalur eksak bilangan bulat.
+# Ini batas bawah lalu lintas memori; lalu lintas sebenarnya lebih besar bila blok tidak muat di cache.
+def byte_dipindahkan(m, k, n, dtype, jalur):
+    ukuran_masuk = np.dtype(dtype).itemsize
+    elemen_operand = m * k + k * n
+    elemen_hasil = m * n
+    if jalur in ("float32", "float64"):
+        ukuran_float = np.dtype(jalur).itemsize
+        # Cast A, B ke float (baca + tulis), matmul (baca salinan, tulis C float), cast C ke int64
+        return elemen_operand * (ukuran_masuk + 2 * ukuran_float) + elemen_hasil * (2 * ukuran_float + 8)
+    if jalur in ("integer", "referensi") and ukuran_masuk != 8 and np.issubdtype(np.dtype(dtype), np.integer):
+        # Cast A, B ke int64 dulu
+        return elemen_operand * (ukuran_masuk + 2 * 8) + elemen_hasil * 8
+    ukuran_hasil = 8 if np.issubdtype(np.dtype(dtype), np.integer) else ukuran_masuk
+    return elemen_operand * ukuran_masuk + elemen_hasil * ukuran_hasil
+
+
+# Fungsi untuk menghitung metrik roofline satu perkalian: GFLOP/s, byte efektif dan intensitas aritmetika
+# dim boleh berupa bentuk (m, k, n) untuk perkalian persegi panjang
+def metrik_perkalian(dim, dtype, jalur, waktu, jumlah=1):
+    m, k, n = (dim, dim, dim) if np.ndim(dim) == 0 else dim
+    flop = flop_perkalian(m, k, n) * jumlah
+    byte = byte_dipindahkan(m, k, n, dtype, jalur) * jumlah
+    return {
+        "gflops": flop / waktu / 1e9 if waktu > 0 else 0.0,
+        "byte_dipindahkan": byte,
+        "intensitas_aritmetika": flop / byte,
+    }
+
+
+# Tipe float yang puncaknya dipakai sebagai atap untuk satu titik (tipe data, jalur)
+def tipe_puncak(dtype, jalur):
+    if jalur in ("float32", "float64"):
+        return jalur
+    if jalur == "blas" or not np.issubdtype(np.dtype(dtype), np.integer):
+        return np.dtype(dtype).name
+    # Loop integer tidak punya puncak sendiri, dibandingkan dengan puncak float64
+    return "float64"
+
+
+def _ukur_puncak_gflops(backend, dim, tipe):
+    xp = backend.xp
+    a = xp.ones((dim, dim), dtype=tipe)
+    b = xp.ones((dim, dim), dtype=tipe)
+    _, statistik = ukur(lambda: xp.matmul(a, b), sinkronisasi=backend.sinkronisasi)
+    return flop_perkalian(dim, dim, dim) / statistik["min"] / 1e9
+
+
+def _ukur_bandwidth_gbs(backend, elemen):
+    xp = backend.xp
+    a = xp.ones(elemen, dtype=np.float64)
+    b = xp.ones(elemen, dtype=np.float64)
+    c = xp.empty(elemen, dtype=np.float64)
+
+    def triad():
+        xp.multiply(b, 3.0, out=c)
+        xp.add(c, a, out=c)
+
+    _, statistik_copy = ukur(lambda: xp.copyto(b, a), sinkronisasi=backend.sinkronisasi)
+    _, statistik_triad = ukur(triad, sinkronisasi=backend.sinkronisasi)
+    return 2 * elemen * 8 / statistik_copy["min"] / 1e9, 5 * elemen * 8 / statistik_triad["min"] / 1e9
+
+
+# Microbenchmark kalibrasi: puncak GFLOP/s matmul float32/float64 dan bandwidth memori (GB/s)
+# Bandwidth diukur dengan "copy" (b = a, 2 array lalu lintas) dan "triad" (c = a + s*b lewat
+# dua operasi in-place, 5 array lalu lintas); yang dipakai sebagai atap adalah yang tertinggi.
+def kalibrasi(backend):
+    memori = backend.memori_tersedia() * FRAKSI_MEMORI_KALIBRASI
+    hasil = {"backend": backend.nama, "info": backend.info(), "puncak_gflops": {}}
+
+    dim = DIM_KALIBRASI_FLOP
+    while dim > 256 and 3 * dim * dim * 8 > memori:
+        dim //= 2
+    for tipe in ("float32", "float64"):
+        hasil["puncak_gflops"][tipe] = _ukur_puncak_gflops(backend, dim, tipe)
+        backend.bebaskan()
+
+    elemen = int(min(ELEMEN_KALIBRASI_STREAM, memori // (3 * 8)))
+    hasil["bandwidth_copy_gbs"], hasil["bandwidth_triad_gbs"] = _ukur_bandwidth_gbs(backend, elemen)
+    backend.bebaskan()
+    hasil["bandwidth_gbs"] = max(hasil["bandwidth_copy_gbs"], hasil["bandwidth_triad_gbs"])
+    return hasil
+
+
+def _muat_cache_kalibrasi(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+# Fungsi untuk mengambil kalibrasi yang sudah tersimpan tanpa menjalankan microbenchmark (None bila belum ada)
+# info_backend adalah Backend.info() saat kalibrasi, misalnya kolom info_backend di penyimpanan hasil
+def kalibrasi_tersimpan(info_backend, hostname=None, path=PATH_KALIBRASI):
+    return _muat_cache_kalibrasi(path).get(f"{hostname or socket.gethostname()}/{info_backend}")
+
+
+# File kalibrasi yang menyertai file penyimpanan hasil: nama file yang sama dengan PATH_KALIBRASI, di folder
+# file hasil, sehingga hasil yang dialihkan (run --path) tidak mencampur kalibrasinya dengan folder bawaan
+def path_kalibrasi(path_hasil):
+    return os.path.join(os.path.dirname(path_hasil), os.path.basename(PATH_KALIBRASI))
+
+
+# Fungsi untuk mengambil kalibrasi dari cache atau menjalankannya sekali lalu menyimpannya
+def dapatkan_kalibrasi(backend, path=PATH_KALIBRASI, ulang=False):
+    kunci = f"{socket.gethostname()}/{backend.info()}"
+    cache = _muat_cache_kalibrasi(path)
+    if kunci in cache and not ulang:
+        return cache[kunci]
+
+    print(f"Menjalankan kalibrasi roofline untuk {backend.info()}...")
+    cache[kunci] = kalibrasi(backend)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    path_sementara = path + ".tmp"
+    with open(path_sementara, "w") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(path_sementara, path)
+    return cache[kunci]
+
+
+# Atap roofline pada intensitas tertentu: min(puncak komputasi, intensitas * bandwidth)
+def batas_roofline(intensitas, puncak_gflops, bandwidth_gbs):
+    return min(puncak_gflops, intensitas * bandwidth_gbs)
+
+
+# Fungsi untuk menempatkan satu catatan di roofline: atap, persen dari atap dan faktor pembatasnya
+def posisi_roofline(catatan, hasil_kalibrasi):
+    puncak = hasil_kalibrasi["puncak_gflops"][tipe_puncak(catatan["dtype"], catatan["jalur"])]
+    bandwidth = hasil_kalibrasi["bandwidth_gbs"]
+    atap = batas_roofline(catatan["intensitas_aritmetika"], puncak, bandwidth)
+    return {
+        "atap_gflops": atap,
+        "persen_atap": 100 * catatan["gflops"] / atap if atap > 0 else 0.0,
+        "terikat": "memori" if catatan["intensitas_aritmetika"] * bandwidth < puncak else "komputasi",
+    }
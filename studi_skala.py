@@ -0,0 +1,308 @@
+import os
+import time
+import contextlib
+import numpy as np
+from backend import dapatkan_backend, threadpool_limits
+from tipe_data import TIPE_DATA_BAWAAN
+from pengukuran_waktu import format_statistik
+from penyimpanan_hasil import id_run_sekarang, sidik_host, tambah_baris
+from roofline import metrik_perkalian
+from verifikasi import JUMLAH_PUTARAN_BAWAAN
+import benchmark
+
+try:
+    from threadpoolctl import threadpool_info
+except ImportError:
+    threadpool_info = None
+
+# File hasil studi skala: baris SKEMA_STUDI + waktu ulangan datar, dengan format yang sama seperti penyimpanan hasil
+# (segmen append-only, dimuat dengan penyimpanan_hasil.muat_hasil(PATH_STUDI, SKEMA_STUDI))
+PATH_STUDI = os.path.join("matrix_results", "studi_skala.npz")
+
+# Dimensi bawaan studi: di bawah ~256 satu thread hampir selalu paling cepat
+DIMENSI_STUDI_BAWAAN = [256, 512, 1024, 2048, 4096]
+
+# Strategi afinitas CPU:
+#   semua    - tanpa pin, thread BLAS boleh berjalan di semua CPU yang diizinkan
+#   kompak   - CPU diisi inti demi inti (saudara hyperthread berdampingan), satu paket dulu
+#   tersebar - satu CPU logis per inti fisik dulu, bergantian antar paket, baru saudara hyperthread-nya
+STRATEGI_AFINITAS = ("semua", "kompak", "tersebar")
+
+# Jumlah thread terbesar yang efisiensi paralelnya masih di atas ambang ini menjadi rekomendasi reservasi core
+AMBANG_EFISIENSI = 0.7
+
+SKEMA_STUDI = np.dtype([
+    ("id_run", "U40"),
+    ("waktu_run", "f8"),
+    ("sidik_host", "U16"),
+    ("info_backend", "U96"),
+    ("strategi", "U16"),
+    ("jumlah_thread", "i8"),
+    ("thread_efektif", "i8"),  # jumlah thread BLAS menurut threadpoolctl; -1 bila tidak diketahui
+    ("cpu", "U256"),  # daftar CPU afinitas, dipisah koma; kosong untuk strategi "semua"
+    ("dtype", "U8"),
+    ("dim", "i8"),
+    ("median", "f8"),
+    ("min", "f8"),
+    ("iqr", "f8"),
+    ("gflops", "f8"),
+    ("percepatan", "f8"),  # terhadap satu thread dengan strategi yang sama
+    ("efisiensi", "f8"),  # percepatan / jumlah thread
+    ("awal_ulangan", "i8"),
+    ("jumlah_ulangan", "i8"),
+])
+
+
+def _baca_angka(path, bawaan):
+    try:
+        with open(path) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return bawaan
+
+
+# Fungsi untuk membaca topologi CPU yang boleh dipakai proses ini: daftar (cpu, paket, inti)
+# Di luar Linux (tanpa /sys) setiap CPU dianggap inti tersendiri di paket 0
+def topologi_cpu():
+    daftar_cpu = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count()))
+    topologi = []
+    for cpu in daftar_cpu:
+        folder = f"/sys/devices/system/cpu/cpu{cpu}/topology"
+        topologi.append((cpu, _baca_angka(f"{folder}/physical_package_id", 0), _baca_angka(f"{folder}/core_id", cpu)))
+    return topologi
+
+
+# Fungsi untuk mengurutkan CPU menurut strategi afinitas; `jumlah` CPU pertama urutan ini menjadi maskernya
+def urutan_cpu(strategi, topologi=None):
+    topologi = topologi or topologi_cpu()
+    if strategi == "kompak":
+        return [cpu for cpu, _, _ in sorted(topologi, key=lambda t: (t[1], t[2], t[0]))]
+
+    # tersebar: urut menurut (urutan saudara dalam inti, urutan inti dalam paket, paket)
+    saudara, inti_paket = {}, {}
+    kunci = {}
+    for cpu, paket, inti in sorted(topologi):
+        urutan_saudara = saudara.setdefault((paket, inti), 0)
+        saudara[(paket, inti)] += 1
+        daftar_inti = inti_paket.setdefault(paket, [])
+        if inti not in daftar_inti:
+            daftar_inti.append(inti)
+        kunci[cpu] = (urutan_saudara, daftar_inti.index(inti), paket)
+    return sorted(kunci, key=kunci.get)
+
+
+# Fungsi untuk mengatur afinitas semua thread proses ini (thread BLAS yang sudah berjalan juga)
+# os.sched_setaffinity(0, ...) hanya mengenai thread pemanggil, jadi setiap thread di /proc/self/task diatur
+def atur_afinitas(cpu):
+    try:
+        daftar_thread = [int(tid) for tid in os.listdir("/proc/self/task")]
+    except OSError:
+        daftar_thread = [0]
+    for tid in daftar_thread:
+        try:
+            os.sched_setaffinity(tid, cpu)
+        except OSError:
+            pass  # thread sudah selesai
+
+
+@contextlib.contextmanager
+def afinitas(cpu):
+    if cpu is None:
+        yield
+        return
+    asal = os.sched_getaffinity(0)
+    atur_afinitas(cpu)
+    try:
+        yield
+    finally:
+        atur_afinitas(asal)
+
+
+# Jumlah thread bawaan: 1, 2, 4, ... sampai jumlah CPU yang diizinkan (selalu termasuk jumlah CPU itu sendiri)
+def grid_thread(jumlah_cpu=None):
+    jumlah_cpu = jumlah_cpu or len(topologi_cpu())
+    grid = [1 << i for i in range(jumlah_cpu.bit_length()) if 1 << i <= jumlah_cpu]
+    return grid + ([jumlah_cpu] if grid[-1] != jumlah_cpu else [])
+
+
+# NumPy dan pustaka BLAS yang dipakainya, misalnya "NumPy 2.1.0, openblas 0.3.27"
+def _info_blas():
+    info = f"NumPy {np.__version__}"
+    if threadpool_info is not None:
+        for pustaka in threadpool_info():
+            if pustaka["user_api"] == "blas":
+                info += f", {pustaka['internal_api']} {pustaka['version']}"
+    return info
+
+
+def _thread_efektif():
+    if threadpool_info is None:
+        return -1
+    jumlah = [info["num_threads"] for info in threadpool_info() if info["user_api"] == "blas"]
+    return max(jumlah) if jumlah else -1
+
+
+# Fungsi untuk menjalankan studi skala: sapuan perkalian_matriks di atas grid jumlah thread BLAS (threadpoolctl)
+# dan strategi afinitas CPU. Operand setiap (tipe data, dimensi) dibuat sekali lalu dipakai semua konfigurasi.
+# Mengembalikan daftar catatan dengan percepatan dan efisiensi paralel terhadap satu thread
+def jalankan_studi_skala(dimensi=DIMENSI_STUDI_BAWAAN, tipe_data_diuji=(TIPE_DATA_BAWAAN,), daftar_thread=None,
+                         strategi=STRATEGI_AFINITAS):
+    if threadpool_limits is None:
+        print("Studi skala membutuhkan threadpoolctl (pip install threadpoolctl). Melewati.")
+        return []
+    if not hasattr(os, "sched_setaffinity") and set(strategi) - {"semua"}:
+        print("os.sched_setaffinity tidak tersedia di platform ini; hanya strategi 'semua' yang dijalankan.")
+        strategi = ["semua"]
+
+    topologi = topologi_cpu()
+    daftar_thread = sorted(daftar_thread or grid_thread(len(topologi)))
+    backend_numpy = dapatkan_backend("numpy")
+    print(f"\nStudi skala: thread {daftar_thread}, strategi {', '.join(strategi)}, {len(topologi)} CPU")
+
+    daftar_catatan = []
+    for tipe_data in tipe_data_diuji:
+        for dim in dimensi:
+            if not benchmark.periksa_memori_tersedia(backend_numpy, dim, tipe_data):
+                print(f"Memori tidak cukup untuk matriks {dim}x{dim}. Melewati.")
+                continue
+            matriks_a, _ = benchmark.buat_matriks(backend_numpy, dim, tipe_data)
+            matriks_b, _ = benchmark.buat_matriks(backend_numpy, dim, tipe_data)
+            if matriks_a is None or matriks_b is None:
+                continue
+
+            terverifikasi = False
+            for nama_strategi in strategi:
+                urutan = None if nama_strategi == "semua" else urutan_cpu(nama_strategi, topologi)
+                for jumlah_thread in daftar_thread:
+                    if urutan is not None and jumlah_thread > len(urutan):
+                        continue
+                    cpu = None if urutan is None else urutan[:jumlah_thread]
+                    # Batas thread dipasang sekali per konfigurasi di luar pengukuran, lalu yang diukur adalah
+                    # backend numpy biasa (numpy-thread akan memasang batasnya sendiri di dalam blok ini)
+                    with afinitas(cpu), threadpool_limits(limits=jumlah_thread, user_api="blas"):
+                        thread_efektif = _thread_efektif()
+                        # Hasil sama untuk semua konfigurasi, jadi cukup diverifikasi sekali per dimensi
+                        hasil, statistik = benchmark.perkalian_matriks(backend_numpy, matriks_a, matriks_b,
+                                                                       0 if terverifikasi else JUMLAH_PUTARAN_BAWAAN)
+                    if statistik is None:
+                        continue
+                    terverifikasi = True
+                    jalur = backend_numpy.jalur(matriks_a, matriks_b)
+                    del hasil
+                    print(f"{nama_strategi} {jumlah_thread} thread ({dim}x{dim}, {tipe_data}): {format_statistik(statistik)}")
+                    daftar_catatan.append({
+                        "dtype": tipe_data, "dim": dim, "strategi": nama_strategi, "jumlah_thread": jumlah_thread,
+                        "thread_efektif": thread_efektif, "cpu": cpu, "statistik": statistik,
+                        "gflops": metrik_perkalian(dim, tipe_data, jalur, statistik["median"])["gflops"],
+                    })
+            del matriks_a, matriks_b
+            backend_numpy.bebaskan()
+
+    hitung_efisiensi(daftar_catatan)
+    return daftar_catatan
+
+
+# Fungsi untuk mengisi percepatan dan efisiensi paralel setiap catatan terhadap satu thread
+# dengan strategi afinitas, tipe data dan dimensi yang sama (NaN bila satu thread tidak diukur)
+def hitung_efisiensi(daftar_catatan):
+    satu_thread = {(c["dtype"], c["dim"], c["strategi"]): c["statistik"]["median"]
+                   for c in daftar_catatan if c["jumlah_thread"] == 1}
+    for catatan in daftar_catatan:
+        waktu_satu = satu_thread.get((catatan["dtype"], catatan["dim"], catatan["strategi"]), float("nan"))
+        catatan["percepatan"] = waktu_satu / catatan["statistik"]["median"]
+        catatan["efisiensi"] = catatan["percepatan"] / catatan["jumlah_thread"]
+    return daftar_catatan
+
+
+# Fungsi untuk memilih jumlah thread terbesar yang efisiensinya masih >= ambang, per (tipe data, dimensi)
+# di strategi terbaiknya. Mengembalikan {(tipe data, dim): (jumlah thread, strategi, efisiensi)}
+def rekomendasi_thread(daftar_catatan, ambang=AMBANG_EFISIENSI):
+    rekomendasi = {}
+    for catatan in daftar_catatan:
+        if not catatan["efisiensi"] >= ambang:
+            continue
+        kunci = (catatan["dtype"], catatan["dim"])
+        kandidat = (catatan["jumlah_thread"], catatan["strategi"], catatan["efisiensi"])
+        terbaik = rekomendasi.get(kunci)
+        # Lebih banyak thread lebih baik selama efisien; pada jumlah thread yang sama pilih yang paling efisien
+        if terbaik is None or kandidat[0] > terbaik[0] or (kandidat[0] == terbaik[0] and kandidat[2] > terbaik[2]):
+            rekomendasi[kunci] = kandidat
+    return rekomendasi
+
+
+# Fungsi untuk mencetak tabel GFLOP/s dan efisiensi per strategi, lalu rekomendasi jumlah thread
+def cetak_studi_skala(daftar_catatan, ambang=AMBANG_EFISIENSI):
+    if not daftar_catatan:
+        return
+    daftar_thread = sorted({c["jumlah_thread"] for c in daftar_catatan})
+    sel = {(c["dtype"], c["strategi"], c["dim"], c["jumlah_thread"]): c for c in daftar_catatan}
+    lebar = 10 + 18 * len(daftar_thread)
+    for tipe_data in dict.fromkeys(c["dtype"] for c in daftar_catatan):
+        for strategi in dict.fromkeys(c["strategi"] for c in daftar_catatan):
+            dimensi = sorted({c["dim"] for c in daftar_catatan if c["dtype"] == tipe_data and c["strategi"] == strategi})
+            if not dimensi:
+                continue
+            print(f"\nStudi skala {tipe_data}, afinitas {strategi}: GFLOP/s (efisiensi paralel)")
+            print("=" * lebar)
+            print(f"{'Dimensi':<10}" + "".join(f"{str(t) + ' thread':>18}" for t in daftar_thread))
+            print("-" * lebar)
+            for dim in dimensi:
+                teks = []
+                for jumlah_thread in daftar_thread:
+                    c = sel.get((tipe_data, strategi, dim, jumlah_thread))
+                    teks.append("-" if c is None else f"{c['gflops']:.2f} ({c['efisiensi']:.0%})")
+                print(f"{dim:<10}" + "".join(f"{t:>18}" for t in teks))
+
+    print(f"\nRekomendasi reservasi core (thread terbanyak dengan efisiensi >= {ambang:.0%}):")
+    for (tipe_data, dim), (jumlah_thread, strategi, efisiensi) in sorted(rekomendasi_thread(daftar_catatan, ambang).items()):
+        print(f"  {tipe_data:<8} {dim:>6}: {jumlah_thread} thread, afinitas {strategi} (efisiensi {efisiensi:.0%})")
+
+
+# Fungsi untuk menambahkan hasil studi ke PATH_STUDI lewat penyimpanan_hasil.tambah_baris (satu segmen baru
+# per studi di bawah kunci file, jadi dua studi yang selesai bersamaan tidak saling menimpa)
+def simpan_studi_skala(daftar_catatan, path=PATH_STUDI):
+    if not daftar_catatan:
+        return
+    baris = np.zeros(len(daftar_catatan), dtype=SKEMA_STUDI)
+    awal = 0
+    info = _info_blas()
+    for b, catatan in zip(baris, daftar_catatan):
+        statistik = catatan["statistik"]
+        b["id_run"], b["waktu_run"], b["sidik_host"], b["info_backend"] = id_run_sekarang(), time.time(), sidik_host(), info
+        for kolom in ("strategi", "jumlah_thread", "thread_efektif", "dtype", "dim", "gflops", "percepatan", "efisiensi"):
+            b[kolom] = catatan[kolom]
+        b["cpu"] = "" if catatan["cpu"] is None else ",".join(map(str, catatan["cpu"]))
+        for kolom in ("median", "min", "iqr"):
+            b[kolom] = statistik[kolom]
+        b["awal_ulangan"], b["jumlah_ulangan"] = awal, len(statistik["ulangan"])
+        awal += len(statistik["ulangan"])
+    ulangan = np.concatenate([np.asarray(c["statistik"]["ulangan"], dtype=np.float64) for c in daftar_catatan])
+    tambah_baris(baris, ulangan, path, SKEMA_STUDI)
+    print(f"{len(daftar_catatan)} baris studi skala (run {id_run_sekarang()}) ditambahkan ke {path}")
+
+
+# Fungsi untuk menggambar efisiensi paralel terhadap jumlah thread, satu subplot per strategi afinitas
+def buat_plot_studi_skala(daftar_catatan, tipe_data, path):
+    import matplotlib.pyplot as plt
+
+    catatan_tipe = [c for c in daftar_catatan if c["dtype"] == tipe_data]
+    daftar_strategi = list(dict.fromkeys(c["strategi"] for c in catatan_tipe))
+    plt.figure(figsize=(6 * len(daftar_strategi), 6))
+    for posisi, strategi in enumerate(daftar_strategi, start=1):
+        plt.subplot(1, len(daftar_strategi), posisi)
+        for dim in sorted({c["dim"] for c in catatan_tipe}):
+            titik = sorted((c["jumlah_thread"], c["efisiensi"]) for c in catatan_tipe
+                           if c["strategi"] == strategi and c["dim"] == dim)
+            plt.plot([t for t, _ in titik], [e for _, e in titik], 'o-', label=str(dim), linewidth=2, markersize=6)
+        plt.axhline(AMBANG_EFISIENSI, color='gray', linestyle='--', linewidth=1)
+        plt.title(f'Afinitas {strategi} ({tipe_data})', fontsize=13)
+        plt.xlabel('Jumlah Thread BLAS', fontsize=11)
+        plt.ylabel('Efisiensi Paralel', fontsize=11)
+        plt.xscale('log', base=2)
+        plt.ylim(0, 1.2)
+        plt.legend(title="Dimensi")
+        plt.grid(True)
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+    print(f"Plot studi skala disimpan ke '{path}'")
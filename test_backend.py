@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+import backend as modul_backend
+from backend import dapatkan_backend, backend_tersedia
+from tipe_data import TIPE_DATA, jalur_perkalian
+
+
+# Backend referensi (loop NumPy di tipe hasil) harus sama persis dengan backend numpy untuk bilangan bulat
+@pytest.mark.parametrize("tipe_data", ["int8", "int16", "int32", "int64"])
+def test_referensi_sama_dengan_numpy_bulat(tipe_data):
+    referensi, numpy = dapatkan_backend("referensi"), dapatkan_backend("numpy")
+    a = numpy.buat_acak((17, 23), tipe_data)
+    b = numpy.buat_acak((23, 9), tipe_data)
+    hasil_referensi, hasil_numpy = referensi.kalikan(a, b), numpy.kalikan(a, b)
+    assert hasil_numpy.dtype == np.int64
+    np.testing.assert_array_equal(hasil_referensi, hasil_numpy)
+
+
+@pytest.mark.parametrize("tipe_data", ["float32", "float64"])
+def test_referensi_sama_dengan_numpy_float(tipe_data):
+    referensi, numpy = dapatkan_backend("referensi"), dapatkan_backend("numpy")
+    a = numpy.buat_acak((31, 16), tipe_data)
+    b = numpy.buat_acak((16, 12), tipe_data)
+    hasil = numpy.kalikan(a, b)
+    assert hasil.dtype == TIPE_DATA[tipe_data]
+    np.testing.assert_allclose(referensi.kalikan(a, b), hasil, rtol=1e-6)
+
+
+# Jalur yang dihitung sekali di luar pengukuran menghasilkan perkalian yang sama dengan pemilihan otomatis
+def test_kalikan_dengan_jalur_dihitung_sebelumnya():
+    numpy = dapatkan_backend("numpy")
+    a = numpy.buat_acak((20, 20), "int32")
+    b = numpy.buat_acak((20, 20), "int32")
+    np.testing.assert_array_equal(numpy.kalikan(a, b, jalur_perkalian(a, b)), numpy.kalikan(a, b))
+
+
+def test_backend_tidak_dikenal():
+    assert dapatkan_backend("tidak-ada") is None
+    assert "numpy" in backend_tersedia()
+
+
+def _thread_blas():
+    from threadpoolctl import threadpool_info
+    return [info["num_threads"] for info in threadpool_info() if info["user_api"] == "blas"]
+
+
+# Batas thread BLAS dipasang sekali saat backend dibuat (tidak di dalam kalikan) dan dipulihkan oleh tutup()
+def test_numpy_thread_batas_sekali():
+    pytest.importorskip("threadpoolctl")
+    asal = _thread_blas()
+    backend = dapatkan_backend("numpy-thread", jumlah_thread=3)
+    try:
+        assert set(_thread_blas()) == {3}
+        a = backend.buat_acak((16, 16), "float64")
+        np.testing.assert_allclose(backend.kalikan(a, a), a @ a)
+        assert set(_thread_blas()) == {3}
+    finally:
+        backend.tutup()
+    assert _thread_blas() == asal
+
+    # Dipakai lagi setelah tutup(): batas dipasang kembali pada perkalian berikutnya
+    backend.kalikan(a, a)
+    assert set(_thread_blas()) == {3}
+    backend.tutup()
+    assert _thread_blas() == asal
+
+
+# Opsi diteruskan ke __init__ backend, dan kelas baru cukup didaftarkan dengan @daftarkan_backend
+def test_registry_backend(monkeypatch):
+    monkeypatch.setattr(modul_backend, "DAFTAR_BACKEND", dict(modul_backend.DAFTAR_BACKEND))
+
+    @modul_backend.daftarkan_backend
+    class BackendUji(modul_backend.BackendNumPy):
+        nama = "uji"
+
+        def __init__(self, faktor=1):
+            self.faktor = faktor
+
+    assert modul_backend.DAFTAR_BACKEND["uji"] is BackendUji
+    assert dapatkan_backend("uji", faktor=3).faktor == 3
+    assert dapatkan_backend("referensi", kapasitas_memori=1024).memori_tersedia() <= 1024
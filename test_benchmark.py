@@ -0,0 +1,35 @@
+import benchmark
+from backend import dapatkan_backend
+
+
+# Profil memori (thread sampler dan tracemalloc) tidak boleh aktif selama perkalian yang diukur waktunya;
+# profil perkalian diambil dari pemanggilan terpisah sesudahnya
+def test_profil_memori_di_luar_waktu_terukur(tmp_path, monkeypatch):
+    aktif = []
+
+    class ProfilTercatat(benchmark.ProfilMemori):
+        def __enter__(self):
+            aktif.append(self)
+            return super().__enter__()
+
+        def __exit__(self, *exc):
+            aktif.remove(self)
+            return super().__exit__(*exc)
+
+    perkalian_asli = benchmark.perkalian_matriks
+    profil_saat_diukur = []
+
+    def perkalian_tercatat(*argumen, **opsi):
+        profil_saat_diukur.append(len(aktif))
+        return perkalian_asli(*argumen, **opsi)
+
+    monkeypatch.setattr(benchmark, "ProfilMemori", ProfilTercatat)
+    monkeypatch.setattr(benchmark, "perkalian_matriks", perkalian_tercatat)
+    assert benchmark.LACAK_ALOKASI is False
+
+    lanjut, catatan = benchmark.uji_dimensi(dapatkan_backend("numpy"), 64, "float64", str(tmp_path))
+    assert lanjut
+    assert profil_saat_diukur == [0]
+    assert catatan["terverifikasi"]
+    assert catatan["memori"]["perkalian"]["rss_puncak"] >= catatan["memori"]["perkalian"]["rss_awal"]
+    assert catatan["memori"]["perkalian"]["byte_puncak_alokasi"] is None
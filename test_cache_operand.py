@@ -0,0 +1,59 @@
+import os
+import numpy as np
+import pytest
+import benchmark
+import penyimpanan_hasil
+from backend import dapatkan_backend
+from cache_operand import CacheOperand, kunci_operand
+from pembangkit_acak import buat_matriks_acak_paralel
+
+
+# Operand cache sama persis dengan pembangkit paralel untuk seed (seed, indeks) dan dimuat tanpa salinan
+def test_ambil_hit_dan_miss(tmp_path):
+    cache = CacheOperand(seed=3, folder=str(tmp_path))
+    a = cache.ambil((16, 16), "int32", 0)
+    assert isinstance(a, np.memmap)
+    np.testing.assert_array_equal(a, buat_matriks_acak_paralel((16, 16), "int32", np.random.SeedSequence([3, 0])))
+    np.testing.assert_array_equal(cache.ambil((16, 16), "int32", 0), a)
+    assert (cache.jumlah_hit, cache.jumlah_miss) == (1, 1)
+    assert not np.array_equal(cache.ambil((16, 16), "int32", 1), a)
+    assert kunci_operand(3, (16, 16), "int32", 0)[0] != kunci_operand(3, (16, 16), "int64", 0)[0]
+
+
+# Entri yang paling lama tidak dipakai diusir lebih dulu; operand di atas batas tidak di-cache
+def test_pengusiran_lru(tmp_path):
+    byte_entri = 32 * 32 * 8
+    cache = CacheOperand(folder=str(tmp_path), batas_byte=2 * byte_entri + 1024)
+    path_0 = cache.path_operand((32, 32), "int64", 0)
+    path_1 = cache.path_operand((32, 32), "int64", 1)
+    os.utime(path_0, (1, 1))
+    os.utime(path_1, (2, 2))
+    assert cache.path_operand((32, 32), "int64", 0) == path_0  # hit: path_0 menjadi yang terbaru dipakai
+    path_2 = cache.path_operand((32, 32), "int64", 2)
+    assert os.path.exists(path_0) and os.path.exists(path_2)
+    assert not os.path.exists(path_1)
+    assert not os.path.exists(path_1[:-len(".npy")] + ".json")
+    assert cache.ukuran() <= cache.batas_byte
+    assert cache.ambil((64, 64), "int64", 0) is None
+
+
+def test_distribusi_tidak_dikenal(tmp_path):
+    with pytest.raises(ValueError):
+        CacheOperand(folder=str(tmp_path), distribusi="normal")
+
+
+# Waktu muat dari cache tersimpan sebagai fase "muat_cache", bukan "pembuatan"
+def test_muat_cache_fase_terpisah(tmp_path, monkeypatch):
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", "run-cache")
+    monkeypatch.setattr(benchmark, "CACHE_OPERAND", CacheOperand(folder=str(tmp_path / "cache")))
+    path = str(tmp_path / "hasil.npz")
+    backend = dapatkan_backend("numpy")
+    _, catatan = benchmark.uji_dimensi(backend, 32, "int32", str(tmp_path))
+    assert catatan["fase_pembuatan"] == "muat_cache"
+    benchmark.simpan_hasil(backend, [catatan], path)
+
+    baris, _ = penyimpanan_hasil.muat_hasil(path)
+    assert sorted(baris["fase"].tolist()) == ["muat_cache", "perkalian", "simpan"]
+    tersimpan = penyimpanan_hasil.catatan_tersimpan("run-cache", "numpy", path)
+    assert tersimpan[0]["fase_pembuatan"] == "muat_cache"
+    assert tersimpan[0]["waktu_pembuatan"] == catatan["waktu_pembuatan"]
@@ -0,0 +1,72 @@
+import os
+import numpy as np
+import pytest
+import penyimpanan_hasil
+import benchmark
+from pengukuran_waktu import ringkas_statistik
+from checkpoint_run import folder_sel, mulai_sel, selesaikan_sel, simpan_operand, muat_operand, tandai_operand
+
+
+@pytest.fixture
+def id_run_tetap(monkeypatch):
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", None)
+
+
+# Penanda percobaan bertambah setiap kali sel dimulai lagi tanpa diselesaikan; selesaikan_sel menghapus
+# sel dan folder run yang kosong
+def test_percobaan_sel(tmp_path):
+    folder = folder_sel(str(tmp_path), "run-1", "numpy", "int32", 64)
+    assert folder == os.path.join(str(tmp_path), "run-1", "numpy_int32_64x64")
+    assert mulai_sel(folder) == 1
+    assert mulai_sel(folder) == 2
+    assert mulai_sel(folder) == 3
+    selesaikan_sel(folder)
+    assert not os.path.exists(os.path.dirname(folder))
+    assert mulai_sel(folder) == 1
+
+
+# Operand dan statistik pembuatannya kembali utuh dari checkpoint, dimuat sebagai memmap
+def test_simpan_muat_operand(tmp_path, monkeypatch):
+    monkeypatch.setattr("checkpoint_run.BARIS_PER_POTONGAN", 7)
+    folder = str(tmp_path / "sel")
+    a = np.arange(20 * 20, dtype=np.int32).reshape(20, 20)
+    b = -a
+    statistik_a, statistik_b = ringkas_statistik([0.1, 0.2]), ringkas_statistik([0.3])
+    assert muat_operand(folder) is None
+    simpan_operand(folder, a, b, statistik_a, statistik_b)
+
+    muat_a, muat_b, muat_statistik_a, muat_statistik_b = muat_operand(folder)
+    assert isinstance(muat_a, np.memmap)
+    np.testing.assert_array_equal(muat_a, a)
+    np.testing.assert_array_equal(muat_b, b)
+    assert muat_statistik_a == statistik_a
+    assert muat_statistik_b["ulangan"] == [0.3]
+
+
+# Operand mode blok (file .dat mentah) ditandai lengkap lewat tandai_operand; file yang rusak dibuat ulang
+def test_operand_blok_dan_rusak(tmp_path):
+    folder = str(tmp_path / "sel")
+    os.makedirs(folder)
+    for nama in ("a", "b"):
+        np.full((8, 8), 3, dtype=np.float32).tofile(os.path.join(folder, f"{nama}.dat"))
+    tandai_operand(folder, "dat", 8, np.float32, ringkas_statistik([1.0]), ringkas_statistik([2.0]))
+    muat_a, _, _, _ = muat_operand(folder)
+    assert muat_a.dtype == np.float32 and (muat_a == 3).all()
+
+    os.remove(os.path.join(folder, "b.dat"))
+    assert muat_operand(folder) is None
+
+
+# Melanjutkan run memakai ID run terbaru di penyimpanan, sehingga sel yang tersimpan dilewati
+def test_lanjutkan_run(tmp_path, id_run_tetap):
+    path = str(tmp_path / "hasil.npz")
+    assert benchmark.lanjutkan_run(path=path) == penyimpanan_hasil.id_run_sekarang()
+
+    penyimpanan_hasil.atur_id_run("run-lama")
+    penyimpanan_hasil.tambah_catatan([{"backend": "numpy", "dtype": "int32", "dim": 8, "contoh": None,
+                                       "statistik_perkalian": ringkas_statistik([1.0])}], path)
+    penyimpanan_hasil.atur_id_run("run-baru")
+    assert benchmark.lanjutkan_run(path=path) == "run-lama"
+    assert penyimpanan_hasil.id_run_sekarang() == "run-lama"
+    assert benchmark.lanjutkan_run("run-lain", path) == "run-lain"
+    assert penyimpanan_hasil.id_run_sekarang() == "run-lain"
@@ -0,0 +1,44 @@
+import os
+import pytest
+import benchmark
+import roofline
+import penyimpanan_hasil
+import matriks
+
+
+@pytest.fixture
+def kalibrasi_palsu(monkeypatch):
+    def kalibrasi(backend):
+        return {"backend": backend.nama, "info": backend.info(), "puncak_gflops": {"float32": 10.0, "float64": 5.0},
+                "bandwidth_copy_gbs": 1.0, "bandwidth_triad_gbs": 1.0, "bandwidth_gbs": 1.0}
+    monkeypatch.setattr(roofline, "kalibrasi", kalibrasi)
+    # perintah_run mengubah flag modul benchmark; nilai asalnya dipulihkan setelah uji
+    for nama in ("PATH_HASIL", "LACAK_ALOKASI", "CHECKPOINT_OPERAND", "MODE_PIPELINE"):
+        monkeypatch.setattr(benchmark, nama, getattr(benchmark, nama))
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", None)
+
+
+# run --path mengalihkan penyimpanan hasil dan kalibrasi roofline; report membaca keduanya dari --path yang sama
+def test_run_path_mengalihkan_penyimpanan(tmp_path, kalibrasi_palsu, capsys):
+    path = str(tmp_path / "hasil" / "hasil.npz")
+    bawaan = [matriks.PATH_HASIL_BAWAAN, penyimpanan_hasil.folder_segmen(matriks.PATH_HASIL_BAWAAN),
+              roofline.PATH_KALIBRASI]
+    sebelum = [os.path.exists(p) and os.stat(p).st_mtime_ns for p in bawaan]
+    assert matriks.main(["run", "numpy", "--dimensi", "8", "16", "--tipe", "int32", "--path", path,
+                         "--folder", str(tmp_path / "plot")]) == 0
+    baris, _ = penyimpanan_hasil.muat_hasil(path)
+    assert sorted(set(baris["dim"].tolist())) == [8, 16]
+    assert os.path.exists(roofline.path_kalibrasi(path))
+    assert [os.path.exists(p) and os.stat(p).st_mtime_ns for p in bawaan] == sebelum
+
+    capsys.readouterr()
+    assert matriks.main(["report", "--path", path]) == 0
+    assert "Roofline numpy" in capsys.readouterr().out
+
+
+def test_lokasi_bawaan_sama_dengan_modul():
+    import regresi
+    assert matriks.FOLDER_BAWAAN == benchmark.FOLDER_HASIL
+    assert os.path.normpath(matriks.PATH_HASIL_BAWAAN) == os.path.normpath(penyimpanan_hasil.PATH_PENYIMPANAN)
+    assert os.path.normpath(matriks.PATH_BASELINE_BAWAAN) == os.path.normpath(regresi.PATH_BASELINE)
+    assert roofline.path_kalibrasi(penyimpanan_hasil.PATH_PENYIMPANAN) == roofline.PATH_KALIBRASI
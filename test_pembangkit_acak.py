@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import pembangkit_acak
+from pembangkit_acak import buat_matriks_acak_paralel, isi_acak_paralel
+from backend import dapatkan_backend
+
+
+# Potongan kecil agar matriks uji terbagi ke banyak substream dan thread benar-benar dipakai
+@pytest.fixture(autouse=True)
+def potongan_kecil(monkeypatch):
+    monkeypatch.setattr(pembangkit_acak, "UKURAN_POTONGAN", 100)
+
+
+# Seed yang sama menghasilkan matriks identik berapa pun jumlah thread-nya
+@pytest.mark.parametrize("tipe_data", ["int8", "int32", "float64"])
+@pytest.mark.parametrize("bit_generator", ["pcg64", "philox"])
+def test_seed_sama_lintas_jumlah_thread(tipe_data, bit_generator):
+    daftar = [buat_matriks_acak_paralel((37, 41), tipe_data, seed=42, jumlah_thread=jumlah_thread,
+                                        bit_generator=bit_generator) for jumlah_thread in (1, 2, 4, 7)]
+    for matriks in daftar[1:]:
+        np.testing.assert_array_equal(matriks, daftar[0])
+    assert daftar[0].min() >= 1 and daftar[0].max() <= 100
+
+
+def test_seed_berbeda_menghasilkan_matriks_berbeda():
+    a = buat_matriks_acak_paralel((30, 30), "int64", seed=1, jumlah_thread=2)
+    b = buat_matriks_acak_paralel((30, 30), "int64", seed=2, jumlah_thread=2)
+    assert not np.array_equal(a, b)
+
+
+# Buffer non-contiguous diisi dengan nilai yang sama seperti salinan contiguous-nya
+def test_isi_buffer_non_contiguous():
+    tujuan = np.zeros((40, 40), dtype=np.int32).T
+    isi_acak_paralel(tujuan, seed=5, jumlah_thread=3)
+    np.testing.assert_array_equal(tujuan, buat_matriks_acak_paralel((40, 40), "int32", seed=5, jumlah_thread=1))
+
+
+# Backend numpy-generator: urutan matriks untuk satu seed tidak bergantung pada jumlah thread
+def test_backend_generator_dapat_diulang():
+    satu = dapatkan_backend("numpy-generator", seed=7, jumlah_thread=1)
+    empat = dapatkan_backend("numpy-generator", seed=7, jumlah_thread=4)
+    for _ in range(2):
+        np.testing.assert_array_equal(satu.buat_acak((25, 25), "int16"), empat.buat_acak((25, 25), "int16"))
@@ -0,0 +1,46 @@
+import numpy as np
+from pengukuran_waktu import ukur, ringkas_statistik, interval_kepercayaan_median, jumlahkan_statistik
+
+
+# Statistik ukur(): jumlah ulangan, median/min dari daftar ulangan dan interval kepercayaan yang mengapit median
+def test_ukur_statistik():
+    panggilan = []
+    hasil, statistik = ukur(lambda: panggilan.append(1) or len(panggilan), pemanasan=1, ulangan=5,
+                            durasi_minimum_ns=0)
+    assert len(statistik["ulangan"]) == 5
+    assert statistik["iterasi"] == 1
+    assert len(panggilan) == 6  # satu pemanasan + lima ulangan
+    assert hasil == 6
+    assert statistik["median"] == np.median(statistik["ulangan"])
+    assert statistik["min"] == min(statistik["ulangan"])
+    assert statistik["ci_bawah"] <= statistik["median"] <= statistik["ci_atas"]
+    assert statistik["iqr"] >= 0
+
+
+# Pemanggilan yang lebih singkat dari durasi minimum diulang beberapa kali per ulangan
+def test_ukur_iterasi_adaptif():
+    _, statistik = ukur(lambda: None, pemanasan=1, ulangan=3, durasi_minimum_ns=1_000_000)
+    assert statistik["iterasi"] > 1
+    assert len(statistik["ulangan"]) == 3
+
+
+# Tanpa pemanasan tidak ada kalibrasi: satu iterasi per ulangan
+def test_ukur_tanpa_pemanasan():
+    _, statistik = ukur(lambda: None, pemanasan=0, ulangan=1)
+    assert statistik["iterasi"] == 1
+    assert len(statistik["ulangan"]) == 1
+
+
+def test_ringkas_statistik_nilai_diketahui():
+    statistik = ringkas_statistik([5.0, 1.0, 3.0, 2.0, 4.0])
+    assert statistik["median"] == 3.0
+    assert statistik["min"] == 1.0
+    assert statistik["iqr"] == 2.0
+    assert interval_kepercayaan_median(list(range(1, 101))) == (40, 61)
+
+
+# Ulangan dijumlahkan berpasangan dan dipotong ke jumlah ulangan terpendek
+def test_jumlahkan_statistik():
+    statistik = jumlahkan_statistik(ringkas_statistik([1.0, 2.0, 3.0]), ringkas_statistik([10.0, 20.0]))
+    assert statistik["ulangan"] == [11.0, 22.0]
+    assert statistik["median"] == 16.5
@@ -0,0 +1,80 @@
+import pytest
+from penjadwal_sapuan import (PenjadwalSapuan, DIM_AWAL, KELIPATAN_DIM, RASIO_CELAH_MINIMUM, cocokkan_model,
+                              waktu_harness)
+
+
+# Model waktu sintetis: perkalian kubik dan pembuatan kuadratik
+def _waktu_kali(dim):
+    return 1e-6 + 1e-10 * dim**3
+
+
+def _waktu_buat(dim):
+    return 1e-8 * dim**2
+
+
+def _jalankan(penjadwal, batas_titik=100):
+    urutan = []
+    while len(urutan) < batas_titik:
+        dim = penjadwal.usul_berikutnya()
+        if dim is None:
+            break
+        urutan.append(dim)
+        waktu_dinding = waktu_harness(_waktu_kali(dim)) + 2 * waktu_harness(_waktu_buat(dim))
+        penjadwal.catat(dim, _waktu_kali(dim), _waktu_buat(dim), waktu_dinding)
+    return urutan
+
+
+def test_cocokkan_model_memulihkan_koefisien():
+    dimensi = [16, 32, 64, 128]
+    c, b = cocokkan_model(dimensi, [2.0 + 3.0 * n**3 for n in dimensi], 3)
+    assert c == pytest.approx(2.0)
+    assert b == pytest.approx(3.0)
+    # Satu titik: hanya skala dari titik itu
+    assert cocokkan_model([10], [5.0], 2) == (0.0, 0.05)
+
+
+# Sapuan kasar menggandakan dimensi, lalu celah disisipi titik kelipatan 8 sampai rapat atau anggaran habis
+def test_sapuan_kasar_lalu_sisipan():
+    penjadwal = PenjadwalSapuan(anggaran_waktu=60.0, anggaran_memori=1 << 40, byte_per_elemen=24)
+    urutan = _jalankan(penjadwal)
+    kasar = [dim for dim in urutan if dim & (dim - 1) == 0]
+    assert urutan[:len(kasar)] == [DIM_AWAL * 2**i for i in range(len(kasar))]
+    assert len(urutan) > len(kasar)
+    assert all(dim % KELIPATAN_DIM == 0 for dim in urutan)
+    assert len(set(urutan)) == len(urutan)
+    assert penjadwal.sisa_waktu > -0.5 * 60.0
+
+
+# Anggaran memori membatasi dimensi terbesar yang diusulkan
+def test_anggaran_memori():
+    penjadwal = PenjadwalSapuan(anggaran_waktu=1e9, anggaran_memori=24 * 256 * 256, byte_per_elemen=24,
+                                dim_maksimum=None)
+    urutan = _jalankan(penjadwal)
+    assert max(urutan) == 256
+    dimensi = sorted(urutan)
+    # Tanpa batas waktu, celah yang masih bisa disisipi kelipatan 8 sudah terisi semua
+    for d1, d2 in zip(dimensi, dimensi[1:]):
+        tengah = round((d1 * d2) ** 0.5 / KELIPATAN_DIM) * KELIPATAN_DIM
+        assert d2 / d1 < RASIO_CELAH_MINIMUM or not d1 < tengah < d2
+
+
+# Dimensi yang gagal membatasi semua usulan berikutnya di bawahnya
+def test_catat_gagal():
+    penjadwal = PenjadwalSapuan(anggaran_waktu=1e9, anggaran_memori=1 << 40, byte_per_elemen=24)
+    assert penjadwal.usul_berikutnya() == DIM_AWAL
+    penjadwal.catat(8, _waktu_kali(8), _waktu_buat(8), 0.01)
+    assert penjadwal.usul_berikutnya() == 16
+    penjadwal.catat_gagal(16, waktu_dinding=0.5)
+    assert penjadwal.dim_maksimum == 15
+    assert penjadwal.sisa_waktu == pytest.approx(1e9 - 0.51)
+    assert penjadwal.usul_berikutnya() is None
+
+
+# Jejak memori terukur menaikkan perkiraan byte per elemen (hanya dari dimensi yang cukup besar)
+def test_jejak_memori_memperbarui_model():
+    penjadwal = PenjadwalSapuan(anggaran_waktu=1e9, anggaran_memori=1 << 40, byte_per_elemen=24)
+    penjadwal.catat(64, 1e-4, 1e-5, 0.01, jejak_memori=100 * 64 * 64)
+    assert penjadwal.byte_per_elemen == 24
+    penjadwal.catat(256, 1e-2, 1e-4, 0.1, jejak_memori=40 * 256 * 256)
+    assert penjadwal.byte_per_elemen == 40
+    assert penjadwal.prediksi_memori(512) == 40 * 512 * 512
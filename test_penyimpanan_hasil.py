@@ -0,0 +1,122 @@
+import os
+import numpy as np
+import pytest
+import penyimpanan_hasil
+from pengukuran_waktu import ringkas_statistik
+from penyimpanan_hasil import (SKEMA, tambah_catatan, muat_hasil, pilih, ulangan_baris, folder_segmen,
+                               padatkan_penyimpanan, catatan_tersimpan, tulis_ulang_penyimpanan,
+                               _daftar_segmen)
+
+
+# Catatan minimal seperti yang dihasilkan benchmark.perkalian_matriks untuk satu titik
+def _catatan(dim, ulangan, backend="numpy", **tambahan):
+    statistik = ringkas_statistik(ulangan)
+    return dict({"backend": backend, "dtype": "int64", "dim": dim, "contoh": None, "statistik_perkalian": statistik},
+                **tambahan)
+
+
+@pytest.fixture
+def path(tmp_path, monkeypatch):
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", "run-uji")
+    return str(tmp_path / "hasil.npz")
+
+
+def test_simpan_lalu_muat(path):
+    tambah_catatan([_catatan(4, [3.0, 1.0, 2.0]), _catatan(8, [5.0, 6.0])], path, info_backend="uji")
+    tambah_catatan([_catatan(16, [7.0], kepadatan=0.1, bentuk=(16, 4, 2), mode="pipeline")], path)
+
+    baris, ulangan = muat_hasil(path)
+    assert len(baris) == 3
+    assert set(baris["id_run"]) == {"run-uji"}
+    for dim, median, waktu in [(4, 2.0, [3.0, 1.0, 2.0]), (8, 5.5, [5.0, 6.0]), (16, 7.0, [7.0])]:
+        b = pilih(baris, dim=dim)[0]
+        assert b["median"] == median
+        assert ulangan_baris(b, ulangan).tolist() == waktu
+        assert b["terverifikasi"] == -1
+    b = pilih(baris, dim=16)[0]
+    assert b["bentuk"].tolist() == [16, 4, 2]
+    assert b["kepadatan"] == 0.1
+    assert b["mode"] == "pipeline"
+    assert pilih(baris, dim=4)[0]["mode"] == "berurutan"
+    assert pilih(baris, dim=4)[0]["info_backend"] == "uji"
+
+
+# File lama (sebelum kolom bentuk, kepadatan dan mode) dimuat dengan nilai bawaan kolom barunya
+def test_skema_lama_ditingkatkan(path):
+    skema_lama = np.dtype([(nama, SKEMA.fields[nama][0]) for nama in SKEMA.names
+                           if nama not in ("bentuk", "kepadatan", "mode", "gflops", "rss_dasar")])
+    lama = np.zeros(2, dtype=skema_lama)
+    lama["id_run"] = "run-lama"
+    lama["backend"] = "numpy"
+    lama["dim"] = [32, 64]
+    lama["fase"] = "perkalian"
+    lama["median"] = [1.0, 2.0]
+    lama["awal_ulangan"] = [0, 1]
+    lama["jumlah_ulangan"] = 1
+    np.savez(path, baris=lama, ulangan=np.array([1.0, 2.0]))
+
+    baris, ulangan = muat_hasil(path)
+    assert baris.dtype == SKEMA
+    assert baris["bentuk"].tolist() == [[32, 32, 32], [64, 64, 64]]
+    assert baris["kepadatan"].tolist() == [1.0, 1.0]
+    assert baris["mode"].tolist() == ["berurutan", "berurutan"]
+    assert np.isnan(baris["gflops"]).all()
+    assert (baris["rss_dasar"] == -1).all()
+    assert ulangan_baris(baris[1], ulangan).tolist() == [2.0]
+
+    # Append ke file lama tetap bisa dimuat bersama baris lamanya
+    tambah_catatan([_catatan(128, [4.0])], path)
+    baris, _ = muat_hasil(path)
+    assert sorted(baris["dim"].tolist()) == [32, 64, 128]
+
+
+# Dengan batas segmen kecil, segmen tingkat 0 digabung ke tingkat 1 lalu ke file utama tanpa baris hilang atau ganda
+def test_penggabungan_segmen(path, monkeypatch):
+    monkeypatch.setattr(penyimpanan_hasil, "BATAS_SEGMEN", 2)
+    for dim in range(1, 21):
+        tambah_catatan([_catatan(dim, [float(dim), float(dim) + 0.5])], path)
+        baris, ulangan = muat_hasil(path)
+        assert sorted(baris["dim"].tolist()) == list(range(1, dim + 1))
+        assert len(_daftar_segmen(path)) <= 2 * (2 + 1)
+    assert os.path.exists(path)
+
+    padatkan_penyimpanan(path)
+    assert _daftar_segmen(path) == []
+    baris, ulangan = muat_hasil(path)
+    assert sorted(baris["dim"].tolist()) == list(range(1, 21))
+    for b in baris:
+        assert ulangan_baris(b, ulangan).tolist() == [float(b["dim"]), float(b["dim"]) + 0.5]
+    assert os.path.isdir(folder_segmen(path))
+
+
+# Fase pembuatan menyimpan waktu A + B per ulangan; catatan yang dibangun ulang memakai mediannya apa adanya
+def test_pembuatan_a_dan_b_tersimpan(path):
+    import benchmark
+    from backend import dapatkan_backend
+    statistik_a, statistik_b = ringkas_statistik([1.0, 2.0, 3.0]), ringkas_statistik([10.0, 30.0, 20.0])
+    catatan = benchmark.buat_catatan(dapatkan_backend("numpy"), 4, "int64", "bulat", statistik_a, statistik_b,
+                                     ringkas_statistik([0.5]))
+    assert catatan["statistik_pembuatan"]["ulangan"] == [11.0, 32.0, 23.0]
+    assert catatan["waktu_pembuatan"] == 23.0
+    tambah_catatan([catatan], path)
+
+    baris, ulangan = muat_hasil(path)
+    assert ulangan_baris(pilih(baris, fase="pembuatan")[0], ulangan).tolist() == [11.0, 32.0, 23.0]
+    tersimpan = catatan_tersimpan("run-uji", "numpy", path)
+    assert tersimpan[0]["waktu_pembuatan"] == 23.0
+
+
+# Tulis ulang menggantikan file utama dan segmennya sekaligus; append berikutnya tetap terbaca
+def test_tulis_ulang_penyimpanan(path):
+    for dim in (4, 8, 16):
+        tambah_catatan([_catatan(dim, [float(dim)])], path)
+    assert len(_daftar_segmen(path)) == 3
+
+    baris, ulangan = tulis_ulang_penyimpanan(lambda baris, ulangan: (baris[baris["dim"] > 4], ulangan), path)
+    assert _daftar_segmen(path) == []
+    assert sorted(muat_hasil(path)[0]["dim"].tolist()) == [8, 16]
+    tambah_catatan([_catatan(32, [32.0])], path)
+    baris, ulangan = muat_hasil(path)
+    assert sorted(baris["dim"].tolist()) == [8, 16, 32]
+    for b in baris:
+        assert ulangan_baris(b, ulangan).tolist() == [float(b["dim"])]
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+import penyimpanan_hasil
+from pengukuran_waktu import ringkas_statistik
+from penyimpanan_hasil import tambah_catatan, muat_hasil
+from perbandingan import (tabel_waktu, riwayat_waktu, cetak_tabel_percepatan, gambar_jika_berubah, bandingkan,
+                          laporan_perbandingan)
+
+
+def _simpan(path, monkeypatch, id_run, backend, waktu, mode="berurutan"):
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", id_run)
+    tambah_catatan([{"backend": backend, "dtype": "int64", "dim": dim, "contoh": None, "mode": mode,
+                     "statistik_pembuatan": ringkas_statistik([t / 10]), "statistik_perkalian": ringkas_statistik([t])}
+                    for dim, t in waktu.items()], path)
+
+
+# Penyimpanan sintetis: dua run numpy, satu run cupy, dan satu run mode pipeline yang tidak boleh tercampur
+@pytest.fixture
+def path(tmp_path, monkeypatch):
+    path = str(tmp_path / "hasil.npz")
+    _simpan(path, monkeypatch, "run-1", "numpy", {8: 2.0, 16: 4.0})
+    _simpan(path, monkeypatch, "run-1", "cupy", {8: 1.0, 16: 1.0})
+    _simpan(path, monkeypatch, "run-2", "numpy", {8: 3.0})
+    _simpan(path, monkeypatch, "run-3", "numpy", {8: 100.0, 16: 100.0}, mode="pipeline")
+    return path
+
+
+# Tabel memakai run terbaru setiap backend; sel tanpa data bernilai NaN
+def test_tabel_waktu_run_terbaru(path):
+    baris, _ = muat_hasil(path)
+    dimensi, waktu, _ = tabel_waktu(baris, ["numpy", "cupy"])
+    assert dimensi.tolist() == [8, 16]
+    np.testing.assert_array_equal(waktu, [[3.0, np.nan], [1.0, 1.0]])
+
+    _, waktu_run_1, _ = tabel_waktu(baris, ["numpy", "cupy"], id_run="run-1")
+    np.testing.assert_array_equal(waktu_run_1, [[2.0, 4.0], [1.0, 1.0]])
+
+    _, waktu_pipeline, _ = tabel_waktu(baris, ["numpy"], mode="pipeline")
+    np.testing.assert_array_equal(waktu_pipeline, [[100.0, 100.0]])
+
+
+def test_riwayat_waktu_urut_menurut_waktu_mulai(path):
+    baris, _ = muat_hasil(path)
+    daftar_run, waktu_mulai, dimensi, waktu, _ = riwayat_waktu(baris, "numpy")
+    assert daftar_run.tolist() == ["run-1", "run-2"]
+    assert waktu_mulai[0] <= waktu_mulai[1]
+    assert dimensi.tolist() == [8, 16]
+    np.testing.assert_array_equal(waktu, [[2.0, 4.0], [3.0, np.nan]])
+
+
+def test_tabel_percepatan_banyak_pasangan(path):
+    baris, _ = muat_hasil(path)
+    dimensi, percepatan, _ = cetak_tabel_percepatan(baris, [("numpy", "cupy"), ("cupy", "numpy")])
+    np.testing.assert_array_equal(percepatan, [[3.0, np.nan], [1 / 3, np.nan]])
+    assert dimensi.tolist() == [8, 16]
+
+
+def test_bandingkan_dan_laporan(path, tmp_path):
+    assert bandingkan("numpy", "cupy", "int64", path, plot=False) == {"pembuatan": True, "perkalian": True}
+    assert bandingkan("numpy", "tidak-ada", "int64", path, plot=False) == {"pembuatan": False, "perkalian": False}
+    assert laporan_perbandingan([("numpy", "cupy")], ["numpy"], "int64", path=path)
+    assert not laporan_perbandingan([("numpy", "cupy")], path=str(tmp_path / "kosong.npz"))
+
+
+# Plot hanya digambar ulang bila sidik rekaman sumbernya berubah atau filenya hilang
+def test_gambar_jika_berubah(tmp_path):
+    path_plot = tmp_path / "plot" / "a.png"
+    jumlah = []
+
+    def gambar():
+        jumlah.append(1)
+        path_plot.write_bytes(b"png")
+
+    assert gambar_jika_berubah(str(path_plot), "sidik-1", gambar)
+    assert not gambar_jika_berubah(str(path_plot), "sidik-1", gambar)
+    assert gambar_jika_berubah(str(path_plot), "sidik-2", gambar)
+    path_plot.unlink()
+    assert gambar_jika_berubah(str(path_plot), "sidik-2", gambar)
+    assert len(jumlah) == 3
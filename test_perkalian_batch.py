@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from backend import dapatkan_backend
+from perkalian_batch import aliran_batch, ukuran_batch_maksimum, jalankan_aliran_batch
+from tipe_data import byte_per_elemen_perkalian
+
+
+# Aliran menghasilkan tepat jumlah_matriks pasangan; batch terakhir boleh lebih kecil
+def test_aliran_batch_jumlah_dan_bentuk():
+    backend = dapatkan_backend("numpy")
+    ukuran = [(a.shape, b.shape) for a, b in aliran_batch(backend, 4, 16, 40, "int32")]
+    assert ukuran == [((16, 4, 4), (16, 4, 4))] * 2 + [((8, 4, 4), (8, 4, 4))]
+
+
+def test_ukuran_batch_maksimum():
+    byte_per_matriks = 8 * 8 * byte_per_elemen_perkalian(np.float64)
+    assert ukuran_batch_maksimum(8, "float64", 10 * byte_per_matriks) == 10
+    assert ukuran_batch_maksimum(8, "float64", 1) == 1
+
+
+# Throughput dan statistik per matriks dari aliran kecil; hasil batch terakhir lolos Freivalds dan sama dengan matmul
+@pytest.mark.parametrize("tipe_data", ["int8", "float32"])
+def test_jalankan_aliran_batch(tipe_data):
+    backend = dapatkan_backend("numpy")
+    catatan, hasil = jalankan_aliran_batch(backend, 8, 16, 40, tipe_data)
+    assert catatan["ukuran_batch"] == 16
+    assert catatan["jumlah_matriks"] == 40
+    assert catatan["terverifikasi"] is True
+    assert len(catatan["statistik_perkalian"]["ulangan"]) == 3
+    assert catatan["matriks_per_detik"] > 0
+    assert catatan["gflops"] > 0
+    assert hasil.shape == (8, 8, 8)
+
+
+# Anggaran memori membatasi ukuran batch yang diminta
+def test_aliran_batch_dibatasi_anggaran():
+    backend = dapatkan_backend("numpy")
+    anggaran = 4 * 8 * 8 * byte_per_elemen_perkalian(np.float64)
+    catatan, _ = jalankan_aliran_batch(backend, 8, 256, 20, "float64", anggaran_memori=anggaran)
+    assert catatan["ukuran_batch"] == 4
+    assert len(catatan["statistik_perkalian"]["ulangan"]) == 5
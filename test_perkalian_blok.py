@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from perkalian_blok import (buat_matriks_memmap, perkalian_matriks_numpy_blok, hapus_matriks_memmap,
+                            hitung_ukuran_panel, byte_per_elemen_blok, profil_panel_blok)
+from tipe_data import byte_per_elemen_perkalian
+
+
+# Anggaran memori kecil memaksa beberapa panel per matriks, termasuk panel terakhir yang lebih pendek
+@pytest.mark.parametrize("tipe_data", ["int8", "int32", "int64", "float32", "float64"])
+def test_blok_sama_dengan_matmul(tmp_path, tipe_data):
+    dim = 50
+    anggaran = 7 * dim * byte_per_elemen_blok(np.dtype(tipe_data))
+    assert hitung_ukuran_panel(dim, byte_per_elemen_blok(np.dtype(tipe_data)), anggaran) == 7
+    a, _ = buat_matriks_memmap(dim, str(tmp_path / "a.dat"), tipe_data, anggaran)
+    b, _ = buat_matriks_memmap(dim, str(tmp_path / "b.dat"), tipe_data, anggaran)
+    c, statistik = perkalian_matriks_numpy_blok(a, b, str(tmp_path / "c.dat"), anggaran)
+    try:
+        assert statistik["terverifikasi"]
+        acuan = np.matmul(np.array(a).astype(c.dtype), np.array(b).astype(c.dtype))
+        if np.issubdtype(c.dtype, np.integer):
+            assert c.dtype == np.int64
+            np.testing.assert_array_equal(np.array(c), acuan)
+        else:
+            np.testing.assert_allclose(np.array(c), acuan, rtol=1e-5)
+    finally:
+        hapus_matriks_memmap(a, b, c)
+
+
+# Anggaran panel bilangan bulat ikut menghitung salinan float jalur eksak dan hasil sementara sebelum +=
+def test_byte_per_elemen_blok():
+    assert byte_per_elemen_blok(np.dtype(np.int8)) == byte_per_elemen_perkalian(np.int8) + 8 == 2 + 8 + 24 + 8
+    assert byte_per_elemen_blok(np.dtype(np.float32)) == 3 * 4 + 4
+    assert hitung_ukuran_panel(100, 40, 1) == 1
+    assert hitung_ukuran_panel(100, 40, 10**9) == 100
+
+
+# Baris panel pertama untuk profil memori sama dengan baris pertama hasil perkalian penuh
+def test_profil_panel_blok(tmp_path):
+    dim = 30
+    anggaran = 4 * dim * byte_per_elemen_blok(np.dtype("int32"))
+    a, _ = buat_matriks_memmap(dim, str(tmp_path / "a.dat"), "int32", anggaran)
+    b, _ = buat_matriks_memmap(dim, str(tmp_path / "b.dat"), "int32", anggaran)
+    try:
+        panel_c = profil_panel_blok(a, b, anggaran)
+        assert panel_c.shape == (4, dim)
+        np.testing.assert_array_equal(panel_c, np.array(a[:4]).astype(np.int64) @ np.array(b).astype(np.int64))
+    finally:
+        hapus_matriks_memmap(a, b)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from perkalian_paralel import bagi_blok, ukuran_blok_default, perkalian_matriks_numpy_paralel, kalikan_paralel, tutup_pool
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pool():
+    yield
+    tutup_pool()
+
+
+# Blok-blok menutup seluruh matriks hasil tepat sekali, termasuk blok tepi yang lebih kecil
+def test_bagi_blok_menutup_matriks():
+    tertutup = np.zeros((10, 7), dtype=int)
+    for i0, i1, j0, j1 in bagi_blok(10, 7, 4):
+        tertutup[i0:i1, j0:j1] += 1
+    assert (tertutup == 1).all()
+
+
+def test_ukuran_blok_default():
+    assert ukuran_blok_default(100, 4) == 64
+    assert ukuran_blok_default(4096, 4) == 1024
+
+
+# Dua worker dengan blok kecil: setiap blok C dihitung di proses lain lewat shared memory
+@pytest.mark.parametrize("tipe_data", [np.int8, np.int64, np.float64])
+def test_paralel_sama_dengan_matmul(tipe_data):
+    a = np.random.randint(-100, 100, size=(45, 30)).astype(tipe_data)
+    b = np.random.randint(-100, 100, size=(30, 38)).astype(tipe_data)
+    hasil, statistik = perkalian_matriks_numpy_paralel(a, b, jumlah_worker=2, ukuran_blok=16, pemanasan=0, ulangan=2)
+    acuan = np.matmul(a.astype(hasil.dtype), b.astype(hasil.dtype))
+    np.testing.assert_array_equal(hasil, acuan)
+    assert len(statistik["ulangan"]) == 2
+    np.testing.assert_array_equal(kalikan_paralel(a, b, jumlah_worker=2, ukuran_blok=16), acuan)
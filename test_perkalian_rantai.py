@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import benchmark
+import penyimpanan_hasil
+from backend import dapatkan_backend
+from penyimpanan_hasil import muat_hasil
+from perkalian_rantai import (FASE_RANTAI_OPTIMAL, FASE_RANTAI_NAIF, rencana_rantai, rencana_kiri_ke_kanan,
+                              format_rencana, kalikan_rantai, jalur_rantai, jalankan_benchmark_rantai)
+
+# Contoh rantai buku teks CLRS (bab 15.2): biaya optimal 15125 perkalian skalar, yaitu 2 x 15125 FLOP
+DIMENSI_CLRS = (30, 35, 15, 5, 10, 20, 25)
+
+
+def test_rencana_rantai_clrs():
+    pohon, flop_optimal, flop_kiri_ke_kanan = rencana_rantai(DIMENSI_CLRS)[:3]
+    assert format_rencana(pohon) == "((A1 (A2 A3)) ((A4 A5) A6))"
+    assert flop_optimal == 2 * 15125
+    assert flop_kiri_ke_kanan == rencana_kiri_ke_kanan(DIMENSI_CLRS)[1] > flop_optimal
+
+
+@pytest.mark.parametrize("tipe_data", ["int64", "float64"])
+def test_kalikan_rantai_sama_dengan_matmul(tipe_data):
+    backend = dapatkan_backend("numpy")
+    daftar = [backend.buat_acak((DIMENSI_CLRS[i], DIMENSI_CLRS[i + 1]), tipe_data) for i in range(len(DIMENSI_CLRS) - 1)]
+    acuan = daftar[0]
+    for matriks in daftar[1:]:
+        acuan = np.matmul(acuan, matriks)
+    hasil = kalikan_rantai(backend, daftar, daftar_jalur=jalur_rantai(backend, daftar))
+    if tipe_data == "int64":
+        np.testing.assert_array_equal(hasil, acuan)
+    else:
+        np.testing.assert_allclose(hasil, acuan, rtol=1e-10)
+
+
+# Waktu urutan optimal dan kiri-ke-kanan tersimpan sebagai dua baris dengan fasenya sendiri
+def test_benchmark_rantai_disimpan(tmp_path, monkeypatch):
+    path = str(tmp_path / "hasil.npz")
+    monkeypatch.setattr(benchmark, "PATH_HASIL", path)
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", "rantai")
+    daftar_catatan = jalankan_benchmark_rantai(dapatkan_backend("numpy"), [DIMENSI_CLRS], ["float64"])
+    assert len(daftar_catatan) == 1 and daftar_catatan[0]["terverifikasi"]
+
+    baris, ulangan = muat_hasil(path)
+    assert sorted(baris["fase"]) == sorted([FASE_RANTAI_OPTIMAL, FASE_RANTAI_NAIF])
+    assert set(baris["dim"]) == {DIMENSI_CLRS[0]}
+    optimal = baris[baris["fase"] == FASE_RANTAI_OPTIMAL][0]
+    naif = baris[baris["fase"] == FASE_RANTAI_NAIF][0]
+    assert optimal["median"] == daftar_catatan[0]["statistik_optimal"]["median"]
+    assert naif["median"] == daftar_catatan[0]["statistik_kiri_ke_kanan"]["median"]
+    assert (optimal["terverifikasi"], naif["terverifikasi"]) == (1, -1)
+    assert optimal["gflops"] > 0 and not np.isnan(optimal["contoh"][0, 0])
+    assert len(ulangan) == optimal["jumlah_ulangan"] + naif["jumlah_ulangan"]
@@ -0,0 +1,56 @@
+import math
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from backend import dapatkan_backend
+from perkalian_sparse import buat_matriks_sparse, flop_sparse, kalikan_sparse, titik_potong_kepadatan
+
+
+def test_buat_matriks_sparse_kepadatan_tepat():
+    matriks = buat_matriks_sparse((40, 50), "int16", 0.1, "csc", np.random.default_rng(0))
+    assert matriks.format == "csc" and matriks.dtype == np.int16
+    assert matriks.nnz == 200
+    assert matriks.data.min() >= 1
+
+
+# FLOP SpGEMM dihitung dari pasangan bukan nol kolom A x baris B, bukan 2 * m * k * n padat
+def test_flop_sparse():
+    a = sp.csr_array(np.array([[1, 0, 2], [0, 0, 3]]))
+    b = sp.csr_array(np.array([[4, 5], [6, 0], [0, 7]]))
+    # nnz kolom A = (1, 0, 2), nnz baris B = (2, 1, 1)
+    assert flop_sparse(a, b) == 2 * (1 * 2 + 0 * 1 + 2 * 1)
+    padat = np.ones((3, 4))
+    assert flop_sparse(padat, padat.T) == 2 * 3 * 4 * 3
+
+
+def test_titik_potong_kepadatan():
+    kepadatan = [0.001, 0.01, 0.1, 1.0]
+    # Sparse lebih cepat sampai 0.01, lebih lambat di 0.1: titik potong di tengah skala log (rasio simetris)
+    potong = titik_potong_kepadatan(kepadatan, [0.1, 0.5, 2.0, 10.0], 1.0)
+    assert potong == pytest.approx(math.sqrt(0.01 * 0.1))
+    assert titik_potong_kepadatan(kepadatan, [2.0, 3.0, 4.0, 5.0], 1.0) is None
+    assert titik_potong_kepadatan(kepadatan, [0.1, 0.2, 0.3, 0.4], 1.0) == float("inf")
+
+
+# Hasil SpGEMM sama dengan perkalian padat; operand bilangan bulat diakumulasi di int64
+@pytest.mark.parametrize("format", ["csr", "csc"])
+@pytest.mark.parametrize("tipe_data", ["int8", "float64"])
+def test_backend_sparse_sama_dengan_padat(format, tipe_data):
+    sparse = dapatkan_backend("scipy-sparse", kepadatan=0.2, format=format, seed=1)
+    a = sparse.buat_acak((30, 20), tipe_data)
+    b = sparse.buat_acak((20, 25), tipe_data)
+    hasil = sparse.kalikan(a, b)
+    assert sp.issparse(hasil) and hasil.format == format
+    padat_a, padat_b = sparse.ke_numpy(a), sparse.ke_numpy(b)
+    if tipe_data == "int8":
+        assert hasil.dtype == np.int64
+        np.testing.assert_array_equal(sparse.ke_numpy(hasil), padat_a.astype(np.int64) @ padat_b.astype(np.int64))
+    else:
+        np.testing.assert_allclose(sparse.ke_numpy(hasil), padat_a @ padat_b)
+
+
+# Operand padat (misalnya dari cache operand) diubah ke sparse sebelum dikalikan
+def test_kalikan_sparse_operand_padat():
+    a = np.array([[0, 2], [3, 0]], dtype=np.int16)
+    hasil = kalikan_sparse(a, sp.csr_array(a))
+    np.testing.assert_array_equal(hasil.toarray(), a.astype(np.int64) @ a)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from backend import dapatkan_backend
+from perkalian_strassen import kalikan_strassen, hitung_ukuran_padding, bebaskan_ruang_kerja
+
+
+@pytest.fixture(autouse=True)
+def ruang_kerja_bersih():
+    yield
+    bebaskan_ruang_kerja()
+
+
+# Padding hanya sampai kelipatan 2^tingkat, bukan pangkat dua berikutnya
+def test_hitung_ukuran_padding():
+    assert hitung_ukuran_padding(100, 128) == (0, 100)
+    assert hitung_ukuran_padding(129, 128) == (1, 130)
+    assert hitung_ukuran_padding(1000, 128) == (3, 1000)
+    assert hitung_ukuran_padding(1001, 128) == (3, 1008)
+
+
+# Strassen-Winograd dengan cutoff kecil agar rekursinya benar-benar berjalan, termasuk dimensi bukan pangkat dua
+@pytest.mark.parametrize("dim", [16, 37, 64])
+@pytest.mark.parametrize("dtype", [np.int8, np.int64])
+def test_strassen_bulat_sama_dengan_matmul(dim, dtype):
+    a = np.random.randint(-50, 50, size=(dim, dim)).astype(dtype)
+    b = np.random.randint(-50, 50, size=(dim, dim)).astype(dtype)
+    hasil = kalikan_strassen(a, b, ukuran_cutoff=8)
+    assert hasil.dtype == np.int64
+    np.testing.assert_array_equal(hasil, np.matmul(a.astype(np.int64), b.astype(np.int64)))
+
+
+@pytest.mark.parametrize("dim", [16, 37])
+def test_strassen_float_sama_dengan_matmul(dim):
+    a = np.random.rand(dim, dim)
+    b = np.random.rand(dim, dim)
+    np.testing.assert_allclose(kalikan_strassen(a, b, ukuran_cutoff=8), np.matmul(a, b), rtol=1e-10)
+
+
+# Operand persegi panjang di-padding ke persegi lalu dipotong kembali
+def test_strassen_persegi_panjang():
+    a = np.random.randint(1, 101, size=(20, 33)).astype(np.int64)
+    b = np.random.randint(1, 101, size=(33, 9)).astype(np.int64)
+    np.testing.assert_array_equal(kalikan_strassen(a, b, ukuran_cutoff=8), a @ b)
+
+
+def test_backend_strassen_jalur():
+    backend = dapatkan_backend("numpy-strassen", ukuran_cutoff=8)
+    a = backend.buat_acak((32, 32), "int32")
+    assert backend.jalur(a, a) == "strassen"
+    assert backend.jalur(a[:8, :8], a[:8, :8]) == "float32"
+    np.testing.assert_array_equal(backend.kalikan(a, a), a.astype(np.int64) @ a.astype(np.int64))
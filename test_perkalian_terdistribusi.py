@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from perkalian_terdistribusi import Klaster
+from tipe_data import jalur_perkalian
+
+
+# Dua worker lokal (proses spawn) dipakai bersama oleh semua uji di modul ini
+@pytest.fixture(scope="module")
+def klaster():
+    klaster = Klaster(2, jumlah_thread=1)
+    yield klaster
+    klaster.tutup()
+
+
+@pytest.mark.parametrize("tipe_data", [np.int64, np.float64])
+def test_klaster_dua_worker_sama_dengan_matmul(klaster, tipe_data):
+    a = np.random.randint(-100, 100, size=(45, 30)).astype(tipe_data)
+    b = np.random.randint(-100, 100, size=(30, 38)).astype(tipe_data)
+    np.testing.assert_array_equal(klaster.kalikan(a, b, ukuran_panel=8), np.matmul(a, b))
+    assert klaster.riwayat
+
+
+def test_klaster_jalur_dihitung_sebelumnya(klaster):
+    a = np.random.randint(-100, 100, size=(32, 32), dtype=np.int64)
+    b = np.random.randint(-100, 100, size=(32, 32), dtype=np.int64)
+    np.testing.assert_array_equal(klaster.kalikan(a, b, jalur=jalur_perkalian(a, b)), np.matmul(a, b))
+
+
+# Panel dikirim dari hub ke setiap worker: A sebanyak pc kali dan B sebanyak pr kali, ditambah blok C kembali
+def test_klaster_volume_komunikasi_hub(klaster):
+    pr, pc = klaster.grid
+    m, k, n = 24, 40, 18
+    a, b = np.ones((m, k)), np.ones((k, n))
+    klaster.kalikan(a, b, ukuran_panel=16)
+    byte_array = (pc * m * k + pr * k * n + m * n) * 8
+    byte = klaster.riwayat[-1]["byte"]
+    # Sisanya hanya header pesan (satu header kalikan dan satu per panel per worker)
+    assert byte_array < byte < byte_array + pr * pc * 4 * 1024
@@ -0,0 +1,41 @@
+import numpy as np
+import benchmark
+import penyimpanan_hasil
+import pipeline_sapuan
+from backend import dapatkan_backend
+from penyimpanan_hasil import muat_hasil
+
+
+# Sapuan kecil dengan dua slot: setiap sel tersimpan sekali sebagai "pipeline" dan terverifikasi
+def test_pipeline_menyimpan_semua_sel(tmp_path, monkeypatch):
+    path = str(tmp_path / "hasil.npz")
+    monkeypatch.setattr(benchmark, "PATH_HASIL", path)
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", "pipeline")
+    dimensi, tipe_data_diuji = [16, 32, 48], ["int32", "float64"]
+
+    daftar_catatan = pipeline_sapuan.jalankan_benchmark_pipeline(
+        dapatkan_backend("numpy"), dimensi, tipe_data_diuji, str(tmp_path))
+    assert [(c["dim"], c["dtype"]) for c in daftar_catatan] == \
+        [(dim, tipe_data) for dim in dimensi for tipe_data in tipe_data_diuji]
+    assert all(c["mode"] == "pipeline" and c["terverifikasi"] for c in daftar_catatan)
+
+    baris, _ = muat_hasil(path)
+    perkalian = baris[baris["fase"] == "perkalian"]
+    assert len(perkalian) == len(daftar_catatan)
+    assert set(perkalian["mode"]) == {"pipeline"}
+    assert np.all(perkalian["terverifikasi"] == 1)
+
+    # Dijalankan ulang di run yang sama: semua sel sudah tersimpan sehingga tidak ada baris baru
+    pipeline_sapuan.jalankan_benchmark_pipeline(dapatkan_backend("numpy"), dimensi, tipe_data_diuji, str(tmp_path))
+    assert len(muat_hasil(path)[0]) == len(baris)
+
+
+# Sel yang tidak muat bersama slot dipisahkan untuk dijalankan berurutan; slot cukup untuk operand terbesar
+def test_bagi_sel_batas_memori(monkeypatch):
+    backend = dapatkan_backend("numpy")
+    monkeypatch.setattr(backend, "memori_tersedia", lambda: 300_000)
+    sel_pipeline, sel_sisa, byte_slot = pipeline_sapuan.bagi_sel(
+        backend, [(32, "int8"), (64, "float64"), (128, "float64")])
+    assert sel_pipeline == [(32, "int8"), (64, "float64")]
+    assert sel_sisa == [(128, "float64")]
+    assert byte_slot == 64 * 64 * 8
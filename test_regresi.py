@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+import penyimpanan_hasil
+import regresi
+from pengukuran_waktu import ringkas_statistik
+from penyimpanan_hasil import tambah_catatan
+from regresi import uji_perlambatan, p_minimum, tetapkan_baseline, periksa_regresi, ada_regresi
+
+
+def test_uji_perlambatan_distribusi_sama():
+    rng = np.random.default_rng(1)
+    waktu = rng.lognormal(0.0, 0.1, size=40)
+    assert uji_perlambatan(waktu[:20], waktu[20:]) > 0.05
+
+
+def test_uji_perlambatan_bergeser():
+    rng = np.random.default_rng(2)
+    dasar = rng.lognormal(0.0, 0.05, size=20)
+    lambat = dasar * 1.5
+    assert uji_perlambatan(dasar, lambat) < 0.001
+    # Satu sisi: waktu yang lebih cepat bukan perlambatan
+    assert uji_perlambatan(lambat, dasar) > 0.99
+
+
+# Uji eksak 3 vs 3: susunan paling ekstrem punya p = 1 / C(6, 3)
+def test_uji_perlambatan_eksak():
+    assert uji_perlambatan([1.0, 2.0, 3.0], [4.0, 5.0, 6.0]) == pytest.approx(1 / 20)
+    assert uji_perlambatan([1.0, 2.0, 3.0], [4.0, 5.0, 6.0]) == p_minimum(3, 3)
+    assert uji_perlambatan([4.0, 5.0, 6.0], [1.0, 2.0, 3.0]) == 1.0
+
+
+def test_p_minimum():
+    assert p_minimum(3, 3) == 1 / 20
+    assert p_minimum(7, 7) < regresi.ALFA
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "hasil.npz"), str(tmp_path / "baseline.npz")
+
+
+def _tambah_run(path, id_run, skala, monkeypatch):
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", id_run)
+    ulangan = list(np.linspace(1.0, 1.02, 7) * skala)
+    tambah_catatan([{"backend": "numpy", "dtype": "int64", "dim": 64, "contoh": None,
+                     "statistik_perkalian": ringkas_statistik(ulangan)}], path)
+
+
+# Baseline dari tiga run, lalu run baru yang stabil, lebih lambat dan lebih cepat
+def test_periksa_regresi_status(path, monkeypatch):
+    path_hasil, path_baseline = path
+    _tambah_run(path_hasil, "awal", 1.0, monkeypatch)
+    assert [e["status"] for e in periksa_regresi("awal", path=path_hasil, path_baseline=path_baseline)] == \
+        ["tanpa baseline"]
+
+    for i, skala in enumerate([1.0, 1.01, 0.99]):
+        _tambah_run(path_hasil, f"run-{i}", skala, monkeypatch)
+        tetapkan_baseline(f"run-{i}", path=path_hasil, path_baseline=path_baseline)
+        if i < regresi.RUN_BASELINE_MINIMUM - 1:
+            hasil = periksa_regresi(f"run-{i}", path=path_hasil, path_baseline=path_baseline)
+            assert hasil[0]["status"] == "baseline kurang"
+
+    status = {}
+    for id_run, skala in [("stabil", 1.005), ("lambat", 1.3), ("cepat", 0.7)]:
+        _tambah_run(path_hasil, id_run, skala, monkeypatch)
+        hasil = periksa_regresi(id_run, path=path_hasil, path_baseline=path_baseline)
+        assert len(hasil) == 1 and len(hasil[0]["run_baseline"]) == 3
+        status[id_run] = hasil[0]["status"]
+    assert status == {"stabil": "stabil", "lambat": "regresi", "cepat": "lebih cepat"}
+    assert ada_regresi(periksa_regresi("lambat", path=path_hasil, path_baseline=path_baseline))
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+import penyimpanan_hasil
+import studi_skala
+from pengukuran_waktu import ringkas_statistik
+from penyimpanan_hasil import muat_hasil, ulangan_baris, _daftar_segmen
+from studi_skala import (SKEMA_STUDI, urutan_cpu, grid_thread, hitung_efisiensi, rekomendasi_thread,
+                         simpan_studi_skala)
+
+# Dua paket, dua inti per paket, dua saudara hyperthread per inti: (cpu, paket, inti)
+TOPOLOGI = [(0, 0, 0), (1, 0, 1), (2, 1, 0), (3, 1, 1), (4, 0, 0), (5, 0, 1), (6, 1, 0), (7, 1, 1)]
+
+
+def test_urutan_cpu():
+    assert urutan_cpu("kompak", TOPOLOGI) == [0, 4, 1, 5, 2, 6, 3, 7]
+    assert urutan_cpu("tersebar", TOPOLOGI) == [0, 2, 1, 3, 4, 6, 5, 7]
+
+
+def test_grid_thread():
+    assert grid_thread(1) == [1]
+    assert grid_thread(8) == [1, 2, 4, 8]
+    assert grid_thread(6) == [1, 2, 4, 6]
+
+
+def _catatan(jumlah_thread, median, strategi="semua", dim=512):
+    return {"dtype": "float64", "dim": dim, "strategi": strategi, "jumlah_thread": jumlah_thread,
+            "thread_efektif": jumlah_thread, "cpu": None if strategi == "semua" else list(range(jumlah_thread)),
+            "statistik": ringkas_statistik([median, median * 1.01]), "gflops": 1.0 / median}
+
+
+# Efisiensi relatif terhadap satu thread strategi yang sama; rekomendasi = thread terbanyak di atas ambang
+def test_efisiensi_dan_rekomendasi():
+    daftar = hitung_efisiensi([_catatan(1, 8.0), _catatan(2, 4.2), _catatan(4, 2.6), _catatan(8, 2.0),
+                               _catatan(2, 4.0, "kompak")])
+    efisiensi = {(c["strategi"], c["jumlah_thread"]): c["efisiensi"] for c in daftar}
+    assert efisiensi[("semua", 1)] == 1.0
+    assert efisiensi[("semua", 4)] == pytest.approx(8.0 / 2.6 / 4)
+    assert np.isnan(efisiensi[("kompak", 2)])  # tanpa satu thread kompak
+    assert rekomendasi_thread(daftar, 0.7) == {("float64", 512): (4, "semua", pytest.approx(8.0 / 2.6 / 4))}
+    assert rekomendasi_thread(daftar, 0.99) == {("float64", 512): (1, "semua", 1.0)}
+
+
+# Setiap studi menjadi satu segmen append di PATH_STUDI, dimuat dengan SKEMA_STUDI
+def test_simpan_studi_skala(tmp_path, monkeypatch):
+    monkeypatch.setattr(penyimpanan_hasil, "_id_run", "run-skala")
+    path = str(tmp_path / "studi.npz")
+    simpan_studi_skala(hitung_efisiensi([_catatan(1, 8.0), _catatan(2, 4.0, dim=256)]), path)
+    simpan_studi_skala(hitung_efisiensi([_catatan(1, 6.0, "kompak")]), path)
+    assert len(_daftar_segmen(path)) == 2
+
+    baris, ulangan = muat_hasil(path, SKEMA_STUDI)
+    assert baris.dtype == SKEMA_STUDI
+    assert baris["strategi"].tolist() == ["semua", "semua", "kompak"]
+    assert baris["dim"].tolist() == [512, 256, 512]
+    assert baris["cpu"].tolist() == ["", "", "0"]
+    assert set(baris["id_run"]) == {"run-skala"}
+    for b, median in zip(baris, [8.0, 4.0, 6.0]):
+        np.testing.assert_allclose(ulangan_baris(b, ulangan), [median, median * 1.01])
+
+
+# Studi memakai backend numpy biasa di dalam threadpool_limits, bukan numpy-thread
+def test_jalankan_studi_skala(monkeypatch):
+    pytest.importorskip("threadpoolctl")
+    dibuat = []
+    dapatkan_asli = studi_skala.dapatkan_backend
+    monkeypatch.setattr(studi_skala, "dapatkan_backend", lambda nama, **opsi: dibuat.append(nama) or dapatkan_asli(nama, **opsi))
+    daftar = studi_skala.jalankan_studi_skala([32], ["float64"], [1, 2], ["semua"])
+    assert dibuat == ["numpy"]
+    assert [(c["jumlah_thread"], c["thread_efektif"]) for c in daftar] == [(1, 1), (2, 2)]
+    assert daftar[0]["efisiensi"] == 1.0
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from tipe_data import (BATAS_EKSAK_FLOAT32, jalur_perkalian, kalikan, tipe_hasil, buat_matriks_acak,
+                       byte_per_elemen_perkalian)
+
+
+def test_tipe_hasil():
+    assert tipe_hasil(np.int8) == np.int64
+    assert tipe_hasil(np.int32) == np.int64
+    assert tipe_hasil(np.float32) == np.float32
+
+
+@pytest.mark.parametrize("tipe_data", ["int8", "int64", "float32"])
+def test_buat_matriks_acak(tipe_data):
+    matriks = buat_matriks_acak(np, (20, 30), tipe_data)
+    assert matriks.shape == (20, 30)
+    assert matriks.dtype == np.dtype(tipe_data)
+    assert matriks.min() >= 1 and matriks.max() <= 100
+
+
+def test_byte_per_elemen_perkalian():
+    assert byte_per_elemen_perkalian(np.float64) == 24
+    assert byte_per_elemen_perkalian(np.int8) == 2 + 8 + 3 * 8
+
+
+# Jalur dipilih dari batas hasil |A|maks * |B|maks * k terhadap batas mantissa float
+def test_jalur_perkalian_bulat():
+    a = np.full((4, 64), 100, dtype=np.int64)
+    b = np.full((64, 4), 100, dtype=np.int64)
+    assert jalur_perkalian(a, b) == "float32"
+    assert jalur_perkalian(a * 100, b) == "float64"
+    assert jalur_perkalian(a * 2**40, b) == "integer"
+    assert jalur_perkalian(np.zeros((0, 3), dtype=np.int8), np.zeros((3, 2), dtype=np.int8)) == "integer"
+    assert 100 * 100 * 64 <= BATAS_EKSAK_FLOAT32
+
+
+# Pasangan float dan bulat mengikuti tipe hasil promosinya (float), bukan jalur pemindaian nilai bulat
+@pytest.mark.parametrize("dtype_a, dtype_b", [(np.float64, np.float64), (np.float32, np.int64),
+                                               (np.int8, np.float64), (np.float32, np.float64)])
+def test_jalur_perkalian_float_dan_campuran(dtype_a, dtype_b):
+    a = np.random.randint(1, 101, size=(8, 5)).astype(dtype_a)
+    b = np.random.randint(1, 101, size=(5, 6)).astype(dtype_b)
+    assert jalur_perkalian(a, b) == "blas"
+    hasil = kalikan(np, a, b)
+    assert hasil.dtype == np.result_type(dtype_a, dtype_b)
+    np.testing.assert_allclose(hasil, np.matmul(a.astype(np.float64), b.astype(np.float64)), rtol=1e-6)
+
+
+# Jalur eksak float32/float64 untuk bilangan bulat memberi hasil yang sama dengan loop integer, tanpa overflow int8
+def test_jalur_eksak_sama_dengan_integer():
+    a = np.random.randint(-100, 100, size=(40, 50), dtype=np.int64)
+    b = np.random.randint(-100, 100, size=(50, 30), dtype=np.int64)
+    assert jalur_perkalian(a, b) == "float32"
+    acuan = kalikan(np, a, b, "integer")
+    for jalur in ("float32", "float64"):
+        hasil = kalikan(np, a, b, jalur)
+        assert hasil.dtype == np.int64
+        np.testing.assert_array_equal(hasil, acuan)
+    a8, b8 = a.astype(np.int8), b.astype(np.int8)
+    np.testing.assert_array_equal(kalikan(np, a8, b8), acuan)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from verifikasi import verifikasi_freivalds, verifikasi_freivalds_rantai
+
+# Satu elemen salah lolos satu putaran Freivalds dengan peluang 1/2, jadi uji memakai seed tetap dan banyak putaran
+PUTARAN = 30
+
+
+@pytest.fixture(autouse=True)
+def seed_tetap():
+    np.random.seed(0)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float32, np.float64])
+def test_freivalds_menerima_hasil_benar(dtype):
+    a = np.random.randint(1, 101, size=(64, 48)).astype(dtype)
+    b = np.random.randint(1, 101, size=(48, 40)).astype(dtype)
+    assert verifikasi_freivalds(a, b, a @ b, PUTARAN)
+
+
+# Bilangan bulat diperiksa eksak (selisih 1 sudah ditolak); float hanya menolak selisih di atas batas galat
+# pembulatan, jadi elemennya dirusak secara relatif, jauh di atas batas galat tipe tersebut
+@pytest.mark.parametrize("dtype, kerusakan", [(np.int64, 1), (np.float32, 1e-3), (np.float64, 1e-9)])
+def test_freivalds_menolak_hasil_rusak(dtype, kerusakan):
+    a = np.random.randint(1, 101, size=(64, 48)).astype(dtype)
+    b = np.random.randint(1, 101, size=(48, 40)).astype(dtype)
+    c = a @ b
+    if np.issubdtype(dtype, np.integer):
+        c[17, 23] += kerusakan
+    else:
+        c[17, 23] *= 1 + kerusakan
+    assert not verifikasi_freivalds(a, b, c, PUTARAN)
+
+
+def test_freivalds_rantai():
+    daftar = [np.random.randint(1, 101, size=bentuk).astype(np.int64) for bentuk in [(10, 30), (30, 5), (5, 60)]]
+    c = daftar[0] @ daftar[1] @ daftar[2]
+    assert verifikasi_freivalds_rantai(daftar, c, PUTARAN)
+    c[3, 4] -= 1
+    assert not verifikasi_freivalds_rantai(daftar, c, PUTARAN)
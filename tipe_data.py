@@ -0,0 +1,88 @@
+import numpy as np
+
+# Tipe data yang didukung untuk pembuatan dan perkalian matriks
+TIPE_DATA = {
+    "float32": np.float32,
+    "float64": np.float64,
+    "int64": np.int64,
+    "int32": np.int32,
+    "int16": np.int16,
+    "int8": np.int8,
+}
+
+# Tipe data yang dipakai skrip sebelumnya (np.random.randint menghasilkan int64)
+TIPE_DATA_BAWAAN = "int64"
+
+# Rentang nilai acak sama seperti sebelumnya: randint(1, 101)
+NILAI_MIN = 1
+NILAI_MAKS = 101
+
+# Bilangan bulat terbesar yang masih eksak di mantissa float32 dan float64
+BATAS_EKSAK_FLOAT32 = 2**24
+BATAS_EKSAK_FLOAT64 = 2**53
+
+
+def apakah_bulat(dtype):
+    return np.issubdtype(np.dtype(dtype), np.integer)
+
+
+# Tipe hasil perkalian: bilangan bulat selalu diakumulasi di int64 agar int8/int16 tidak overflow
+def tipe_hasil(dtype):
+    return np.dtype(np.int64) if apakah_bulat(dtype) else np.dtype(dtype)
+
+
+# Memori per sel matriks untuk A, B dan C termasuk salinan float sementara pada jalur eksak
+def byte_per_elemen_perkalian(dtype):
+    dtype = np.dtype(dtype)
+    byte_per_elemen = 2 * dtype.itemsize + tipe_hasil(dtype).itemsize
+    if apakah_bulat(dtype):
+        byte_per_elemen += 3 * 8
+    return byte_per_elemen
+
+
+# Fungsi untuk membuat matriks acak bernilai 1..100 langsung dalam tipe data yang diminta
+# xp adalah modul array (numpy atau cupy)
+def buat_matriks_acak(xp, bentuk, tipe_data=TIPE_DATA_BAWAAN):
+    dtype = TIPE_DATA[tipe_data]
+    if apakah_bulat(dtype):
+        return xp.random.randint(NILAI_MIN, NILAI_MAKS, size=bentuk, dtype=dtype)
+    return xp.random.randint(NILAI_MIN, NILAI_MAKS, size=bentuk, dtype=np.int32).astype(dtype)
+
+
+def _nilai_mutlak_maks(matriks):
+    return max(abs(int(matriks.max())), abs(int(matriks.min())))
+
+
+# Fungsi untuk memilih jalur perkalian menurut tipe hasil promosi kedua operand (np.result_type):
+#   "blas"    - tipe hasil float (termasuk pasangan float dan bulat), langsung ke BLAS
+#   "float32" - operand bulat, hasil eksak di float32 (|A|maks * |B|maks * k <= 2^24)
+#   "float64" - operand bulat, hasil eksak di float64 (|A|maks * |B|maks * k <= 2^53)
+#   "integer" - operand bulat terlalu besar, pakai loop integer NumPy/CuPy
+def jalur_perkalian(matriks_a, matriks_b):
+    if not apakah_bulat(np.result_type(matriks_a.dtype, matriks_b.dtype)):
+        return "blas"
+    if matriks_a.size == 0 or matriks_b.size == 0:
+        return "integer"
+
+    batas_hasil = _nilai_mutlak_maks(matriks_a) * _nilai_mutlak_maks(matriks_b) * matriks_a.shape[-1]
+    if batas_hasil <= BATAS_EKSAK_FLOAT32:
+        return "float32"
+    if batas_hasil <= BATAS_EKSAK_FLOAT64:
+        return "float64"
+    return "integer"
+
+
+# Fungsi untuk mengalikan dua matriks lewat jalur tercepat yang tetap eksak
+def kalikan(xp, matriks_a, matriks_b, jalur=None):
+    if jalur is None:
+        jalur = jalur_perkalian(matriks_a, matriks_b)
+
+    if jalur == "blas":
+        return xp.matmul(matriks_a, matriks_b)
+    if jalur == "integer":
+        return xp.matmul(matriks_a.astype(np.int64, copy=False), matriks_b.astype(np.int64, copy=False))
+
+    # Semua jumlah parsial adalah bilangan bulat di bawah batas mantissa, jadi pembulatan tidak terjadi
+    tipe_float = np.float32 if jalur == "float32" else np.float64
+    hasil = xp.matmul(matriks_a.astype(tipe_float), matriks_b.astype(tipe_float))
+    return hasil.astype(np.int64)
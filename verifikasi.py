@@ -0,0 +1,124 @@
+import math
+import numpy as np
+from tipe_data import apakah_bulat
+
+# Jumlah putaran Freivalds bawaan; peluang hasil salah lolos paling besar 2^-putaran
+JUMLAH_PUTARAN_BAWAAN = 10
+
+# Pengali batas galat pembulatan untuk hasil float (batas dasar: sqrt(k) * eps * |A| |B| r,
+# galat pembulatan acak tumbuh sebanding akar k, bukan k seperti batas terburuknya)
+FAKTOR_TOLERANSI = 4
+
+# Jumlah baris per potongan saat menghitung |M| @ v, agar salinan |M| tidak sebesar matriks penuh
+BARIS_PER_POTONGAN = 1024
+
+
+def _xp_dari(matriks):
+    if type(matriks).__module__.startswith("cupy"):
+        import cupy
+        return cupy
+    return np
+
+
+# Tipe kerja pemeriksaan: int64 (eksak) untuk bilangan bulat, tipe hasil untuk float
+def _tipe_kerja(matriks_c):
+    return np.dtype(np.int64) if apakah_bulat(matriks_c.dtype) else matriks_c.dtype
+
+
+def _kalikan_mutlak(xp, matriks, vektor):
+    # Matriks sparse (scipy.sparse): |M| hanya menyalin elemen bukan nol, jadi tidak perlu dipotong
+    if hasattr(matriks, "nnz"):
+        return abs(matriks) @ vektor
+    hasil = xp.empty(matriks.shape[:-1] + vektor.shape[-1:], dtype=vektor.dtype)
+    for i in range(0, matriks.shape[-2], BARIS_PER_POTONGAN):
+        hasil[..., i:i + BARIS_PER_POTONGAN, :] = xp.abs(matriks[..., i:i + BARIS_PER_POTONGAN, :]) @ vektor
+    return hasil
+
+
+# Batas galat pembulatan elemen demi elemen untuk hasil float: FAKTOR * sqrt(k) * eps * |A| (|B| |r|)
+def _batas_galat(xp, matriks_a, matriks_b, vektor, dtype):
+    k = matriks_a.shape[-1]
+    eps = np.finfo(dtype).eps
+    return FAKTOR_TOLERANSI * math.sqrt(k) * eps * _kalikan_mutlak(xp, matriks_a, _kalikan_mutlak(xp, matriks_b, vektor))
+
+
+# Fungsi untuk memeriksa C == A @ B dengan algoritma Freivalds dalam O(n^2) per putaran
+# Semua putaran dihitung sekaligus: R berisi `putaran` vektor acak 0/1, lalu A (B R) dibandingkan dengan C R.
+# Bilangan bulat diperiksa eksak; float diperiksa terhadap batas galat pembulatan.
+# Bekerja juga untuk tumpukan (batch, n, n) dan untuk array CuPy.
+def verifikasi_freivalds(matriks_a, matriks_b, matriks_c, putaran=JUMLAH_PUTARAN_BAWAAN):
+    xp = _xp_dari(matriks_c)
+    dtype = _tipe_kerja(matriks_c)
+    vektor = xp.random.randint(0, 2, size=(matriks_c.shape[-1], putaran)).astype(dtype)
+
+    kiri = matriks_a.astype(dtype, copy=False) @ (matriks_b.astype(dtype, copy=False) @ vektor)
+    kanan = matriks_c.astype(dtype, copy=False) @ vektor
+    if apakah_bulat(dtype):
+        return bool(xp.array_equal(kiri, kanan))
+    batas = _batas_galat(xp, matriks_a, matriks_b, vektor, dtype)
+    return bool(xp.all(xp.abs(kiri - kanan) <= batas))
+
+
+# Fungsi untuk memeriksa C == A1 @ A2 @ ... @ An dengan Freivalds: C R dibandingkan dengan A1 (A2 (... (An R))),
+# tetap O(jumlah elemen) per putaran berapa pun urutan perkalian yang menghasilkan C.
+# Batas galat float menjumlahkan batas setiap perkalian dalam rantai (sqrt(k) per perkalian, lihat _batas_galat).
+def verifikasi_freivalds_rantai(daftar_matriks, matriks_c, putaran=JUMLAH_PUTARAN_BAWAAN):
+    xp = _xp_dari(matriks_c)
+    dtype = _tipe_kerja(matriks_c)
+    vektor = xp.random.randint(0, 2, size=(matriks_c.shape[-1], putaran)).astype(dtype)
+
+    kiri = mutlak = vektor
+    for matriks in reversed(daftar_matriks):
+        kiri = matriks.astype(dtype, copy=False) @ kiri
+        if not apakah_bulat(dtype):
+            mutlak = _kalikan_mutlak(xp, matriks, mutlak)
+    kanan = matriks_c.astype(dtype, copy=False) @ vektor
+    if apakah_bulat(dtype):
+        return bool(xp.array_equal(kiri, kanan))
+    akar_k = sum(math.sqrt(matriks.shape[-1]) for matriks in daftar_matriks[:-1])
+    batas = FAKTOR_TOLERANSI * akar_k * np.finfo(dtype).eps * mutlak
+    return bool(xp.all(xp.abs(kiri - kanan) <= batas))
+
+
+# Checksum aliran untuk mesin yang menulis hasil per panel (misalnya mode blok out-of-core).
+# Jumlah kolom C (e^T C) diakumulasi saat panel hasil ditulis, lalu dibandingkan dengan (e^T A) B
+# yang hanya butuh satu lintasan O(n^2) atas A dan B (pemeriksaan checksum Huang-Abraham).
+# Urutan pemakaian: tambah_hasil()/tambah_a() selama perkalian, lalu tambah_b() untuk setiap panel B.
+class ChecksumAliran:
+    def __init__(self, jumlah_kolom, dtype_hasil):
+        self.dtype = _tipe_kerja(np.empty(0, dtype=dtype_hasil))
+        self.jumlah_kolom_c = np.zeros(jumlah_kolom, dtype=self.dtype)
+        self.jumlah_baris_a = None
+        self.jumlah_baris_a_mutlak = None
+        self.harapan = np.zeros(jumlah_kolom, dtype=self.dtype)
+        self.batas = np.zeros(jumlah_kolom, dtype=self.dtype)
+
+    def tambah_hasil(self, panel_c):
+        self.jumlah_kolom_c += panel_c.sum(axis=0, dtype=self.dtype)
+
+    def tambah_a(self, panel_a):
+        if self.jumlah_baris_a is None:
+            self.jumlah_baris_a = np.zeros(panel_a.shape[1], dtype=self.dtype)
+            self.jumlah_baris_a_mutlak = np.zeros(panel_a.shape[1], dtype=self.dtype)
+        self.jumlah_baris_a += panel_a.sum(axis=0, dtype=self.dtype)
+        if not apakah_bulat(self.dtype):
+            self.jumlah_baris_a_mutlak += np.abs(panel_a).sum(axis=0, dtype=self.dtype)
+
+    # panel_b adalah baris baris_awal.. dari B
+    def tambah_b(self, baris_awal, panel_b):
+        baris_akhir = baris_awal + panel_b.shape[0]
+        self.harapan += self.jumlah_baris_a[baris_awal:baris_akhir] @ panel_b.astype(self.dtype, copy=False)
+        if not apakah_bulat(self.dtype):
+            self.batas += self.jumlah_baris_a_mutlak[baris_awal:baris_akhir] @ np.abs(panel_b).astype(self.dtype, copy=False)
+
+    # Total seluruh elemen C, disimpan sebagai checksum hasil
+    def total(self):
+        return float(self.jumlah_kolom_c.sum(dtype=np.float64))
+
+    def cocok(self):
+        if apakah_bulat(self.dtype):
+            return bool(np.array_equal(self.jumlah_kolom_c, self.harapan))
+        # Jumlah kolom menambah satu faktor n pada akumulasi galat
+        k = len(self.jumlah_baris_a)
+        eps = np.finfo(self.dtype).eps
+        return bool(np.all(np.abs(self.jumlah_kolom_c - self.harapan) <= FAKTOR_TOLERANSI * 2 * k * eps * self.batas))